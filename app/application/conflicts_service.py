@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Callable
 
 from app.application.ports.conflicts_repository import ConflictRecord, ConflictsRepository
+from app.domain.utc_timestamps import to_canonical_utc
 
 
 class ConflictsService:
@@ -36,8 +37,8 @@ class ConflictsService:
 
     @staticmethod
     def _is_local_newer(local_snapshot: dict, remote_snapshot: dict) -> bool:
-        local_updated = ConflictsService._parse_iso(local_snapshot.get("updated_at"))
-        remote_updated = ConflictsService._parse_iso(remote_snapshot.get("updated_at"))
+        local_updated = to_canonical_utc(local_snapshot.get("updated_at"))
+        remote_updated = to_canonical_utc(remote_snapshot.get("updated_at"))
         if local_updated and remote_updated:
             return local_updated >= remote_updated
         if local_updated and not remote_updated:
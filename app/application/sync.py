@@ -24,16 +24,20 @@ class SyncCancelledError(Exception):
 
 
 class CancellationToken:
-    """Token cooperativo para cancelación de sincronizaciones."""
+    """Token cooperativo para cancelación de sincronizaciones.
 
-    def __init__(self) -> None:
+    Un token con ``parent`` también queda cancelado cuando lo está el padre.
+    """
+
+    def __init__(self, parent: CancellationToken | None = None) -> None:
         self._event = threading.Event()
+        self._parent = parent
 
     def cancel(self) -> None:
         self._event.set()
 
     def is_cancelled(self) -> bool:
-        return self._event.is_set()
+        return self._event.is_set() or (self._parent is not None and self._parent.is_cancelled())
 
 
 @dataclass(frozen=True)
@@ -136,7 +140,7 @@ class GoogleSheetsSyncModule:
             attempts += 1
             self._raise_if_cancelled(options.cancellation_token)
             try:
-                summary = self._run_with_timeout(options.operation, options.timeout_seconds)
+                summary = self._run_with_timeout(options.operation, options.timeout_seconds, options.cancellation_token)
                 report = self._summary_to_report(
                     options=options,
                     summary=summary,
@@ -171,22 +175,29 @@ class GoogleSheetsSyncModule:
             duration_seconds=duration,
         )
 
-    def _run_with_timeout(self, operation: SyncOperation, timeout_seconds: float) -> SyncSummary:
+    def _run_with_timeout(
+        self, operation: SyncOperation, timeout_seconds: float, cancellation_token: CancellationToken | None = None
+    ) -> SyncSummary:
         self._log("sync_attempt_started", operation=operation, timeout_seconds=timeout_seconds)
+        # Token propio del intento: el timeout lo cancela sin tocar el del usuario.
+        attempt_token = CancellationToken(parent=cancellation_token)
         with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._dispatch_operation, operation)
+            future = executor.submit(self._dispatch_operation, operation, attempt_token)
             try:
                 return future.result(timeout=timeout_seconds)
             except FuturesTimeoutError as exc:
+                # Se pide al hilo que pare en el siguiente límite de bloque y el ``with`` lo espera:
+                # un reintento nunca corre a la vez que el intento anterior sobre el mismo servicio.
+                attempt_token.cancel()
                 future.cancel()
                 raise TimeoutError(f"Timeout en sincronización '{operation}' tras {timeout_seconds} segundos") from exc
 
-    def _dispatch_operation(self, operation: SyncOperation) -> SyncSummary:
+    def _dispatch_operation(self, operation: SyncOperation, cancellation_token: CancellationToken) -> SyncSummary:
         if operation == "pull":
-            return self._sync_use_case.pull()
+            return self._sync_use_case.pull(cancellation_token)
         if operation == "push":
             return self._sync_use_case.push()
-        return self._sync_use_case.sync()
+        return self._sync_use_case.sync(cancellation_token)
 
     def _summary_to_report(
         self,
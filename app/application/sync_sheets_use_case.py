@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from app.domain.ports import SheetsSyncPort
+from app.domain.ports import TokenCancelacion, SheetsSyncPort
 from app.domain.sync_models import SyncExecutionPlan, SyncSummary
 from app.core.metrics import medir_tiempo, metrics_registry
 
@@ -14,19 +14,24 @@ class SyncSheetsUseCase:
     def __init__(self, sync_port: SheetsSyncPort) -> None:
         self._sync_port = sync_port
 
-    def pull(self) -> SyncSummary:
-        return self._sync_port.pull()
+    def pull(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
+        if cancellation_token is None:
+            return self._sync_port.pull()
+        return self._sync_port.pull(cancellation_token)
 
     def push(self) -> SyncSummary:
         return self._sync_port.push()
 
-    def sync(self) -> SyncSummary:
-        return self.sync_bidirectional()
+    def sync(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
+        return self.sync_bidirectional(cancellation_token)
 
     @medir_tiempo("latency.sync_bidireccional_ms")
-    def sync_bidirectional(self) -> SyncSummary:
+    def sync_bidirectional(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
         metrics_registry.incrementar("syncs_ejecutados")
-        summary = self._sync_port.sync_bidirectional()
+        if cancellation_token is None:
+            summary = self._sync_port.sync_bidirectional()
+        else:
+            summary = self._sync_port.sync_bidirectional(cancellation_token)
         if summary.conflicts_detected > 0:
             metrics_registry.incrementar("conflictos_detectados", summary.conflicts_detected)
         return summary
@@ -6,7 +6,7 @@ from typing import Callable, Protocol, Sequence
 
 from app.application.dto import SolicitudDTO
 from app.application.use_cases.confirmacion_pdf.pdf_confirmadas_builder import PdfConfirmadasPlan
-from app.application.use_cases.confirmacion_pdf.servicio_pdf_confirmadas import actualizar_pdf_en_repo
+from app.application.use_cases.confirmacion_pdf.servicio_pdf_confirmadas import actualizar_pdf_en_repo_lote
 from app.core.errors import InfraError, PersistenceError
 from app.core.metrics import medir_tiempo, metrics_registry
 from app.core.observability import log_event
@@ -53,7 +53,7 @@ def run_pdf_confirmadas_plan(
 
     pdf_path: Path | None = None
     pdf_hash: str | None = None
-    actualizadas: list[SolicitudDTO] = []
+    por_actualizar: list[SolicitudDTO] = []
 
     try:
         for action in plan.actions:
@@ -80,9 +80,11 @@ def run_pdf_confirmadas_plan(
             if action.action_type == "UPDATE_STATUS":
                 if action.solicitud is None or pdf_path is None:
                     continue
-                actualizadas.append(actualizar_pdf_en_repo(repo, action.solicitud, pdf_path, pdf_hash))
+                por_actualizar.append(action.solicitud)
 
-        return pdf_path, actualizadas
+        if not por_actualizar or pdf_path is None:
+            return pdf_path, []
+        return pdf_path, actualizar_pdf_en_repo_lote(repo, por_actualizar, pdf_path, pdf_hash)
     except PersistenceError:
         raise
     except InfraError:
@@ -26,13 +26,17 @@ def hash_file(path: Path) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def actualizar_pdf_en_repo(
+def actualizar_pdf_en_repo_lote(
     repo: SolicitudRepository,
-    solicitud: SolicitudDTO,
+    solicitudes: list[SolicitudDTO],
     pdf_path: Path,
     pdf_hash: str | None,
-) -> SolicitudDTO:
-    if solicitud.id is None:
-        return solicitud
-    repo.update_pdf_info(solicitud.id, str(pdf_path), pdf_hash)
-    return replace(solicitud, pdf_path=str(pdf_path), pdf_hash=pdf_hash)
+) -> list[SolicitudDTO]:
+    """Registra el PDF en todas las solicitudes del lote con una única escritura."""
+    repo.update_pdf_info_many(
+        [(solicitud.id, str(pdf_path), pdf_hash) for solicitud in solicitudes if solicitud.id is not None]
+    )
+    return [
+        solicitud if solicitud.id is None else replace(solicitud, pdf_path=str(pdf_path), pdf_hash=pdf_hash)
+        for solicitud in solicitudes
+    ]
@@ -47,6 +47,7 @@ class ConflictResolutionPolicy:
             conflicts=tuple(item for item in plan.conflicts if item.uuid in unresolved),
             potential_errors=plan.potential_errors,
             values_matrix=plan.values_matrix,
+            remote_snapshot=plan.remote_snapshot,
         )
         self._persist_decisions(decisions)
         return adjusted, tuple(unresolved)
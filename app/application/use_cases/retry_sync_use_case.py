@@ -35,6 +35,7 @@ class RetrySyncUseCase:
             conflicts=unresolved_conflicts,
             potential_errors=base_plan.potential_errors,
             values_matrix=base_plan.values_matrix,
+            remote_snapshot=base_plan.remote_snapshot,
         )
         return RetryPlanResult(plan=retry_plan, retried_items=retried)
 
@@ -15,7 +15,7 @@ from app.application.dto import ConflictoDiaDTO, PeriodoFiltro, ResumenSaldosDTO
 from app.application.dtos.contexto_operacion import ContextoOperacion
 from app.application.operaciones.exportacion_pdf_historico_operacion import RequestExportacionPdfHistorico
 from app.application.pending_conflicts import detect_pending_time_conflicts
-from app.domain.models import Persona, Solicitud
+from app.domain.models import ConsumoMensual, Persona, Solicitud
 from app.domain.request_time import compute_request_minutes
 from app.domain.services import BusinessRuleError, ValidacionError
 from app.core.errors import InfraError, PersistenceError
@@ -259,15 +259,13 @@ def calcular_totales_globales_desde_fuentes(
     *,
     filtro: PeriodoFiltro,
     personas: list[Persona],
-    listar_consumos: Callable[[int, int, int | None], list[int]],
-    sumar_consumo: Callable[[list[int]], int],
+    listar_consumo_mensual: Callable[[int], Iterable[ConsumoMensual]],
+    indexar_consumo: Callable[..., dict[int, int]],
     calcular_totales: Callable[..., TotalesGlobalesDTO],
 ) -> TotalesGlobalesDTO:
     mes = filtro.month if filtro.modo == "MENSUAL" else None
-    consumidas_por_persona = [
-        sumar_consumo(listar_consumos(persona.id or 0, filtro.year, mes))
-        for persona in personas
-    ]
+    consumo = indexar_consumo(listar_consumo_mensual(filtro.year), month=mes)
+    consumidas_por_persona = [consumo.get(persona.id or 0, 0) for persona in personas]
     return calcular_totales(filtro=filtro, personas=personas, consumidas_por_persona=consumidas_por_persona)
 
 
@@ -276,25 +274,19 @@ def calcular_resumen_saldos_desde_fuentes(
     persona: Persona,
     persona_id: int,
     filtro: PeriodoFiltro,
-    listar_periodo: Callable[[int, int, int | None], Iterable[Any]],
-    sumar_consumo: Callable[[list[int]], int],
+    listar_consumo_mensual: Callable[[int], Iterable[ConsumoMensual]],
+    indexar_consumo: Callable[..., dict[int, int]],
     acumular_consumo_anual: Callable[..., tuple[int, int]],
     bolsa_grupo: int,
     personas: list[Persona],
     construir_resumen: Callable[..., ResumenSaldosDTO],
 ) -> ResumenSaldosDTO:
-    solicitudes_periodo = listar_periodo(
-        persona_id,
-        filtro.year,
-        filtro.month if filtro.modo == "MENSUAL" else None,
+    consumos = list(listar_consumo_mensual(filtro.year))
+    consumo_anual = indexar_consumo(consumos)
+    consumo_periodo = (
+        indexar_consumo(consumos, month=filtro.month) if filtro.modo == "MENSUAL" else consumo_anual
     )
-    solicitudes_ano = listar_periodo(persona_id, filtro.year, None)
-    consumidas_periodo = sumar_consumo([s.horas_solicitadas_min for s in solicitudes_periodo])
-    consumidas_anual = sumar_consumo([s.horas_solicitadas_min for s in solicitudes_ano])
-    consumo_anual_por_persona = [
-        sumar_consumo([s.horas_solicitadas_min for s in listar_periodo(p.id or 0, filtro.year, None)])
-        for p in personas
-    ]
+    consumo_anual_por_persona = [consumo_anual.get(p.id or 0, 0) for p in personas]
     total_bolsa_anual, total_consumidas_anual = acumular_consumo_anual(
         personas=personas,
         consumo_anual_por_persona_min=consumo_anual_por_persona,
@@ -302,8 +294,8 @@ def calcular_resumen_saldos_desde_fuentes(
     return construir_resumen(
         persona=persona,
         filtro=filtro,
-        consumidas_periodo_min=consumidas_periodo,
-        consumidas_anual_persona_min=consumidas_anual,
+        consumidas_periodo_min=consumo_periodo.get(persona_id, 0),
+        consumidas_anual_persona_min=consumo_anual.get(persona_id, 0),
         total_bolsa_anual_min=total_bolsa_anual,
         total_consumidas_anual_min=total_consumidas_anual,
         bolsa_anual_grupo_min=bolsa_grupo,
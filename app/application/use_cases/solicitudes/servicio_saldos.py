@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from app.application.dto import (
     PeriodoFiltro,
     ResumenGlobalAnualDTO,
@@ -8,7 +10,7 @@ from app.application.dto import (
     ResumenSaldosDTO,
     TotalesGlobalesDTO,
 )
-from app.domain.models import Persona
+from app.domain.models import ConsumoMensual, Persona
 
 MONTH_NAMES = {
     1: "ENERO",
@@ -62,6 +64,18 @@ def sumar_consumo_solicitudes(solicitudes_min: list[int]) -> int:
     return sum(solicitudes_min)
 
 
+def indexar_consumo_por_persona(
+    consumos: Iterable[ConsumoMensual], *, month: int | None = None
+) -> dict[int, int]:
+    """Agrupa el consumo mensual por persona; con `month` solo suma ese mes."""
+    totales: dict[int, int] = {}
+    for consumo in consumos:
+        if month is not None and consumo.month != month:
+            continue
+        totales[consumo.persona_id] = totales.get(consumo.persona_id, 0) + consumo.minutos
+    return totales
+
+
 def acumular_consumo_anual_por_personas(
     *,
     personas: list[Persona],
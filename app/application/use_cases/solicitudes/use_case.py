@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from app.application.dto import (
     ConflictoDiaDTO,
@@ -70,7 +70,7 @@ from app.application.use_cases.solicitudes.servicio_saldos import (
     acumular_consumo_anual_por_personas as _acumular_consumo_anual_por_personas,
     calcular_totales_globales as _calcular_totales_globales,
     construir_resumen_saldos as _construir_resumen_saldos,
-    sumar_consumo_solicitudes as _sumar_consumo_solicitudes,
+    indexar_consumo_por_persona as _indexar_consumo_por_persona,
     sugerir_nombre_pdf_historico as _sugerir_nombre_pdf_historico,
 )
 from app.application.use_cases.solicitudes.auxiliares_caso_uso import (
@@ -105,7 +105,7 @@ from app.application.use_cases.solicitudes.orquestacion_pendientes import (
 from app.application.use_cases.solicitudes.validacion_service import (
     build_periodo_filtro as _build_periodo_filtro,
     calcular_minutos as _calcular_minutos,
-    calcular_saldos as _calcular_saldos,
+    calcular_saldos_desde_consumo as _calcular_saldos_desde_consumo,
     normalize_date,
     parse_year_month as _parse_year_month,
     solicitud_key,
@@ -152,21 +152,22 @@ class SolicitudUseCases:
         return [_solicitud_to_dto(s) for s in self._repo.list_by_persona(persona_id)]
 
     def listar_historico(self) -> Iterable[SolicitudDTO]:
-        """Lista el histórico consolidado con paginación defensiva y sin consultas N+1."""
-        limite = 500
-        offset = 0
-        solicitudes: list[SolicitudDTO] = []
-
+        """Lista el histórico consolidado completo; para grandes volúmenes usar `iterar_historico`."""
+        return list(self.iterar_historico())
+
+    def iterar_historico(self, batch_size: int = 500) -> Iterator[SolicitudDTO]:
+        """Recorre el histórico por páginas keyset con memoria acotada a `batch_size` filas."""
+        if batch_size <= 0:
+            raise ValueError("batch_size debe ser mayor que cero.")
+        cursor: tuple[str, int] | None = None
         while True:
-            lote = list(self._repo.list_historico_batch(limit=limite, offset=offset))
-            if not lote:
-                break
-            solicitudes.extend(_solicitud_to_dto(solicitud) for solicitud in lote)
-            if len(lote) < limite:
-                break
-            offset += limite
-
-        return solicitudes
+            lote = list(self._repo.list_historico_batch(limit=batch_size, after=cursor))
+            for solicitud in lote:
+                yield _solicitud_to_dto(solicitud)
+            if len(lote) < batch_size:
+                return
+            ultima = lote[-1]
+            cursor = (ultima.fecha_pedida, int(ultima.id or 0))
 
     def _personas_por_solicitudes(
         self, solicitudes: list[SolicitudDTO]
@@ -517,13 +518,12 @@ class SolicitudUseCases:
         persona = self._persona_repo.get_by_id(persona_id)
         if persona is None:
             raise BusinessRuleError("Persona no encontrada.")
-        solicitudes_mes = self._repo.list_by_persona_and_period(
-            persona_id, filtro.year, filtro.month
+        consumos = list(self._repo.list_consumo_mensual(filtro.year, persona_id))
+        return _calcular_saldos_desde_consumo(
+            persona,
+            consumidas_mes=_indexar_consumo_por_persona(consumos, month=filtro.month).get(persona_id, 0),
+            consumidas_ano=_indexar_consumo_por_persona(consumos).get(persona_id, 0),
         )
-        solicitudes_ano = self._repo.list_by_persona_and_period(
-            persona_id, filtro.year, None
-        )
-        return _calcular_saldos(persona, solicitudes_mes, solicitudes_ano)
 
     def eliminar_solicitud(
         self,
@@ -722,13 +722,8 @@ class SolicitudUseCases:
         return calcular_totales_globales_desde_fuentes(
             filtro=filtro,
             personas=personas,
-            listar_consumos=lambda persona_id, year, month: [
-                solicitud.horas_solicitadas_min
-                for solicitud in self._repo.list_by_persona_and_period(
-                    persona_id, year, month
-                )
-            ],
-            sumar_consumo=_sumar_consumo_solicitudes,
+            listar_consumo_mensual=self._repo.list_consumo_mensual,
+            indexar_consumo=_indexar_consumo_por_persona,
             calcular_totales=_calcular_totales_globales,
         )
 
@@ -743,8 +738,8 @@ class SolicitudUseCases:
             persona=persona,
             persona_id=persona_id,
             filtro=filtro,
-            listar_periodo=self._repo.list_by_persona_and_period,
-            sumar_consumo=_sumar_consumo_solicitudes,
+            listar_consumo_mensual=self._repo.list_consumo_mensual,
+            indexar_consumo=_indexar_consumo_por_persona,
             acumular_consumo_anual=_acumular_consumo_anual_por_personas,
             bolsa_grupo=bolsa_grupo,
             personas=personas,
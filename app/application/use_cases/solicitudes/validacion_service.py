@@ -99,8 +99,19 @@ def calcular_saldos(
     solicitudes_mes: Iterable[Solicitud],
     solicitudes_ano: Iterable[Solicitud],
 ) -> SaldosDTO:
-    consumidas_mes = sum(s.horas_solicitadas_min for s in solicitudes_mes)
-    consumidas_ano = sum(s.horas_solicitadas_min for s in solicitudes_ano)
+    return calcular_saldos_desde_consumo(
+        persona,
+        consumidas_mes=sum(s.horas_solicitadas_min for s in solicitudes_mes),
+        consumidas_ano=sum(s.horas_solicitadas_min for s in solicitudes_ano),
+    )
+
+
+def calcular_saldos_desde_consumo(
+    persona: Persona,
+    *,
+    consumidas_mes: int,
+    consumidas_ano: int,
+) -> SaldosDTO:
     restantes_mes = persona.horas_mes_min - consumidas_mes
     restantes_ano = persona.horas_ano_min - consumidas_ano
     exceso_mes = abs(restantes_mes) if restantes_mes < 0 else 0
@@ -4,6 +4,8 @@ from typing import Any
 
 from app.application.sheets_service import SHEETS_SCHEMA
 from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets import sync_outbox
+from app.domain.utc_timestamps import to_canonical_utc
 
 
 def push_pdf_log(service: Any, spreadsheet: Any, last_sync_at: str | None) -> int:
@@ -11,6 +13,8 @@ def push_pdf_log(service: Any, spreadsheet: Any, last_sync_at: str | None) -> in
     headers, rows = service._rows_with_index(worksheet)
     header_map = service._header_map(headers, SHEETS_SCHEMA["pdf_log"])
     remote_index = {row["pdf_id"]: row for _, row in rows if row.get("pdf_id")}
+    lote = sync_outbox.abrir_lote(service._connection, "pdf_log", last_sync_at=last_sync_at)
+    filtro, params = sync_outbox.filtro_sql(lote, "pdf_id")
     cursor = service._connection.cursor()
     cursor.execute(
         """
@@ -18,14 +22,16 @@ def push_pdf_log(service: Any, spreadsheet: Any, last_sync_at: str | None) -> in
         FROM pdf_log
         WHERE updated_at IS NOT NULL
         """
+        + filtro,
+        params,
     )
     uploaded = 0
     for row in cursor.fetchall():
         if not sync_sheets_core.is_after_last_sync(row["updated_at"], last_sync_at):
             continue
         remote_row = remote_index.get(row["pdf_id"])
-        remote_updated_at = sync_sheets_core.parse_iso(remote_row.get("updated_at") if remote_row else None)
-        local_updated_at = sync_sheets_core.parse_iso(row["updated_at"])
+        remote_updated_at = to_canonical_utc(remote_row.get("updated_at") if remote_row else None)
+        local_updated_at = to_canonical_utc(row["updated_at"])
         if remote_row and remote_updated_at and local_updated_at and remote_updated_at > local_updated_at:
             continue
         payload = {
@@ -45,6 +51,7 @@ def push_pdf_log(service: Any, spreadsheet: Any, last_sync_at: str | None) -> in
         service._append_row(worksheet, header_map, payload)
         uploaded += 1
     service._flush_write_batches(spreadsheet, worksheet)
+    sync_outbox.confirmar_lote(service._connection, lote)
     return uploaded
 
 
@@ -53,6 +60,8 @@ def push_config(service: Any, spreadsheet: Any, last_sync_at: str | None) -> int
     headers, rows = service._rows_with_index(worksheet)
     header_map = service._header_map(headers, SHEETS_SCHEMA["config"])
     remote_index = {row["key"]: row for _, row in rows if row.get("key")}
+    lote = sync_outbox.abrir_lote(service._connection, "sync_config", last_sync_at=last_sync_at)
+    filtro, params = sync_outbox.filtro_sql(lote, "key")
     cursor = service._connection.cursor()
     cursor.execute(
         """
@@ -60,14 +69,16 @@ def push_config(service: Any, spreadsheet: Any, last_sync_at: str | None) -> int
         FROM sync_config
         WHERE updated_at IS NOT NULL
         """
+        + filtro,
+        params,
     )
     uploaded = 0
     for row in cursor.fetchall():
         if not sync_sheets_core.is_after_last_sync(row["updated_at"], last_sync_at):
             continue
         remote_row = remote_index.get(row["key"])
-        remote_updated_at = sync_sheets_core.parse_iso(remote_row.get("updated_at") if remote_row else None)
-        local_updated_at = sync_sheets_core.parse_iso(row["updated_at"])
+        remote_updated_at = to_canonical_utc(remote_row.get("updated_at") if remote_row else None)
+        local_updated_at = to_canonical_utc(row["updated_at"])
         if remote_row and remote_updated_at and local_updated_at and remote_updated_at > local_updated_at:
             continue
         payload = {
@@ -84,6 +95,7 @@ def push_config(service: Any, spreadsheet: Any, last_sync_at: str | None) -> int
         service._append_row(worksheet, header_map, payload)
         uploaded += 1
     service._flush_write_batches(spreadsheet, worksheet)
+    sync_outbox.confirmar_lote(service._connection, lote)
     return uploaded
 
 
@@ -92,6 +104,8 @@ def push_delegadas(service: Any, spreadsheet: Any, last_sync_at: str | None) ->
     headers, rows = service._rows_with_index(worksheet)
     header_map = service._header_map(headers, SHEETS_SCHEMA["delegadas"])
     remote_index = service._uuid_index(rows)
+    lote = sync_outbox.abrir_lote(service._connection, "personas", last_sync_at=last_sync_at)
+    filtro, params = sync_outbox.filtro_sql(lote, "id", clave_entera=True)
     cursor = service._connection.cursor()
     cursor.execute(
         """
@@ -100,6 +114,8 @@ def push_delegadas(service: Any, spreadsheet: Any, last_sync_at: str | None) ->
         FROM personas
         WHERE updated_at IS NOT NULL
         """
+        + filtro,
+        params,
     )
     uploaded = 0
     conflicts = 0
@@ -108,7 +124,7 @@ def push_delegadas(service: Any, spreadsheet: Any, last_sync_at: str | None) ->
             continue
         uuid_value = row["uuid"]
         remote_row = remote_index.get(uuid_value)
-        remote_updated_at = sync_sheets_core.parse_iso(remote_row.get("updated_at") if remote_row else None)
+        remote_updated_at = to_canonical_utc(remote_row.get("updated_at") if remote_row else None)
         if sync_sheets_core.is_conflict(row["updated_at"], remote_updated_at, last_sync_at):
             service._store_conflict("delegadas", uuid_value, dict(row), remote_row or {})
             conflicts += 1
@@ -132,4 +148,5 @@ def push_delegadas(service: Any, spreadsheet: Any, last_sync_at: str | None) ->
         service._append_row(worksheet, header_map, payload)
         uploaded += 1
     service._flush_write_batches(spreadsheet, worksheet)
+    sync_outbox.confirmar_lote(service._connection, lote)
     return uploaded, conflicts
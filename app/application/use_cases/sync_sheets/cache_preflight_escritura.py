@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from app.domain.utc_timestamps import CANONICAL_UTC_FORMAT, format_canonical_utc
+
+logger = logging.getLogger(__name__)
+
+# Vigencia de un preflight de escritura correcto; 0 desactiva la caché.
+TTL_PREFLIGHT_POR_DEFECTO_SEGUNDOS = 6 * 60 * 60
+ENV_TTL_PREFLIGHT = "SYNC_PREFLIGHT_TTL_SECONDS"
+
+# Las entradas viven en ``sync_config`` con ``updated_at`` a NULL: ni los triggers del outbox
+# ni el push de la hoja ``config`` las ven, así que nunca salen del equipo.
+_PREFIJO_CLAVE = "preflight_escritura|"
+
+
+def ttl_preflight_segundos(configurado: float | None = None) -> float:
+    """TTL del preflight: el del servicio, ``SYNC_PREFLIGHT_TTL_SECONDS`` o el valor por defecto."""
+    if configurado is not None:
+        if configurado < 0:
+            raise ValueError("El TTL del preflight no puede ser negativo")
+        return float(configurado)
+    texto = os.getenv(ENV_TTL_PREFLIGHT, "").strip()
+    if not texto:
+        return float(TTL_PREFLIGHT_POR_DEFECTO_SEGUNDOS)
+    try:
+        valor = float(texto)
+    except ValueError:
+        valor = -1.0
+    if valor < 0:
+        logger.warning("%s=%r no es válido; se usa un TTL de %ss", ENV_TTL_PREFLIGHT, texto, TTL_PREFLIGHT_POR_DEFECTO_SEGUNDOS)
+        return float(TTL_PREFLIGHT_POR_DEFECTO_SEGUNDOS)
+    return valor
+
+
+def clave_preflight(spreadsheet_id: str, cuenta_servicio: str, worksheet: str) -> str:
+    return f"{_PREFIJO_CLAVE}{spreadsheet_id}|{cuenta_servicio}|{worksheet}"
+
+
+def preflight_vigente(connection: Any, clave: str, ttl_segundos: float, *, ahora: datetime | None = None) -> bool:
+    if ttl_segundos <= 0:
+        return False
+    cursor = connection.cursor()
+    cursor.execute("SELECT value FROM sync_config WHERE key = ?", (clave,))
+    row = cursor.fetchone()
+    if not row or not row[0]:
+        return False
+    try:
+        verificado = datetime.strptime(str(row[0]), CANONICAL_UTC_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return False
+    ahora = ahora or datetime.now(timezone.utc)
+    # Un reloj que ha ido hacia atrás invalida la entrada en lugar de alargarla.
+    return verificado <= ahora < verificado + timedelta(seconds=ttl_segundos)
+
+
+def registrar_preflight(connection: Any, clave: str, *, ahora: datetime | None = None) -> None:
+    verificado = format_canonical_utc(ahora or datetime.now(timezone.utc))
+    connection.cursor().execute(
+        """
+        INSERT INTO sync_config (key, value, updated_at, source_device) VALUES (?, ?, NULL, NULL)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """,
+        (clave, verificado),
+    )
+    connection.commit()
+
+
+def invalidar_preflights(connection: Any) -> None:
+    """Borra todos los preflights guardados: tras un error de permisos ninguno es fiable."""
+    connection.cursor().execute(
+        "DELETE FROM sync_config WHERE substr(key, 1, ?) = ?", (len(_PREFIJO_CLAVE), _PREFIJO_CLAVE)
+    )
+    connection.commit()
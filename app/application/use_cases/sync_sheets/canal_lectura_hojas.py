@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterator
+
+from app.core.errors import InfraError
+from app.domain.sheets_errors import SheetsRateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Páginas en cola entre el hilo de lectura y el de aplicación: acota la memoria en vuelo.
+MAX_PAGINAS_EN_COLA = 4
+FILAS_POR_PAGINA = 1000
+
+_FIN_HOJA = object()
+_ESPERA_COLA_SEGUNDOS = 0.1
+
+
+@dataclass(frozen=True)
+class MetricasCanalLectura:
+    hojas: int
+    paginas: int
+    lectura_s: float
+    espera_consumidor_s: float
+    espera_productor_s: float
+
+    @property
+    def solapado_s(self) -> float:
+        """Tiempo de red que quedó oculto tras el trabajo local (lectura que no tuvo que esperarse)."""
+        return max(self.lectura_s - self.espera_consumidor_s, 0.0)
+
+
+class CanalLecturaHojas:
+    """Lee las hojas del pull en un hilo propio mientras el hilo principal aplica las anteriores.
+
+    El productor recorre ``hojas`` en orden y deja páginas de filas en una cola acotada; el
+    consumidor pide cada hoja con ``filas`` en el mismo orden. El hilo de lectura solo usa el
+    cliente de Sheets (antes de las páginas, ``precarga`` lee con un ``values_batch_get`` las
+    hojas que el cliente deja en su caché): ni SQLite ni el estado del servicio se tocan fuera
+    del hilo que consume, que consulta ``hojas_precargadas`` tras ``cerrar``. Si se
+    pide una hoja fuera de orden, que no estaba prevista o después de un error de lectura,
+    ``filas`` devuelve ``None`` y el llamador lee la hoja directamente.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        hojas: list[str],
+        *,
+        precarga: dict[str, str] | None = None,
+        max_paginas: int = MAX_PAGINAS_EN_COLA,
+        filas_por_pagina: int = FILAS_POR_PAGINA,
+    ) -> None:
+        self._client = client
+        self._hojas = list(dict.fromkeys(hojas))
+        self._precarga = dict(precarga or {})
+        self._precarga_completa = False
+        self._filas_por_pagina = filas_por_pagina
+        self._cola: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=max(max_paginas, 1))
+        self._parar = threading.Event()
+        self._hilo: threading.Thread | None = None
+        self._siguiente = 0
+        self._en_curso: str | None = None
+        self._roto = False
+        self._paginas = 0
+        self._lectura_s = 0.0
+        self._espera_consumidor_s = 0.0
+        self._espera_productor_s = 0.0
+
+    def iniciar(self) -> None:
+        self._hilo = threading.Thread(target=self._producir, name="sync-pull-lectura", daemon=True)
+        self._hilo.start()
+
+    def filas(self, hoja: str) -> Iterator[list[str]] | None:
+        if self._roto or self._hilo is None or hoja not in self._hojas[self._siguiente :]:
+            return None
+        # Lo que queda de la hoja anterior y las hojas previstas que el pull no ha pedido se
+        # descartan para que la cola no se quede bloqueada.
+        if self._en_curso is not None and not self._descartar(self._en_curso):
+            return None
+        while self._hojas[self._siguiente] != hoja:
+            if not self._descartar(self._hojas[self._siguiente]):
+                return None
+            self._siguiente += 1
+        self._siguiente += 1
+        self._en_curso = hoja
+        return self._filas_de(hoja)
+
+    @property
+    def hojas_precargadas(self) -> list[str]:
+        return list(self._precarga) if self._precarga_completa else []
+
+    def cerrar(self) -> MetricasCanalLectura:
+        self._parar.set()
+        while True:
+            try:
+                self._cola.get_nowait()
+            except queue.Empty:
+                break
+        if self._hilo is not None:
+            self._hilo.join(timeout=5)
+        return MetricasCanalLectura(
+            hojas=self._siguiente,
+            paginas=self._paginas,
+            lectura_s=self._lectura_s,
+            espera_consumidor_s=self._espera_consumidor_s,
+            espera_productor_s=self._espera_productor_s,
+        )
+
+    def _filas_de(self, hoja: str) -> Iterator[list[str]]:
+        for pagina in self._paginas_de(hoja):
+            yield from pagina
+        self._en_curso = None
+
+    def _descartar(self, hoja: str) -> bool:
+        try:
+            for _ in self._paginas_de(hoja):
+                pass
+        except Exception:  # noqa: BLE001 - lo descartado no se usa; el llamador lee directamente
+            return False
+        self._en_curso = None
+        return True
+
+    def _paginas_de(self, hoja: str) -> Iterator[list[list[str]]]:
+        while True:
+            inicio = time.perf_counter()
+            try:
+                nombre, contenido = self._recibir()
+            finally:
+                self._espera_consumidor_s += time.perf_counter() - inicio
+            if isinstance(contenido, BaseException):
+                self._roto = True
+                raise contenido
+            if contenido is _FIN_HOJA:
+                return
+            if nombre != hoja:  # pragma: no cover - el productor sigue el orden de ``_hojas``
+                raise RuntimeError(f"Canal de lectura desordenado: se esperaba {hoja} y llegó {nombre}")
+            yield contenido
+
+    def _recibir(self) -> tuple[str, Any]:
+        """Siguiente elemento de la cola; falla en vez de esperar si el productor ya no está vivo."""
+        while True:
+            try:
+                return self._cola.get(timeout=_ESPERA_COLA_SEGUNDOS)
+            except queue.Empty:
+                if self._hilo is not None and self._hilo.is_alive():
+                    continue
+            # El productor pudo dejar su último elemento justo antes de terminar.
+            try:
+                return self._cola.get_nowait()
+            except queue.Empty:
+                self._roto = True
+                raise RuntimeError("El hilo de lectura del pull terminó sin entregar todas las hojas") from None
+
+    def _producir(self) -> None:
+        try:
+            if self._precarga:
+                inicio = time.perf_counter()
+                self._precargar()
+                self._lectura_s += time.perf_counter() - inicio
+            for hoja in self._hojas:
+                inicio = time.perf_counter()
+                filas = self._leer(hoja)
+                self._lectura_s += time.perf_counter() - inicio
+                while True:
+                    inicio = time.perf_counter()
+                    pagina = list(islice(filas, self._filas_por_pagina))
+                    self._lectura_s += time.perf_counter() - inicio
+                    if not pagina:
+                        break
+                    self._paginas += 1
+                    if not self._poner(hoja, pagina):
+                        return
+                if not self._poner(hoja, _FIN_HOJA):
+                    return
+        except Exception as exc:  # noqa: BLE001 - el error se entrega al consumidor en su hilo
+            logger.debug("Lectura en segundo plano interrumpida", exc_info=True)
+            self._poner("", exc)
+
+    def _precargar(self) -> None:
+        try:
+            self._client.batch_get_ranges(list(self._precarga.values()))
+        except SheetsRateLimitError:
+            raise
+        except InfraError:
+            logger.debug("No se pudo precargar valores de worksheets; se leerán bajo demanda.", exc_info=True)
+            return
+        self._precarga_completa = True
+
+    def _leer(self, hoja: str) -> Iterator[list[str]]:
+        iter_values = getattr(self._client, "iter_values", None)
+        if iter_values is not None:
+            return iter(iter_values(hoja))
+        return iter(self._client.read_all_values(hoja))
+
+    def _poner(self, hoja: str, contenido: Any) -> bool:
+        inicio = time.perf_counter()
+        try:
+            while not self._parar.is_set():
+                try:
+                    self._cola.put((hoja, contenido), timeout=_ESPERA_COLA_SEGUNDOS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self._espera_productor_s += time.perf_counter() - inicio
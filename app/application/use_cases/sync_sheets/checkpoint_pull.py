@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from app.domain.utc_timestamps import utc_now_canonical
+
+logger = logging.getLogger(__name__)
+
+# Filas remotas que se aplican y confirman juntas; cada bloque confirmado deja un checkpoint.
+FILAS_POR_BLOQUE_PULL = 2000
+ENV_FILAS_POR_BLOQUE_PULL = "SYNC_PULL_CHUNK_ROWS"
+
+
+@dataclass(frozen=True)
+class CheckpointPull:
+    worksheet: str
+    row: int
+    revision: str
+
+
+class HuellaHoja:
+    """Huella incremental del contenido remoto de una hoja, fila a fila y en orden.
+
+    Incluye el número de fila para que insertar o borrar filas (también vacías) cambie la
+    huella aunque el contenido de las demás sea el mismo.
+    """
+
+    def __init__(self, headers: Iterable[Any]) -> None:
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._agregar(0, headers)
+
+    def actualizar(self, row_number: int, valores: Iterable[Any]) -> None:
+        self._agregar(row_number, valores)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _agregar(self, row_number: int, valores: Iterable[Any]) -> None:
+        contenido = "\x1f".join("" if valor is None else str(valor) for valor in valores)
+        self._hash.update(f"{row_number}\x1e{contenido}\x1d".encode("utf-8"))
+
+
+def filas_por_bloque_pull(configuradas: int | None = None) -> int:
+    """Tamaño de bloque del pull: el del servicio, ``SYNC_PULL_CHUNK_ROWS`` o el valor por defecto."""
+    if configuradas is not None:
+        if configuradas < 1:
+            raise ValueError("El bloque del pull debe tener al menos una fila")
+        return configuradas
+    texto = os.getenv(ENV_FILAS_POR_BLOQUE_PULL, "").strip()
+    if not texto:
+        return FILAS_POR_BLOQUE_PULL
+    if not texto.isdigit() or int(texto) < 1:
+        logger.warning("%s=%r no es válido; se usan %s filas por bloque", ENV_FILAS_POR_BLOQUE_PULL, texto, FILAS_POR_BLOQUE_PULL)
+        return FILAS_POR_BLOQUE_PULL
+    return int(texto)
+
+
+def _es_esquema_sin_checkpoint(exc: Exception) -> bool:
+    mensaje = str(exc).lower()
+    return "no such column: pull_checkpoint" in mensaje or "no such table: sync_state" in mensaje
+
+
+def cargar_checkpoint(connection: Any) -> CheckpointPull | None:
+    """Checkpoint guardado por un pull interrumpido; ``None`` si no hay o la base no está migrada."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT pull_checkpoint_worksheet, pull_checkpoint_row, pull_checkpoint_revision
+            FROM sync_state WHERE id = 1
+            """
+        )
+    except Exception as exc:
+        if _es_esquema_sin_checkpoint(exc):
+            logger.debug("sync_state sin columnas de checkpoint; el pull no se puede reanudar")
+            return None
+        raise
+    row = cursor.fetchone()
+    if not row or not row[0] or row[1] is None or not row[2]:
+        return None
+    return CheckpointPull(worksheet=str(row[0]), row=int(row[1]), revision=str(row[2]))
+
+
+def guardar_checkpoint(connection: Any, checkpoint: CheckpointPull) -> None:
+    """Registra el checkpoint; el commit lo hace el pull junto con el bloque aplicado."""
+    _actualizar(connection, (checkpoint.worksheet, checkpoint.row, checkpoint.revision, utc_now_canonical()))
+
+
+def borrar_checkpoint(connection: Any) -> None:
+    _actualizar(connection, (None, None, None, None))
+
+
+def _actualizar(connection: Any, valores: tuple[Any, ...]) -> None:
+    try:
+        connection.cursor().execute(
+            """
+            UPDATE sync_state
+            SET pull_checkpoint_worksheet = ?, pull_checkpoint_row = ?, pull_checkpoint_revision = ?, pull_checkpoint_at = ?
+            WHERE id = 1
+            """,
+            valores,
+        )
+    except Exception as exc:
+        if not _es_esquema_sin_checkpoint(exc):
+            raise
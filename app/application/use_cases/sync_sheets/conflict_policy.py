@@ -22,7 +22,7 @@ class ConflictDecision:
 
 def evaluate_conflict_policy(
     local_updated_at: Any,
-    remote_updated_at: datetime | None,
+    remote_updated_at: datetime | str | None,
     last_sync_at: str | None,
 ) -> ConflictDecision:
     """Evalúa la política de conflictos para pull remoto -> local.
@@ -33,8 +33,7 @@ def evaluate_conflict_policy(
     - Si no hay conflicto, se permite continuar con la política normal (overwrite/skip según recencia).
     """
 
-    remote_value = remote_updated_at.isoformat() if remote_updated_at else None
-    has_conflict = conflicts.is_conflict(local_updated_at, remote_value, last_sync_at)
+    has_conflict = conflicts.is_conflict(local_updated_at, remote_updated_at, last_sync_at)
     if has_conflict:
         return ConflictDecision(
             outcome=ConflictOutcome.DIVERGENT_CONFLICT,
@@ -48,5 +47,5 @@ def evaluate_conflict_policy(
     )
 
 
-def is_conflict(local_updated_at: Any, remote_updated_at: datetime | None, last_sync_at: str | None) -> bool:
+def is_conflict(local_updated_at: Any, remote_updated_at: datetime | str | None, last_sync_at: str | None) -> bool:
     return evaluate_conflict_policy(local_updated_at, remote_updated_at, last_sync_at).should_register_conflict
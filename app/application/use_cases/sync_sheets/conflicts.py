@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
+from app.domain.utc_timestamps import to_canonical_utc
+
 
 def parse_iso(value: Any) -> datetime | None:
     if not value:
@@ -17,9 +19,9 @@ def parse_iso(value: Any) -> datetime | None:
 def is_conflict(local_updated_at: Any, remote_updated_at: Any, last_sync_at: str | None) -> bool:
     if not local_updated_at or not remote_updated_at or not last_sync_at:
         return False
-    sync_at = parse_iso(last_sync_at)
-    local_at = parse_iso(local_updated_at)
-    remote_at = parse_iso(remote_updated_at)
+    sync_at = to_canonical_utc(last_sync_at)
+    local_at = to_canonical_utc(local_updated_at)
+    remote_at = to_canonical_utc(remote_updated_at)
     if not sync_at or not local_at or not remote_at:
         return False
     return local_at > sync_at and remote_at > sync_at
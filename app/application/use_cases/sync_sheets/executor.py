@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import logging
 from typing import Any
 
+from app.application.use_cases.sync_sheets.snapshot_remoto_plan import snapshot_vigente
 from app.domain.sync_models import SyncExecutionPlan, SyncSummary
 
+logger = logging.getLogger(__name__)
+
 
 def execute_plan(service: Any, spreadsheet: Any, plan: SyncExecutionPlan) -> SyncSummary:
+    if plan.remote_snapshot is not None:
+        if snapshot_vigente(service._client, plan.remote_snapshot):
+            logger.info("Plan de sync: la hoja %s no cambió desde la simulación; se reutiliza el snapshot.", plan.worksheet)
+        else:
+            logger.info("Plan de sync: la hoja %s cambió desde la simulación; se recalcula el plan.", plan.worksheet)
+            plan = service._build_solicitudes_sync_plan(spreadsheet)
     worksheet = service._get_worksheet(spreadsheet, plan.worksheet)
     values = [list(row) for row in plan.values_matrix]
     worksheet.update("A1", values)
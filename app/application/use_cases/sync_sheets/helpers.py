@@ -3,7 +3,9 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from app.application.use_cases.sync_sheets.snapshot_remoto_plan import construir_snapshot_remoto
 from app.domain.sync_models import SyncExecutionPlan, SyncFieldDiff, SyncPlanItem
+from app.domain.utc_timestamps import canonical_utc_or_raw
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +73,7 @@ def build_solicitudes_sync_plan(
         conflicts=tuple(conflicts),
         potential_errors=tuple(errors),
         values_matrix=tuple(values),
+        remote_snapshot=construir_snapshot_remoto("solicitudes", headers, rows),
     )
 
 
@@ -235,7 +238,7 @@ def construir_payload_insercion_solicitud(
         fila_remota.get("pdf_id"),
         1,
         fecha_creacion,
-        fila_remota.get("updated_at") or funcion_ahora_iso(),
+        canonical_utc_or_raw(fila_remota.get("updated_at")) or funcion_ahora_iso(),
         fila_remota.get("source_device"),
         funcion_entero(fila_remota.get("deleted")),
     )
@@ -262,7 +265,7 @@ def construir_payload_actualizacion_solicitud(
         fila_remota.get("notas") or "",
         fila_remota.get("pdf_id"),
         fecha_creacion,
-        fila_remota.get("updated_at") or funcion_ahora_iso(),
+        canonical_utc_or_raw(fila_remota.get("updated_at")) or funcion_ahora_iso(),
         fila_remota.get("source_device"),
         funcion_entero(fila_remota.get("deleted")),
         solicitud_id,
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import canonical_header_map, iter_valores_con_indice
+
+# Mismo orden de campos que el dict de ``sync_sheets_core.normalize_remote_solicitud_row``.
+CAMPOS_SOLICITUD_REMOTA = (
+    "uuid",
+    "delegada_uuid",
+    "delegada_nombre",
+    "fecha",
+    "desde",
+    "hasta",
+    "desde_h",
+    "desde_m",
+    "hasta_h",
+    "hasta_m",
+    "completo",
+    "minutos_total",
+    "horas",
+    "notas",
+    "estado",
+    "created_at",
+    "updated_at",
+    "source_device",
+    "deleted",
+    "pdf_id",
+)
+
+# Claves de la fila remota que consulta la normalización (campos y alias legacy).
+_CLAVES_ORIGEN = (
+    "uuid",
+    "delegada_uuid",
+    "delegado_uuid",
+    "delegada_nombre",
+    "Delegada",
+    "delegado_nombre",
+    "delegada",
+    "delegado",
+    "fecha",
+    "fecha_pedida",
+    "desde",
+    "hora_desde",
+    "hasta",
+    "hora_hasta",
+    "desde_h",
+    "desde_m",
+    "hasta_h",
+    "hasta_m",
+    "completo",
+    "minutos_total",
+    "horas",
+    "notas",
+    "estado",
+    "created_at",
+    "updated_at",
+    "source_device",
+    "deleted",
+    "pdf_id",
+)
+
+# ``row.get(clave)`` de una clave ausente; ``estado`` se lee con ``row.get("estado", "")``.
+_VALOR_AUSENTE: dict[str, Any] = {"estado": ""}
+
+_HOJAS_HISTORICO = {"histórico", "historico"}
+
+
+class IndiceColumnasHoja:
+    """Alias de la cabecera resueltos a índices de columna una sola vez por hoja.
+
+    ``valores`` devuelve por fila una tupla con los mismos valores, en el mismo orden, que el
+    dict de ``iter_rows_with_index`` (sin ``__row_number__``): celdas ausentes como ``""`` y,
+    si varios alias caen en el mismo campo, el primer valor no vacío.
+    """
+
+    def __init__(self, headers: list[Any], aliases: dict[str, list[str]] | None = None) -> None:
+        canonical_by_header = canonical_header_map(headers, aliases)
+        indice_por_cabecera: dict[Any, int] = {}
+        for indice, header in enumerate(headers):
+            if str(header).strip():
+                indice_por_cabecera[header] = indice
+        indices_por_campo: dict[str, list[int]] = {}
+        for header, indice in indice_por_cabecera.items():
+            indices_por_campo.setdefault(canonical_by_header.get(header, header), []).append(indice)
+        self.claves: tuple[str, ...] = tuple(indices_por_campo)
+        self._indices = tuple(tuple(indices) for indices in indices_por_campo.values())
+        self._posiciones = {clave: posicion for posicion, clave in enumerate(self.claves)}
+        self._ancho = len(headers)
+
+    def valores(self, fila: list[Any]) -> tuple[Any, ...]:
+        if len(fila) < self._ancho:
+            fila = [*fila, *([""] * (self._ancho - len(fila)))]
+        return tuple(
+            fila[indices[0]] if len(indices) == 1 else _primero_no_vacio(fila, indices) for indices in self._indices
+        )
+
+    def valor(self, valores: tuple[Any, ...], clave: str) -> Any:
+        """``row.get(clave)`` sobre la tupla de ``valores``."""
+        posicion = self._posiciones.get(clave)
+        return None if posicion is None else valores[posicion]
+
+    def columnas(self, filas: list[tuple[Any, ...]]) -> dict[str, list[Any]]:
+        """Columnas que consulta ``normalizar_columnas_solicitud``, a partir de tuplas de ``valores``."""
+        return {
+            clave: [fila[self._posiciones[clave]] for fila in filas]
+            for clave in _CLAVES_ORIGEN
+            if clave in self._posiciones
+        }
+
+
+def columnas_desde_valores(
+    values: list[list[Any]], aliases: dict[str, list[str]] | None = None
+) -> tuple[list[int], dict[str, list[Any]]]:
+    """Columnas de la hoja por nombre canónico, como las lee el pull de solicitudes.
+
+    Reproduce ``rows_with_index``: omite filas vacías y devuelve los números de fila de la
+    hoja junto con las columnas alineadas con ellos.
+    """
+    if not values:
+        return [], {}
+    indice = IndiceColumnasHoja(values[0], aliases)
+    numeros: list[int] = []
+    filas: list[tuple[Any, ...]] = []
+    for row_number, fila in iter_valores_con_indice(values[1:]):
+        numeros.append(row_number)
+        filas.append(indice.valores(fila))
+    return numeros, indice.columnas(filas)
+
+
+def columnas_desde_filas(filas: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Columnas a partir de filas ya convertidas en dict (p. ej. las de ``_rows_with_index``)."""
+    return {clave: [fila.get(clave, _VALOR_AUSENTE.get(clave)) for fila in filas] for clave in _CLAVES_ORIGEN}
+
+
+def normalizar_filas_solicitud(filas: list[dict[str, Any]], worksheet_name: str) -> list[tuple[Any, ...]]:
+    return normalizar_columnas_solicitud(columnas_desde_filas(filas), len(filas), worksheet_name)
+
+
+def normalizar_columnas_solicitud(
+    columnas: dict[str, list[Any]], total: int, worksheet_name: str
+) -> list[tuple[Any, ...]]:
+    """Equivalente columnar de ``normalize_remote_solicitud_row``.
+
+    Cada campo se calcula en un bucle sobre su columna, y fechas, horas y estados se
+    parsean una vez por valor distinto. Devuelve una tupla por fila con los campos en el
+    orden de ``CAMPOS_SOLICITUD_REMOTA``.
+    """
+
+    def columna(clave: str) -> list[Any]:
+        valores = columnas.get(clave)
+        return [_VALOR_AUSENTE.get(clave)] * total if valores is None else valores
+
+    uuid = _texto(columna("uuid"))
+    delegada_uuid, delegada_nombre = _campos_delegada(columna)
+    fecha = _por_valor(_fecha_iso, _primero(columna("fecha"), columna("fecha_pedida")))
+    created_at = [
+        creada or fecha_pedida or ""
+        for creada, fecha_pedida in zip(_por_valor(_fecha_iso, _texto(columna("created_at"))), fecha)
+    ]
+    desde = _primero(columna("desde"), columna("hora_desde"))
+    hasta = _primero(columna("hasta"), columna("hora_hasta"))
+    desde_h, desde_m = _partes_hora(columna("desde_h"), columna("desde_m"), desde)
+    hasta_h, hasta_m = _partes_hora(columna("hasta_h"), columna("hasta_m"), hasta)
+    minutos_total = _minutos_total(columna("minutos_total"), columna("horas"))
+    estado_por_defecto = "historico" if worksheet_name.strip().lower() in _HOJAS_HISTORICO else ""
+    estado = _por_valor(lambda valor: str(valor).strip().lower() or estado_por_defecto, columna("estado"))
+    return list(
+        zip(
+            uuid,
+            delegada_uuid,
+            delegada_nombre,
+            fecha,
+            desde,
+            hasta,
+            desde_h,
+            desde_m,
+            hasta_h,
+            hasta_m,
+            _texto(columna("completo")),
+            minutos_total,
+            _texto(columna("horas")),
+            _texto(columna("notas")),
+            estado,
+            created_at,
+            _texto(columna("updated_at")),
+            _texto(columna("source_device")),
+            _texto(columna("deleted")),
+            _texto(columna("pdf_id")),
+        )
+    )
+
+
+def _campos_delegada(columna: Callable[[str], list[Any]]) -> tuple[list[Any], list[Any]]:
+    delegada_uuid = [
+        alternativo if actual in (None, "") and alternativo not in (None, "") else (actual or "")
+        for actual, alternativo in zip(columna("delegada_uuid"), columna("delegado_uuid"))
+    ]
+    delegada_nombre = [
+        (nombre or legacy or "") if nombre not in (None, "") else (legacy or delegado_nombre or delegada or delegado or "")
+        for nombre, legacy, delegado_nombre, delegada, delegado in zip(
+            columna("delegada_nombre"),
+            columna("Delegada"),
+            columna("delegado_nombre"),
+            columna("delegada"),
+            columna("delegado"),
+        )
+    ]
+    return delegada_uuid, delegada_nombre
+
+
+def _minutos_total(minutos_total: list[Any], horas: list[Any]) -> list[Any]:
+    # Sin ``minutos_total`` se toman las ``horas`` legacy como minutos enteros.
+    return [
+        sync_sheets_core.int_or_zero(hora) if minutos in (None, "") and hora not in (None, "") else (minutos or "")
+        for minutos, hora in zip(minutos_total, horas)
+    ]
+
+
+def _primero_no_vacio(fila: list[Any], indices: tuple[int, ...]) -> Any:
+    valor = fila[indices[0]]
+    for indice in indices[1:]:
+        if str(valor).strip():
+            break
+        valor = fila[indice]
+    return valor
+
+
+def _texto(valores: list[Any]) -> list[Any]:
+    return [valor or "" for valor in valores]
+
+
+def _primero(principal: list[Any], alternativo: list[Any]) -> list[Any]:
+    return [valor or otro or "" for valor, otro in zip(principal, alternativo)]
+
+
+def _fecha_iso(valor: Any) -> str:
+    return sync_sheets_core.normalize_date(valor) or ""
+
+
+def _por_valor(funcion: Callable[[Any], Any], valores: Iterable[Any]) -> list[Any]:
+    # Las hojas repiten mucho fechas, horas y estados: se parsea una vez por valor distinto.
+    cache: dict[Any, Any] = {}
+    resultado = []
+    for valor in valores:
+        try:
+            resultado.append(cache[valor])
+        except KeyError:
+            cache[valor] = convertido = funcion(valor)
+            resultado.append(convertido)
+    return resultado
+
+
+def _partes_hora(horas: list[Any], minutos: list[Any], completas: list[Any]) -> tuple[list[Any], list[Any]]:
+    partes = _por_valor(lambda clave: _hora_en_partes(*clave), zip(horas, minutos, completas))
+    return [hora for hora, _ in partes], [minuto for _, minuto in partes]
+
+
+def _hora_en_partes(horas: Any, minutos: Any, completa: Any) -> tuple[Any, Any]:
+    hhmm = sync_sheets_core.remote_hhmm(horas, minutos, completa)
+    if not hhmm:
+        return "", ""
+    hora, minuto = hhmm.split(":")
+    return int(hora), int(minuto)
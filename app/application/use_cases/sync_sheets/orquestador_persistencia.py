@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from app.application.use_cases import sync_sheets_core
 from app.application.use_cases.sync_sheets import persistence_ops
@@ -12,9 +12,16 @@ from app.application.use_cases.sync_sheets.helpers import (
     normalizar_fechas_solicitud,
 )
 
-from app.application.use_cases.sync_sheets.sync_sheets_helpers import execute_with_validation, rows_with_index
+from app.application.use_cases.sync_sheets.snapshot_local_pull import SnapshotLocalPull
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import (
+    execute_with_validation,
+    iter_rows_with_index,
+    iter_valores_con_indice,
+    rows_with_index,
+)
 from app.application.use_cases.sync_sheets.sync_snapshots import normalize_dia
 from app.domain.sheets_errors import SheetsRateLimitError
+from app.domain.utc_timestamps import canonical_utc_or_raw
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,9 +31,31 @@ class OrquestadorPersistenciaSync:
         def __getattr__(self, name: str) -> Any:
             raise AttributeError(name)
 
+        def _snapshot_pull(self) -> SnapshotLocalPull | None:
+            return getattr(self, "_snapshot_local_pull", None)
+
+        def _solicitud_de_snapshot(self, local_row: dict[str, Any] | None) -> dict[str, Any] | None:
+            snapshot = self._snapshot_pull()
+            if local_row is None or snapshot is None or local_row["id"] is not None:
+                return local_row
+            # Fila insertada en este pull y aún en el lote: se vuelca para conocer su id.
+            lote = getattr(self, "_lote_solicitudes_pull", None)
+            if lote is not None:
+                lote.volcar(self._connection)
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT id FROM solicitudes WHERE uuid = ?", (local_row["uuid"],))
+            fila_id = cursor.fetchone()
+            if fila_id is not None:
+                snapshot.asignar_id_solicitud(local_row, int(fila_id["id"]))
+            return local_row
+
         def _find_solicitud_by_composite_key(self, row: dict[str, Any]) -> Any | None:
             delegada_uuid = str(row.get("delegada_uuid", "")).strip() or None
             persona_id = self._persona_id_from_uuid(delegada_uuid)
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                clave = persistence_ops.solicitud_composite_key(row, persona_id)
+                return self._solicitud_de_snapshot(snapshot.solicitud_por_clave_compuesta(clave))
             return persistence_ops.find_solicitud_by_composite_key(self._connection, row, persona_id)
 
         def _backfill_uuid(self, worksheet: Any, headers: list[str], row_number: int, column: str, value: str) -> None:
@@ -39,6 +68,9 @@ class OrquestadorPersistenciaSync:
             self._queue_values_batch_update(worksheet, row_number, col_idx, value)
 
         def _fetch_solicitud(self, uuid_value: str) -> Any | None:
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                return self._solicitud_de_snapshot(snapshot.solicitud_por_uuid(uuid_value))
             cursor = self._connection.cursor()
             cursor.execute(
                 """
@@ -52,6 +84,9 @@ class OrquestadorPersistenciaSync:
             return cursor.fetchone()
 
         def _fetch_cuadrante(self, uuid_value: str) -> Any | None:
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                return snapshot.cuadrante_por_uuid(uuid_value)
             cursor = self._connection.cursor()
             cursor.execute(
                 """
@@ -139,8 +174,12 @@ class OrquestadorPersistenciaSync:
                     identificador,
                     delegada_nombre,
                 )
-            import app.application.use_cases.sync_sheets.use_case as uc
-            resolved_uuid = uc.get_or_resolve_delegada_uuid(self._connection, delegada_uuid, delegada_nombre)
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                resolved_uuid = snapshot.resolver_delegada_uuid(delegada_uuid, delegada_nombre)
+            else:
+                import app.application.use_cases.sync_sheets.use_case as uc
+                resolved_uuid = uc.get_or_resolve_delegada_uuid(self._connection, delegada_uuid, delegada_nombre)
             if not resolved_uuid:
                 logger.warning("Solicitud omitida por delegada no resuelta: %s", identificador)
                 return None
@@ -190,11 +229,12 @@ class OrquestadorPersistenciaSync:
                     row.get("dia_semana"),
                     sync_sheets_core.join_minutes(row.get("man_h"), row.get("man_m")),
                     sync_sheets_core.join_minutes(row.get("tar_h"), row.get("tar_m")),
-                    row.get("updated_at") or self._now_iso(),
+                    canonical_utc_or_raw(row.get("updated_at")) or self._now_iso(),
                     row.get("source_device"),
                     sync_sheets_core.int_or_zero(row.get("deleted")),
                 ),
             )
+            self._registrar_cuadrante_en_snapshot(cursor.lastrowid, uuid_value, row)
             self._connection.commit()
             self._apply_cuadrante_to_persona(row)
 
@@ -211,15 +251,34 @@ class OrquestadorPersistenciaSync:
                     row.get("dia_semana"),
                     sync_sheets_core.join_minutes(row.get("man_h"), row.get("man_m")),
                     sync_sheets_core.join_minutes(row.get("tar_h"), row.get("tar_m")),
-                    row.get("updated_at") or self._now_iso(),
+                    canonical_utc_or_raw(row.get("updated_at")) or self._now_iso(),
                     row.get("source_device"),
                     sync_sheets_core.int_or_zero(row.get("deleted")),
                     cuadrante_id,
                 ),
             )
+            self._registrar_cuadrante_en_snapshot(cuadrante_id, row.get("uuid"), row)
             self._connection.commit()
             self._apply_cuadrante_to_persona(row)
 
+        def _registrar_cuadrante_en_snapshot(self, cuadrante_id: int | None, uuid_value: Any, row: dict[str, Any]) -> None:
+            snapshot = self._snapshot_pull()
+            if snapshot is None or not uuid_value:
+                return
+            snapshot.registrar_cuadrante(
+                {
+                    "id": cuadrante_id,
+                    "uuid": uuid_value,
+                    "delegada_uuid": row.get("delegada_uuid"),
+                    "dia_semana": row.get("dia_semana"),
+                    "man_min": sync_sheets_core.join_minutes(row.get("man_h"), row.get("man_m")),
+                    "tar_min": sync_sheets_core.join_minutes(row.get("tar_h"), row.get("tar_m")),
+                    "updated_at": canonical_utc_or_raw(row.get("updated_at")) or self._now_iso(),
+                    "source_device": row.get("source_device"),
+                    "deleted": sync_sheets_core.int_or_zero(row.get("deleted")),
+                }
+            )
+
         def _apply_cuadrante_to_persona(self, row: dict[str, Any]) -> None:
             delegada_uuid = row.get("delegada_uuid")
             dia = normalize_dia(str(row.get("dia_semana", "")))
@@ -242,6 +301,9 @@ class OrquestadorPersistenciaSync:
         def _persona_id_from_uuid(self, delegada_uuid: str | None) -> int | None:
             if not delegada_uuid:
                 return None
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                return snapshot.persona_id(delegada_uuid)
             cursor = self._connection.cursor()
             cursor.execute("SELECT id FROM personas WHERE uuid = ?", (delegada_uuid,))
             row = cursor.fetchone()
@@ -263,7 +325,14 @@ class OrquestadorPersistenciaSync:
             aliases: dict[str, list[str]] | None = None,
         ) -> tuple[list[str], list[tuple[int, dict[str, Any]]]]:
             cache_name = worksheet_name or getattr(worksheet, "title", None)
-            if cache_name:
+            values = self._read_worksheet_values(worksheet, cache_name)
+            return rows_with_index(values, worksheet_name=cache_name or worksheet.title, aliases=aliases)
+
+        def _read_worksheet_values(self, worksheet: Any, cache_name: str | None) -> list[list[str]]:
+            values = self._valores_canal_lectura(cache_name) if cache_name else None
+            if values is not None:
+                self._servicio_escritura_lotes.registrar_siguiente_fila_append(cache_name, len(values))
+            elif cache_name:
                 try:
                     values = self._client.read_all_values(cache_name)
                 except SheetsRateLimitError:
@@ -272,7 +341,79 @@ class OrquestadorPersistenciaSync:
                 self._servicio_escritura_lotes.registrar_siguiente_fila_append(cache_name, len(values))
             else:
                 values = worksheet.get_all_values()
-            return rows_with_index(values, worksheet_name=cache_name or worksheet.title, aliases=aliases)
+            return values
+
+        def _valores_canal_lectura(self, worksheet_name: str) -> list[list[str]] | None:
+            """Valores de la hoja leídos en segundo plano por el pull; ``None`` si hay que leerla aquí."""
+            canal = getattr(self, "_canal_lectura_pull", None)
+            filas = canal.filas(worksheet_name) if canal is not None else None
+            if filas is None:
+                return None
+            try:
+                return list(filas)
+            except SheetsRateLimitError:
+                logger.warning("Rate limit al leer worksheet=%s en segundo plano; se lee de nuevo.", worksheet_name)
+                return None
+
+        def _iter_rows_with_index(
+            self,
+            worksheet: Any,
+            worksheet_name: str,
+            aliases: dict[str, list[str]] | None = None,
+        ) -> tuple[list[str], Iterable[tuple[int, dict[str, Any]]]]:
+            """Como ``_rows_with_index``, pero leyendo la hoja por páginas si el cliente lo permite.
+
+            La siguiente fila de append se registra al agotar las filas, cuando ya se conoce el total.
+            """
+            leidas = self._iter_worksheet_values(worksheet_name)
+            if leidas is None:
+                return self._rows_with_index(worksheet, worksheet_name, aliases=aliases)
+            headers, valores = leidas
+            return headers, iter_rows_with_index(headers, valores, aliases=aliases)
+
+        def _iter_valores_con_indice(
+            self, worksheet: Any, worksheet_name: str
+        ) -> tuple[list[str], Iterable[tuple[int, list[Any]]]]:
+            """Como ``_iter_rows_with_index``, pero con las celdas de cada fila tal cual, sin crear un dict."""
+            leidas = self._iter_worksheet_values(worksheet_name)
+            if leidas is None:
+                values = self._read_worksheet_values(worksheet, worksheet_name)
+                leidas = (values[0], iter(values[1:])) if values else ([], iter(()))
+            headers, valores = leidas
+            return headers, iter_valores_con_indice(valores)
+
+        def _iter_worksheet_values(self, worksheet_name: str) -> tuple[list[str], Iterator[list[str]]] | None:
+            """Cabecera y filas restantes leídas por páginas; ``None`` si el cliente no lee por páginas."""
+            canal = getattr(self, "_canal_lectura_pull", None)
+            filas_canal = canal.filas(worksheet_name) if canal is not None else None
+            iter_values = getattr(self._client, "iter_values", None)
+            if filas_canal is None and iter_values is None:
+                return None
+
+            def _leer() -> Iterator[list[str]]:
+                if iter_values is None:
+                    return iter(self._client.read_all_values(worksheet_name))
+                return iter(iter_values(worksheet_name))
+
+            valores = filas_canal if filas_canal is not None else _leer()
+            try:
+                headers = next(valores, None)
+            except SheetsRateLimitError:
+                logger.warning("Rate limit al leer worksheet=%s; reintentando una vez.", worksheet_name)
+                valores = _leer()
+                headers = next(valores, None)
+            if headers is None:
+                self._servicio_escritura_lotes.registrar_siguiente_fila_append(worksheet_name, 0)
+                return [], iter(())
+
+            def _contar_filas() -> Iterator[list[str]]:
+                total = 1
+                for fila in valores:
+                    total += 1
+                    yield fila
+                self._servicio_escritura_lotes.registrar_siguiente_fila_append(worksheet_name, total)
+
+            return headers, _contar_filas()
 
         def _header_map(self, headers: list[str], expected: list[str]) -> list[str]:
             if not headers:
@@ -318,4 +459,7 @@ class OrquestadorPersistenciaSync:
             return sync_sheets_core.solicitud_dedupe_key_from_local_row(row)
 
         def _is_duplicate_local_solicitud(self, key: tuple[object, ...], exclude_uuid: str | None = None) -> bool:
+            snapshot = self._snapshot_pull()
+            if snapshot is not None:
+                return snapshot.existe_duplicado(key, exclude_uuid)
             return persistence_ops.is_duplicate_local_solicitud(self._connection, key, exclude_uuid)
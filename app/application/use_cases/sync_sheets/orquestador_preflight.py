@@ -3,9 +3,9 @@ from __future__ import annotations
 import logging
 import os
 import uuid
-from datetime import datetime, timezone
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from app.core.errors import InfraError
 from app.application.sheets_service import SHEETS_SCHEMA
@@ -17,6 +17,8 @@ from app.domain.sheets_errors import (
 )
 from app.application.dtos.sync_preflight_result import SyncPreflightResult
 from app.domain.sync_models import SyncSummary
+from app.domain.utc_timestamps import to_canonical_utc, utc_now_canonical
+from app.application.use_cases.sync_sheets import cache_preflight_escritura, sync_outbox
 from app.application.use_cases.sync_sheets.sync_snapshots import (
     format_rango_fechas,
 )
@@ -24,7 +26,14 @@ from app.application.use_cases.sync_sheets.sync_snapshots import (
 logger = logging.getLogger(__name__)
 
 
+def _rango_hoja_completa(worksheet_name: str) -> str:
+    return "'" + worksheet_name.replace("'", "''") + "'"
+
+
 class OrquestadorPreflightSync:
+        _ttl_preflight_escritura: float
+        _worksheets_prefetched: set[str]
+
         def __getattr__(self, name: str) -> Any:
             raise AttributeError(name)
 
@@ -34,10 +43,16 @@ class OrquestadorPreflightSync:
             if not self._hay_cambios_pendientes_para_push():
                 logger.info("SYNC_WRITE_PREFLIGHT_SKIPPED", extra={"reason": "no_pending_changes"})
                 return SyncPreflightResult.ok_result()
+            clave = self._clave_preflight_escritura("solicitudes", spreadsheet)
+            if cache_preflight_escritura.preflight_vigente(self._connection, clave, self._ttl_preflight_escritura):
+                logger.info("SYNC_WRITE_PREFLIGHT_SKIPPED", extra={"reason": "cached"})
+                return SyncPreflightResult.ok_result()
             try:
                 self._client.check_write_access("solicitudes")
+                cache_preflight_escritura.registrar_preflight(self._connection, clave)
                 return SyncPreflightResult.ok_result()
             except SheetsPermissionError as error:
+                cache_preflight_escritura.invalidar_preflights(self._connection)
                 enriched = self._enrich_permission_error(error, spreadsheet)
                 return SyncPreflightResult.permission_denied(
                     mensaje=str(enriched),
@@ -45,11 +60,37 @@ class OrquestadorPreflightSync:
                     metadata=enriched.to_safe_payload(),
                 )
 
+        def _clave_preflight_escritura(self, worksheet_name: str, spreadsheet: Any | None) -> str:
+            spreadsheet_id = getattr(spreadsheet, "id", None)
+            if not spreadsheet_id:
+                config = self._config_store.load()
+                spreadsheet_id = config.spreadsheet_id if config else ""
+            cuenta = self._client.get_service_account_email() if hasattr(self._client, "get_service_account_email") else None
+            return cache_preflight_escritura.clave_preflight(str(spreadsheet_id or ""), cuenta or "", worksheet_name)
+
+        @contextmanager
+        def _invalidando_preflight_por_permisos(self) -> Iterator[None]:
+            """Un 403 en cualquier punto del sync anula los preflights guardados antes de propagarse."""
+            try:
+                yield
+            except SheetsPermissionError:
+                cache_preflight_escritura.invalidar_preflights(self._connection)
+                raise
+
         def _hay_cambios_pendientes_para_push(self) -> bool:
             last_sync_at = self._get_last_sync_at()
             cursor = self._connection.cursor()
             if not last_sync_at:
                 return True
+            try:
+                pendientes_outbox = sync_outbox.hay_pendientes(self._connection)
+            except Exception:
+                logger.debug("No se pudo consultar sync_outbox", exc_info=True)
+                return True
+            if pendientes_outbox is not None:
+                return pendientes_outbox
+            # Con ``updated_at`` canónico, la comparación de cadenas en SQL es cronológica.
+            last_sync_at = to_canonical_utc(last_sync_at) or last_sync_at
             consultas = (
                 ("personas", "updated_at > ?"),
                 ("solicitudes", "updated_at > ?"),
@@ -155,6 +196,7 @@ class OrquestadorPreflightSync:
 
         def _prepare_sync_context(self, spreadsheet: Any) -> None:
             self._worksheet_cache = {}
+            self._worksheets_prefetched: set[str] = set()
             try:
                 self._worksheet_cache.update(self._client.get_worksheets_by_title())
             except SheetsRateLimitError:
@@ -162,6 +204,49 @@ class OrquestadorPreflightSync:
             except InfraError:
                 logger.debug("No se pudo precargar metadata de worksheets; se continuará bajo demanda.", exc_info=True)
 
+        def _prefetch_worksheet_values(self, worksheet_names: Iterable[str]) -> None:
+            """Lee con un único ``values_batch_get`` las hojas que el sync va a recorrer.
+
+            El cliente guarda los valores en su caché, así que ``_rows_with_index`` no
+            vuelve a pedir cada hoja. Las hojas que no figuran en el metadata
+            (p. ej. recién creadas por ``ensure_schema``) se siguen leyendo bajo demanda.
+            """
+            rangos = self._rangos_prefetch(worksheet_names)
+            if not rangos:
+                return
+            try:
+                self._client.batch_get_ranges(list(rangos.values()))
+            except SheetsRateLimitError:
+                raise
+            except InfraError:
+                logger.debug("No se pudo precargar valores de worksheets; se leerán bajo demanda.", exc_info=True)
+                return
+            self._registrar_prefetch(list(rangos))
+
+        def _rangos_prefetch(self, worksheet_names: Iterable[str]) -> dict[str, str]:
+            """Rango de hoja completa de cada hoja aún no precargada; vacío si no compensa un batch."""
+            prefetched: set[str] = getattr(self, "_worksheets_prefetched", set())
+            pendientes = [
+                name
+                for name in dict.fromkeys(worksheet_names)
+                if name in self._worksheet_cache and name not in prefetched
+            ]
+            if len(pendientes) < 2:
+                return {}
+            return {name: _rango_hoja_completa(name) for name in pendientes}
+
+        def _registrar_prefetch(self, worksheet_names: list[str]) -> None:
+            if not worksheet_names:
+                return
+            prefetched: set[str] = getattr(self, "_worksheets_prefetched", set())
+            prefetched.update(worksheet_names)
+            self._worksheets_prefetched = prefetched
+            logger.info(
+                "Prefetch Sheets: hojas=%s values_batch_get=1 api_calls_evitadas=%s",
+                ",".join(worksheet_names),
+                len(worksheet_names) - 1,
+            )
+
         def _get_worksheet(self, spreadsheet: Any, worksheet_name: str) -> Any:
             if worksheet_name in self._worksheet_cache:
                 return self._worksheet_cache[worksheet_name]
@@ -203,7 +288,7 @@ class OrquestadorPreflightSync:
             cursor = self._connection.cursor()
             cursor.execute(
                 "UPDATE sync_state SET last_sync_at = ? WHERE id = 1",
-                (timestamp,),
+                (to_canonical_utc(timestamp) or timestamp,),
             )
             self._connection.commit()
 
@@ -212,18 +297,24 @@ class OrquestadorPreflightSync:
             write_count = self._client.get_write_calls_count() if hasattr(self._client, "get_write_calls_count") else "n/a"
             avoided = self._client.get_avoided_requests_count() if hasattr(self._client, "get_avoided_requests_count") else "n/a"
             api_calls = self._client.get_sheets_api_calls_count() if hasattr(self._client, "get_sheets_api_calls_count") else "n/a"
+            throttled = self._client.get_throttled_calls_count() if hasattr(self._client, "get_throttled_calls_count") else "n/a"
+            throttle_wait = (
+                f"{self._client.get_throttle_wait_seconds():.3f}s" if hasattr(self._client, "get_throttle_wait_seconds") else "n/a"
+            )
             logger.info(
-                "Sync stats (%s): api_calls=%s read_count=%s write_count=%s avoided_requests=%s",
+                "Sync stats (%s): api_calls=%s read_count=%s write_count=%s avoided_requests=%s throttled_calls=%s throttle_wait=%s",
                 operation,
                 api_calls,
                 read_count,
                 write_count,
                 avoided,
+                throttled,
+                throttle_wait,
             )
 
         @staticmethod
         def _now_iso() -> str:
-            return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            return utc_now_canonical()
 
         def _device_id(self) -> str:
             config = self._config_store.load()
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Iterator
 
+from app.application.use_cases.sync_sheets import checkpoint_pull
+from app.application.use_cases.sync_sheets.canal_lectura_hojas import CanalLecturaHojas
+from app.application.use_cases.sync_sheets.checkpoint_pull import CheckpointPull
 from app.application.use_cases.sync_sheets.pull_planner import PullAction
 from app.application.use_cases.sync_sheets.sync_snapshots import (
     PullContext,
@@ -9,53 +14,131 @@ from app.application.use_cases.sync_sheets.sync_snapshots import (
     RemoteSolicitudRowDTO,
     build_pdf_log_payload,
     pdf_log_insert_values,
-    pdf_log_update_values,
 )
 from app.application.use_cases.sync_sheets.sync_reporting_rules import accumulate_write_result, pull_stats_tuple
 from app.application.use_cases.sync_sheets.helpers import sync_local_cuadrantes_from_personas
-from app.application.use_cases.sync_sheets import payloads_puros
+from app.application.use_cases.sync_sheets import payloads_puros, persistence_ops, sync_row_digest
+from app.application.sync import SyncCancelledError
+from app.domain.ports import TokenCancelacion
 from app.domain.sheets_errors import SheetsConfigError
 from app.application.use_cases import sync_sheets_core
-from app.application.use_cases.sync_sheets.normalization_rules import normalize_remote_solicitud_row
+from app.application.use_cases.sync_sheets.normalization_rules import normalize_remote_uuid
+from app.application.use_cases.sync_sheets.normalizacion_columnar import (
+    CAMPOS_SOLICITUD_REMOTA,
+    IndiceColumnasHoja,
+    normalizar_columnas_solicitud,
+)
 from app.application.use_cases.sync_sheets.orquestacion_modelos import PullApplyContext
+from app.application.use_cases.sync_sheets.snapshot_local_pull import SnapshotLocalPull
 from app.domain.sync_models import SyncSummary
+from app.domain.utc_timestamps import canonical_utc_or_raw, to_canonical_utc
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Clave que ``iter_rows_with_index`` añade al dict de cada fila. Las huellas de fila y de checkpoint
+# ya guardadas se calcularon sobre ese dict, así que se reproduce su contenido a partir de la tupla.
+_CLAVE_NUMERO_FILA = "__row_number__"
+
+
+def _contenido_fila(row_number: int, valores: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Valores del antiguo dict de la fila, en su orden: los campos y al final el número de fila."""
+    return (*valores, row_number)
+
 
 class OrquestadorPullSheets:
         _pull_apply_context: PullApplyContext | None
+        _filas_por_bloque_pull: int
+        _checkpoint_pull_pendiente: CheckpointPull | None
+        _snapshot_local_pull: SnapshotLocalPull | None = None
+        _canal_lectura_pull: CanalLecturaHojas | None = None
 
         def __getattr__(self, name: str) -> Any:
             raise AttributeError(name)
 
-        def _pull_with_spreadsheet(self, spreadsheet: Any) -> SyncSummary:
+        def _pull_with_spreadsheet(
+            self, spreadsheet: Any, *, cancellation_token: TokenCancelacion | None = None
+        ) -> SyncSummary:
             self._reset_write_batch_state()
             write_calls_before = self._client.get_write_calls_count() if hasattr(self._client, "get_write_calls_count") else 0
             last_sync_at = self._get_last_sync_at()
+            solicitud_titles = self._solicitudes_pull_source_titles(spreadsheet)
+            canal = self._iniciar_canal_lectura_pull(solicitud_titles)
+            try:
+                return self._pull_hojas(
+                    spreadsheet, last_sync_at, solicitud_titles, write_calls_before, cancellation_token=cancellation_token
+                )
+            finally:
+                self._canal_lectura_pull = None
+                if canal is not None:
+                    metricas = canal.cerrar()
+                    # El hilo de lectura no toca el estado del servicio: lo precargado se anota aquí.
+                    self._registrar_prefetch(canal.hojas_precargadas)
+                    logger.info(
+                        "Pipeline pull: hojas=%s paginas=%s lectura=%.3fs solapado=%.3fs espera_aplicacion=%.3fs espera_lectura=%.3fs",
+                        metricas.hojas,
+                        metricas.paginas,
+                        metricas.lectura_s,
+                        metricas.solapado_s,
+                        metricas.espera_consumidor_s,
+                        metricas.espera_productor_s,
+                    )
+
+        def _iniciar_canal_lectura_pull(self, solicitud_titles: list[str]) -> CanalLecturaHojas | None:
+            """Arranca la lectura en segundo plano de las hojas del pull, en el orden en que se aplican.
+
+            Las hojas pequeñas se precargan juntas (un ``values_batch_get``) y las de solicitudes
+            se leen por páginas, de modo que la siguiente página llega mientras se aplica la actual.
+            El hilo de lectura solo recibe el cliente y los rangos que debe leer.
+            """
+            pequenas = ["delegadas", "cuadrantes", "pdf_log", "config"]
+            hojas = [name for name in ("delegadas", *solicitud_titles, "cuadrantes", "pdf_log", "config") if name in self._worksheet_cache]
+            if not hojas or not hasattr(self._client, "read_all_values"):
+                self._prefetch_worksheet_values(pequenas)
+                return None
+            canal = CanalLecturaHojas(self._client, hojas, precarga=self._rangos_prefetch(pequenas))
+            self._canal_lectura_pull = canal
+            canal.iniciar()
+            return canal
+
+        def _pull_hojas(
+            self,
+            spreadsheet: Any,
+            last_sync_at: str | None,
+            solicitud_titles: list[str],
+            write_calls_before: int,
+            *,
+            cancellation_token: TokenCancelacion | None = None,
+        ) -> SyncSummary:
             downloaded = 0
             conflicts = 0
             omitted_duplicates = 0
             omitted_by_delegada = 0
             errors = 0
-            solicitud_titles = self._solicitudes_pull_source_titles(spreadsheet)
             downloaded_count, conflict_count = self._pull_delegadas(spreadsheet, last_sync_at)
             downloaded += downloaded_count
             conflicts += conflict_count
-            downloaded_count, conflict_count, duplicate_count, omitted_delegada_count, solicitud_errors = self._pull_solicitudes(
-                spreadsheet, last_sync_at, solicitud_titles
-            )
-            downloaded += downloaded_count
-            conflicts += conflict_count
-            omitted_duplicates += duplicate_count
-            omitted_by_delegada += omitted_delegada_count
-            errors += solicitud_errors
-            downloaded_count, conflict_count = self._pull_cuadrantes(spreadsheet, last_sync_at)
-            downloaded += downloaded_count
-            conflicts += conflict_count
-            downloaded += self._pull_pdf_log(spreadsheet)
-            downloaded += self._pull_config(spreadsheet)
+            # Índices locales cargados una vez (tras el pull de delegadas) en lugar de SELECT por fila.
+            self._snapshot_local_pull = SnapshotLocalPull.cargar(self._connection)
+            try:
+                downloaded_count, conflict_count, duplicate_count, omitted_delegada_count, solicitud_errors = self._pull_solicitudes(
+                    spreadsheet, last_sync_at, solicitud_titles, cancellation_token=cancellation_token
+                )
+                downloaded += downloaded_count
+                conflicts += conflict_count
+                omitted_duplicates += duplicate_count
+                omitted_by_delegada += omitted_delegada_count
+                errors += solicitud_errors
+                downloaded_count, conflict_count = self._pull_cuadrantes(spreadsheet, last_sync_at)
+                downloaded += downloaded_count
+                conflicts += conflict_count
+            finally:
+                self._snapshot_local_pull = None
+            downloaded += sum(self._pull_pdf_log(spreadsheet))
+            downloaded += sum(self._pull_config(spreadsheet))
+            # Pull completo: el siguiente ya no tiene nada que reanudar.
+            checkpoint_pull.borrar_checkpoint(self._connection)
+            self._connection.commit()
             write_calls_after = self._client.get_write_calls_count() if hasattr(self._client, "get_write_calls_count") else 0
             logger.info("Write calls por sync (pull): %s", write_calls_after - write_calls_before)
             return SyncSummary(
@@ -102,7 +185,7 @@ class OrquestadorPullSheets:
                 self._backfill_uuid(worksheet, headers, row_number, "uuid", str(persona_uuid))
             if was_inserted or not uuid_value or local_row is None or local_row["uuid"] != uuid_value:
                 return (1, 0) if was_inserted else (0, 0)
-            remote_updated_at = sync_sheets_core.parse_iso(row.get("updated_at"))
+            remote_updated_at = to_canonical_utc(row.get("updated_at"))
             if sync_sheets_core.is_conflict(local_row["updated_at"], remote_updated_at, last_sync_at):
                 self._store_conflict("delegadas", uuid_value, dict(local_row), row)
                 return 0, 1
@@ -112,26 +195,42 @@ class OrquestadorPullSheets:
             return 0, 0
 
         def _pull_solicitudes(
-            self, spreadsheet: Any, last_sync_at: str | None, solicitud_titles: list[str] | None = None
+            self,
+            spreadsheet: Any,
+            last_sync_at: str | None,
+            solicitud_titles: list[str] | None = None,
+            *,
+            cancellation_token: TokenCancelacion | None = None,
         ) -> tuple[int, int, int, int, int]:
             stats = {"downloaded": 0, "conflicts": 0, "omitted_duplicates": 0, "omitted_by_delegada": 0, "errors": 0}
-            for worksheet_name, worksheet in self._solicitudes_pull_sources(spreadsheet, solicitud_titles):
-                worksheet_stats = self._pull_solicitudes_worksheet(worksheet_name, worksheet, last_sync_at)
-                for key in stats:
-                    stats[key] += worksheet_stats[key]
-                logger.info(
-                    "Pull solicitudes: worksheet=%s insertadas_local=%s actualizadas_local=%s",
-                    worksheet_name,
-                    worksheet_stats["inserted_ws"],
-                    worksheet_stats["updated_ws"],
-                )
-                logger.debug(
-                    "Pull solicitudes fechas: worksheet=%s ejemplo_antes='%s' ejemplo_despues='%s'",
-                    worksheet_name,
-                    worksheet_stats["sample_fecha_before"] or "",
-                    worksheet_stats["sample_fecha_after"] or "",
-                )
-                self._flush_write_batches(spreadsheet, worksheet)
+            sources = self._solicitudes_pull_sources(spreadsheet, solicitud_titles)
+            self._checkpoint_pull_pendiente = self._checkpoint_pull_vigente([name for name, _ in sources])
+            try:
+                for worksheet_name, worksheet in sources:
+                    worksheet_stats = self._pull_solicitudes_worksheet(
+                        worksheet_name,
+                        worksheet,
+                        last_sync_at,
+                        spreadsheet=spreadsheet,
+                        cancellation_token=cancellation_token,
+                    )
+                    for key in stats:
+                        stats[key] += worksheet_stats[key]
+                    logger.info(
+                        "Pull solicitudes: worksheet=%s insertadas_local=%s actualizadas_local=%s",
+                        worksheet_name,
+                        worksheet_stats["inserted_ws"],
+                        worksheet_stats["updated_ws"],
+                    )
+                    logger.debug(
+                        "Pull solicitudes fechas: worksheet=%s ejemplo_antes='%s' ejemplo_despues='%s'",
+                        worksheet_name,
+                        worksheet_stats["sample_fecha_before"] or "",
+                        worksheet_stats["sample_fecha_after"] or "",
+                    )
+                    self._flush_write_batches(spreadsheet, worksheet)
+            finally:
+                self._checkpoint_pull_pendiente = None
             logger.info(
                 "Pull solicitudes resumen: insertadas_local=%s omitidas_por_delegada=%s errores=%s",
                 stats["downloaded"],
@@ -140,14 +239,97 @@ class OrquestadorPullSheets:
             )
             return pull_stats_tuple(stats)
 
+        def _checkpoint_pull_vigente(self, worksheet_names: list[str]) -> CheckpointPull | None:
+            checkpoint = checkpoint_pull.cargar_checkpoint(self._connection)
+            if checkpoint is not None and checkpoint.worksheet not in worksheet_names:
+                logger.info("Checkpoint de pull descartado: la hoja %s ya no está en el spreadsheet", checkpoint.worksheet)
+                return None
+            return checkpoint
+
+        def _reanudar_pull_solicitudes(
+            self, worksheet_name: str, huella: checkpoint_pull.HuellaHoja, filas: Iterator[tuple[int, tuple[Any, ...]]]
+        ) -> Iterator[tuple[int, tuple[Any, ...]]] | None:
+            """Salta las filas ya aplicadas por un pull interrumpido si la hoja no ha cambiado desde entonces.
+
+            Las filas hasta la del checkpoint se leen igualmente para calcular su huella, pero no se
+            aplican. Devuelve ``None`` si la huella no coincide: esas filas ya se han consumido sin
+            aplicar y el llamador debe volver a leer la hoja desde el principio.
+            """
+            checkpoint = self._checkpoint_pull_pendiente
+            if checkpoint is None or checkpoint.worksheet != worksheet_name:
+                return filas
+            self._checkpoint_pull_pendiente = None
+            siguiente: list[tuple[int, tuple[Any, ...]]] = []
+            saltadas = 0
+            for row_number, valores in filas:
+                if row_number > checkpoint.row:
+                    siguiente.append((row_number, valores))
+                    break
+                huella.actualizar(row_number, _contenido_fila(row_number, valores))
+                saltadas += 1
+            if huella.hexdigest() == checkpoint.revision:
+                logger.info(
+                    "Pull solicitudes: worksheet=%s reanudado tras la fila %s (filas_ya_aplicadas=%s)",
+                    worksheet_name,
+                    checkpoint.row,
+                    saltadas,
+                )
+                return chain(siguiente, filas)
+            logger.info(
+                "Pull solicitudes: worksheet=%s cambió desde el checkpoint de la fila %s; se aplica completa",
+                worksheet_name,
+                checkpoint.row,
+            )
+            checkpoint_pull.borrar_checkpoint(self._connection)
+            self._connection.commit()
+            return None
+
+        @staticmethod
+        def _parar_pull_si_cancelado(
+            cancellation_token: TokenCancelacion | None, worksheet_name: str, row_number: int
+        ) -> None:
+            if cancellation_token is None or not cancellation_token.is_cancelled():
+                return
+            logger.info("Pull cancelado: worksheet=%s checkpoint_fila=%s", worksheet_name, row_number)
+            raise SyncCancelledError("Sincronización cancelada; el pull se reanudará desde el último bloque confirmado")
+
+        def _confirmar_bloque_pull(self, spreadsheet: Any | None, worksheet: Any, checkpoint: CheckpointPull) -> None:
+            """Confirma un bloque ya aplicado: escrituras remotas de la hoja, checkpoint y commit local.
+
+            Las escrituras de Sheets (backfill de uuid) van antes del commit; si el proceso se corta
+            entre ambos, el bloque local se repite en el siguiente pull sin perder nada remoto.
+            """
+            name = checkpoint.worksheet
+            pendientes = (self._pending_append_rows, self._pending_batch_updates, self._pending_values_batch_updates)
+            if spreadsheet is not None and any(pendiente.get(name) for pendiente in pendientes):
+                self._flush_write_batches(spreadsheet, worksheet)
+            # Un checkpoint de otra hoja que este pull aún no ha alcanzado sigue siendo válido.
+            if self._checkpoint_pull_pendiente is None:
+                checkpoint_pull.guardar_checkpoint(self._connection, checkpoint)
+            self._connection.commit()
+
         def _pull_solicitudes_worksheet(
-            self, worksheet_name: str, worksheet: Any, last_sync_at: str | None
+            self,
+            worksheet_name: str,
+            worksheet: Any,
+            last_sync_at: str | None,
+            *,
+            spreadsheet: Any | None = None,
+            cancellation_token: TokenCancelacion | None = None,
         ) -> dict[str, Any]:
-            headers, rows = self._rows_with_index(
-                worksheet,
-                worksheet_name,
-                aliases=self._solicitudes_header_aliases(),
+            aliases = self._solicitudes_header_aliases()
+            # Los alias se resuelven a índices de columna una vez por hoja; cada fila es una tupla.
+            headers, valores_hoja = self._iter_valores_con_indice(worksheet, worksheet_name)
+            indice = IndiceColumnasHoja(headers, aliases)
+            huella = checkpoint_pull.HuellaHoja(headers)
+            filas = self._reanudar_pull_solicitudes(
+                worksheet_name, huella, ((n, indice.valores(fila)) for n, fila in valores_hoja)
             )
+            if filas is None:
+                headers, valores_hoja = self._iter_valores_con_indice(worksheet, worksheet_name)
+                indice = IndiceColumnasHoja(headers, aliases)
+                huella = checkpoint_pull.HuellaHoja(headers)
+                filas = ((n, indice.valores(fila)) for n, fila in valores_hoja)
             stats: dict[str, Any] = {
                 "downloaded": 0,
                 "conflicts": 0,
@@ -159,27 +341,101 @@ class OrquestadorPullSheets:
                 "sample_fecha_before": None,
                 "sample_fecha_after": None,
             }
-            logger.info("Pull solicitudes: worksheet=%s filas_leidas=%s", worksheet_name, len(rows))
             self._defer_local_commits = True
+            snapshot = self._snapshot_local_pull
+            # Sin snapshot las búsquedas van a SQL y deben ver cada escritura al momento.
+            lote = persistence_ops.LoteEscriturasSolicitudes() if snapshot else None
+            # Las huellas solo se usan con snapshot: hace falta saber sin SQL que la fila local existe.
+            digests = sync_row_digest.cargar_digests(self._connection, worksheet_name) if snapshot else None
+            huellas = (digests, snapshot) if digests is not None and snapshot is not None else None
+            digests_aplicados: dict[str, str] = {}
+            totales = {"leidas": 0, "sin_cambios": 0, "huellas": 0}
+            self._lote_solicitudes_pull = lote
             try:
-                def _run_rows() -> None:
-                    for row_number, raw_row in rows:
-                        self._set_pull_solicitud_samples(stats, raw_row)
-                        row = normalize_remote_solicitud_row(raw_row, worksheet_name)
+                def _procesar_bloque(bloque: list[tuple[int, tuple[Any, ...]]]) -> int:
+                    if stats["sample_fecha_before"] is None and bloque:
+                        fila = bloque[0][1]
+                        stats["sample_fecha_before"] = str(indice.valor(fila, "fecha") or indice.valor(fila, "fecha_pedida") or "")
+                    if huellas is None:
+                        pendientes: list[tuple[int, tuple[Any, ...], str, str | None]] = [
+                            (row_number, valores, "", None) for row_number, valores in bloque
+                        ]
+                        sin_cambios = 0
+                    else:
+                        pendientes, sin_cambios = self._separar_filas_sin_cambios(bloque, indice, *huellas)
+                    # Se normalizan de una vez, por columnas, solo las filas del bloque que hay que procesar;
+                    # el dict por campo solo se crea para las que pasan al planificador.
+                    columnas = indice.columnas([valores for _, valores, _, _ in pendientes])
+                    normalizadas = normalizar_columnas_solicitud(columnas, len(pendientes), worksheet_name)
+                    for (row_number, _, uuid_value, digest), normalizada in zip(pendientes, normalizadas):
+                        row = dict(zip(CAMPOS_SOLICITUD_REMOTA, normalizada))
                         if stats["sample_fecha_after"] is None:
                             stats["sample_fecha_after"] = str(row.get("fecha") or "")
+                        incidencias = stats["conflicts"] + stats["errors"]
                         self._process_pull_solicitud_row(worksheet, headers, row_number, row, last_sync_at, stats)
+                        # Los conflictos y errores se reevalúan en el siguiente pull aunque la fila no cambie.
+                        if (
+                            digest is not None
+                            and huellas is not None
+                            and stats["conflicts"] + stats["errors"] == incidencias
+                            and huellas[1].solicitud_por_uuid(uuid_value)
+                        ):
+                            digests_aplicados[uuid_value] = digest
+                    return sin_cambios
+
+                def _aplicar_bloque(bloque: list[tuple[int, tuple[Any, ...]]]) -> None:
+                    totales["sin_cambios"] += _procesar_bloque(bloque)
+                    if lote is not None:
+                        lote.volcar(self._connection)
+                    sync_row_digest.guardar_digests(self._connection, worksheet_name, digests_aplicados)
+                    totales["huellas"] += len(digests_aplicados)
+                    digests_aplicados.clear()
 
                 import app.application.use_cases.sync_sheets.use_case as uc
-                uc.run_with_savepoint(self._connection, "pull_solicitudes_worksheet", _run_rows)
+                # Cada bloque se aplica en su savepoint y se confirma con su checkpoint: un fallo o
+                # una interrupción solo descartan el bloque en curso, y cancelar para tras el último
+                # bloque confirmado.
+                while bloque := list(islice(filas, self._filas_por_bloque_pull)):
+                    totales["leidas"] += len(bloque)
+                    uc.run_with_savepoint(self._connection, "pull_solicitudes_worksheet", partial(_aplicar_bloque, bloque))
+                    for row_number, valores in bloque:
+                        huella.actualizar(row_number, _contenido_fila(row_number, valores))
+                    self._confirmar_bloque_pull(
+                        spreadsheet, worksheet, CheckpointPull(worksheet_name, bloque[-1][0], huella.hexdigest())
+                    )
+                    self._parar_pull_si_cancelado(cancellation_token, worksheet_name, bloque[-1][0])
+                logger.info("Pull solicitudes: worksheet=%s filas_leidas=%s", worksheet_name, totales["leidas"])
+                if digests is not None:
+                    logger.info(
+                        "Pull solicitudes: worksheet=%s filas_sin_cambios=%s huellas_actualizadas=%s",
+                        worksheet_name,
+                        totales["sin_cambios"],
+                        totales["huellas"],
+                    )
             finally:
                 self._defer_local_commits = False
+                self._lote_solicitudes_pull = None
             return stats
 
         @staticmethod
-        def _set_pull_solicitud_samples(stats: dict[str, Any], raw_row: dict[str, Any]) -> None:
-            if stats["sample_fecha_before"] is None:
-                stats["sample_fecha_before"] = str(raw_row.get("fecha") or raw_row.get("fecha_pedida") or "")
+        def _separar_filas_sin_cambios(
+            bloque: list[tuple[int, tuple[Any, ...]]],
+            indice: IndiceColumnasHoja,
+            digests: dict[str, str],
+            snapshot: SnapshotLocalPull,
+        ) -> tuple[list[tuple[int, tuple[Any, ...], str, str | None]], int]:
+            """Omite las filas cuya huella coincide con la aplicada y cuya solicitud sigue en local."""
+            pendientes: list[tuple[int, tuple[Any, ...], str, str | None]] = []
+            sin_cambios = 0
+            claves = (*indice.claves, _CLAVE_NUMERO_FILA)
+            for row_number, valores in bloque:
+                uuid_value = normalize_remote_uuid(indice.valor(valores, "uuid"))
+                digest = payloads_puros.digest_fila((*claves, *_contenido_fila(row_number, valores))) if uuid_value else None
+                if digest is not None and digests.get(uuid_value) == digest and snapshot.solicitud_por_uuid(uuid_value):
+                    sin_cambios += 1
+                    continue
+                pendientes.append((row_number, valores, uuid_value, digest))
+            return pendientes, sin_cambios
 
         def _process_pull_solicitud_row(self, worksheet: Any, headers: list[str], row_number: int, row: dict[str, Any], last_sync_at: str | None, stats: dict[str, Any]) -> None:
             dto = self.parse_remote_solicitud_row(row)
@@ -211,7 +467,7 @@ class OrquestadorPullSheets:
             return uc.parse_remote_solicitud_row(
                 row,
                 normalize_remote_uuid=uc.normalize_remote_uuid,
-                parse_iso=uc.sync_sheets_core.parse_iso,
+                parse_iso=to_canonical_utc,
             )
 
         def build_pull_signals(
@@ -357,7 +613,7 @@ class OrquestadorPullSheets:
                 uuid_value = str(row.get("uuid", "")).strip()
                 if not uuid_value:
                     continue
-                remote_updated_at = sync_sheets_core.parse_iso(row.get("updated_at"))
+                remote_updated_at = to_canonical_utc(row.get("updated_at"))
                 local_row = self._fetch_cuadrante(uuid_value)
                 if local_row is None:
                     self._insert_cuadrante_from_remote(uuid_value, row)
@@ -372,87 +628,42 @@ class OrquestadorPullSheets:
                     downloaded += 1
             return downloaded, conflicts
 
-        def _pull_pdf_log(self, spreadsheet: Any) -> int:
+        def _pull_pdf_log(self, spreadsheet: Any) -> tuple[int, int]:
             worksheet = self._get_worksheet(spreadsheet, "pdf_log")
             _, rows = self._rows_with_index(worksheet)
-            cursor = self._connection.cursor()
-            downloaded = 0
-            for _, row in rows:
-                downloaded += self._sync_pdf_log_row(cursor, row)
+            payloads = [payload for _, row in rows if (payload := build_pdf_log_payload(row)) is not None]
+            insertadas, actualizadas = persistence_ops.upsert_filas_remotas(
+                self._connection, "pdf_log", [pdf_log_insert_values(payload) for payload in payloads]
+            )
             if not self._defer_local_commits:
                 self._connection.commit()
-            return downloaded
-
-        def _sync_pdf_log_row(self, cursor: Any, row: dict[str, Any]) -> int:
-            payload = build_pdf_log_payload(row)
-            if payload is None:
-                return 0
-            existing = self._fetch_pdf_log_updated_at(cursor, payload["pdf_id"])
-            if existing is None:
-                cursor.execute(
-                    """
-                    INSERT INTO pdf_log (pdf_id, delegada_uuid, rango_fechas, fecha_generacion, hash, updated_at, source_device)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    pdf_log_insert_values(payload),
-                )
-                return 1
-            if self._pdf_log_should_update(existing["updated_at"], payload["updated_at"]):
-                cursor.execute(
-                    """
-                    UPDATE pdf_log
-                    SET delegada_uuid = ?, rango_fechas = ?, fecha_generacion = ?, hash = ?, updated_at = ?, source_device = ?
-                    WHERE pdf_id = ?
-                    """,
-                    pdf_log_update_values(payload),
-                )
-                return 1
-            return 0
+            logger.info("Pull pdf_log: filas=%s insertadas_local=%s actualizadas_local=%s", len(payloads), insertadas, actualizadas)
+            return insertadas, actualizadas
 
-        @staticmethod
-        def _fetch_pdf_log_updated_at(cursor: Any, pdf_id: str) -> Any | None:
-            cursor.execute("SELECT updated_at FROM pdf_log WHERE pdf_id = ?", (pdf_id,))
-            return cursor.fetchone()
-
-        @staticmethod
-        def _pdf_log_should_update(local_updated_at: str | None, remote_updated_at_raw: Any) -> bool:
-            remote_updated_at = sync_sheets_core.parse_iso(remote_updated_at_raw)
-            return sync_sheets_core.is_remote_newer(local_updated_at, remote_updated_at)
-
-        def _pull_config(self, spreadsheet: Any) -> int:
+        def _pull_config(self, spreadsheet: Any) -> tuple[int, int]:
             worksheet = self._get_worksheet(spreadsheet, "config")
             _, rows = self._rows_with_index(worksheet)
-            downloaded = 0
-            cursor = self._connection.cursor()
-            for _, row in rows:
-                key = str(row.get("key", "")).strip()
-                if not key:
-                    continue
-                cursor.execute("SELECT updated_at FROM sync_config WHERE key = ?", (key,))
-                existing = cursor.fetchone()
-                if existing is None:
-                    cursor.execute(
-                        """
-                        INSERT INTO sync_config (key, value, updated_at, source_device)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (key, row.get("value"), row.get("updated_at"), row.get("source_device")),
-                    )
-                    downloaded += 1
-                    self._apply_config_value(key, row.get("value"))
-                elif sync_sheets_core.is_remote_newer(existing["updated_at"], sync_sheets_core.parse_iso(row.get("updated_at"))):
-                    cursor.execute(
-                        """
-                        UPDATE sync_config
-                        SET value = ?, updated_at = ?, source_device = ?
-                        WHERE key = ?
-                        """,
-                        (row.get("value"), row.get("updated_at"), row.get("source_device"), key),
-                    )
-                    downloaded += 1
-                    self._apply_config_value(key, row.get("value"))
+            filas = [
+                (key, row.get("value"), canonical_utc_or_raw(row.get("updated_at")), row.get("source_device"))
+                for _, row in rows
+                if (key := str(row.get("key", "")).strip())
+            ]
+            antes = self._valores_sync_config()
+            insertadas, actualizadas = persistence_ops.upsert_filas_remotas(self._connection, "sync_config", filas)
+            if insertadas or actualizadas:
+                # Los efectos de cada clave (p. ej. ``pdf_text``) solo se aplican si el upsert la cambió.
+                despues = self._valores_sync_config()
+                for key in dict.fromkeys(fila[0] for fila in filas):
+                    if despues.get(key) != antes.get(key):
+                        self._apply_config_value(key, despues[key][0])
             self._connection.commit()
-            return downloaded
+            logger.info("Pull config: filas=%s insertadas_local=%s actualizadas_local=%s", len(filas), insertadas, actualizadas)
+            return insertadas, actualizadas
+
+        def _valores_sync_config(self) -> dict[str, tuple[Any, Any]]:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT key, value, updated_at FROM sync_config")
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
 
         def _sync_local_cuadrantes_from_personas(self) -> None:
             sync_local_cuadrantes_from_personas(self)
@@ -4,7 +4,7 @@ from app.application.sheets_service import SHEETS_SCHEMA
 from typing import Any
 
 from app.application.use_cases.sync_sheets.ayudantes_push import push_config, push_delegadas, push_pdf_log
-from app.application.use_cases.sync_sheets import persistence_ops
+from app.application.use_cases.sync_sheets import persistence_ops, sync_outbox
 from app.application.use_cases.sync_sheets.helpers import build_solicitudes_sync_plan
 from app.application.use_cases.sync_sheets.persona_resolution_rules import build_persona_resolution_plan
 from app.application.use_cases.sync_sheets.orquestacion_modelos import HEADER_CANONICO_SOLICITUDES
@@ -12,6 +12,7 @@ from app.application.use_cases.sync_sheets.sync_snapshots import build_local_sol
 from app.application.use_cases.sync_sheets import payloads_puros
 from app.application.use_cases import sync_sheets_core
 from app.domain.sync_models import SyncExecutionPlan, SyncSummary
+from app.domain.utc_timestamps import to_canonical_utc
 import logging
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,7 @@ class OrquestadorPushSheets:
             conflicts = 0
             omitted_duplicates = 0
             self._sync_local_cuadrantes_from_personas()
+            self._prefetch_worksheet_values(["delegadas", "solicitudes", "cuadrantes", "pdf_log", "config"])
             uploaded_count, conflict_count = self._push_delegadas(spreadsheet, last_sync_at)
             uploaded += uploaded_count
             conflicts += conflict_count
@@ -64,6 +66,8 @@ class OrquestadorPushSheets:
             worksheet = self._get_worksheet(spreadsheet, "solicitudes")
             headers, rows = self._rows_with_index(worksheet)
             remote_index = self._uuid_index(rows)
+            lote = sync_outbox.abrir_lote(self._connection, "solicitudes", last_sync_at=last_sync_at)
+            filtro, params = sync_outbox.filtro_sql(lote, "s.id", clave_entera=True)
             cursor = self._connection.cursor()
             cursor.execute(
                 """
@@ -75,6 +79,8 @@ class OrquestadorPushSheets:
                 JOIN personas p ON p.id = s.persona_id
                 WHERE s.updated_at IS NOT NULL
                 """
+                + filtro,
+                params,
             )
             import app.application.use_cases.sync_sheets.use_case as uc
             result = uc.build_push_solicitudes_payloads(
@@ -89,14 +95,45 @@ class OrquestadorPushSheets:
             for conflict in result.conflicts:
                 self._store_conflict("solicitudes", conflict.uuid_value, conflict.local_row, conflict.remote_row)
 
-            if headers != HEADER_CANONICO_SOLICITUDES:
+            if headers == HEADER_CANONICO_SOLICITUDES:
+                self._push_solicitudes_delta(spreadsheet, worksheet, rows, result.local_values)
+            else:
+                # Sin encabezado canónico las posiciones de columna no son fiables: se reescribe la hoja.
                 logger.info("Reescribiendo encabezado canónico de 'solicitudes' (sin columnas extras o vacías).")
                 self._normalize_solicitudes_header(worksheet)
-
-            uc.run_push_values_update(worksheet, result.values, retries=2)
-            logger.info("PUSH Sheets: %s filas enviadas", max(len(result.values) - 1, 0))
+                uc.run_push_values_update(worksheet, result.values, retries=2)
+                logger.info("PUSH Sheets: %s filas enviadas", max(len(result.values) - 1, 0))
+            sync_outbox.confirmar_lote(self._connection, lote)
             return result.uploaded, len(result.conflicts), result.omitted_duplicates
 
+        def _push_solicitudes_delta(
+            self,
+            spreadsheet: Any,
+            worksheet: Any,
+            rows: list[tuple[int, dict[str, Any]]],
+            local_values: tuple[tuple[Any, ...], ...],
+        ) -> None:
+            import app.application.use_cases.sync_sheets.use_case as uc
+            plan = uc.build_push_solicitudes_delta(
+                local_values=local_values,
+                remote_rows=rows,
+                remote_payload_builder=self._remote_solicitud_payload,
+            )
+            if not plan.updates and not plan.appends:
+                logger.info("PUSH Sheets (delta): sin cambios (%s filas ya al día)", plan.unchanged)
+                return
+            for row_number, payload in plan.updates:
+                self._update_row(worksheet, row_number, HEADER_CANONICO_SOLICITUDES, dict(zip(HEADER_CANONICO_SOLICITUDES, payload)))
+            for payload in plan.appends:
+                self._append_row(worksheet, HEADER_CANONICO_SOLICITUDES, dict(zip(HEADER_CANONICO_SOLICITUDES, payload)))
+            self._flush_write_batches(spreadsheet, worksheet)
+            logger.info(
+                "PUSH Sheets (delta): actualizadas=%s añadidas=%s sin_cambios=%s",
+                len(plan.updates),
+                len(plan.appends),
+                plan.unchanged,
+            )
+
         def _build_solicitudes_sync_plan(self, spreadsheet: Any) -> SyncExecutionPlan:
             return build_solicitudes_sync_plan(self, spreadsheet, HEADER_CANONICO_SOLICITUDES)
 
@@ -118,6 +155,8 @@ class OrquestadorPushSheets:
             headers, rows = self._rows_with_index(worksheet)
             header_map = self._header_map(headers, SHEETS_SCHEMA["cuadrantes"])
             remote_index = self._uuid_index(rows)
+            lote = sync_outbox.abrir_lote(self._connection, "cuadrantes", last_sync_at=last_sync_at)
+            filtro, params = sync_outbox.filtro_sql(lote, "id", clave_entera=True)
             cursor = self._connection.cursor()
             cursor.execute(
                 """
@@ -125,6 +164,8 @@ class OrquestadorPushSheets:
                 FROM cuadrantes
                 WHERE updated_at IS NOT NULL
                 """
+                + filtro,
+                params,
             )
             uploaded = 0
             conflicts = 0
@@ -133,7 +174,7 @@ class OrquestadorPushSheets:
                     continue
                 uuid_value = row["uuid"]
                 remote_row = remote_index.get(uuid_value)
-                remote_updated_at = sync_sheets_core.parse_iso(remote_row.get("updated_at") if remote_row else None)
+                remote_updated_at = to_canonical_utc(remote_row.get("updated_at") if remote_row else None)
                 if sync_sheets_core.is_conflict(row["updated_at"], remote_updated_at, last_sync_at):
                     self._store_conflict("cuadrantes", uuid_value, dict(row), remote_row or {})
                     conflicts += 1
@@ -160,6 +201,7 @@ class OrquestadorPushSheets:
                 self._append_row(worksheet, header_map, payload)
                 uploaded += 1
             self._flush_write_batches(spreadsheet, worksheet)
+            sync_outbox.confirmar_lote(self._connection, lote)
             return uploaded, conflicts
 
         def _fetch_persona(self, uuid_value: str) -> Any | None:
@@ -242,10 +284,28 @@ class OrquestadorPushSheets:
             self._connection.commit()
 
         def _ejecutar_insert_remoto_solicitud(self, payload: tuple[Any, ...]) -> None:
-            persistence_ops.execute_insert_solicitud(self._connection, payload)
+            snapshot = getattr(self, "_snapshot_local_pull", None)
+            if snapshot is not None:
+                snapshot.registrar_insercion_solicitud(payload)
+            lote = getattr(self, "_lote_solicitudes_pull", None)
+            if lote is None:
+                persistence_ops.execute_insert_solicitud(self._connection, payload)
+                return
+            lote.insertar(payload)
+            if lote.lleno:
+                lote.volcar(self._connection)
 
         def _ejecutar_update_remoto_solicitud(self, payload: tuple[Any, ...]) -> None:
-            persistence_ops.execute_update_solicitud(self._connection, payload)
+            snapshot = getattr(self, "_snapshot_local_pull", None)
+            if snapshot is not None:
+                snapshot.registrar_actualizacion_solicitud(payload)
+            lote = getattr(self, "_lote_solicitudes_pull", None)
+            if lote is None:
+                persistence_ops.execute_update_solicitud(self._connection, payload)
+                return
+            lote.actualizar(payload)
+            if lote.lleno:
+                lote.volcar(self._connection)
 
         def _normalize_solicitudes_header(self, worksheet: Any) -> None:
             worksheet.update("A1", [HEADER_CANONICO_SOLICITUDES])
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 
 from app.application.use_cases import sync_sheets_core
 
@@ -17,6 +18,12 @@ def _campo(row: Any, key: str, default: Any = None) -> Any:
         return default
 
 
+def digest_fila(valores: Iterable[Any]) -> str:
+    """Huella del contenido de una fila de Sheets, con cada celda como texto sin espacios extremos."""
+    contenido = "\x1f".join("" if valor is None else str(valor).strip() for valor in valores)
+    return hashlib.blake2b(contenido.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def limpiar_texto(value: Any) -> str:
     return " ".join(str(value or "").split()).strip()
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from typing import Any, Callable
 
-from app.application.use_cases.sync_sheets.sync_sheets_helpers import execute_with_validation
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import execute_with_validation, executemany_with_validation
+from app.domain.utc_timestamps import CANONICAL_UTC_LENGTH, canonical_utc_or_raw, is_canonical_utc
 
 
 def insert_persona_from_remote(connection: Any, uuid_value: str, row: dict[str, Any], now_iso: Callable[[], str]) -> None:
@@ -29,7 +30,7 @@ def insert_persona_from_remote(connection: Any, uuid_value: str, row: dict[str,
             0,
             1 if _int_or_zero(row.get("activa")) else 0,
             0,0,0,0,0,0,0,0,0,0,0,0,0,0,
-            row.get("updated_at") or now_iso(),
+            canonical_utc_or_raw(row.get("updated_at")) or now_iso(),
             row.get("source_device"),
             _int_or_zero(row.get("deleted")),
         ),
@@ -54,7 +55,7 @@ def update_persona_from_remote(connection: Any, persona_id: int, row: dict[str,
             _int_or_zero(row.get("bolsa_mes_min")),
             _int_or_zero(row.get("bolsa_anual_min")),
             0 if deleted else (1 if _int_or_zero(row.get("activa")) else 0),
-            row.get("updated_at") or now_iso(),
+            canonical_utc_or_raw(row.get("updated_at")) or now_iso(),
             row.get("source_device"),
             deleted,
             persona_id,
@@ -63,34 +64,121 @@ def update_persona_from_remote(connection: Any, persona_id: int, row: dict[str,
     )
 
 
+_INSERT_SOLICITUD_REMOTA_SQL = """
+    INSERT INTO solicitudes (
+        uuid, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
+        horas_solicitadas_min, observaciones, notas, pdf_path, pdf_hash,
+        generated, created_at, updated_at, source_device, deleted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_SOLICITUD_REMOTA_SQL = """
+    UPDATE solicitudes
+    SET persona_id = ?, fecha_pedida = ?, desde_min = ?, hasta_min = ?, completo = ?,
+        horas_solicitadas_min = ?, notas = ?, pdf_hash = ?, created_at = ?, updated_at = ?,
+        source_device = ?, deleted = ?, generated = 1
+    WHERE id = ?
+"""
+
+
 def execute_insert_solicitud(connection: Any, payload: tuple[Any, ...]) -> None:
-    execute_with_validation(
-        connection.cursor(),
-        """
-        INSERT INTO solicitudes (
-            uuid, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
-            horas_solicitadas_min, observaciones, notas, pdf_path, pdf_hash,
-            generated, created_at, updated_at, source_device, deleted
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        payload,
-        "solicitudes.insert_remote",
-    )
+    execute_with_validation(connection.cursor(), _INSERT_SOLICITUD_REMOTA_SQL, payload, "solicitudes.insert_remote")
 
 
 def execute_update_solicitud(connection: Any, payload: tuple[Any, ...]) -> None:
-    execute_with_validation(
-        connection.cursor(),
-        """
-        UPDATE solicitudes
-        SET persona_id = ?, fecha_pedida = ?, desde_min = ?, hasta_min = ?, completo = ?,
-            horas_solicitadas_min = ?, notas = ?, pdf_hash = ?, created_at = ?, updated_at = ?,
-            source_device = ?, deleted = ?, generated = 1
-        WHERE id = ?
-        """,
-        payload,
-        "solicitudes.update_remote",
+    execute_with_validation(connection.cursor(), _UPDATE_SOLICITUD_REMOTA_SQL, payload, "solicitudes.update_remote")
+
+
+def _sql_upsert_remoto(tabla: str, columnas: tuple[str, ...], clave: str) -> tuple[str, str]:
+    """SQL de alta remota con upsert (si el remoto es más nuevo) y de solo alta (``DO NOTHING``).
+
+    Con ``updated_at`` canónico la comparación de cadenas es cronológica. Un valor local vacío
+    o no canónico cuenta como más antiguo, igual que en ``sync_sheets_core.is_remote_newer``.
+    """
+    alta = f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({', '.join('?' for _ in columnas)})"
+    asignaciones = ", ".join(f"{columna} = excluded.{columna}" for columna in columnas if columna != clave)
+    upsert = (
+        f"{alta} ON CONFLICT({clave}) DO UPDATE SET {asignaciones} "
+        f"WHERE {tabla}.updated_at IS NULL OR length({tabla}.updated_at) <> {CANONICAL_UTC_LENGTH} "
+        f"OR excluded.updated_at > {tabla}.updated_at"
     )
+    return upsert, f"{alta} ON CONFLICT({clave}) DO NOTHING"
+
+
+_COLUMNAS_UPSERT_REMOTO: dict[str, tuple[tuple[str, ...], str]] = {
+    "pdf_log": (
+        ("pdf_id", "delegada_uuid", "rango_fechas", "fecha_generacion", "hash", "updated_at", "source_device"),
+        "pdf_id",
+    ),
+    "sync_config": (("key", "value", "updated_at", "source_device"), "key"),
+}
+_SQL_UPSERT_REMOTO = {
+    tabla: _sql_upsert_remoto(tabla, columnas, clave) for tabla, (columnas, clave) in _COLUMNAS_UPSERT_REMOTO.items()
+}
+
+
+def upsert_filas_remotas(connection: Any, tabla: str, filas: list[tuple[Any, ...]]) -> tuple[int, int]:
+    """Aplica las filas remotas de ``tabla`` en lote y devuelve ``(insertadas, actualizadas)``.
+
+    Las filas siguen el orden de columnas de ``_COLUMNAS_UPSERT_REMOTO``. Una fila existente
+    solo se actualiza si su ``updated_at`` remoto es canónico y más nuevo que el local. Las
+    cuentas salen de ``changes()`` (``rowcount``), que no incluye lo que escriben los triggers.
+    """
+    if not filas:
+        return 0, 0
+    columnas, _ = _COLUMNAS_UPSERT_REMOTO[tabla]
+    posicion_updated_at = columnas.index("updated_at")
+    upsert_sql, alta_sql = _SQL_UPSERT_REMOTO[tabla]
+    comparables = [fila for fila in filas if is_canonical_utc(str(fila[posicion_updated_at] or ""))]
+    sin_fecha = [fila for fila in filas if not is_canonical_utc(str(fila[posicion_updated_at] or ""))]
+    cursor = connection.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM {tabla}")
+    antes = int(cursor.fetchone()[0])
+    cambios = 0
+    for sql, lote in ((upsert_sql, comparables), (alta_sql, sin_fecha)):
+        if lote:
+            executemany_with_validation(cursor, sql, lote, f"{tabla}.upsert_remote")
+            cambios += max(cursor.rowcount, 0)
+    cursor.execute(f"SELECT COUNT(*) FROM {tabla}")
+    insertadas = int(cursor.fetchone()[0]) - antes
+    return insertadas, cambios - insertadas
+
+
+class LoteEscriturasSolicitudes:
+    """Acumula los INSERT/UPDATE de solicitudes del pull para volcarlos con ``executemany``.
+
+    Solo se usa junto a ``SnapshotLocalPull``: las búsquedas de filas posteriores se
+    resuelven en memoria, así que la base no necesita reflejar el lote hasta el volcado.
+    """
+
+    def __init__(self, limite: int = 500) -> None:
+        self._limite = limite
+        self._inserts: list[tuple[Any, ...]] = []
+        self._updates: list[tuple[Any, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._inserts) + len(self._updates)
+
+    @property
+    def lleno(self) -> bool:
+        return len(self) >= self._limite
+
+    def insertar(self, payload: tuple[Any, ...]) -> None:
+        self._inserts.append(payload)
+
+    def actualizar(self, payload: tuple[Any, ...]) -> None:
+        self._updates.append(payload)
+
+    def volcar(self, connection: Any) -> None:
+        if not self:
+            return
+        cursor = connection.cursor()
+        if self._inserts:
+            executemany_with_validation(cursor, _INSERT_SOLICITUD_REMOTA_SQL, self._inserts, "solicitudes.insert_remote_many")
+        if self._updates:
+            executemany_with_validation(cursor, _UPDATE_SOLICITUD_REMOTA_SQL, self._updates, "solicitudes.update_remote_many")
+        self._inserts.clear()
+        self._updates.clear()
 
 
 def backfill_uuid(connection: Any, table_name: str, record_id: int, uuid_value: str, now_iso: Callable[[], str]) -> None:
@@ -122,7 +210,8 @@ def _int_or_zero(value: Any) -> int:
         return 0
 
 
-def find_solicitud_by_composite_key(connection: Any, row: dict[str, Any], persona_id: int | None) -> Any | None:
+def solicitud_composite_key(row: dict[str, Any], persona_id: int | None) -> tuple[Any, ...] | None:
+    """Clave ``(persona_id, fecha_pedida, completo, desde_min, hasta_min)`` de una fila remota sin uuid."""
     if persona_id is None:
         return None
     from app.application.use_cases import sync_sheets_core
@@ -136,8 +225,20 @@ def find_solicitud_by_composite_key(connection: Any, row: dict[str, Any], person
     key = solicitud_unique_key(delegada_uuid, fecha, completo, desde, hasta)
     if key is None:
         return None
-    desde_min = sync_sheets_core.parse_hhmm_to_minutes(desde)
-    hasta_min = sync_sheets_core.parse_hhmm_to_minutes(hasta)
+    return (
+        persona_id,
+        key[1],
+        1 if key[2] else 0,
+        sync_sheets_core.parse_hhmm_to_minutes(desde),
+        sync_sheets_core.parse_hhmm_to_minutes(hasta),
+    )
+
+
+def find_solicitud_by_composite_key(connection: Any, row: dict[str, Any], persona_id: int | None) -> Any | None:
+    composite_key = solicitud_composite_key(row, persona_id)
+    if composite_key is None:
+        return None
+    _, fecha_pedida, completo, desde_min, hasta_min = composite_key
     cursor = connection.cursor()
     cursor.execute(
         """
@@ -149,7 +250,7 @@ def find_solicitud_by_composite_key(connection: Any, row: dict[str, Any], person
           AND (deleted = 0 OR deleted IS NULL)
         LIMIT 1
         """,
-        (persona_id, key[1], 1 if key[2] else 0, desde_min, desde_min, hasta_min, hasta_min),
+        (persona_id, fecha_pedida, completo, desde_min, desde_min, hasta_min, hasta_min),
     )
     return cursor.fetchone()
 
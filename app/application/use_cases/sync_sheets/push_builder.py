@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets.payloads_puros import digest_fila
+from app.domain.utc_timestamps import to_canonical_utc
 
 
 @dataclass(frozen=True)
@@ -20,6 +22,14 @@ class PushBuildResult:
     uploaded: int
     omitted_duplicates: int
     conflicts: tuple[PushConflict, ...]
+    local_values: tuple[tuple[Any, ...], ...] = ()
+
+
+@dataclass(frozen=True)
+class PushDeltaPlan:
+    updates: tuple[tuple[int, tuple[Any, ...]], ...]
+    appends: tuple[tuple[Any, ...], ...]
+    unchanged: int
 
 
 def build_push_solicitudes_payloads(
@@ -44,7 +54,7 @@ def build_push_solicitudes_payloads(
         uuid_value = row["uuid"]
         local_uuids.add(uuid_value)
         remote_row = remote_index.get(uuid_value)
-        remote_updated_at = sync_sheets_core.parse_iso(remote_row.get("updated_at") if remote_row else None)
+        remote_updated_at = to_canonical_utc(remote_row.get("updated_at") if remote_row else None)
         if sync_sheets_core.is_conflict(row["updated_at"], remote_updated_at, last_sync_at):
             conflicts.append(PushConflict(uuid_value=uuid_value, local_row=dict(row), remote_row=remote_row or {}))
             continue
@@ -63,4 +73,37 @@ def build_push_solicitudes_payloads(
         uploaded=uploaded,
         omitted_duplicates=omitted_duplicates,
         conflicts=tuple(conflicts),
+        local_values=tuple(values[1 : uploaded + 1]),
     )
+
+
+def build_push_solicitudes_delta(
+    *,
+    local_values: tuple[tuple[Any, ...], ...],
+    remote_rows: list[tuple[int, dict[str, Any]]],
+    remote_payload_builder: Any,
+) -> PushDeltaPlan:
+    """Compara por huella cada fila local con su fila remota (por uuid).
+
+    Las filas iguales no se escriben, las distintas se actualizan en su número de fila y
+    las que no existen en la hoja se añaden al final. El resto de la hoja no se toca.
+    """
+    remote_by_uuid: dict[str, tuple[int, dict[str, Any]]] = {}
+    for row_number, remote_row in remote_rows:
+        remote_uuid = str(remote_row.get("uuid", "")).strip()
+        if remote_uuid:
+            remote_by_uuid[remote_uuid] = (row_number, remote_row)
+    updates: list[tuple[int, tuple[Any, ...]]] = []
+    appends: list[tuple[Any, ...]] = []
+    unchanged = 0
+    for payload in local_values:
+        remote = remote_by_uuid.get(str(payload[0] or "").strip())
+        if remote is None:
+            appends.append(payload)
+            continue
+        row_number, remote_row = remote
+        if digest_fila(payload) == digest_fila(remote_payload_builder(remote_row)):
+            unchanged += 1
+            continue
+        updates.append((row_number, payload))
+    return PushDeltaPlan(updates=tuple(updates), appends=tuple(appends), unchanged=unchanged)
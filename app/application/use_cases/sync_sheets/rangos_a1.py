@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, replace
+from typing import Any
+
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rowcol_to_a1
+
+_RANGO_RE = re.compile(
+    r"^'(?P<hoja>(?:[^']|'')+)'!(?P<col_ini>[A-Z]+)(?P<fila_ini>\d+)(?::(?P<col_fin>[A-Z]+)(?P<fila_fin>\d+))?$"
+)
+
+
+@dataclass(frozen=True)
+class RangoA1:
+    hoja: str
+    fila_inicio: int
+    col_inicio: int
+    fila_fin: int
+    col_fin: int
+
+    @property
+    def total_filas(self) -> int:
+        return self.fila_fin - self.fila_inicio + 1
+
+    def a1(self) -> str:
+        titulo = self.hoja.replace("'", "''")
+        inicio = rowcol_to_a1(self.fila_inicio, self.col_inicio)
+        if (self.fila_inicio, self.col_inicio) == (self.fila_fin, self.col_fin):
+            return f"'{titulo}'!{inicio}"
+        return f"'{titulo}'!{inicio}:{rowcol_to_a1(self.fila_fin, self.col_fin)}"
+
+
+def parsear_rango(rango: str) -> RangoA1 | None:
+    """Solo rangos con hoja entre comillas, como los que genera ``ServicioEscrituraLotes``."""
+    match = _RANGO_RE.match(rango)
+    if not match:
+        return None
+    fila_inicio = int(match.group("fila_ini"))
+    col_inicio = _columna_a_indice(match.group("col_ini"))
+    fila_fin = int(match.group("fila_fin") or fila_inicio)
+    col_fin = _columna_a_indice(match.group("col_fin") or match.group("col_ini"))
+    if fila_inicio < 1 or fila_fin < fila_inicio or col_fin < col_inicio:
+        return None
+    return RangoA1(match.group("hoja").replace("''", "'"), fila_inicio, col_inicio, fila_fin, col_fin)
+
+
+def fusionar_entradas(entradas: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Une entradas de filas contiguas con las mismas columnas en un único rango rectangular.
+
+    ``values_batch_update`` aplica los rangos en orden, así que solo se reordena cuando
+    todos son disjuntos; si alguno se solapa (o no se puede interpretar) únicamente se
+    une cada entrada con la inmediatamente anterior.
+    """
+    pares = [(_rango_de_entrada(entrada), entrada) for entrada in entradas]
+    if entradas_disjuntas(entradas):
+        pares.sort(key=lambda par: _clave_orden(par[0]))
+    fusionadas: list[dict[str, Any]] = []
+    # Rango de la última entrada emitida; una entrada no interpretable corta la fusión.
+    previo: RangoA1 | None = None
+    for rango, entrada in pares:
+        if rango is None:
+            previo = None
+            fusionadas.append(entrada)
+            continue
+        if previo is not None and _contiguos(previo, rango):
+            previo = replace(previo, fila_fin=rango.fila_fin)
+            fusionadas[-1]["range"] = previo.a1()
+            fusionadas[-1]["values"].extend(entrada["values"])
+            continue
+        previo = rango
+        fusionadas.append({**entrada, "values": list(entrada["values"])})
+    return fusionadas
+
+
+def son_disjuntos(rangos: list[RangoA1]) -> bool:
+    for hoja in {rango.hoja for rango in rangos}:
+        activos: list[RangoA1] = []
+        for rango in sorted((r for r in rangos if r.hoja == hoja), key=lambda r: r.fila_inicio):
+            activos = [activo for activo in activos if activo.fila_fin >= rango.fila_inicio]
+            if any(activo.col_inicio <= rango.col_fin and rango.col_inicio <= activo.col_fin for activo in activos):
+                return False
+            activos.append(rango)
+    return True
+
+
+def entradas_disjuntas(entradas: list[dict[str, Any]]) -> bool:
+    rangos = [_rango_de_entrada(entrada) for entrada in entradas]
+    interpretables = [rango for rango in rangos if rango is not None]
+    return len(interpretables) == len(rangos) and son_disjuntos(interpretables)
+
+
+def trocear_por_bytes(entradas: list[dict[str, Any]], max_bytes: int) -> list[list[dict[str, Any]]]:
+    """Reparte las entradas en peticiones de como mucho ``max_bytes`` (salvo una sola fila mayor)."""
+    trozos: list[list[dict[str, Any]]] = []
+    actual: list[dict[str, Any]] = []
+    bytes_actual = 0
+    for pieza in (pieza for entrada in entradas for pieza in _partir_entrada(entrada, max_bytes)):
+        tamano = bytes_entrada(pieza)
+        if actual and bytes_actual + tamano > max_bytes:
+            trozos.append(actual)
+            actual, bytes_actual = [], 0
+        actual.append(pieza)
+        bytes_actual += tamano
+    if actual:
+        trozos.append(actual)
+    return trozos
+
+
+def bytes_entrada(entrada: dict[str, Any]) -> int:
+    return len(json.dumps(entrada, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _partir_entrada(entrada: dict[str, Any], max_bytes: int) -> list[dict[str, Any]]:
+    tamano = bytes_entrada(entrada)
+    valores = entrada["values"]
+    rango = _rango_de_entrada(entrada)
+    if tamano <= max_bytes or rango is None or len(valores) < 2:
+        return [entrada]
+    filas_por_pieza = max(1, max_bytes * len(valores) // tamano)
+    piezas = []
+    for desplazamiento in range(0, len(valores), filas_por_pieza):
+        bloque = valores[desplazamiento : desplazamiento + filas_por_pieza]
+        fila_inicio = rango.fila_inicio + desplazamiento
+        pieza = replace(rango, fila_inicio=fila_inicio, fila_fin=fila_inicio + len(bloque) - 1)
+        piezas.append({"range": pieza.a1(), "values": bloque})
+    return piezas
+
+
+def _rango_de_entrada(entrada: dict[str, Any]) -> RangoA1 | None:
+    rango = parsear_rango(str(entrada.get("range", "")))
+    valores = entrada.get("values")
+    if rango is None or not isinstance(valores, list) or len(valores) != rango.total_filas:
+        return None
+    return rango
+
+
+def _contiguos(previo: RangoA1, rango: RangoA1) -> bool:
+    return (
+        previo.hoja == rango.hoja
+        and (previo.col_inicio, previo.col_fin) == (rango.col_inicio, rango.col_fin)
+        and rango.fila_inicio == previo.fila_fin + 1
+    )
+
+
+def _clave_orden(rango: RangoA1 | None) -> tuple[Any, ...]:
+    # Solo se ordena cuando todos los rangos se han podido interpretar.
+    if rango is None:
+        return ()
+    return (rango.hoja, rango.col_inicio, rango.col_fin, rango.fila_inicio)
+
+
+def _columna_a_indice(letras: str) -> int:
+    indice = 0
+    for letra in letras:
+        indice = indice * 26 + (ord(letra) - ord("A") + 1)
+    return indice
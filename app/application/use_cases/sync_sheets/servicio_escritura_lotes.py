@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+from app.application.use_cases.sync_sheets.rangos_a1 import (
+    bytes_entrada,
+    entradas_disjuntas,
+    fusionar_entradas,
+    trocear_por_bytes,
+)
 from app.application.use_cases.sync_sheets.sync_sheets_helpers import rowcol_to_a1
 
 
 logger = logging.getLogger(__name__)
 
+# Google recomienda peticiones de como mucho 2 MB; el limitador de SheetsClient acota el ritmo.
+MAX_BYTES_POR_PETICION = 2_000_000
+MAX_PETICIONES_CONCURRENTES = 4
+
 
 @dataclass
 class EstadoEscrituraLotes:
@@ -18,9 +29,23 @@ class EstadoEscrituraLotes:
     siguiente_fila_append: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class ResultadoFlush:
+    peticiones: int = 0
+    bytes_payload: int = 0
+    rangos: int = 0
+
+
 class ServicioEscrituraLotes:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_bytes_por_peticion: int = MAX_BYTES_POR_PETICION,
+        max_peticiones_concurrentes: int = MAX_PETICIONES_CONCURRENTES,
+    ) -> None:
         self._estado = EstadoEscrituraLotes()
+        self._max_bytes_por_peticion = max_bytes_por_peticion
+        self._max_peticiones_concurrentes = max_peticiones_concurrentes
 
     @property
     def pendientes_altas(self) -> dict[str, list[list[Any]]]:
@@ -49,7 +74,8 @@ class ServicioEscrituraLotes:
 
     def encolar_actualizacion(self, worksheet: Any, fila: int, cabeceras: list[str], payload: dict[str, Any]) -> None:
         valores = [payload.get(cabecera, "") for cabecera in cabeceras]
-        rango = f"A{fila}:{rowcol_to_a1(fila, len(cabeceras))}"
+        # Con values_batch_update un rango sin hoja se aplicaría a la primera hoja visible.
+        rango = self._a1_sheet_range(worksheet.title, fila, len(cabeceras))
         self._estado.pendientes_actualizaciones.setdefault(worksheet.title, []).append({"range": rango, "values": [valores]})
 
     def encolar_alta(self, worksheet: Any, cabeceras: list[str], payload: dict[str, Any]) -> None:
@@ -70,7 +96,7 @@ class ServicioEscrituraLotes:
         worksheet: Any,
         cliente: Any,
         lector_valores: Callable[[str], list[list[Any]]],
-    ) -> None:
+    ) -> ResultadoFlush:
         titulo = worksheet.title
         altas = self._estado.pendientes_altas.pop(titulo, [])
         actualizaciones = self._estado.pendientes_actualizaciones.pop(titulo, [])
@@ -81,14 +107,15 @@ class ServicioEscrituraLotes:
             lector_valores=lector_valores,
         )
         body = self._compose_values_batch_body(altas_en_rango, actualizaciones, backfills)
-        self._write_batch(body=body, cliente=cliente, spreadsheet=spreadsheet)
+        resultado = self._write_batch(body=body, cliente=cliente, spreadsheet=spreadsheet)
         self._log_write_batch(
             titulo=titulo,
             altas=altas,
             actualizaciones=actualizaciones,
             backfills=backfills,
-            total_rangos=len(body["data"]),
+            resultado=resultado,
         )
+        return resultado
 
     def _build_append_batch_entries(
         self,
@@ -149,14 +176,28 @@ class ServicioEscrituraLotes:
         data = [entrada for parte in partes for entrada in parte]
         return {"valueInputOption": "USER_ENTERED", "data": data}
 
-    @staticmethod
-    def _write_batch(*, body: dict[str, Any], cliente: Any, spreadsheet: Any) -> None:
+    def _write_batch(self, *, body: dict[str, Any], cliente: Any, spreadsheet: Any) -> ResultadoFlush:
         if not body["data"]:
-            return
-        if hasattr(cliente, "values_batch_update"):
-            cliente.values_batch_update(body)
-            return
-        spreadsheet.values_batch_update(body)
+            return ResultadoFlush()
+        data = fusionar_entradas(body["data"])
+        cuerpos = [
+            {"valueInputOption": body["valueInputOption"], "data": trozo}
+            for trozo in trocear_por_bytes(data, self._max_bytes_por_peticion)
+        ]
+        escribir = cliente.values_batch_update if hasattr(cliente, "values_batch_update") else spreadsheet.values_batch_update
+        # Con rangos solapados el orden importa: solo se paraleliza si todos son disjuntos.
+        if len(cuerpos) > 1 and self._max_peticiones_concurrentes > 1 and entradas_disjuntas(data):
+            with ThreadPoolExecutor(max_workers=min(self._max_peticiones_concurrentes, len(cuerpos))) as executor:
+                for futuro in [executor.submit(escribir, cuerpo) for cuerpo in cuerpos]:
+                    futuro.result()
+        else:
+            for cuerpo in cuerpos:
+                escribir(cuerpo)
+        return ResultadoFlush(
+            peticiones=len(cuerpos),
+            bytes_payload=sum(bytes_entrada(entrada) for entrada in data),
+            rangos=len(data),
+        )
 
     @staticmethod
     def _log_write_batch(
@@ -165,15 +206,17 @@ class ServicioEscrituraLotes:
         altas: list[list[Any]],
         actualizaciones: list[dict[str, Any]],
         backfills: list[dict[str, Any]],
-        total_rangos: int,
+        resultado: ResultadoFlush,
     ) -> None:
         if not (altas or actualizaciones or backfills):
             return
         logger.info(
-            "Write batch (%s): appended=%s updated=%s backfills=%s total_ranges=%s",
+            "Write batch (%s): appended=%s updated=%s backfills=%s total_ranges=%s requests=%s payload_bytes=%s",
             titulo,
             len(altas),
             len(actualizaciones),
             len(backfills),
-            total_rangos,
+            resultado.rangos,
+            resultado.peticiones,
+            resultado.bytes_payload,
         )
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from app.application.use_cases import sync_sheets_core
+
+logger = logging.getLogger(__name__)
+
+SOLICITUD_COLUMNS = (
+    "id", "uuid", "persona_id", "fecha_pedida", "desde_min", "hasta_min", "completo",
+    "horas_solicitadas_min", "notas", "created_at", "updated_at", "source_device", "deleted", "pdf_hash",
+)
+CUADRANTE_COLUMNS = (
+    "id", "uuid", "delegada_uuid", "dia_semana", "man_min", "tar_min", "updated_at", "source_device", "deleted",
+)
+
+# Posiciones de los payloads de persistence_ops.execute_insert_solicitud / execute_update_solicitud.
+_INSERT_FIELDS = {
+    "uuid": 0, "persona_id": 1, "fecha_pedida": 3, "desde_min": 4, "hasta_min": 5, "completo": 6,
+    "horas_solicitadas_min": 7, "notas": 9, "pdf_hash": 11, "created_at": 13, "updated_at": 14,
+    "source_device": 15, "deleted": 16,
+}
+_UPDATE_FIELDS = {
+    "persona_id": 0, "fecha_pedida": 1, "desde_min": 2, "hasta_min": 3, "completo": 4,
+    "horas_solicitadas_min": 5, "notas": 6, "pdf_hash": 7, "created_at": 8, "updated_at": 9,
+    "source_device": 10, "deleted": 11,
+}
+
+
+def _nombre_normalizado(nombre: Any) -> str:
+    return " ".join(str(nombre or "").split()).casefold()
+
+
+def _activa(row: dict[str, Any]) -> bool:
+    return not row.get("deleted")
+
+
+class SnapshotLocalPull:
+    """Índices en memoria de personas, solicitudes y cuadrantes para el pull de Sheets.
+
+    Se carga una vez por pull y sustituye a las búsquedas por fila (uuid, clave
+    compuesta, clave de deduplicación, persona por uuid). El pull registra aquí cada
+    INSERT/UPDATE que aplica para que las filas siguientes vean el estado actualizado.
+    Las filas devueltas son dicts con las mismas columnas que los SELECT a los que
+    sustituyen.
+    """
+
+    def __init__(self) -> None:
+        self._persona_id_por_uuid: dict[str, int] = {}
+        self._persona_uuid_por_id: dict[int, str | None] = {}
+        self._persona_uuid_por_nombre: dict[str, str] = {}
+        self._delegada_uuid_por_nombre: dict[str, str] = {}
+        self._solicitudes_por_uuid: dict[str, dict[str, Any]] = {}
+        self._solicitudes_por_id: dict[int, dict[str, Any]] = {}
+        self._por_clave_compuesta: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        self._por_clave_dedupe: dict[tuple[object, ...], list[dict[str, Any]]] = {}
+        self._cuadrantes_por_uuid: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def cargar(cls, connection: Any) -> SnapshotLocalPull:
+        snapshot = cls()
+        cursor = connection.cursor()
+        cursor.execute("SELECT id, uuid, nombre FROM personas ORDER BY id")
+        for row in cursor.fetchall():
+            snapshot._indexar_persona(int(row["id"]), row["uuid"], row["nombre"])
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'delegadas'")
+        if cursor.fetchone() is not None:
+            cursor.execute("SELECT uuid, nombre FROM delegadas")
+            for row in cursor.fetchall():
+                uuid_delegada = str(row["uuid"] or "").strip()
+                if uuid_delegada:
+                    snapshot._delegada_uuid_por_nombre.setdefault(_nombre_normalizado(row["nombre"]), uuid_delegada)
+        cursor.execute(f"SELECT {', '.join(SOLICITUD_COLUMNS)} FROM solicitudes ORDER BY id")
+        for row in cursor.fetchall():
+            snapshot._indexar_solicitud({column: row[column] for column in SOLICITUD_COLUMNS})
+        cursor.execute(f"SELECT {', '.join(CUADRANTE_COLUMNS)} FROM cuadrantes ORDER BY id")
+        for row in cursor.fetchall():
+            cuadrante = {column: row[column] for column in CUADRANTE_COLUMNS}
+            if cuadrante["uuid"]:
+                snapshot._cuadrantes_por_uuid.setdefault(str(cuadrante["uuid"]), cuadrante)
+        logger.info(
+            "pull_snapshot_local personas=%s solicitudes=%s cuadrantes=%s",
+            len(snapshot._persona_uuid_por_id),
+            len(snapshot._solicitudes_por_id),
+            len(snapshot._cuadrantes_por_uuid),
+        )
+        return snapshot
+
+    def persona_id(self, persona_uuid: str | None) -> int | None:
+        if not persona_uuid:
+            return None
+        return self._persona_id_por_uuid.get(persona_uuid)
+
+    def resolver_delegada_uuid(self, delegada_uuid: str | None, delegada_nombre: str | None) -> str | None:
+        """Misma regla que ``get_or_resolve_delegada_uuid``: uuid local, nombre en personas, nombre en delegadas."""
+        uuid_value = str(delegada_uuid or "").strip()
+        if uuid_value and uuid_value in self._persona_id_por_uuid:
+            return uuid_value
+        nombre = _nombre_normalizado(delegada_nombre)
+        if not nombre:
+            return None
+        return self._persona_uuid_por_nombre.get(nombre) or self._delegada_uuid_por_nombre.get(nombre)
+
+    def solicitud_por_uuid(self, uuid_value: str) -> dict[str, Any] | None:
+        return self._solicitudes_por_uuid.get(uuid_value)
+
+    def solicitud_por_clave_compuesta(self, clave: tuple[Any, ...] | None) -> dict[str, Any] | None:
+        if clave is None:
+            return None
+        candidatas = self._por_clave_compuesta.get(clave)
+        return candidatas[0] if candidatas else None
+
+    def existe_duplicado(self, clave: tuple[object, ...], exclude_uuid: str | None = None) -> bool:
+        delegada_key, fecha_pedida = clave[0], clave[1]
+        if not delegada_key or not fecha_pedida:
+            return False
+        return any(
+            not (exclude_uuid and row["uuid"] == exclude_uuid) for row in self._por_clave_dedupe.get(clave, ())
+        )
+
+    def cuadrante_por_uuid(self, uuid_value: str) -> dict[str, Any] | None:
+        return self._cuadrantes_por_uuid.get(uuid_value)
+
+    def registrar_insercion_solicitud(self, payload: tuple[Any, ...]) -> None:
+        """Indexa una fila insertada (o pendiente de volcar); su ``id`` se resuelve después."""
+        row: dict[str, Any] = dict.fromkeys(SOLICITUD_COLUMNS)
+        row.update({column: payload[index] for column, index in _INSERT_FIELDS.items()})
+        self._indexar_solicitud(row)
+
+    def registrar_actualizacion_solicitud(self, payload: tuple[Any, ...]) -> None:
+        row = self._solicitudes_por_id.get(int(payload[-1]))
+        if row is None:
+            return
+        self._desindexar_claves(row)
+        row.update({column: payload[index] for column, index in _UPDATE_FIELDS.items()})
+        self._indexar_claves(row)
+
+    def asignar_id_solicitud(self, row: dict[str, Any], solicitud_id: int) -> None:
+        row["id"] = solicitud_id
+        self._solicitudes_por_id[solicitud_id] = row
+
+    def registrar_cuadrante(self, cuadrante: dict[str, Any]) -> None:
+        self._cuadrantes_por_uuid[str(cuadrante["uuid"])] = cuadrante
+
+    def _indexar_persona(self, persona_id: int, persona_uuid: Any, nombre: Any) -> None:
+        uuid_value = str(persona_uuid or "").strip()
+        self._persona_uuid_por_id[persona_id] = persona_uuid
+        if uuid_value:
+            self._persona_id_por_uuid.setdefault(uuid_value, persona_id)
+            self._persona_uuid_por_nombre.setdefault(_nombre_normalizado(nombre), uuid_value)
+
+    def _indexar_solicitud(self, row: dict[str, Any]) -> None:
+        if row["uuid"]:
+            self._solicitudes_por_uuid.setdefault(str(row["uuid"]), row)
+        if row["id"] is not None:
+            self._solicitudes_por_id[int(row["id"])] = row
+        self._indexar_claves(row)
+
+    def _indexar_claves(self, row: dict[str, Any]) -> None:
+        if not _activa(row):
+            return
+        self._por_clave_compuesta.setdefault(self._clave_compuesta(row), []).append(row)
+        clave_dedupe = self._clave_dedupe(row)
+        if clave_dedupe is not None:
+            self._por_clave_dedupe.setdefault(clave_dedupe, []).append(row)
+
+    def _desindexar_claves(self, row: dict[str, Any]) -> None:
+        if not _activa(row):
+            return
+        for indice, clave in (
+            (self._por_clave_compuesta, self._clave_compuesta(row)),
+            (self._por_clave_dedupe, self._clave_dedupe(row)),
+        ):
+            candidatas = indice.get(clave) if clave is not None else None
+            if candidatas and row in candidatas:
+                candidatas.remove(row)
+
+    @staticmethod
+    def _clave_compuesta(row: dict[str, Any]) -> tuple[Any, ...]:
+        return (row["persona_id"], row["fecha_pedida"], 1 if row["completo"] else 0, row["desde_min"], row["hasta_min"])
+
+    def _clave_dedupe(self, row: dict[str, Any]) -> tuple[object, ...] | None:
+        persona_id = row["persona_id"]
+        if persona_id not in self._persona_uuid_por_id:
+            # Igual que el JOIN con personas de is_duplicate_local_solicitud.
+            return None
+        return sync_sheets_core.solicitud_dedupe_key_from_local_row(
+            {**row, "delegada_uuid": self._persona_uuid_por_id[persona_id]}
+        )
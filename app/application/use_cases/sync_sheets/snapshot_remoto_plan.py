@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+from itertools import zip_longest
+from typing import Any
+
+from app.application.use_cases.sync_sheets.payloads_puros import digest_fila
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rowcol_to_a1
+from app.core.errors import InfraError
+from app.domain.sheets_errors import SheetsRateLimitError
+from app.domain.sync_models import SyncRemoteSnapshot
+
+logger = logging.getLogger(__name__)
+
+COLUMNAS_HUELLA = ("uuid", "updated_at")
+
+
+def construir_snapshot_remoto(
+    worksheet_name: str, headers: list[Any], rows: list[tuple[int, dict[str, Any]]]
+) -> SyncRemoteSnapshot:
+    """Huella de ``uuid``/``updated_at`` a partir de las filas ya leídas para simular el plan.
+
+    Las filas en blanco que omite ``rows_with_index`` cuentan como celdas vacías, igual que
+    en la lectura por columnas con la que ``snapshot_vigente`` la compara.
+    """
+    cabecera = [str(celda or "").strip().lower() for celda in headers]
+    if not all(columna in cabecera for columna in COLUMNAS_HUELLA):
+        return SyncRemoteSnapshot(worksheet=worksheet_name)
+    indices = [cabecera.index(columna) for columna in COLUMNAS_HUELLA]
+    total_filas = max((row_number for row_number, _ in rows), default=1)
+    columnas: list[list[Any]] = []
+    for indice, canonica in zip(indices, COLUMNAS_HUELLA):
+        columna: list[Any] = [""] * total_filas
+        columna[0] = headers[indice]
+        for row_number, payload in rows:
+            columna[row_number - 1] = payload.get(headers[indice], payload.get(canonica, ""))
+        columnas.append(columna)
+    titulo = worksheet_name.replace("'", "''")
+    rangos = []
+    for indice in indices:
+        letra = rowcol_to_a1(1, indice + 1)[:-1]
+        rangos.append(f"'{titulo}'!{letra}:{letra}")
+    return SyncRemoteSnapshot(
+        worksheet=worksheet_name,
+        fingerprint_ranges=tuple(rangos),
+        fingerprint=huella_columnas(columnas),
+    )
+
+
+def huella_columnas(columnas: list[list[Any]]) -> str:
+    """Huella de varias columnas leídas por separado; ignora las filas vacías finales que recorta la API."""
+    filas = [tuple(str(celda or "").strip() for celda in fila) for fila in zip_longest(*columnas, fillvalue="")]
+    while filas and not any(filas[-1]):
+        filas.pop()
+    return digest_fila("\x1e".join(fila) for fila in filas)
+
+
+def snapshot_vigente(client: Any, snapshot: SyncRemoteSnapshot | None) -> bool:
+    """Lee solo las columnas de la huella (una llamada) y las compara con el snapshot."""
+    if snapshot is None or snapshot.fingerprint is None:
+        return False
+    try:
+        leidos = client.batch_get_ranges(list(snapshot.fingerprint_ranges))
+    except SheetsRateLimitError:
+        raise
+    except (InfraError, AttributeError):
+        logger.debug("No se pudo comprobar la huella remota de %s; se recalcula el plan.", snapshot.worksheet, exc_info=True)
+        return False
+    columnas = [[fila[0] if fila else "" for fila in leidos.get(rango, [])] for rango in snapshot.fingerprint_ranges]
+    return huella_columnas(columnas) == snapshot.fingerprint
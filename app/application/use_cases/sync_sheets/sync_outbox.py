@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LoteOutbox:
+    """Marcas de ``sync_outbox`` de una entidad leídas al iniciar su push.
+
+    ``hasta_seq`` es ``None`` si la conexión no tiene la tabla (bases sin migrar);
+    ``filtra`` es ``False`` cuando hay que recorrer la tabla completa (primer sync).
+    """
+
+    entidad: str
+    hasta_seq: int | None
+    filtra: bool
+
+
+def _es_tabla_ausente(exc: Exception) -> bool:
+    return "no such table: sync_outbox" in str(exc).lower()
+
+
+def abrir_lote(connection: Any, entidad: str, *, last_sync_at: str | None) -> LoteOutbox:
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT MAX(seq) FROM sync_outbox WHERE entidad = ?", (entidad,))
+    except Exception as exc:
+        if _es_tabla_ausente(exc):
+            logger.debug("sync_outbox no disponible; push de %s recorre la tabla completa", entidad)
+            return LoteOutbox(entidad=entidad, hasta_seq=None, filtra=False)
+        raise
+    row = cursor.fetchone()
+    hasta_seq = int(row[0] or 0) if row else 0
+    return LoteOutbox(entidad=entidad, hasta_seq=hasta_seq, filtra=bool(last_sync_at))
+
+
+def filtro_sql(lote: LoteOutbox, columna: str, *, clave_entera: bool = False) -> tuple[str, tuple[Any, ...]]:
+    """Devuelve ``(" AND ...", params)`` para restringir una consulta a las filas encoladas."""
+    if not lote.filtra:
+        return "", ()
+    clave = "CAST(clave AS INTEGER)" if clave_entera else "clave"
+    return (
+        f" AND {columna} IN (SELECT {clave} FROM sync_outbox WHERE entidad = ? AND seq <= ?)",
+        (lote.entidad, lote.hasta_seq),
+    )
+
+
+def confirmar_lote(connection: Any, lote: LoteOutbox) -> None:
+    """Borra las marcas leídas; el commit lo hace ``_set_last_sync_at`` al cerrar el push."""
+    if not lote.hasta_seq:
+        return
+    connection.cursor().execute(
+        "DELETE FROM sync_outbox WHERE entidad = ? AND seq <= ?",
+        (lote.entidad, lote.hasta_seq),
+    )
+
+
+def hay_pendientes(connection: Any) -> bool | None:
+    """``True``/``False`` según el outbox; ``None`` si la tabla no existe."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM sync_outbox LIMIT 1")
+    except Exception as exc:
+        if _es_tabla_ausente(exc):
+            return None
+        raise
+    return cursor.fetchone() is not None
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _es_tabla_ausente(exc: Exception) -> bool:
+    return "no such table: sync_row_digest" in str(exc).lower()
+
+
+def cargar_digests(connection: Any, entidad: str) -> dict[str, str] | None:
+    """Huellas aplicadas de ``entidad`` por uuid; ``None`` si la tabla no existe (bases sin migrar)."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT uuid, digest FROM sync_row_digest WHERE entity = ?", (entidad,))
+    except Exception as exc:
+        if _es_tabla_ausente(exc):
+            logger.debug("sync_row_digest no disponible; el pull de %s procesa todas las filas", entidad)
+            return None
+        raise
+    return {str(row[0]): str(row[1]) for row in cursor.fetchall()}
+
+
+def guardar_digests(connection: Any, entidad: str, digests: dict[str, str]) -> None:
+    """Upsert de las huellas aplicadas; el commit lo hace el savepoint del pull."""
+    if not digests:
+        return
+    connection.cursor().executemany(
+        """
+        INSERT INTO sync_row_digest (entity, uuid, digest) VALUES (?, ?, ?)
+        ON CONFLICT(entity, uuid) DO UPDATE SET digest = excluded.digest
+        """,
+        [(entidad, uuid_value, digest) for uuid_value, digest in digests.items()],
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from app.domain.ports import SqlCursorPort
 
@@ -28,16 +28,21 @@ def execute_with_validation(cursor: SqlCursorPort, sql: str, params: tuple[objec
     cursor.execute(sql, params)
 
 
-def rows_with_index(
-    values: list[list[Any]],
-    *,
-    worksheet_name: str,
-    aliases: dict[str, list[str]] | None = None,
-) -> tuple[list[str], list[tuple[int, dict[str, Any]]]]:
-    if not values:
-        return [], []
-    headers = values[0]
-    canonical_by_header: dict[str, str] = {}
+def executemany_with_validation(
+    cursor: SqlCursorPort, sql: str, rows: list[tuple[object, ...]], context: str
+) -> None:
+    expected = sql.count("?")
+    for params in rows:
+        if len(params) != expected:
+            raise ValueError(
+                f"SQL param mismatch for {context}: expected {expected} placeholders, got {len(params)} parameters."
+            )
+    cursor.executemany(sql, rows)
+
+
+def canonical_header_map(headers: list[Any], aliases: dict[str, list[str]] | None) -> dict[Any, str]:
+    """Nombre canónico de cada cabecera según ``aliases``; vacío si no hay alias."""
+    canonical_by_header: dict[Any, str] = {}
     if aliases:
         lowered_map: dict[str, str] = {}
         for canonical, names in aliases.items():
@@ -47,8 +52,39 @@ def rows_with_index(
         for header in headers:
             key = str(header).strip().lower()
             canonical_by_header[header] = lowered_map.get(key, header)
-    rows: list[tuple[int, dict[str, Any]]] = []
-    for row_number, row in enumerate(values[1:], start=2):
+    return canonical_by_header
+
+
+def rows_with_index(
+    values: list[list[Any]],
+    *,
+    worksheet_name: str,
+    aliases: dict[str, list[str]] | None = None,
+) -> tuple[list[str], list[tuple[int, dict[str, Any]]]]:
+    if not values:
+        return [], []
+    headers = values[0]
+    rows = list(iter_rows_with_index(headers, values[1:], aliases=aliases))
+    logger.info("Read worksheet=%s filas_leidas=%s", worksheet_name, len(rows))
+    return headers, rows
+
+
+def iter_valores_con_indice(values: Iterable[list[Any]]) -> Iterator[tuple[int, list[Any]]]:
+    """Filas no vacías (sin la cabecera) con su número de fila en la hoja, sin convertirlas en dict."""
+    for row_number, row in enumerate(values, start=2):
+        if any(str(cell).strip() for cell in row):
+            yield row_number, row
+
+
+def iter_rows_with_index(
+    headers: list[Any],
+    values: Iterable[list[Any]],
+    *,
+    aliases: dict[str, list[str]] | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Versión perezosa de ``rows_with_index`` para filas que llegan por páginas (sin la cabecera)."""
+    canonical_by_header = canonical_header_map(headers, aliases)
+    for row_number, row in enumerate(values, start=2):
         if not any(str(cell).strip() for cell in row):
             continue
         payload = {
@@ -64,6 +100,4 @@ def rows_with_index(
                     canonical_payload[canonical_key] = value
             payload = canonical_payload
         payload["__row_number__"] = row_number
-        rows.append((row_number, payload))
-    logger.info("Read worksheet=%s filas_leidas=%s", worksheet_name, len(rows))
-    return headers, rows
+        yield row_number, payload
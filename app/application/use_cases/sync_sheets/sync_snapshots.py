@@ -4,12 +4,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
 
+from app.domain.utc_timestamps import canonical_utc_or_raw
+
 
 @dataclass(frozen=True)
 class RemoteSolicitudRowDTO:
     row: dict[str, Any]
     uuid_value: str
-    remote_updated_at: datetime | None
+    remote_updated_at: datetime | str | None
 
 
 @dataclass(frozen=True)
@@ -33,7 +35,7 @@ def parse_remote_solicitud_row(
     row: dict[str, Any],
     *,
     normalize_remote_uuid: Callable[[Any], str],
-    parse_iso: Callable[[Any], datetime | None],
+    parse_iso: Callable[[Any], datetime | str | None],
 ) -> RemoteSolicitudRowDTO:
     uuid_value = normalize_remote_uuid(row.get("uuid"))
     remote_updated_at = parse_iso(row.get("updated_at")) if uuid_value else None
@@ -47,8 +49,8 @@ def build_pull_signals_snapshot(
     existing: Any | None,
     skip_duplicate: bool,
     enable_backfill: bool,
-    is_conflict: Callable[[Any, datetime | None, str | None], bool],
-    is_remote_newer: Callable[[Any, datetime | None], bool],
+    is_conflict: Callable[[Any, datetime | str | None, str | None], bool],
+    is_remote_newer: Callable[[Any, datetime | str | None], bool],
     last_sync_at: str | None,
 ) -> PullSignals:
     existing_uuid = str(existing["uuid"] or "").strip() if existing is not None else None
@@ -73,7 +75,7 @@ def build_pdf_log_payload(row: dict[str, Any]) -> dict[str, Any] | None:
         "rango_fechas": row.get("rango_fechas"),
         "fecha_generacion": row.get("fecha_generacion"),
         "hash": row.get("hash"),
-        "updated_at": row.get("updated_at"),
+        "updated_at": canonical_utc_or_raw(row.get("updated_at")),
         "source_device": row.get("source_device"),
     }
 
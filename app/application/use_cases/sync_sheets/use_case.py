@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.application.use_cases.sync_sheets.cache_preflight_escritura import ttl_preflight_segundos
+from app.application.use_cases.sync_sheets.checkpoint_pull import CheckpointPull, filas_por_bloque_pull
 from app.application.use_cases.sync_sheets.executor import execute_plan
 from app.application.use_cases.sync_sheets.orquestador_persistencia import OrquestadorPersistenciaSync
 from app.application.use_cases.sync_sheets.orquestador_preflight import OrquestadorPreflightSync
@@ -12,13 +14,14 @@ from app.application.use_cases.sync_sheets.orquestacion_modelos import (
     PullApplyContext,
 )
 from app.application.use_cases.sync_sheets.planner import build_plan
+from app.application.use_cases.sync_sheets.persistence_ops import LoteEscriturasSolicitudes
 from app.application.use_cases.sync_sheets.servicio_escritura_lotes import ServicioEscrituraLotes
 from app.application.use_cases.sync_sheets.pull_planner import PullPlannerSignals, plan_pull_actions
 from app.application.use_cases.sync_sheets.pull_runner import run_pull_actions, run_with_savepoint
 from app.application.use_cases import sync_sheets_core
 from app.application.use_cases.sync_sheets.normalization_rules import normalize_remote_uuid
 from app.application.delegada_resolution import get_or_resolve_delegada_uuid
-from app.application.use_cases.sync_sheets.push_builder import build_push_solicitudes_payloads
+from app.application.use_cases.sync_sheets.push_builder import build_push_solicitudes_delta, build_push_solicitudes_payloads
 from app.application.use_cases.sync_sheets.push_runner import run_push_values_update
 from app.application.use_cases.sync_sheets.sync_reporting_rules import (
     apply_stat_counter,
@@ -34,6 +37,7 @@ from app.application.use_cases.sync_sheets.sync_snapshots import (
     parse_remote_solicitud_row,
 )
 from app.domain.ports import (
+    TokenCancelacion,
     SheetsClientPort,
     SheetsConfigStorePort,
     SheetsRepositoryPort,
@@ -55,12 +59,15 @@ class SheetsSyncService(
         repository: SheetsRepositoryPort,
         *,
         enable_backfill: bool = False,
+        pull_chunk_rows: int | None = None,
+        preflight_ttl_seconds: float | None = None,
     ) -> None:
         self._connection = connection
         self._config_store = config_store
         self._client = client
         self._repository = repository
         self._worksheet_cache: dict[str, Any] = {}
+        self._worksheets_prefetched: set[str] = set()
         self._servicio_escritura_lotes = ServicioEscrituraLotes()
         self._pending_append_rows = self._servicio_escritura_lotes.pendientes_altas
         self._pending_batch_updates = self._servicio_escritura_lotes.pendientes_actualizaciones
@@ -68,12 +75,17 @@ class SheetsSyncService(
         self._worksheet_next_append_row = self._servicio_escritura_lotes.siguiente_fila_append
         self._enable_backfill = enable_backfill
         self._defer_local_commits = False
+        self._lote_solicitudes_pull: LoteEscriturasSolicitudes | None = None
         self._pull_apply_context: PullApplyContext | None = None
         self._delegadas_nombre_por_uuid_cache: dict[str, str] | None = None
+        self._filas_por_bloque_pull = filas_por_bloque_pull(pull_chunk_rows)
+        self._checkpoint_pull_pendiente: CheckpointPull | None = None
+        self._ttl_preflight_escritura = ttl_preflight_segundos(preflight_ttl_seconds)
 
-    def pull(self) -> SyncSummary:
+    def pull(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
         spreadsheet = self._ensure_connection_ready()
-        summary = self._pull_with_spreadsheet(spreadsheet)
+        with self._invalidando_preflight_por_permisos():
+            summary = self._pull_with_spreadsheet(spreadsheet, cancellation_token=cancellation_token)
         self._log_sync_stats("pull")
         return summary
 
@@ -82,16 +94,18 @@ class SheetsSyncService(
         preflight = self.preflight_permisos_escritura(spreadsheet)
         if not preflight.ok:
             return self._resolver_preflight_denegado(preflight)
-        summary = self._push_with_spreadsheet(spreadsheet)
+        with self._invalidando_preflight_por_permisos():
+            summary = self._push_with_spreadsheet(spreadsheet)
         self._log_sync_stats("push")
         return summary
 
-    def sync(self) -> SyncSummary:
-        return self.sync_bidirectional()
+    def sync(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
+        return self.sync_bidirectional(cancellation_token)
 
-    def sync_bidirectional(self) -> SyncSummary:
+    def sync_bidirectional(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
         spreadsheet = self._ensure_connection_ready()
-        pull_summary = self._pull_with_spreadsheet(spreadsheet)
+        with self._invalidando_preflight_por_permisos():
+            pull_summary = self._pull_with_spreadsheet(spreadsheet, cancellation_token=cancellation_token)
         self._connection.commit()
         preflight = self.preflight_permisos_escritura(spreadsheet)
         if not preflight.ok:
@@ -100,7 +114,8 @@ class SheetsSyncService(
             self._registrar_issue_preflight(preflight)
             self._log_sync_stats("sync_bidirectional")
             return combine_sync_summaries(pull_summary, SyncSummary(errors=1))
-        push_summary = self._push_with_spreadsheet(spreadsheet)
+        with self._invalidando_preflight_por_permisos():
+            push_summary = self._push_with_spreadsheet(spreadsheet)
         self._log_sync_stats("sync_bidirectional")
         return combine_sync_summaries(pull_summary, push_summary)
 
@@ -110,7 +125,8 @@ class SheetsSyncService(
 
     def execute_sync_plan(self, plan: SyncExecutionPlan) -> SyncSummary:
         spreadsheet = self._ensure_connection_ready()
-        return execute_plan(self, spreadsheet, plan)
+        with self._invalidando_preflight_por_permisos():
+            return execute_plan(self, spreadsheet, plan)
 
     def get_last_sync_at(self) -> str | None:
         return self._get_last_sync_at()
@@ -135,6 +151,7 @@ __all__ = [
     "SheetsSyncService",
     "apply_stat_counter",
     "build_pull_signals_snapshot",
+    "build_push_solicitudes_delta",
     "build_push_solicitudes_payloads",
     "get_or_resolve_delegada_uuid",
     "normalize_remote_uuid",
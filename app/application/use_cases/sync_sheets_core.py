@@ -5,6 +5,7 @@ from typing import Any
 
 from app.application.use_cases.sync_sheets import conflict_policy
 from app.application.sync_normalization import normalize_hhmm
+from app.domain.utc_timestamps import to_canonical_utc
 
 
 def _pick_value(row: dict[str, Any], key: str | tuple[str, ...], default: Any = "") -> Any:
@@ -199,26 +200,26 @@ def is_after_last_sync(updated_at: str | None, last_sync_at: str | None) -> bool
         return False
     if not last_sync_at:
         return True
-    parsed_updated = parse_iso(updated_at)
-    parsed_last = parse_iso(last_sync_at)
-    if not parsed_updated or not parsed_last:
+    # Con valores canónicos (los que se guardan) basta comparar cadenas; el resto se canoniza.
+    canonical_updated = to_canonical_utc(updated_at)
+    canonical_last = to_canonical_utc(last_sync_at)
+    if not canonical_updated or not canonical_last:
         return False
-    return parsed_updated > parsed_last
+    return canonical_updated > canonical_last
 
 
-def is_conflict(local_updated_at: str | None, remote_updated_at: datetime | None, last_sync_at: str | None) -> bool:
+def is_conflict(local_updated_at: str | None, remote_updated_at: datetime | str | None, last_sync_at: str | None) -> bool:
     return conflict_policy.is_conflict(local_updated_at, remote_updated_at, last_sync_at)
 
 
-def is_remote_newer(local_updated_at: str | None, remote_updated_at: datetime | None) -> bool:
-    if not remote_updated_at:
+def is_remote_newer(local_updated_at: str | None, remote_updated_at: datetime | str | None) -> bool:
+    canonical_remote = to_canonical_utc(remote_updated_at)
+    if not canonical_remote:
         return False
-    if not local_updated_at:
+    canonical_local = to_canonical_utc(local_updated_at)
+    if not canonical_local:
         return True
-    parsed_local = parse_iso(local_updated_at)
-    if not parsed_local:
-        return True
-    return remote_updated_at > parsed_local
+    return canonical_remote > canonical_local
 
 
 def remote_hhmm(hours: Any, minutes: Any, full_value: Any) -> str | None:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import importlib
 import logging
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Callable
 
@@ -47,7 +49,13 @@ from app.infrastructure.confirmacion_pdf.adaptadores import (
     GeneradorPdfConfirmadasDesdeCasosUso,
     RepositorioSolicitudesDesdeCasosUso,
 )
-from app.infrastructure.db import _default_db_path, get_connection
+from app.infrastructure.db import (
+    ConnectionProvider,
+    SingleConnectionProvider,
+    SQLiteConnectionPool,
+    _default_db_path,
+    get_connection,
+)
 from app.infrastructure.health_probes import (
     DefaultConnectivityProbe,
     SheetsConfigProbe,
@@ -74,7 +82,11 @@ from app.infrastructure.sheets_gateway_gspread import SheetsGatewayGspread
 from app.infrastructure.sheets_repository import SheetsRepository
 from app.infrastructure.sqlite_lock_error_classifier import SQLiteLockErrorClassifier
 from app.infrastructure.sync_sheets_adapter import SyncSheetsAdapter
-from app.configuracion.settings import is_read_only_enabled
+from app.configuracion.settings import (
+    is_read_only_enabled,
+    resolver_perfil_sqlite,
+    resolver_perfil_sqlite_lectura,
+)
 from aplicacion.puertos.proveedor_i18n import ProveedorI18N
 from aplicacion.puertos.repositorio_preferencias import IRepositorioPreferencias
 
@@ -114,14 +126,15 @@ def build_container(
     estado_modo_solo_lectura = crear_estado_modo_solo_lectura(is_read_only_enabled)
     politica_modo_solo_lectura = crear_politica_modo_solo_lectura(estado_modo_solo_lectura)
 
-    connection = connection_factory()
-    run_migrations(connection)
-    seed_if_empty(connection)
+    connections = _build_connection_provider(connection_factory)
+    with connections.writer() as connection:
+        run_migrations(connection)
+        seed_if_empty(connection)
 
-    persona_repo = RepositorioPersonasSQLite(connection)
-    solicitud_repo = SolicitudRepositorySQLite(connection)
-    grupo_repo = GrupoConfigRepositorySQLite(connection)
-    cuadrante_repo = CuadranteRepositorySQLite(connection)
+    persona_repo = RepositorioPersonasSQLite(connections)
+    solicitud_repo = SolicitudRepositorySQLite(connections)
+    grupo_repo = GrupoConfigRepositorySQLite(connections)
+    cuadrante_repo = CuadranteRepositorySQLite(connections)
 
     base_cuadrantes_service = BaseCuadrantesService(persona_repo, cuadrante_repo)
     base_cuadrantes_service.ensure_for_all_personas()
@@ -217,7 +230,7 @@ def build_container(
         preferencias_headless=preferencias_headless
     )
 
-    conflicts_repository = SQLiteConflictsRepository(connection)
+    conflicts_repository = SQLiteConflictsRepository(connections)
     conflicts_service = ConflictsService(
         conflicts_repository,
         lambda: config_store.load().device_id if config_store.load() else "",
@@ -263,6 +276,19 @@ def build_container(
     )
 
 
+def _build_connection_provider(connection_factory: ConnectionFactory) -> ConnectionProvider:
+    if connection_factory is get_connection:
+        pool = SQLiteConnectionPool(
+            partial(get_connection, perfil=resolver_perfil_sqlite()),
+            reader_factory=partial(get_connection, perfil=resolver_perfil_sqlite_lectura()),
+        )
+        atexit.register(pool.close)
+        return pool
+    # Factorías a medida (p. ej. ``:memory:`` en tests) no comparten base entre
+    # conexiones: se usa una única conexión para lecturas y escrituras.
+    return SingleConnectionProvider(connection_factory())
+
+
 def _build_repositorio_preferencias(
     *, preferencias_headless: bool = False
 ) -> IRepositorioPreferencias:
@@ -22,3 +22,23 @@ def resolver_startup_timeout_ms() -> int:
         return max(1, int(raw))
     except (TypeError, ValueError):
         return STARTUP_TIMEOUT_MS_POR_DEFECTO
+
+
+ENV_SQLITE_PERFIL = "HORAS_SINDICALES_SQLITE_PERFIL"
+ENV_SQLITE_PERFIL_LECTURA = "HORAS_SINDICALES_SQLITE_PERFIL_LECTURA"
+SQLITE_PERFIL_POR_DEFECTO = "interactive"
+SQLITE_PERFIL_LECTURA_POR_DEFECTO = "read-only"
+SQLITE_PERFILES_ESCRITURA = ("interactive", "bulk-import")
+SQLITE_PERFILES_LECTURA = ("read-only", "interactive", "bulk-import")
+
+
+def resolver_perfil_sqlite() -> str:
+    """Perfil de PRAGMAs del escritor SQLite de la app (interactive o bulk-import)."""
+    valor = os.environ.get(ENV_SQLITE_PERFIL, "").strip().lower()
+    return valor if valor in SQLITE_PERFILES_ESCRITURA else SQLITE_PERFIL_POR_DEFECTO
+
+
+def resolver_perfil_sqlite_lectura() -> str:
+    """Perfil de PRAGMAs de las conexiones lectoras por hilo (read-only por defecto)."""
+    valor = os.environ.get(ENV_SQLITE_PERFIL_LECTURA, "").strip().lower()
+    return valor if valor in SQLITE_PERFILES_LECTURA else SQLITE_PERFIL_LECTURA_POR_DEFECTO
@@ -72,6 +72,21 @@ class ConflictoSolicitud:
     completo: bool
 
 
+@dataclass(frozen=True)
+class ConsumoMensual:
+    """Minutos de una delegada agregados por año y mes.
+
+    `minutos` recoge solo solicitudes confirmadas (histórico) y `pendientes_min`
+    las que aún no se han confirmado; ambas excluyen las borradas.
+    """
+
+    persona_id: int
+    year: int
+    month: int
+    minutos: int
+    pendientes_min: int = 0
+
+
 @dataclass(frozen=True)
 class GrupoConfig:
     """Configuración global que afecta a cálculos agregados y salida de PDF.
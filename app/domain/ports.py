@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Protocol, Iterable
+from typing import Any, Protocol, Iterable, Iterator
 
 from app.domain.sync_models import SyncExecutionPlan, SyncSummary
-from app.domain.models import ConflictoSolicitud, GrupoConfig, Persona, SheetsConfig, Solicitud
+from app.domain.models import ConflictoSolicitud, ConsumoMensual, GrupoConfig, Persona, SheetsConfig, Solicitud
 
 
 class PersonaRepository(Protocol):
@@ -36,7 +36,10 @@ class CuadranteRepository(Protocol):
 
 
 class SolicitudRepository(Protocol):
-    def list_historico_batch(self, *, limit: int, offset: int) -> Iterable[Solicitud]:
+    def list_historico_batch(
+        self, *, limit: int, after: tuple[str, int] | None = None
+    ) -> Iterable[Solicitud]:
+        """Página del histórico ordenada por (fecha_pedida, id) DESC, posterior al cursor `after`."""
         ...
 
     def list_by_persona(self, persona_id: int) -> Iterable[Solicitud]:
@@ -50,6 +53,10 @@ class SolicitudRepository(Protocol):
     def list_by_persona_and_fecha(self, persona_id: int, fecha_pedida: str) -> Iterable[Solicitud]:
         ...
 
+    def list_consumo_mensual(self, year: int, persona_id: int | None = None) -> Iterable[ConsumoMensual]:
+        """Devuelve el consumo por (persona, mes) del año sin recorrer las solicitudes."""
+        ...
+
     def list_pendientes_by_persona(self, persona_id: int) -> Iterable[Solicitud]:
         ...
 
@@ -98,12 +105,22 @@ class SolicitudRepository(Protocol):
     def create(self, solicitud: Solicitud) -> Solicitud:
         ...
 
+    def create_many(self, solicitudes: Iterable[Solicitud]) -> list[Solicitud]:
+        ...
+
     def update_pdf_info(self, solicitud_id: int, pdf_path: str, pdf_hash: str | None) -> None:
         ...
 
+    def update_pdf_info_many(self, updates: Iterable[tuple[int, str, str | None]]) -> None:
+        """Aplica ``(id, pdf_path, pdf_hash)`` a todo el lote en una sola transacción."""
+        ...
+
     def mark_generated(self, solicitud_id: int, generated: bool = True) -> None:
         ...
 
+    def mark_generated_many(self, solicitud_ids: Iterable[int], generated: bool = True) -> None:
+        ...
+
     def delete(self, solicitud_id: int) -> None:
         ...
 
@@ -125,6 +142,9 @@ class SqlCursorPort(Protocol):
     def execute(self, sql: str, params: tuple[object, ...] = ...) -> Any:
         ...
 
+    def executemany(self, sql: str, params: Iterable[tuple[object, ...]]) -> Any:
+        ...
+
     def fetchone(self) -> Any:
         ...
 
@@ -166,6 +186,9 @@ class SheetsGatewayPort(Protocol):
     def upsert_solicitud(self, config: SheetsConfig, row: dict[str, Any]) -> None:
         ...
 
+    def upsert_many(self, config: SheetsConfig, worksheet_name: str, rows: list[dict[str, Any]]) -> None:
+        ...
+
     def backfill_uuid(self, config: SheetsConfig, worksheet_name: str, row_index: int, uuid_value: str) -> None:
         ...
 
@@ -177,6 +200,9 @@ class SheetsClientPort(Protocol):
     def read_all_values(self, worksheet_name: str) -> list[list[str]]:
         ...
 
+    def iter_values(self, worksheet_name: str) -> Iterator[list[str]]:
+        ...
+
     def get_worksheet(self, name: str):
         ...
 
@@ -234,8 +260,13 @@ class LocalDbProbe(Protocol):
         """Retorna un mapa clave->(ok, mensaje, action_id) para checks de integridad local."""
 
 
+class TokenCancelacion(Protocol):
+    def is_cancelled(self) -> bool:
+        ...
+
+
 class SheetsSyncPort(Protocol):
-    def pull(self) -> SyncSummary:
+    def pull(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
         ...
 
     def push(self) -> SyncSummary:
@@ -244,7 +275,7 @@ class SheetsSyncPort(Protocol):
     def sync(self) -> SyncSummary:
         ...
 
-    def sync_bidirectional(self) -> SyncSummary:
+    def sync_bidirectional(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
         ...
 
     def simulate_sync_plan(self) -> SyncExecutionPlan:
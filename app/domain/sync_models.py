@@ -146,6 +146,19 @@ class SyncPlanItem:
     diffs: tuple[SyncFieldDiff, ...] = ()
 
 
+@dataclass(frozen=True)
+class SyncRemoteSnapshot:
+    """Huella de las columnas ``uuid``/``updated_at`` remotas leídas al simular.
+
+    ``fingerprint_ranges`` son los rangos A1 de esas columnas; al confirmar basta leerlos
+    para saber si la hoja cambió. Sin huella (columnas ausentes) el plan se recalcula.
+    """
+
+    worksheet: str
+    fingerprint_ranges: tuple[str, ...] = ()
+    fingerprint: str | None = None
+
+
 @dataclass(frozen=True)
 class SyncExecutionPlan:
     generated_at: str
@@ -156,6 +169,7 @@ class SyncExecutionPlan:
     conflicts: tuple[SyncPlanItem, ...] = ()
     potential_errors: tuple[str, ...] = ()
     values_matrix: tuple[tuple[Any, ...], ...] = ()
+    remote_snapshot: SyncRemoteSnapshot | None = None
 
     @property
     def has_changes(self) -> bool:
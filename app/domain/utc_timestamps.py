@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+# Formato único de ``updated_at`` y ``last_sync_at``: UTC, microsegundos y ``Z``.
+# Con ancho fijo, el orden de las cadenas coincide con el cronológico, así que las
+# comparaciones (también en SQL con los índices de ``updated_at``) no necesitan parsear.
+CANONICAL_UTC_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+CANONICAL_UTC_LENGTH = 27
+
+
+def utc_now_canonical() -> str:
+    return format_canonical_utc(datetime.now(timezone.utc))
+
+
+def format_canonical_utc(moment: datetime) -> str:
+    """Las fechas sin zona se interpretan como UTC, igual que en ``sync_sheets_core.parse_iso``."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime(CANONICAL_UTC_FORMAT)
+
+
+def is_canonical_utc(text: str) -> bool:
+    return (
+        len(text) == CANONICAL_UTC_LENGTH
+        and text[10] == "T"
+        and text[19] == "."
+        and text[26] == "Z"
+    )
+
+
+def to_canonical_utc(value: Any) -> str | None:
+    """Forma canónica de un timestamp ISO (o ``datetime``); ``None`` si está vacío o no se entiende.
+
+    Los valores ya canónicos se devuelven sin parsear.
+    """
+    if isinstance(value, datetime):
+        return format_canonical_utc(value)
+    if not value:
+        return None
+    text = str(value).strip()
+    if is_canonical_utc(text):
+        return text
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        return format_canonical_utc(datetime.fromisoformat(text))
+    except ValueError:
+        return None
+
+
+def canonical_utc_or_raw(value: Any) -> Any:
+    """Para datos de entrada: canoniza si se puede y, si no, conserva el valor tal cual."""
+    return to_canonical_utc(value) or value
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import logging
 import sqlite3
-from datetime import UTC, datetime
 from pathlib import Path
 from shutil import copy2
 
 from app.application.ports.datos_demo_puerto import CargadorDatosDemoPuerto, ResultadoCargaDemoPuerto
+from app.domain.models import Solicitud
+from app.domain.utc_timestamps import utc_now_canonical
+from app.infrastructure.configuracion_conexion_sqlite import PERFIL_IMPORTACION_MASIVA, cerrar_conexion
 from app.infrastructure.db import get_connection
 from app.infrastructure.migrations import run_migrations
+from app.infrastructure.repos_sqlite import SolicitudRepositorySQLite
 
 logger = logging.getLogger(__name__)
 
@@ -56,33 +59,23 @@ class CargadorDatosDemoSQLite(CargadorDatosDemoPuerto):
     def _recrear_base(self, dataset: dict[str, object]) -> None:
         if self._db_path.exists():
             self._db_path.unlink()
-        connection = get_connection(self._db_path)
+        connection = get_connection(self._db_path, perfil=PERFIL_IMPORTACION_MASIVA)
         try:
             run_migrations(connection)
             self._insertar_dataset(connection, dataset)
             connection.commit()
         finally:
-            connection.close()
+            cerrar_conexion(connection)
 
     def _insertar_dataset(self, connection: sqlite3.Connection, dataset: dict[str, object]) -> None:
-        cursor = connection.cursor()
         delegadas = dataset.get("delegadas", [])
-        for delegada in delegadas:
-            self._insertar_delegada(cursor, delegada)
+        self._insertar_delegadas(connection, delegadas)
         solicitudes = dataset.get("solicitudes", [])
-        for solicitud in solicitudes:
-            self._insertar_solicitud(cursor, solicitud)
+        self._insertar_solicitudes(connection, solicitudes)
 
-    def _insertar_delegada(self, cursor: sqlite3.Cursor, delegada: dict[str, object]) -> None:
-        now = datetime.now(UTC).isoformat()
-        params = (
-            delegada["nombre"],
-            delegada.get("genero", "F"),
-            int(delegada.get("horas_mes_min", 720)),
-            int(delegada.get("horas_ano_min", 8640)),
-            now,
-        )
-        cursor.execute(
+    def _insertar_delegadas(self, connection: sqlite3.Connection, delegadas: list[dict[str, object]]) -> None:
+        now = utc_now_canonical()
+        connection.executemany(
             """
             INSERT INTO personas (
                 nombre, genero, horas_mes_min, horas_ano_min, is_active,
@@ -93,40 +86,45 @@ class CargadorDatosDemoSQLite(CargadorDatosDemoPuerto):
                 updated_at, deleted
             ) VALUES (?, ?, ?, ?, 1, 240, 240, 240, 240, 240, 240, 240, 240, 240, 240, 0, 0, 0, 0, 1, 0, ?, 0)
             """,
-            params,
+            [
+                (
+                    delegada["nombre"],
+                    delegada.get("genero", "F"),
+                    int(delegada.get("horas_mes_min", 720)),
+                    int(delegada.get("horas_ano_min", 8640)),
+                    now,
+                )
+                for delegada in delegadas
+            ],
         )
 
-    def _insertar_solicitud(self, cursor: sqlite3.Cursor, solicitud: dict[str, object]) -> None:
-        persona_id = self._resolver_persona_id(cursor, str(solicitud["delegada"]))
-        now = datetime.now(UTC).isoformat()
-        fecha = str(solicitud["fecha_pedida"])
-        params = (
-            persona_id,
-            fecha,
-            fecha,
-            solicitud.get("desde_min"),
-            solicitud.get("hasta_min"),
-            1 if solicitud.get("completo", False) else 0,
-            int(solicitud.get("horas_solicitadas_min", 0)),
-            str(solicitud.get("notas", "")),
-            str(solicitud.get("notas", "")),
-            1 if solicitud.get("generated", False) else 0,
-            now,
-            now,
-        )
-        cursor.execute(
-            """
-            INSERT INTO solicitudes (
-                persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min,
-                completo, horas_solicitadas_min, observaciones, notas,
-                generated, updated_at, created_at, deleted
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-            """,
-            params,
+    def _insertar_solicitudes(self, connection: sqlite3.Connection, solicitudes: list[dict[str, object]]) -> None:
+        persona_ids = {
+            str(row["nombre"]): int(row["id"]) for row in connection.execute("SELECT id, nombre FROM personas")
+        }
+        repo = SolicitudRepositorySQLite(connection)
+        creadas = repo.create_many(self._construir_solicitud(persona_ids, solicitud) for solicitud in solicitudes)
+        repo.mark_generated_many(
+            creada.id
+            for creada, solicitud in zip(creadas, solicitudes)
+            if creada.id is not None and solicitud.get("generated", False)
         )
 
-    def _resolver_persona_id(self, cursor: sqlite3.Cursor, nombre: str) -> int:
-        row = cursor.execute("SELECT id FROM personas WHERE nombre = ?", (nombre,)).fetchone()
-        if row is None:
+    def _construir_solicitud(self, persona_ids: dict[str, int], solicitud: dict[str, object]) -> Solicitud:
+        nombre = str(solicitud["delegada"])
+        if nombre not in persona_ids:
             raise ValueError(f"Delegada no encontrada en dataset demo: {nombre}")
-        return int(row[0])
+        fecha = str(solicitud["fecha_pedida"])
+        notas = str(solicitud.get("notas", ""))
+        return Solicitud(
+            id=None,
+            persona_id=persona_ids[nombre],
+            fecha_solicitud=fecha,
+            fecha_pedida=fecha,
+            desde_min=solicitud.get("desde_min"),
+            hasta_min=solicitud.get("hasta_min"),
+            completo=bool(solicitud.get("completo", False)),
+            horas_solicitadas_min=int(solicitud.get("horas_solicitadas_min", 0)),
+            observaciones=notas,
+            notas=notas,
+        )
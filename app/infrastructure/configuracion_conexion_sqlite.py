@@ -2,17 +2,95 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from dataclasses import dataclass
 
 DEFAULT_BUSY_TIMEOUT_MS = 30000
 
+PERFIL_INTERACTIVO = "interactive"
+PERFIL_IMPORTACION_MASIVA = "bulk-import"
+PERFIL_SOLO_LECTURA = "read-only"
+
 logger = logging.getLogger(__name__)
 
 
-def configurar_conexion(conn: sqlite3.Connection, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS) -> None:
-    """Aplica PRAGMAs base para conexiones SQLite del proyecto."""
+@dataclass(frozen=True)
+class PerfilPragmasSQLite:
+    """PRAGMAs de rendimiento por tipo de carga (ver ``scripts/benchmarks/perfiles_pragmas.py``)."""
+
+    nombre: str
+    cache_size_kib: int
+    mmap_size_bytes: int
+    temp_store: str
+    wal_autocheckpoint_paginas: int
+    query_only: bool = False
+
+
+PERFILES_PRAGMAS: dict[str, PerfilPragmasSQLite] = {
+    PERFIL_INTERACTIVO: PerfilPragmasSQLite(
+        nombre=PERFIL_INTERACTIVO,
+        cache_size_kib=16 * 1024,
+        mmap_size_bytes=64 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint_paginas=1000,
+    ),
+    PERFIL_IMPORTACION_MASIVA: PerfilPragmasSQLite(
+        nombre=PERFIL_IMPORTACION_MASIVA,
+        cache_size_kib=64 * 1024,
+        mmap_size_bytes=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint_paginas=10000,
+    ),
+    PERFIL_SOLO_LECTURA: PerfilPragmasSQLite(
+        nombre=PERFIL_SOLO_LECTURA,
+        cache_size_kib=16 * 1024,
+        mmap_size_bytes=128 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint_paginas=1000,
+        query_only=True,
+    ),
+}
+
+
+def resolver_perfil_pragmas(perfil: PerfilPragmasSQLite | str | None) -> PerfilPragmasSQLite:
+    if isinstance(perfil, PerfilPragmasSQLite):
+        return perfil
+    nombre = (perfil or PERFIL_INTERACTIVO).strip().lower()
+    if nombre not in PERFILES_PRAGMAS:
+        logger.warning("sqlite_perfil_desconocido perfil=%s; se usa %s", nombre, PERFIL_INTERACTIVO)
+        return PERFILES_PRAGMAS[PERFIL_INTERACTIVO]
+    return PERFILES_PRAGMAS[nombre]
+
+
+def configurar_conexion(
+    conn: sqlite3.Connection,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    perfil: PerfilPragmasSQLite | str | None = None,
+) -> None:
+    """Aplica PRAGMAs base para conexiones SQLite del proyecto y, si se indica, un perfil."""
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
     try:
         conn.execute("PRAGMA journal_mode=WAL")
     except sqlite3.DatabaseError:
         logger.debug("sqlite_journal_mode_wal_not_supported", exc_info=True)
+    if perfil is not None:
+        aplicar_perfil_pragmas(conn, resolver_perfil_pragmas(perfil))
+
+
+def aplicar_perfil_pragmas(conn: sqlite3.Connection, perfil: PerfilPragmasSQLite) -> None:
+    # cache_size negativo = KiB en lugar de páginas, independiente del page_size.
+    conn.execute(f"PRAGMA cache_size=-{int(perfil.cache_size_kib)}")
+    conn.execute(f"PRAGMA mmap_size={int(perfil.mmap_size_bytes)}")
+    conn.execute(f"PRAGMA temp_store={perfil.temp_store}")
+    conn.execute(f"PRAGMA wal_autocheckpoint={int(perfil.wal_autocheckpoint_paginas)}")
+    conn.execute(f"PRAGMA query_only={'ON' if perfil.query_only else 'OFF'}")
+
+
+def cerrar_conexion(conn: sqlite3.Connection) -> None:
+    """Ejecuta ``PRAGMA optimize`` con las estadísticas de la sesión y cierra la conexión."""
+    try:
+        conn.execute("PRAGMA query_only=OFF")
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        logger.debug("sqlite_optimize_on_close_skipped", exc_info=True)
+    conn.close()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+
+from app.infrastructure.sqlite_uow import transaccion
+
+# Misma regla que los triggers de la migración 007: solo cuentan solicitudes no
+# borradas con fecha_pedida ISO; generated = 1 suma minutos y generated = 0 pendientes.
+SQL_CONSUMO_DESDE_SOLICITUDES = """
+    SELECT persona_id,
+           CAST(substr(fecha_pedida, 1, 4) AS INTEGER) AS year,
+           CAST(substr(fecha_pedida, 6, 2) AS INTEGER) AS month,
+           SUM(CASE WHEN generated = 1 THEN COALESCE(horas_solicitadas_min, 0) ELSE 0 END) AS minutos,
+           SUM(CASE WHEN generated = 0 THEN COALESCE(horas_solicitadas_min, 0) ELSE 0 END) AS pendientes_min
+    FROM solicitudes
+    WHERE COALESCE(deleted, 0) = 0
+      AND fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+    GROUP BY persona_id, substr(fecha_pedida, 1, 7)
+"""
+
+_ClaveConsumo = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class DiferenciaConsumoMensual:
+    persona_id: int
+    year: int
+    month: int
+    esperado: tuple[int, int]
+    almacenado: tuple[int, int]
+
+
+def _leer_consumo(connection: sqlite3.Connection, sql: str) -> dict[_ClaveConsumo, tuple[int, int]]:
+    return {
+        (int(row[0]), int(row[1]), int(row[2])): (int(row[3] or 0), int(row[4] or 0))
+        for row in connection.execute(sql).fetchall()
+    }
+
+
+def reconstruir_consumo_mensual(connection: sqlite3.Connection) -> int:
+    """Regenera la tabla resumen desde `solicitudes` y devuelve las filas escritas."""
+    with transaccion(connection):
+        connection.execute("DELETE FROM consumo_mensual")
+        cursor = connection.execute(
+            f"""
+            INSERT INTO consumo_mensual (persona_id, year, month, minutos, pendientes_min)
+            {SQL_CONSUMO_DESDE_SOLICITUDES}
+            """
+        )
+        return int(cursor.rowcount)
+
+
+def verificar_consumo_mensual(connection: sqlite3.Connection) -> list[DiferenciaConsumoMensual]:
+    """Compara la tabla resumen con el agregado real; vacío significa consistente."""
+    esperado = _leer_consumo(connection, SQL_CONSUMO_DESDE_SOLICITUDES)
+    almacenado = _leer_consumo(
+        connection,
+        "SELECT persona_id, year, month, minutos, pendientes_min FROM consumo_mensual",
+    )
+    diferencias: list[DiferenciaConsumoMensual] = []
+    for clave in sorted(esperado.keys() | almacenado.keys()):
+        valor_esperado = esperado.get(clave, (0, 0))
+        valor_almacenado = almacenado.get(clave, (0, 0))
+        if valor_esperado == valor_almacenado:
+            continue
+        persona_id, year, month = clave
+        diferencias.append(
+            DiferenciaConsumoMensual(
+                persona_id=persona_id,
+                year=year,
+                month=month,
+                esperado=valor_esperado,
+                almacenado=valor_almacenado,
+            )
+        )
+    return diferencias
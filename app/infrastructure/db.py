@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import logging
 import sqlite3
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any, ContextManager, Protocol, TypeVar, cast
 
-from app.infrastructure.configuracion_conexion_sqlite import configurar_conexion
+from app.infrastructure.configuracion_conexion_sqlite import (
+    PERFIL_INTERACTIVO,
+    PerfilPragmasSQLite,
+    cerrar_conexion,
+    configurar_conexion,
+)
 
 DB_FILENAME = "horas_sindicales.db"
 DB_RUNTIME_DIR = Path("logs") / "runtime"
 DEFAULT_BUSY_TIMEOUT_MS = 30000
 
+logger = logging.getLogger(__name__)
+
 
 def _default_db_path() -> Path:
     root = Path(__file__).resolve().parents[2]
     return root / DB_RUNTIME_DIR / DB_FILENAME
 
 
-def configure_sqlite_connection(connection: sqlite3.Connection, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS) -> None:
+def configure_sqlite_connection(
+    connection: sqlite3.Connection,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    *,
+    perfil: PerfilPragmasSQLite | str = PERFIL_INTERACTIVO,
+) -> None:
     connection.row_factory = sqlite3.Row
-    configurar_conexion(connection, busy_timeout_ms=busy_timeout_ms)
+    configurar_conexion(connection, busy_timeout_ms=busy_timeout_ms, perfil=perfil)
     connection.execute("PRAGMA synchronous=NORMAL")
 
 
@@ -26,6 +44,7 @@ def get_connection(
     *,
     busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
     check_same_thread: bool = False,
+    perfil: PerfilPragmasSQLite | str = PERFIL_INTERACTIVO,
 ) -> sqlite3.Connection:
     path = db_path or _default_db_path()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -34,5 +53,160 @@ def get_connection(
         check_same_thread=check_same_thread,
         timeout=max(1.0, busy_timeout_ms / 1000),
     )
-    configure_sqlite_connection(connection, busy_timeout_ms=busy_timeout_ms)
+    configure_sqlite_connection(connection, busy_timeout_ms=busy_timeout_ms, perfil=perfil)
     return connection
+
+
+class ConnectionProvider(Protocol):
+    """Entrega la conexión adecuada al hilo que la pide.
+
+    ``connection()`` sirve lecturas; dentro de ``writer()`` devuelve la conexión
+    de escritura para que el hilo lea sus propios cambios aún no confirmados.
+    """
+
+    def connection(self) -> sqlite3.Connection: ...
+
+    def writer(self) -> ContextManager[sqlite3.Connection]: ...
+
+
+class _WriterLock:
+    """Cerrojo reentrante del escritor con espera acotada, como ``busy_timeout``."""
+
+    def __init__(self, timeout_seconds: float) -> None:
+        self._lock = threading.RLock()
+        self._timeout_seconds = timeout_seconds
+        self._owner: int | None = None
+        self._depth = 0
+
+    def held_by_current_thread(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    @contextlib.contextmanager
+    def hold(self) -> Iterator[None]:
+        if not self._lock.acquire(timeout=self._timeout_seconds):
+            raise sqlite3.OperationalError("database is locked (writer busy)")
+        self._owner = threading.get_ident()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+            self._lock.release()
+
+
+class SingleConnectionProvider:
+    """Proveedor sobre una conexión ya abierta (tests, ``:memory:``, scripts).
+
+    Lecturas y escrituras comparten la conexión; el escritor sigue serializado.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, *, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS) -> None:
+        self._connection = connection
+        self._writer_lock = _WriterLock(busy_timeout_ms / 1000)
+
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    @contextlib.contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock.hold():
+            yield self._connection
+
+
+class SQLiteConnectionPool:
+    """Una conexión lectora por hilo y un único escritor serializado.
+
+    Con WAL, las lecturas de la UI no esperan a una transacción larga del sync:
+    cada hilo lee su propia instantánea mientras el escritor trabaja.
+    ``reader_factory`` permite abrir los lectores con otro perfil (p. ej. ``read-only``).
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], sqlite3.Connection] = get_connection,
+        *,
+        reader_factory: Callable[[], sqlite3.Connection] | None = None,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    ) -> None:
+        self._connection_factory = connection_factory
+        self._reader_factory = reader_factory or connection_factory
+        self._writer_lock = _WriterLock(busy_timeout_ms / 1000)
+        self._writer_connection: sqlite3.Connection | None = None
+        self._readers: dict[int, tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._readers_lock = threading.Lock()
+        self._closed = False
+
+    def connection(self) -> sqlite3.Connection:
+        if self._writer_lock.held_by_current_thread():
+            return self._get_writer_connection()
+        return self._get_reader_connection()
+
+    @contextlib.contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock.hold():
+            yield self._get_writer_connection()
+
+    def reader_count(self) -> int:
+        with self._readers_lock:
+            return len(self._readers)
+
+    def close(self) -> None:
+        with self._readers_lock:
+            readers = [connection for _, connection in self._readers.values()]
+            self._readers.clear()
+            self._closed = True
+        for connection in readers:
+            cerrar_conexion(connection)
+        with self._writer_lock.hold():
+            if self._writer_connection is not None:
+                cerrar_conexion(self._writer_connection)
+                self._writer_connection = None
+
+    def _get_writer_connection(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+        if self._writer_connection is None:
+            self._writer_connection = self._connection_factory()
+        return self._writer_connection
+
+    def _get_reader_connection(self) -> sqlite3.Connection:
+        thread = threading.current_thread()
+        with self._readers_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+            entry = self._readers.get(thread.ident or 0)
+            if entry is not None and entry[0] is thread:
+                return entry[1]
+            stale = self._pop_dead_readers()
+            connection = self._reader_factory()
+            self._readers[thread.ident or 0] = (thread, connection)
+        for stale_connection in stale:
+            cerrar_conexion(stale_connection)
+        logger.debug("sqlite_reader_connection_opened thread=%s", thread.name)
+        return connection
+
+    def _pop_dead_readers(self) -> list[sqlite3.Connection]:
+        dead = [ident for ident, (thread, _) in self._readers.items() if not thread.is_alive()]
+        return [self._readers.pop(ident)[1] for ident in dead]
+
+
+def as_connection_provider(source: sqlite3.Connection | ConnectionProvider) -> ConnectionProvider:
+    if isinstance(source, sqlite3.Connection):
+        return SingleConnectionProvider(source)
+    return source
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def uses_writer(method: _Method) -> _Method:
+    """Ejecuta un método de repositorio con el escritor de ``self._connections`` tomado."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with self._connections.writer():
+            return method(self, *args, **kwargs)
+
+    return cast(_Method, wrapper)
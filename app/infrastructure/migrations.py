@@ -13,6 +13,7 @@ from typing import Callable
 
 from app.bootstrap.logging import configure_logging
 from app.bootstrap.settings import resolve_log_dir
+from app.infrastructure.consumo_mensual_sqlite import reconstruir_consumo_mensual, verificar_consumo_mensual
 from app.infrastructure.db import _default_db_path, get_connection
 
 MigrationHook = Callable[[sqlite3.Connection], None]
@@ -229,7 +230,11 @@ def run_data_fixups(connection: sqlite3.Connection) -> None:
 
 def build_cli() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Gestiona migraciones SQLite")
-    parser.add_argument("command", choices=["up", "down", "status"], help="Operación a ejecutar")
+    parser.add_argument(
+        "command",
+        choices=["up", "down", "status", "rebuild-consumo", "verify-consumo"],
+        help="Operación a ejecutar",
+    )
     parser.add_argument("--db", default=str(_default_db_path()), help="Ruta al archivo SQLite")
     parser.add_argument("--steps", type=int, default=1, help="Número de migraciones a revertir")
     return parser
@@ -255,6 +260,26 @@ def main() -> int:
             "Migraciones revertidas",
             extra={"context_module": __name__, "context_function": "main", "command": "down", "count": len(rolled_back)},
         )
+    elif args.command == "rebuild-consumo":
+        filas = reconstruir_consumo_mensual(connection)
+        logger.info(
+            "Resumen consumo_mensual reconstruido",
+            extra={"context_module": __name__, "context_function": "main", "command": "rebuild-consumo", "count": filas},
+        )
+    elif args.command == "verify-consumo":
+        diferencias = verificar_consumo_mensual(connection)
+        for diferencia in diferencias:
+            logger.warning(
+                "Desajuste consumo_mensual persona_id=%s periodo=%04d-%02d esperado=%s almacenado=%s",
+                diferencia.persona_id,
+                diferencia.year,
+                diferencia.month,
+                diferencia.esperado,
+                diferencia.almacenado,
+                extra={"context_module": __name__, "context_function": "main", "command": "verify-consumo"},
+            )
+        connection.close()
+        return 1 if diferencias else 0
     else:
         for item in runner.status():
             marker = "[x]" if item["applied"] else "[ ]"
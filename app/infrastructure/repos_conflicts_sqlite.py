@@ -4,7 +4,7 @@ import json
 import sqlite3
 
 from app.application.ports.conflicts_repository import ConflictRecord
-from datetime import datetime, timezone
+from app.domain.utc_timestamps import utc_now_canonical
 from app.infrastructure.conflicts_payloads import (
     apply_mark_dirty,
     build_cuadrante_data_local,
@@ -17,6 +17,7 @@ from app.infrastructure.conflicts_payloads import (
     solicitud_insert_params,
     solicitud_update_params,
 )
+from app.infrastructure.db import ConnectionProvider, as_connection_provider, uses_writer
 
 
 def _execute_with_validation(cursor: sqlite3.Cursor, sql: str, params: tuple[object, ...], context: str) -> None:
@@ -30,8 +31,12 @@ def _execute_with_validation(cursor: sqlite3.Cursor, sql: str, params: tuple[obj
 
 
 class SQLiteConflictsRepository:
-    def __init__(self, connection: sqlite3.Connection) -> None:
-        self._connection = connection
+    def __init__(self, connection: sqlite3.Connection | ConnectionProvider) -> None:
+        self._connections = as_connection_provider(connection)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.connection()
 
     def list_conflicts(self) -> list[ConflictRecord]:
         cursor = self._connection.cursor()
@@ -62,6 +67,7 @@ class SQLiteConflictsRepository:
         row = cursor.fetchone()
         return int(row["total"] if row else 0)
 
+    @uses_writer
     def resolve_conflict(self, conflict_id: int, keep_local: bool, device_id: str) -> bool:
         cursor = self._connection.cursor()
         cursor.execute(
@@ -339,7 +345,7 @@ class SQLiteConflictsRepository:
 
     @staticmethod
     def _now_iso() -> str:
-        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        return utc_now_canonical()
 
     @staticmethod
     def _normalize_dia(dia: str) -> str | None:
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 import logging
+import re
 import sqlite3
 import time
 import uuid
-from datetime import datetime, timezone
+from dataclasses import replace
+from datetime import datetime
 from typing import Callable, Iterable, TypeVar
 
-from app.domain.models import ConflictoSolicitud, GrupoConfig, Solicitud
+from app.domain.models import ConflictoSolicitud, ConsumoMensual, GrupoConfig, Solicitud
 from app.domain.ports import (
     CuadranteRepository,
     GrupoConfigRepository,
     SolicitudRepository,
 )
 from app.domain.time_utils import minutes_to_hhmm
+from app.domain.utc_timestamps import utc_now_canonical
 from app.infrastructure.repos_sqlite_builders import (
     SOLICITUD_SELECT_FIELDS,
     build_period_filters,
@@ -24,14 +27,45 @@ from app.infrastructure.repos_sqlite_builders import (
 )
 from app.infrastructure.repositorio_personas_sqlite import RepositorioPersonasSQLite  # noqa: F401 - re-export for compatibility
 from app.infrastructure.configuracion_conexion_sqlite import configurar_conexion
+from app.infrastructure.db import ConnectionProvider, as_connection_provider, uses_writer
 from app.infrastructure.sqlite_uow import transaccion
 
 
 logger = logging.getLogger(__name__)
 
 _LOCKED_RETRY_BACKOFF_SECONDS = (0.05, 0.15, 0.3)
+_UUID_LOOKUP_CHUNK = 500
+_FECHA_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 _T = TypeVar("_T")
 
+_INSERT_SOLICITUD_SQL = """
+    INSERT INTO solicitudes (
+        uuid, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
+        horas_solicitadas_min, observaciones, notas, pdf_path, pdf_hash, generated, created_at, updated_at, deleted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Misma clasificación que la validación de dominio: la nueva solicitud completa choca con
+# cualquier pendiente (DUPLICADO si también es completa); una parcial choca con una completa,
+# duplica el mismo tramo exacto o solapa si los intervalos se cortan (tramos contiguos no).
+_CONFLICTO_PENDIENTE_SQL = """
+    SELECT id, persona_id, fecha_pedida, desde_min, hasta_min, completo, tipo_conflicto
+    FROM (
+        SELECT s.id, s.persona_id, s.fecha_pedida, s.desde_min, s.hasta_min, s.completo,
+               CASE
+                   WHEN ? = 1 THEN CASE WHEN COALESCE(s.completo, 0) != 0 THEN 'DUPLICADO' ELSE 'SOLAPE' END
+                   WHEN COALESCE(s.completo, 0) != 0 THEN 'SOLAPE'
+                   WHEN s.desde_min IS ? AND s.hasta_min IS ? THEN 'DUPLICADO'
+                   WHEN s.desde_min < ? AND s.hasta_min > ? THEN 'SOLAPE'
+               END AS tipo_conflicto
+        FROM solicitudes s
+        WHERE {where}
+    )
+    WHERE tipo_conflicto IS NOT NULL
+    ORDER BY id DESC
+    LIMIT 1
+"""
+
 
 def _configure_connection_for_runtime(connection: sqlite3.Connection) -> None:
     """Aplica pragmas defensivos para minimizar conflictos de lock en runtime."""
@@ -79,7 +113,7 @@ def _run_in_transaction_with_retry(
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now_canonical()
 
 
 def _execute_with_validation(
@@ -95,31 +129,22 @@ def _execute_with_validation(
     cursor.execute(sql, tuple(params_list))
 
 
-def _detectar_conflicto_desde_fila(
-    *,
-    desde_min: int | None,
-    hasta_min: int | None,
-    completo: bool,
-    existente: sqlite3.Row,
-) -> ConflictoSolicitud | None:
-    existente_completo = bool(existente["completo"])
-    existente_desde = existente["desde_min"]
-    existente_hasta = existente["hasta_min"]
-    if completo:
-        if existente_completo:
-            return _crear_conflicto("DUPLICADO", existente)
-        return _crear_conflicto("SOLAPE", existente)
-    if existente_completo:
-        return _crear_conflicto("SOLAPE", existente)
-    if desde_min == existente_desde and hasta_min == existente_hasta:
-        return _crear_conflicto("DUPLICADO", existente)
-    if _solapan_intervalos(desde_min, hasta_min, existente_desde, existente_hasta):
-        return _crear_conflicto("SOLAPE", existente)
-    return None
+def _executemany_with_validation(
+    cursor: sqlite3.Cursor, sql: str, rows: list[tuple[object, ...]], context: str
+) -> None:
+    expected = sql.count("?")
+    for params in rows:
+        if len(params) != expected:
+            raise ValueError(
+                f"SQL param mismatch for {context}: expected {expected} placeholders, got {len(params)} parameters."
+            )
+    cursor.executemany(sql, rows)
 
 
 def _normalizar_fecha_iso(fecha: str) -> str:
     fecha_norm = str(fecha).strip()
+    if _FECHA_ISO_RE.fullmatch(fecha_norm):
+        return fecha_norm
     for pattern in ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%d-%m-%Y"):
         try:
             return datetime.strptime(fecha_norm, pattern).strftime("%Y-%m-%d")
@@ -141,17 +166,6 @@ def _normalizar_minutos(valor: int | str | None) -> int | None:
     )
 
 
-def _solapan_intervalos(
-    nuevo_desde: int | None,
-    nuevo_hasta: int | None,
-    existente_desde: int | None,
-    existente_hasta: int | None,
-) -> bool:
-    if None in {nuevo_desde, nuevo_hasta, existente_desde, existente_hasta}:
-        return False
-    return bool(nuevo_desde < existente_hasta and nuevo_hasta > existente_desde)
-
-
 def _crear_conflicto(tipo: str, fila: sqlite3.Row) -> ConflictoSolicitud:
     return ConflictoSolicitud(
         tipo=tipo,
@@ -165,9 +179,14 @@ def _crear_conflicto(tipo: str, fila: sqlite3.Row) -> ConflictoSolicitud:
 
 
 class CuadranteRepositorySQLite(CuadranteRepository):
-    def __init__(self, connection: sqlite3.Connection) -> None:
-        self._connection = connection
-        _configure_connection_for_runtime(self._connection)
+    def __init__(self, connection: sqlite3.Connection | ConnectionProvider) -> None:
+        self._connections = as_connection_provider(connection)
+        if isinstance(connection, sqlite3.Connection):
+            _configure_connection_for_runtime(connection)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.connection()
 
     def exists_for_delegada(self, delegada_uuid: str, dia_semana: str) -> bool:
         cursor = self._connection.cursor()
@@ -184,6 +203,7 @@ class CuadranteRepositorySQLite(CuadranteRepository):
         )
         return cursor.fetchone() is not None
 
+    @uses_writer
     def create(
         self, delegada_uuid: str, dia_semana: str, man_min: int, tar_min: int
     ) -> None:
@@ -213,9 +233,14 @@ class CuadranteRepositorySQLite(CuadranteRepository):
 
 
 class SolicitudRepositorySQLite(SolicitudRepository):
-    def __init__(self, connection: sqlite3.Connection) -> None:
-        self._connection = connection
-        _configure_connection_for_runtime(self._connection)
+    def __init__(self, connection: sqlite3.Connection | ConnectionProvider) -> None:
+        self._connections = as_connection_provider(connection)
+        if isinstance(connection, sqlite3.Connection):
+            _configure_connection_for_runtime(connection)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.connection()
 
     @staticmethod
     def _row_to_solicitud(row: sqlite3.Row) -> Solicitud:
@@ -251,19 +276,32 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         )
         return [self._row_to_solicitud(row) for row in cursor.fetchall()]
 
-    def list_historico_batch(self, *, limit: int, offset: int) -> Iterable[Solicitud]:
+    def list_historico_batch(
+        self, *, limit: int, after: tuple[str, int] | None = None
+    ) -> Iterable[Solicitud]:
+        """Página del histórico por keyset: filas estrictamente anteriores a `after`.
+
+        `after` es el par (fecha_pedida, id) de la última fila de la página previa;
+        sin desplazamiento, cada página cuesta lo mismo sin importar su posición.
+        """
         cursor = self._connection.cursor()
+        keyset_clause = ""
+        params: tuple[object, ...] = (limit,)
+        if after is not None:
+            keyset_clause = "AND (fecha_pedida, id) < (?, ?)"
+            params = (after[0], after[1], limit)
         cursor.execute(
-            """
+            f"""
             SELECT id, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
                    horas_solicitadas_min, observaciones, notas, pdf_path, pdf_hash, generated
             FROM solicitudes
             WHERE generated = 1
               AND (deleted = 0 OR deleted IS NULL)
+              {keyset_clause}
             ORDER BY fecha_pedida DESC, id DESC
-            LIMIT ? OFFSET ?
+            LIMIT ?
             """,
-            (limit, offset),
+            params,
         )
         return [self._row_to_solicitud(row) for row in cursor.fetchall()]
 
@@ -372,6 +410,39 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         )
         return [self._row_to_solicitud(row) for row in cursor.fetchall()]
 
+    def list_consumo_mensual(
+        self, year: int, persona_id: int | None = None
+    ) -> Iterable[ConsumoMensual]:
+        """Lee la tabla `consumo_mensual`, mantenida por triggers sobre `solicitudes`."""
+        cursor = self._connection.cursor()
+
+        def _query() -> list[ConsumoMensual]:
+            clauses = ["year = ?"]
+            params: list[object] = [year]
+            if persona_id is not None:
+                clauses.insert(0, "persona_id = ?")
+                params.insert(0, persona_id)
+            cursor.execute(
+                f"""
+                SELECT persona_id, year, month, minutos, pendientes_min
+                FROM consumo_mensual
+                WHERE {" AND ".join(clauses)}
+                """,
+                tuple(params),
+            )
+            return [
+                ConsumoMensual(
+                    persona_id=int_or_zero(row["persona_id"]),
+                    year=int_or_zero(row["year"]),
+                    month=int_or_zero(row["month"]),
+                    minutos=int_or_zero(row["minutos"]),
+                    pendientes_min=int_or_zero(row["pendientes_min"]),
+                )
+                for row in cursor.fetchall()
+            ]
+
+        return _run_with_locked_retry(_query, context="solicitudes.list_consumo_mensual")
+
     def get_by_id(self, solicitud_id: int) -> Solicitud | None:
         cursor = self._connection.cursor()
 
@@ -452,50 +523,53 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         *,
         excluir_solicitud_id: int | None = None,
     ) -> ConflictoSolicitud | None:
-        """Detecta conflicto solo contra pendientes activas (generated = 0 y no borradas)."""
+        """Detecta conflicto solo contra pendientes activas (generated = 0 y no borradas).
+
+        La clasificación se resuelve en SQL sobre ``idx_sol_pendientes_persona_fecha``
+        y devuelve la pendiente más reciente en conflicto.
+        """
         fecha_normalizada = _normalizar_fecha_iso(fecha_pedida)
         desde_normalizado = _normalizar_minutos(desde_min)
         hasta_normalizado = _normalizar_minutos(hasta_min)
-        cursor = self._connection.cursor()
         clauses = [
             "s.persona_id = ?",
             "s.fecha_pedida = ?",
             "s.generated = 0",
             "(s.deleted = 0 OR s.deleted IS NULL)",
         ]
-        params: list[object] = [persona_id, fecha_normalizada]
+        params: list[object] = [
+            int(completo),
+            desde_normalizado,
+            hasta_normalizado,
+            hasta_normalizado,
+            desde_normalizado,
+            persona_id,
+            fecha_normalizada,
+        ]
         if excluir_solicitud_id is not None:
             clauses.append("s.id != ?")
             params.append(excluir_solicitud_id)
 
-        cursor.execute(
-            f"""
-            SELECT s.id, s.persona_id, s.fecha_pedida, s.desde_min, s.hasta_min, s.completo, s.generated
-            FROM solicitudes s
-            WHERE {" AND ".join(clauses)}
-            ORDER BY s.id DESC
-            """,
-            tuple(params),
+        cursor = self._connection.cursor()
+        _execute_with_validation(
+            cursor,
+            _CONFLICTO_PENDIENTE_SQL.format(where=" AND ".join(clauses)),
+            params,
+            "solicitudes.detectar_conflicto_pendiente",
         )
-        for row in cursor.fetchall():
-            conflicto = _detectar_conflicto_desde_fila(
-                desde_min=desde_normalizado,
-                hasta_min=hasta_normalizado,
-                completo=completo,
-                existente=row,
-            )
-            if conflicto is None:
-                continue
-            logger.debug(
-                "Conflicto de solicitud pendiente detectado persona_id=%s fecha=%s tipo_conflicto=%s "
-                "id_existente=%s",
-                persona_id,
-                fecha_normalizada,
-                conflicto.tipo,
-                conflicto.id_existente,
-            )
-            return conflicto
-        return None
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        conflicto = _crear_conflicto(str(row["tipo_conflicto"]), row)
+        logger.debug(
+            "Conflicto de solicitud pendiente detectado persona_id=%s fecha=%s tipo_conflicto=%s "
+            "id_existente=%s",
+            persona_id,
+            fecha_normalizada,
+            conflicto.tipo,
+            conflicto.id_existente,
+        )
+        return conflicto
 
     def find_duplicate(
         self,
@@ -525,6 +599,7 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         )
         return conflicto is not None and conflicto.tipo == "DUPLICADO"
 
+    @uses_writer
     def create(self, solicitud: Solicitud) -> Solicitud:
         logger.info(
             "INSERT solicitudes persona_id=%s fecha_pedida=%s completo=%s desde_min=%s hasta_min=%s horas_min=%s",
@@ -542,12 +617,7 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         def _operation() -> None:
             _execute_with_validation(
                 cursor,
-                """
-                INSERT INTO solicitudes (
-                    uuid, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
-                    horas_solicitadas_min, observaciones, notas, pdf_path, pdf_hash, generated, created_at, updated_at, deleted
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_SOLICITUD_SQL,
                 solicitud_insert_params(solicitud, solicitud_uuid, created_at),
                 "solicitudes.insert",
             )
@@ -571,6 +641,45 @@ class SolicitudRepositorySQLite(SolicitudRepository):
             generated=False,
         )
 
+    @uses_writer
+    def create_many(self, solicitudes: Iterable[Solicitud]) -> list[Solicitud]:
+        """Inserta el lote con un único ``executemany`` dentro de una transacción."""
+        lote = [(str(uuid.uuid4()), solicitud) for solicitud in solicitudes]
+        if not lote:
+            return []
+        logger.info("INSERT solicitudes lote=%s", len(lote))
+        cursor = self._connection.cursor()
+        created_at = _now_iso()
+
+        def _operation() -> dict[str, int]:
+            _executemany_with_validation(
+                cursor,
+                _INSERT_SOLICITUD_SQL,
+                [solicitud_insert_params(solicitud, solicitud_uuid, created_at) for solicitud_uuid, solicitud in lote],
+                "solicitudes.insert_many",
+            )
+            return self._ids_by_uuid(cursor, [solicitud_uuid for solicitud_uuid, _ in lote])
+
+        ids = _run_in_transaction_with_retry(
+            self._connection, _operation, context="solicitudes.create_many"
+        )
+        return [
+            replace(solicitud, id=ids[solicitud_uuid], notas=solicitud.notas or "", generated=False)
+            for solicitud_uuid, solicitud in lote
+        ]
+
+    @staticmethod
+    def _ids_by_uuid(cursor: sqlite3.Cursor, uuids: list[str]) -> dict[str, int]:
+        # ``lastrowid`` no es fiable tras ``executemany``: se recuperan por el índice único de uuid.
+        ids: dict[str, int] = {}
+        for start in range(0, len(uuids), _UUID_LOOKUP_CHUNK):
+            chunk = uuids[start : start + _UUID_LOOKUP_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(f"SELECT id, uuid FROM solicitudes WHERE uuid IN ({placeholders})", chunk)
+            ids.update({row["uuid"]: int(row["id"]) for row in cursor.fetchall()})
+        return ids
+
+    @uses_writer
     def delete(self, solicitud_id: int) -> None:
         cursor = self._connection.cursor()
         updated_at = _now_iso()
@@ -591,6 +700,7 @@ class SolicitudRepositorySQLite(SolicitudRepository):
             self._connection, _operation, context="solicitudes.delete"
         )
 
+    @uses_writer
     def delete_by_ids(self, solicitud_ids: Iterable[int]) -> None:
         ids = list(solicitud_ids)
         if not ids:
@@ -607,6 +717,7 @@ class SolicitudRepositorySQLite(SolicitudRepository):
             self._connection, _operation, context="solicitudes.delete_by_ids"
         )
 
+    @uses_writer
     def update_pdf_info(
         self, solicitud_id: int, pdf_path: str, pdf_hash: str | None
     ) -> None:
@@ -629,6 +740,7 @@ class SolicitudRepositorySQLite(SolicitudRepository):
             self._connection, _operation, context="solicitudes.update_pdf_info"
         )
 
+    @uses_writer
     def mark_generated(self, solicitud_id: int, generated: bool = True) -> None:
         cursor = self._connection.cursor()
         updated_at = _now_iso()
@@ -650,10 +762,67 @@ class SolicitudRepositorySQLite(SolicitudRepository):
         )
 
 
+    @uses_writer
+    def update_pdf_info_many(
+        self, updates: Iterable[tuple[int, str, str | None]]
+    ) -> None:
+        """Aplica ``(id, pdf_path, pdf_hash)`` a todo el lote en una sola transacción."""
+        updated_at = _now_iso()
+        rows = [(pdf_path, pdf_hash, updated_at, solicitud_id) for solicitud_id, pdf_path, pdf_hash in updates]
+        if not rows:
+            return
+        cursor = self._connection.cursor()
+
+        def _operation() -> None:
+            _executemany_with_validation(
+                cursor,
+                """
+                UPDATE solicitudes
+                SET pdf_path = ?, pdf_hash = ?, generated = 1, updated_at = ?
+                WHERE id = ?
+                """,
+                rows,
+                "solicitudes.update_pdf_info_many",
+            )
+
+        _run_in_transaction_with_retry(
+            self._connection, _operation, context="solicitudes.update_pdf_info_many"
+        )
+
+    @uses_writer
+    def mark_generated_many(self, solicitud_ids: Iterable[int], generated: bool = True) -> None:
+        updated_at = _now_iso()
+        rows = [(int(generated), updated_at, solicitud_id) for solicitud_id in solicitud_ids]
+        if not rows:
+            return
+        cursor = self._connection.cursor()
+
+        def _operation() -> None:
+            _executemany_with_validation(
+                cursor,
+                """
+                UPDATE solicitudes
+                SET generated = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                rows,
+                "solicitudes.mark_generated_many",
+            )
+
+        _run_in_transaction_with_retry(
+            self._connection, _operation, context="solicitudes.mark_generated_many"
+        )
+
+
 class GrupoConfigRepositorySQLite(GrupoConfigRepository):
-    def __init__(self, connection: sqlite3.Connection) -> None:
-        self._connection = connection
-        _configure_connection_for_runtime(self._connection)
+    def __init__(self, connection: sqlite3.Connection | ConnectionProvider) -> None:
+        self._connections = as_connection_provider(connection)
+        if isinstance(connection, sqlite3.Connection):
+            _configure_connection_for_runtime(connection)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.connection()
 
     def get(self) -> GrupoConfig | None:
         cursor = self._connection.cursor()
@@ -679,6 +848,7 @@ class GrupoConfigRepositorySQLite(GrupoConfigRepository):
             ),
         )
 
+    @uses_writer
     def upsert(self, config: GrupoConfig) -> GrupoConfig:
         cursor = self._connection.cursor()
 
@@ -168,10 +168,19 @@ def build_solicitud_candidate(
     )
 
 
-def build_period_filters(year: int, month: int | None = None) -> tuple[str, tuple[str, ...]]:
+def build_period_bounds(year: int, month: int | None = None) -> tuple[str, str]:
+    """Devuelve el rango ISO semiabierto [inicio, fin) que cubre el periodo."""
     if month is None:
-        return "strftime('%Y', fecha_pedida) = ?", (f"{year:04d}",)
-    return "strftime('%Y', fecha_pedida) = ? AND strftime('%m', fecha_pedida) = ?", (f"{year:04d}", f"{month:02d}")
+        return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+    if month == 12:
+        return f"{year:04d}-12-01", f"{year + 1:04d}-01-01"
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month + 1:02d}-01"
+
+
+def build_period_filters(year: int, month: int | None = None) -> tuple[str, tuple[str, ...]]:
+    # Comparación por rango para que SQLite use idx_sol_persona_fecha_pedida
+    # (strftime() sobre la columna obliga a recorrer todas las filas).
+    return "fecha_pedida >= ? AND fecha_pedida < ?", build_period_bounds(year, month)
 
 
 def build_soft_delete_many_sql(ids: Iterable[int]) -> tuple[str, list[object]]:
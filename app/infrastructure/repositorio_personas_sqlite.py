@@ -4,11 +4,11 @@ import logging
 import sqlite3
 import time
 import uuid
-from datetime import datetime, timezone
 from typing import Callable, Iterable, TypeVar
 
 from app.domain.models import Persona
 from app.domain.ports import PersonaRepository
+from app.domain.utc_timestamps import utc_now_canonical
 from app.infrastructure.repos_sqlite_builders import (
     PERSONA_SELECT_FIELDS,
     persona_insert_params,
@@ -16,6 +16,7 @@ from app.infrastructure.repos_sqlite_builders import (
     row_to_persona,
 )
 from app.infrastructure.configuracion_conexion_sqlite import configurar_conexion
+from app.infrastructure.db import ConnectionProvider, as_connection_provider, uses_writer
 from app.infrastructure.sqlite_uow import transaccion
 
 
@@ -71,7 +72,7 @@ def _run_in_transaction_with_retry(
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now_canonical()
 
 
 def _execute_with_validation(cursor: sqlite3.Cursor, sql: str, params: Iterable[object], context: str) -> None:
@@ -86,9 +87,14 @@ def _execute_with_validation(cursor: sqlite3.Cursor, sql: str, params: Iterable[
 
 
 class RepositorioPersonasSQLite(PersonaRepository):
-    def __init__(self, connection: sqlite3.Connection) -> None:
-        self._connection = connection
-        _configure_connection_for_runtime(self._connection)
+    def __init__(self, connection: sqlite3.Connection | ConnectionProvider) -> None:
+        self._connections = as_connection_provider(connection)
+        if isinstance(connection, sqlite3.Connection):
+            _configure_connection_for_runtime(connection)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.connection()
 
     def list_all(self, include_inactive: bool = False) -> Iterable[Persona]:
         cursor = self._connection.cursor()
@@ -119,6 +125,7 @@ class RepositorioPersonasSQLite(PersonaRepository):
         row = cursor.fetchone()
         return row_to_persona(row) if row else None
 
+    @uses_writer
     def create(self, persona: Persona) -> Persona:
         cursor = self._connection.cursor()
         persona_uuid = str(uuid.uuid4())
@@ -167,6 +174,7 @@ class RepositorioPersonasSQLite(PersonaRepository):
             trabaja_finde=persona.trabaja_finde,
         )
 
+    @uses_writer
     def update(self, persona: Persona) -> Persona:
         cursor = self._connection.cursor()
         updated_at = _now_iso()
@@ -201,6 +209,7 @@ class RepositorioPersonasSQLite(PersonaRepository):
         row = cursor.fetchone()
         return row_to_persona(row) if row else None
 
+    @uses_writer
     def get_or_create_uuid(self, persona_id: int) -> str | None:
         cursor = self._connection.cursor()
         cursor.execute("SELECT uuid FROM personas WHERE id = ? AND (deleted = 0 OR deleted IS NULL)", (persona_id,))
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import sqlite3
 import uuid
-from datetime import datetime, timezone
+
+from app.domain.utc_timestamps import utc_now_canonical
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +77,7 @@ def seed_if_empty(connection: sqlite3.Connection) -> None:
     has_uuid = _column_exists(cursor, "personas", "uuid")
     has_updated_at = _column_exists(cursor, "personas", "updated_at")
     has_deleted = _column_exists(cursor, "personas", "deleted")
-    now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now_iso = utc_now_canonical()
     extra_columns: list[str] = []
     if has_uuid:
         extra_columns.append("uuid")
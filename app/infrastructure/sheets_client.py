@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Iterator, TypeVar
 
 import gspread
 from google.auth.exceptions import DefaultCredentialsError
@@ -15,7 +16,10 @@ from app.core.observability import get_correlation_id
 from app.domain.ports import SheetsClientPort
 from app.domain.sheets_errors import SheetsPermissionError, SheetsRateLimitError
 from app.infrastructure.sheets_client_puros import (
+    answered_batch_get_ranges,
     normalize_batch_get_result,
+    pad_rows,
+    paged_range,
     read_backoff_seconds,
     should_retry_rate_limit,
     worksheet_from_operation_name,
@@ -23,27 +27,59 @@ from app.infrastructure.sheets_client_puros import (
     write_backoff_seconds,
 )
 from app.infrastructure.sheets_errors import map_gspread_exception
+from app.infrastructure.sheets_rate_limiter import (
+    DEFAULT_BURST,
+    READ_QUOTA_PER_MINUTE,
+    WRITE_QUOTA_PER_MINUTE,
+    TokenBucket,
+)
+from app.infrastructure.sheets_values_cache import (
+    DEFAULT_VALUES_CACHE_MAX_BYTES,
+    WorksheetValuesCache,
+    estimate_row_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 5
 _BASE_BACKOFF_SECONDS = 1
 _WRITE_MAX_RETRIES = 5
+# Filas por ventana en las lecturas paginadas (``iter_values``).
+DEFAULT_READ_PAGE_ROWS = 5000
 
 T = TypeVar("T")
 
 
 class SheetsClient(SheetsClientPort):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        read_quota_per_minute: int = READ_QUOTA_PER_MINUTE,
+        write_quota_per_minute: int = WRITE_QUOTA_PER_MINUTE,
+        burst: int = DEFAULT_BURST,
+        values_cache_max_bytes: int = DEFAULT_VALUES_CACHE_MAX_BYTES,
+        read_page_rows: int = DEFAULT_READ_PAGE_ROWS,
+    ) -> None:
+        if read_page_rows <= 0:
+            raise ValueError("read_page_rows debe ser mayor que cero")
         self._client: Any | None = None
         self._spreadsheet: gspread.Spreadsheet | None = None
-        self._worksheet_values_cache: dict[str, list[list[str]]] = {}
+        self._worksheet_values_cache = WorksheetValuesCache(values_cache_max_bytes)
+        self._read_page_rows = read_page_rows
         self._worksheet_cache: dict[str, gspread.Worksheet] = {}
         self._worksheets_by_title_cache: dict[str, gspread.Worksheet] | None = None
         self._read_calls_count = 0
         self._avoided_requests_count = 0
         self._write_calls_count = 0
         self._sheets_api_calls_count = 0
+        self._read_bucket = TokenBucket(read_quota_per_minute, burst=burst)
+        self._write_bucket = TokenBucket(write_quota_per_minute, burst=burst)
+        self._throttled_calls_count = 0
+        self._throttle_wait_seconds = 0.0
+        # El cliente se comparte entre hilos (escrituras en paralelo, lectura del pull en
+        # segundo plano): los contadores y la caché de worksheets van bajo lock.
+        self._stats_lock = threading.Lock()
+        self._worksheets_lock = threading.Lock()
         self._service_account_email: str | None = None
 
     def open_spreadsheet(self, credentials_path: Path, spreadsheet_id: str) -> gspread.Spreadsheet:
@@ -58,13 +94,17 @@ class SheetsClient(SheetsClientPort):
                 spreadsheet_id=spreadsheet_id,
             )
             self._spreadsheet = spreadsheet
-            self._worksheet_values_cache = {}
-            self._worksheet_cache = {}
-            self._worksheets_by_title_cache = None
-            self._read_calls_count = 0
-            self._avoided_requests_count = 0
-            self._write_calls_count = 0
-            self._sheets_api_calls_count = 0
+            self._worksheet_values_cache.clear()
+            with self._worksheets_lock:
+                self._worksheet_cache = {}
+                self._worksheets_by_title_cache = None
+            with self._stats_lock:
+                self._read_calls_count = 0
+                self._avoided_requests_count = 0
+                self._write_calls_count = 0
+                self._sheets_api_calls_count = 0
+                self._throttled_calls_count = 0
+                self._throttle_wait_seconds = 0.0
             return spreadsheet
         except (
             gspread.exceptions.GSpreadException,
@@ -89,30 +129,86 @@ class SheetsClient(SheetsClientPort):
             raise mapped_error from exc
 
     def read_all_values(self, worksheet_name: str) -> list[list[str]]:
-        if worksheet_name in self._worksheet_values_cache:
-            self._avoided_requests_count += 1
-            return self._worksheet_values_cache[worksheet_name]
+        cached = self._worksheet_values_cache.get(worksheet_name)
+        if cached is not None:
+            self._count_avoided_request()
+            return cached
         worksheet = self.get_worksheet(worksheet_name)
         values = self._with_rate_limit_retry(
             f"worksheet.get_all_values({worksheet_name})",
             worksheet.get_all_values,
         )
-        self._worksheet_values_cache[worksheet_name] = values
-        self._read_calls_count += 1
+        self._worksheet_values_cache.put(worksheet_name, values)
+        self._count_read_call()
         return values
 
+    def iter_values(self, worksheet_name: str) -> Iterator[list[str]]:
+        """Recorre la hoja por ventanas de filas (``A{n}:<última columna>{m}``) y la entrega fila a fila.
+
+        La primera fila es la cabecera y las filas vacías intermedias se entregan como ``[]``,
+        así que el número de fila es la posición + 1, igual que con ``read_all_values``. Si la
+        hoja está en caché no se llama a la API. Si cabe en el presupuesto de la caché, se
+        guarda al terminar; si no, solo se retiene una ventana a la vez.
+        """
+        cached = self._worksheet_values_cache.get(worksheet_name)
+        if cached is not None:
+            self._count_avoided_request()
+            yield from cached
+            return
+        worksheet = self.get_worksheet(worksheet_name)
+        columns = max(int(getattr(worksheet, "col_count", 26) or 26), 1)
+        grid_rows = max(int(getattr(worksheet, "row_count", 0) or 0), 0)
+        retained: list[list[str]] | None = []
+        retained_bytes = 0
+        pending_empty = 0
+        start = 1
+        while True:
+            page = self._read_page(worksheet_name, start, columns)
+            # Una ventana sin ninguna fila con datos marca el final (no se admiten huecos de una ventana entera).
+            if not page:
+                break
+            # La API recorta las filas vacías finales de cada ventana: se reponen solo si hay datos después.
+            empty_rows: list[list[str]] = [[] for _ in range(pending_empty)]
+            for row in (*empty_rows, *page):
+                if retained is not None:
+                    retained.append(row)
+                    retained_bytes += estimate_row_bytes(row)
+                    if retained_bytes > self._worksheet_values_cache.max_bytes:
+                        retained = None
+                yield row
+            pending_empty = self._read_page_rows - len(page)
+            start += self._read_page_rows
+            # ``row_count`` puede estar desfasado si otro cliente añadió filas: una ventana llena sigue leyendo.
+            if start > grid_rows and pending_empty:
+                break
+        if retained is not None:
+            self._worksheet_values_cache.put(worksheet_name, pad_rows(retained))
+
+    def _read_page(self, worksheet_name: str, start: int, columns: int) -> list[list[str]]:
+        if self._spreadsheet is None:
+            raise RuntimeError("Spreadsheet no inicializado. Llama a open_spreadsheet primero.")
+        range_name = paged_range(worksheet_name, start, start + self._read_page_rows - 1, _column_index_to_letters(columns))
+        response = self._with_rate_limit_retry(
+            f"spreadsheet.values_get({worksheet_name})",
+            lambda: self._spreadsheet.values_get(range_name),
+        )
+        self._count_read_call()
+        values = response.get("values", []) if isinstance(response, dict) else []
+        return values if isinstance(values, list) else []
+
     # Backward-compatible alias for existing collaborators/tests.
     def get_worksheet_values_cached(self, name: str) -> list[list[str]]:
         return self.read_all_values(name)
 
     def get_worksheet(self, name: str):
-        if name in self._worksheet_cache:
-            self._avoided_requests_count += 1
-            return self._worksheet_cache[name]
-        if self._worksheets_by_title_cache is not None and name in self._worksheets_by_title_cache:
-            self._avoided_requests_count += 1
-            worksheet = self._worksheets_by_title_cache[name]
-            self._worksheet_cache[name] = worksheet
+        with self._worksheets_lock:
+            worksheet = self._worksheet_cache.get(name)
+            if worksheet is None and self._worksheets_by_title_cache is not None:
+                worksheet = self._worksheets_by_title_cache.get(name)
+                if worksheet is not None:
+                    self._worksheet_cache[name] = worksheet
+        if worksheet is not None:
+            self._count_avoided_request()
             return worksheet
         if self._spreadsheet is None:
             raise RuntimeError("Spreadsheet no inicializado. Llama a open_spreadsheet primero.")
@@ -120,22 +216,27 @@ class SheetsClient(SheetsClientPort):
             f"spreadsheet.worksheet({name})",
             lambda: self._spreadsheet.worksheet(name),
         )
-        self._worksheet_cache[name] = worksheet
-        if self._worksheets_by_title_cache is not None:
-            self._worksheets_by_title_cache[name] = worksheet
+        with self._worksheets_lock:
+            self._worksheet_cache[name] = worksheet
+            if self._worksheets_by_title_cache is not None:
+                self._worksheets_by_title_cache[name] = worksheet
         return worksheet
 
     def get_worksheets_by_title(self) -> dict[str, gspread.Worksheet]:
-        if self._worksheets_by_title_cache is not None:
-            self._avoided_requests_count += 1
-            return self._worksheets_by_title_cache
+        with self._worksheets_lock:
+            cached = self._worksheets_by_title_cache
+        if cached is not None:
+            self._count_avoided_request()
+            return cached
         if self._spreadsheet is None:
             raise RuntimeError("Spreadsheet no inicializado. Llama a open_spreadsheet primero.")
         worksheets = self._with_rate_limit_retry("spreadsheet.worksheets", self._spreadsheet.worksheets)
-        self._worksheets_by_title_cache = {worksheet.title: worksheet for worksheet in worksheets}
-        self._worksheet_cache.update(self._worksheets_by_title_cache)
-        self._read_calls_count += 1
-        return self._worksheets_by_title_cache
+        by_title = {worksheet.title: worksheet for worksheet in worksheets}
+        with self._worksheets_lock:
+            self._worksheets_by_title_cache = by_title
+            self._worksheet_cache.update(by_title)
+        self._count_read_call()
+        return by_title
 
     def batch_get_ranges(self, ranges: list[str]) -> dict[str, list[list[str]]]:
         if self._spreadsheet is None:
@@ -147,12 +248,13 @@ class SheetsClient(SheetsClientPort):
             f"spreadsheet.values_batch_get({len(ranges)} ranges)",
             lambda: self._spreadsheet.values_batch_get(ranges),
         )
-        self._read_calls_count += 1
+        self._count_read_call()
         mapped = self._normalize_batch_get_result(ranges, values_by_range)
-        for range_name, normalized_values in mapped.items():
-            worksheet_name = self._worksheet_name_from_range(range_name)
+        for range_name, answered_values in answered_batch_get_ranges(ranges, values_by_range).items():
+            # Solo los rangos de hoja completa que la API respondió sirven como caché de read_all_values.
+            worksheet_name = None if "!" in range_name else self._worksheet_name_from_range(range_name)
             if worksheet_name:
-                self._worksheet_values_cache[worksheet_name] = normalized_values
+                self._worksheet_values_cache.put(worksheet_name, pad_rows(answered_values))
         return mapped
 
     @staticmethod
@@ -166,16 +268,28 @@ class SheetsClient(SheetsClientPort):
         return normalize_batch_get_result(ranges, values_by_range)
 
     def get_read_calls_count(self) -> int:
-        return self._read_calls_count
+        with self._stats_lock:
+            return self._read_calls_count
 
     def get_avoided_requests_count(self) -> int:
-        return self._avoided_requests_count
+        with self._stats_lock:
+            return self._avoided_requests_count
 
     def get_write_calls_count(self) -> int:
-        return self._write_calls_count
+        with self._stats_lock:
+            return self._write_calls_count
 
     def get_sheets_api_calls_count(self) -> int:
-        return self._sheets_api_calls_count
+        with self._stats_lock:
+            return self._sheets_api_calls_count
+
+    def get_throttled_calls_count(self) -> int:
+        with self._stats_lock:
+            return self._throttled_calls_count
+
+    def get_throttle_wait_seconds(self) -> float:
+        with self._stats_lock:
+            return self._throttle_wait_seconds
 
     def append_rows(self, worksheet_name: str, rows: list[list[Any]]) -> None:
         if not rows:
@@ -185,7 +299,7 @@ class SheetsClient(SheetsClientPort):
             f"worksheet.append_rows({worksheet_name})",
             lambda: worksheet.append_rows(rows, value_input_option="USER_ENTERED"),
         )
-        self._write_calls_count += 1
+        self._count_write_call()
 
     def batch_update(self, worksheet_name: str, data: list[dict[str, Any]]) -> None:
         if not data:
@@ -195,7 +309,7 @@ class SheetsClient(SheetsClientPort):
             f"worksheet.batch_update({worksheet_name})",
             lambda: worksheet.batch_update(data, value_input_option="USER_ENTERED"),
         )
-        self._write_calls_count += 1
+        self._count_write_call()
 
     def values_batch_update(self, body: dict[str, Any]) -> None:
         if not body.get("data"):
@@ -206,7 +320,7 @@ class SheetsClient(SheetsClientPort):
             "spreadsheet.values_batch_update",
             lambda: self._spreadsheet.values_batch_update(body),
         )
-        self._write_calls_count += 1
+        self._count_write_call()
 
 
     def check_write_access(self, worksheet_name: str | None = None) -> None:
@@ -298,6 +412,7 @@ class SheetsClient(SheetsClientPort):
     def _with_rate_limit_retry(self, operation_name: str, operation: Callable[[], T], *, spreadsheet_id: str | None = None) -> T:
         for attempt in range(1, _MAX_RETRIES + 1):
             try:
+                self._throttle(self._read_bucket, operation_name)
                 self._record_api_call(operation_name)
                 return operation()
             except gspread.exceptions.APIError as exc:
@@ -339,6 +454,7 @@ class SheetsClient(SheetsClientPort):
     def _with_write_retry(self, operation_name: str, operation: Callable[[], T], *, spreadsheet_id: str | None = None) -> T:
         for attempt in range(1, _WRITE_MAX_RETRIES + 1):
             try:
+                self._throttle(self._write_bucket, operation_name)
                 self._record_api_call(operation_name)
                 return operation()
             except gspread.exceptions.APIError as exc:
@@ -403,10 +519,34 @@ class SheetsClient(SheetsClientPort):
 
         return getattr(current_spreadsheet, "id", None)
 
+    def _throttle(self, bucket: TokenBucket, operation_name: str) -> None:
+        wait_seconds = bucket.acquire()
+        if wait_seconds <= 0:
+            return
+        with self._stats_lock:
+            self._throttled_calls_count += 1
+            self._throttle_wait_seconds += wait_seconds
+        metrics_registry.incrementar("sheets_throttled_calls")
+        logger.debug("Sheets throttle operation=%s espera=%.3fs", operation_name, wait_seconds)
+
+    def _count_read_call(self) -> None:
+        with self._stats_lock:
+            self._read_calls_count += 1
+
+    def _count_avoided_request(self) -> None:
+        with self._stats_lock:
+            self._avoided_requests_count += 1
+
+    def _count_write_call(self) -> None:
+        with self._stats_lock:
+            self._write_calls_count += 1
+
     def _record_api_call(self, operation_name: str) -> None:
-        self._sheets_api_calls_count += 1
+        with self._stats_lock:
+            self._sheets_api_calls_count += 1
+            llamada = self._sheets_api_calls_count
         metrics_registry.incrementar("sheets_api_calls")
-        logger.debug("Sheets API call #%s operation=%s", self._sheets_api_calls_count, operation_name)
+        logger.debug("Sheets API call #%s operation=%s", llamada, operation_name)
 
     @staticmethod
     def _read_service_account_email(credentials_path: Path) -> str | None:
@@ -7,13 +7,34 @@ from app.infrastructure.sheets_errors import SheetsApiCompatibilityError
 
 def normalize_batch_get_result(ranges: list[str], values_by_range: Any) -> dict[str, list[list[str]]]:
     mapped: dict[str, list[list[str]]] = {range_name: [] for range_name in ranges}
+    mapped.update(answered_batch_get_ranges(ranges, values_by_range))
+    return mapped
+
+
+def answered_batch_get_ranges(ranges: list[str], values_by_range: Any) -> dict[str, list[list[str]]]:
+    """Valores de los rangos que la API respondió, indexados por el rango pedido.
+
+    La API etiqueta cada ``valueRange`` con el rango resuelto (``hoja!A1:Z1000``), no con el
+    pedido, pero conserva el orden de la petición: se emparejan por posición.
+    """
     if isinstance(values_by_range, dict):
-        return _normalize_from_dict(mapped, values_by_range)
+        return _answered_from_dict(ranges, values_by_range)
     if isinstance(values_by_range, list):
-        return _normalize_from_list(mapped, ranges, values_by_range)
+        return _answered_from_list(ranges, values_by_range)
     raise SheetsApiCompatibilityError("Versión de gspread no soporta batch_get; usa values_batch_get")
 
 
+def pad_rows(values: list[list[str]]) -> list[list[str]]:
+    """Iguala la longitud de las filas como ``get_all_values`` (la API recorta celdas vacías finales)."""
+    width = max((len(row) for row in values), default=0)
+    return [row + [""] * (width - len(row)) if len(row) < width else row for row in values]
+
+
+def paged_range(worksheet_name: str, first_row: int, last_row: int, last_column: str) -> str:
+    title = worksheet_name.replace("'", "''")
+    return f"'{title}'!A{first_row}:{last_column}{last_row}"
+
+
 def worksheet_name_from_range(range_name: str) -> str | None:
     if "!" in range_name:
         sheet_part = range_name.split("!", 1)[0].strip()
@@ -35,32 +56,23 @@ def worksheet_from_operation_name(operation_name: str) -> str | None:
     return worksheet_name or None
 
 
-def _normalize_from_dict(
-    mapped: dict[str, list[list[str]]],
-    values_by_range: dict[str, Any],
-) -> dict[str, list[list[str]]]:
+def _answered_from_dict(ranges: list[str], values_by_range: dict[str, Any]) -> dict[str, list[list[str]]]:
     value_ranges = values_by_range.get("valueRanges", [])
     if not isinstance(value_ranges, list):
-        return mapped
-    for value_range in value_ranges:
+        return {}
+    answered: dict[str, list[list[str]]] = {}
+    for range_name, value_range in zip(ranges, value_ranges):
         if not isinstance(value_range, dict):
             continue
-        range_name = value_range.get("range")
-        if not isinstance(range_name, str):
-            continue
+        # Una hoja vacía llega sin clave ``values``: es una respuesta válida.
         values = value_range.get("values", [])
-        mapped[range_name] = values if isinstance(values, list) else []
-    return mapped
+        if isinstance(values, list):
+            answered[range_name] = values
+    return answered
 
 
-def _normalize_from_list(
-    mapped: dict[str, list[list[str]]],
-    ranges: list[str],
-    values_by_range: list[Any],
-) -> dict[str, list[list[str]]]:
-    for range_name, values in zip(ranges, values_by_range):
-        mapped[range_name] = values if isinstance(values, list) else []
-    return mapped
+def _answered_from_list(ranges: list[str], values_by_range: list[Any]) -> dict[str, list[list[str]]]:
+    return {range_name: values for range_name, values in zip(ranges, values_by_range) if isinstance(values, list)}
 
 
 def should_retry_rate_limit(attempt: int, max_retries: int) -> bool:
@@ -10,10 +10,9 @@ from app.infrastructure.sheets_client import SheetsClient
 from app.infrastructure.sheets_gateway_puros import (
     ensure_headers,
     ensure_uuid_header,
-    find_uuid_row,
     map_gateway_error,
-    merge_values_for_upsert,
     normalize_rows,
+    plan_upserts,
 )
 from app.infrastructure.sheets_repository import SheetsRepository
 
@@ -35,10 +34,33 @@ class SheetsGatewayGspread(SheetsGatewayPort):
         return self._read_rows(config, "solicitudes")
 
     def upsert_persona(self, config: SheetsConfig, row: dict[str, Any]) -> None:
-        self._upsert_row(config, "delegadas", row)
+        self.upsert_many(config, "delegadas", [row])
 
     def upsert_solicitud(self, config: SheetsConfig, row: dict[str, Any]) -> None:
-        self._upsert_row(config, "solicitudes", row)
+        self.upsert_many(config, "solicitudes", [row])
+
+    def upsert_many(self, config: SheetsConfig, worksheet_name: str, rows: list[dict[str, Any]]) -> None:
+        """Upsert por uuid con una lectura de la hoja, un ``values_batch_update`` y un ``append_rows``."""
+        if not rows:
+            return
+        try:
+            self._open(config)
+            values = self._client.read_all_values(worksheet_name)
+            current_headers = values[0] if values else []
+            headers = ensure_headers(current_headers, rows[0])
+            updates, appends = plan_upserts(headers, values, rows)
+            data = [
+                {"range": _row_range(worksheet_name, row_number), "values": [row_values]}
+                for row_number, row_values in sorted(updates.items())
+            ]
+            if not current_headers:
+                data.insert(0, {"range": _row_range(worksheet_name, 1), "values": [headers]})
+            if data:
+                self._client.values_batch_update({"valueInputOption": "USER_ENTERED", "data": data})
+            if appends:
+                self._client.append_rows(worksheet_name, appends)
+        except Exception as exc:  # noqa: BLE001
+            raise map_gateway_error(exc) from exc
 
     def backfill_uuid(self, config: SheetsConfig, worksheet_name: str, row_index: int, uuid_value: str) -> None:
         try:
@@ -66,19 +88,7 @@ class SheetsGatewayGspread(SheetsGatewayPort):
         except Exception as exc:  # noqa: BLE001
             raise map_gateway_error(exc) from exc
 
-    def _upsert_row(self, config: SheetsConfig, worksheet_name: str, row: dict[str, Any]) -> None:
-        try:
-            worksheet = self._open(config).worksheet(worksheet_name)
-            current_headers = worksheet.row_values(1)
-            headers = ensure_headers(current_headers, row)
-            if not current_headers:
-                worksheet.update("A1", [headers])
-            records = worksheet.get_all_records()
-            row_idx = find_uuid_row(records, str(row.get("uuid", "")))
-            if row_idx is not None:
-                record = records[row_idx - 2]
-                worksheet.update(f"A{row_idx}", [merge_values_for_upsert(headers, row, record)])
-                return
-            worksheet.append_row(merge_values_for_upsert(headers, row), value_input_option="USER_ENTERED")
-        except Exception as exc:  # noqa: BLE001
-            raise map_gateway_error(exc) from exc
+
+def _row_range(worksheet_name: str, row_number: int) -> str:
+    escaped = worksheet_name.replace("'", "''")
+    return f"'{escaped}'!A{row_number}"
@@ -94,6 +94,42 @@ def merge_values_for_upsert(headers: list[str], row: dict[str, Any], fallback: d
     return [row.get(header, base.get(header, "")) for header in headers]
 
 
+def index_uuid_rows(values: list[list[Any]]) -> dict[str, tuple[int, dict[str, str]]]:
+    """Índice uuid -> (fila, registro) de una hoja; ante uuids repetidos gana la primera fila, como ``find_uuid_row``."""
+    index: dict[str, tuple[int, dict[str, str]]] = {}
+    for row_number, payload in normalize_rows(values):
+        uuid_value = payload.get("uuid", "")
+        if uuid_value:
+            index.setdefault(uuid_value, (row_number, payload))
+    return index
+
+
+def plan_upserts(
+    headers: list[str], values: list[list[Any]], rows: list[dict[str, Any]]
+) -> tuple[dict[int, list[Any]], list[list[Any]]]:
+    """Reparte ``rows`` en actualizaciones por número de fila y filas nuevas a añadir al final."""
+    index = index_uuid_rows(values)
+    updates: dict[int, list[Any]] = {}
+    appends: list[list[Any]] = []
+    appended_by_uuid: dict[str, int] = {}
+    for row in rows:
+        uuid_value = normalize_cell(row.get("uuid", ""))
+        if uuid_value in appended_by_uuid:
+            position = appended_by_uuid[uuid_value]
+            appends[position] = merge_values_for_upsert(headers, row, dict(zip(headers, appends[position])))
+            continue
+        existing = index.get(uuid_value) if uuid_value else None
+        if existing is None:
+            if uuid_value:
+                appended_by_uuid[uuid_value] = len(appends)
+            appends.append(merge_values_for_upsert(headers, row))
+            continue
+        row_number, record = existing
+        updates[row_number] = merge_values_for_upsert(headers, row, record)
+        index[uuid_value] = (row_number, dict(zip(headers, updates[row_number])))
+    return updates, appends
+
+
 def ensure_uuid_header(headers: list[str]) -> tuple[list[str], bool]:
     if "uuid" in headers:
         return headers, False
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+# Cuotas por defecto de la API de Google Sheets por usuario y minuto.
+READ_QUOTA_PER_MINUTE = 60
+WRITE_QUOTA_PER_MINUTE = 60
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """Limitador de llamadas a Sheets que espera antes de enviar en lugar de tras un 429.
+
+    Admite ``burst`` llamadas seguidas y repone ``(quota_per_minute - burst) / 60``
+    fichas por segundo, de modo que ninguna ventana de 60 s supera la cuota. Cada
+    llamada reserva su ficha bajo el lock y duerme fuera de él, así que varios hilos
+    pueden compartir el mismo bucket.
+    """
+
+    def __init__(
+        self,
+        quota_per_minute: int,
+        *,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        if quota_per_minute <= 0:
+            raise ValueError("quota_per_minute debe ser mayor que cero")
+        self._capacity = float(max(1, min(burst, quota_per_minute)))
+        self._refill_per_second = max(quota_per_minute - self._capacity, 1.0) / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self._capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Reserva una ficha y devuelve los segundos esperados (0.0 si había ficha libre)."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._refill_per_second)
+            self._updated_at = now
+            self._tokens -= 1.0
+            wait_seconds = -self._tokens / self._refill_per_second if self._tokens < 0 else 0.0
+        if wait_seconds > 0:
+            (self._sleep or time.sleep)(wait_seconds)
+        return wait_seconds
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
+# Presupuesto por defecto de la caché de valores de hojas (por sesión de SheetsClient).
+DEFAULT_VALUES_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Tamaños aproximados de CPython: lista vacía + puntero por elemento, str ASCII vacío.
+_LIST_OVERHEAD_BYTES = 56
+_POINTER_BYTES = 8
+_STR_OVERHEAD_BYTES = 49
+
+
+def estimate_row_bytes(row: list[str]) -> int:
+    return (
+        _LIST_OVERHEAD_BYTES
+        + _POINTER_BYTES * len(row)
+        + sum(_STR_OVERHEAD_BYTES + len(cell) for cell in row)
+    )
+
+
+def estimate_values_bytes(values: list[list[str]]) -> int:
+    """Estimación barata de la memoria de un ``get_all_values`` (sin ``sys.getsizeof`` por celda)."""
+    return _LIST_OVERHEAD_BYTES + _POINTER_BYTES * len(values) + sum(estimate_row_bytes(row) for row in values)
+
+
+class WorksheetValuesCache:
+    """Caché LRU de valores de hojas acotada por bytes estimados.
+
+    Al superar ``max_bytes`` se descartan las hojas usadas hace más tiempo; una hoja que
+    por sí sola no cabe en el presupuesto no se guarda. Así la memoria retenida entre
+    lecturas no crece con el tamaño del spreadsheet.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_VALUES_CACHE_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes no puede ser negativo")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[list[list[str]], int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def get(self, name: str) -> list[list[str]] | None:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            self._entries.move_to_end(name)
+            return entry[0]
+
+    def put(self, name: str, values: list[list[str]], size: int | None = None) -> bool:
+        """Guarda ``values`` y devuelve si han cabido en el presupuesto."""
+        size = estimate_values_bytes(values) if size is None else size
+        with self._lock:
+            self._discard_locked(name)
+            if size > self._max_bytes:
+                return False
+            self._entries[name] = (values, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+            return True
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            self._discard_locked(name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def items(self) -> Iterator[tuple[str, list[list[str]]]]:
+        with self._lock:
+            snapshot = [(name, values) for name, (values, _) in self._entries.items()]
+        return iter(snapshot)
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _discard_locked(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            self._bytes -= entry[1]
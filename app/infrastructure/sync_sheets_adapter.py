@@ -4,6 +4,7 @@ from collections.abc import Callable
 import sqlite3
 
 from app.domain.ports import (
+    TokenCancelacion,
     SheetsClientPort,
     SheetsConfigStorePort,
     SheetsRepositoryPort,
@@ -32,8 +33,8 @@ class SyncSheetsAdapter(SheetsSyncPort):
         self._client = client
         self._repository = repository
 
-    def pull(self) -> SyncSummary:
-        return self._run_with_connection(build_service_operation("pull"))
+    def pull(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
+        return self._run_with_connection(build_service_operation("pull", cancellation_token))
 
     def push(self) -> SyncSummary:
         return self._run_with_connection(build_service_operation("push"))
@@ -41,8 +42,8 @@ class SyncSheetsAdapter(SheetsSyncPort):
     def sync(self) -> SyncSummary:
         return self.sync_bidirectional()
 
-    def sync_bidirectional(self) -> SyncSummary:
-        return self._run_with_connection(build_service_operation("sync_bidirectional"))
+    def sync_bidirectional(self, cancellation_token: TokenCancelacion | None = None) -> SyncSummary:
+        return self._run_with_connection(build_service_operation("sync_bidirectional", cancellation_token))
 
     def simulate_sync_plan(self) -> SyncExecutionPlan:
         return self._run_with_connection(build_service_operation("simulate_sync_plan"))
@@ -0,0 +1 @@
+-- Rollback lógico: sin transformación inversa automática.
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+
+_ISO_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+_LEGACY_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y")
+
+
+def _to_iso(value: object) -> str | None:
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    # Valores tipo "2025-01-05T10:00:00" o "2025-01-05 10:00" conservan solo la fecha.
+    candidate = raw[:10] if len(raw) > 10 and raw[10] in ("T", " ") else raw
+    for fmt in _LEGACY_FORMATS:
+        try:
+            return datetime.strptime(candidate, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def run(connection: sqlite3.Connection) -> None:
+    cursor = connection.cursor()
+    cursor.execute(
+        f"""
+        SELECT id, fecha_pedida
+        FROM solicitudes
+        WHERE fecha_pedida IS NOT NULL
+          AND NOT (length(fecha_pedida) = 10 AND fecha_pedida GLOB '{_ISO_GLOB}')
+        """
+    )
+    updates: list[tuple[str, int]] = []
+    for row in cursor.fetchall():
+        fecha_iso = _to_iso(row["fecha_pedida"])
+        if fecha_iso is None or fecha_iso == row["fecha_pedida"]:
+            continue
+        updates.append((fecha_iso, row["id"]))
+    if updates:
+        cursor.executemany("UPDATE solicitudes SET fecha_pedida = ? WHERE id = ?", updates)
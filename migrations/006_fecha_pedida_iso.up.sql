@@ -0,0 +1 @@
+-- Canonicalización de fecha_pedida a ISO (YYYY-MM-DD) ejecutada en hook Python.
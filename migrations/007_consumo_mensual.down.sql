@@ -0,0 +1,5 @@
+DROP TRIGGER IF EXISTS trg_consumo_mensual_delete;
+DROP TRIGGER IF EXISTS trg_consumo_mensual_update_suma;
+DROP TRIGGER IF EXISTS trg_consumo_mensual_update_resta;
+DROP TRIGGER IF EXISTS trg_consumo_mensual_insert;
+DROP TABLE IF EXISTS consumo_mensual;
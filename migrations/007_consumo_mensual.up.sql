@@ -0,0 +1,98 @@
+CREATE TABLE IF NOT EXISTS consumo_mensual (
+    persona_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    minutos INTEGER NOT NULL DEFAULT 0,
+    pendientes_min INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (persona_id, year, month)
+) WITHOUT ROWID;
+
+-- Solo contribuyen solicitudes no borradas con fecha_pedida ISO (YYYY-MM-DD);
+-- generated = 1 suma en minutos y generated = 0 en pendientes_min.
+INSERT INTO consumo_mensual (persona_id, year, month, minutos, pendientes_min)
+SELECT persona_id,
+       CAST(substr(fecha_pedida, 1, 4) AS INTEGER),
+       CAST(substr(fecha_pedida, 6, 2) AS INTEGER),
+       SUM(CASE WHEN generated = 1 THEN COALESCE(horas_solicitadas_min, 0) ELSE 0 END),
+       SUM(CASE WHEN generated = 0 THEN COALESCE(horas_solicitadas_min, 0) ELSE 0 END)
+FROM solicitudes
+WHERE COALESCE(deleted, 0) = 0
+  AND fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+GROUP BY persona_id, substr(fecha_pedida, 1, 7)
+ON CONFLICT(persona_id, year, month) DO UPDATE SET
+    minutos = excluded.minutos,
+    pendientes_min = excluded.pendientes_min;
+
+CREATE TRIGGER IF NOT EXISTS trg_consumo_mensual_insert
+AFTER INSERT ON solicitudes
+WHEN COALESCE(NEW.deleted, 0) = 0
+  AND NEW.fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+BEGIN
+    INSERT INTO consumo_mensual (persona_id, year, month, minutos, pendientes_min)
+    VALUES (
+        NEW.persona_id,
+        CAST(substr(NEW.fecha_pedida, 1, 4) AS INTEGER),
+        CAST(substr(NEW.fecha_pedida, 6, 2) AS INTEGER),
+        CASE WHEN NEW.generated = 1 THEN COALESCE(NEW.horas_solicitadas_min, 0) ELSE 0 END,
+        CASE WHEN NEW.generated = 0 THEN COALESCE(NEW.horas_solicitadas_min, 0) ELSE 0 END
+    )
+    ON CONFLICT(persona_id, year, month) DO UPDATE SET
+        minutos = minutos + excluded.minutos,
+        pendientes_min = pendientes_min + excluded.pendientes_min;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_consumo_mensual_update_resta
+AFTER UPDATE OF persona_id, fecha_pedida, horas_solicitadas_min, generated, deleted ON solicitudes
+WHEN COALESCE(OLD.deleted, 0) = 0
+  AND OLD.fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+BEGIN
+    UPDATE consumo_mensual
+    SET minutos = minutos - CASE WHEN OLD.generated = 1 THEN COALESCE(OLD.horas_solicitadas_min, 0) ELSE 0 END,
+        pendientes_min = pendientes_min - CASE WHEN OLD.generated = 0 THEN COALESCE(OLD.horas_solicitadas_min, 0) ELSE 0 END
+    WHERE persona_id = OLD.persona_id
+      AND year = CAST(substr(OLD.fecha_pedida, 1, 4) AS INTEGER)
+      AND month = CAST(substr(OLD.fecha_pedida, 6, 2) AS INTEGER);
+    DELETE FROM consumo_mensual
+    WHERE persona_id = OLD.persona_id
+      AND year = CAST(substr(OLD.fecha_pedida, 1, 4) AS INTEGER)
+      AND month = CAST(substr(OLD.fecha_pedida, 6, 2) AS INTEGER)
+      AND minutos = 0
+      AND pendientes_min = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_consumo_mensual_update_suma
+AFTER UPDATE OF persona_id, fecha_pedida, horas_solicitadas_min, generated, deleted ON solicitudes
+WHEN COALESCE(NEW.deleted, 0) = 0
+  AND NEW.fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+BEGIN
+    INSERT INTO consumo_mensual (persona_id, year, month, minutos, pendientes_min)
+    VALUES (
+        NEW.persona_id,
+        CAST(substr(NEW.fecha_pedida, 1, 4) AS INTEGER),
+        CAST(substr(NEW.fecha_pedida, 6, 2) AS INTEGER),
+        CASE WHEN NEW.generated = 1 THEN COALESCE(NEW.horas_solicitadas_min, 0) ELSE 0 END,
+        CASE WHEN NEW.generated = 0 THEN COALESCE(NEW.horas_solicitadas_min, 0) ELSE 0 END
+    )
+    ON CONFLICT(persona_id, year, month) DO UPDATE SET
+        minutos = minutos + excluded.minutos,
+        pendientes_min = pendientes_min + excluded.pendientes_min;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_consumo_mensual_delete
+AFTER DELETE ON solicitudes
+WHEN COALESCE(OLD.deleted, 0) = 0
+  AND OLD.fecha_pedida GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+BEGIN
+    UPDATE consumo_mensual
+    SET minutos = minutos - CASE WHEN OLD.generated = 1 THEN COALESCE(OLD.horas_solicitadas_min, 0) ELSE 0 END,
+        pendientes_min = pendientes_min - CASE WHEN OLD.generated = 0 THEN COALESCE(OLD.horas_solicitadas_min, 0) ELSE 0 END
+    WHERE persona_id = OLD.persona_id
+      AND year = CAST(substr(OLD.fecha_pedida, 1, 4) AS INTEGER)
+      AND month = CAST(substr(OLD.fecha_pedida, 6, 2) AS INTEGER);
+    DELETE FROM consumo_mensual
+    WHERE persona_id = OLD.persona_id
+      AND year = CAST(substr(OLD.fecha_pedida, 1, 4) AS INTEGER)
+      AND month = CAST(substr(OLD.fecha_pedida, 6, 2) AS INTEGER)
+      AND minutos = 0
+      AND pendientes_min = 0;
+END;
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS idx_sol_historico_keyset;
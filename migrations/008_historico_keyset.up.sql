@@ -0,0 +1,5 @@
+-- Soporta la paginación keyset del histórico: ORDER BY fecha_pedida DESC, id DESC
+-- con cursor (fecha_pedida, id) < (?, ?) sobre confirmadas no borradas.
+CREATE INDEX IF NOT EXISTS idx_sol_historico_keyset
+ON solicitudes (fecha_pedida, id)
+WHERE generated = 1 AND (deleted = 0 OR deleted IS NULL);
@@ -0,0 +1,5 @@
+DROP INDEX IF EXISTS idx_pdf_log_updated_at;
+DROP INDEX IF EXISTS idx_solicitudes_updated_at;
+DROP INDEX IF EXISTS idx_personas_updated_at;
+DROP INDEX IF EXISTS idx_sol_pendientes_fecha;
+DROP INDEX IF EXISTS idx_sol_pendientes_persona_fecha;
@@ -0,0 +1,23 @@
+-- Pendientes activas: listados por persona / globales y detección de conflictos.
+-- El WHERE replica literalmente el filtro de las consultas para que SQLite
+-- pueda elegir estos índices parciales.
+CREATE INDEX IF NOT EXISTS idx_sol_pendientes_persona_fecha
+ON solicitudes (persona_id, fecha_pedida)
+WHERE generated = 0 AND (deleted = 0 OR deleted IS NULL);
+
+CREATE INDEX IF NOT EXISTS idx_sol_pendientes_fecha
+ON solicitudes (fecha_pedida)
+WHERE generated = 0 AND (deleted = 0 OR deleted IS NULL);
+
+-- Detección de cambios locales posteriores al último sync (índices cubrientes
+-- para `SELECT 1 ... WHERE updated_at > ? LIMIT 1`).
+CREATE INDEX IF NOT EXISTS idx_personas_updated_at
+ON personas (updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_solicitudes_updated_at
+ON solicitudes (updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_pdf_log_updated_at
+ON pdf_log (updated_at);
+
+ANALYZE;
@@ -0,0 +1,11 @@
+DROP TRIGGER IF EXISTS trg_sync_outbox_sync_config_update;
+DROP TRIGGER IF EXISTS trg_sync_outbox_sync_config_insert;
+DROP TRIGGER IF EXISTS trg_sync_outbox_pdf_log_update;
+DROP TRIGGER IF EXISTS trg_sync_outbox_pdf_log_insert;
+DROP TRIGGER IF EXISTS trg_sync_outbox_cuadrantes_update;
+DROP TRIGGER IF EXISTS trg_sync_outbox_cuadrantes_insert;
+DROP TRIGGER IF EXISTS trg_sync_outbox_solicitudes_update;
+DROP TRIGGER IF EXISTS trg_sync_outbox_solicitudes_insert;
+DROP TRIGGER IF EXISTS trg_sync_outbox_personas_update;
+DROP TRIGGER IF EXISTS trg_sync_outbox_personas_insert;
+DROP TABLE IF EXISTS sync_outbox;
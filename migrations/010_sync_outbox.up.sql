@@ -0,0 +1,108 @@
+CREATE TABLE IF NOT EXISTS sync_outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entidad TEXT NOT NULL,
+    clave TEXT NOT NULL,
+    UNIQUE (entidad, clave)
+);
+
+-- Estado inicial: todas las filas sincronizables quedan marcadas una vez; el push
+-- sigue filtrando por last_sync_at, así que solo se envía lo realmente nuevo.
+
+INSERT OR IGNORE INTO sync_outbox (entidad, clave)
+SELECT 'personas', CAST(id AS TEXT) FROM personas WHERE updated_at IS NOT NULL ORDER BY rowid;
+
+INSERT OR IGNORE INTO sync_outbox (entidad, clave)
+SELECT 'solicitudes', CAST(id AS TEXT) FROM solicitudes WHERE updated_at IS NOT NULL ORDER BY rowid;
+
+INSERT OR IGNORE INTO sync_outbox (entidad, clave)
+SELECT 'cuadrantes', CAST(id AS TEXT) FROM cuadrantes WHERE updated_at IS NOT NULL ORDER BY rowid;
+
+INSERT OR IGNORE INTO sync_outbox (entidad, clave)
+SELECT 'pdf_log', pdf_id FROM pdf_log WHERE updated_at IS NOT NULL ORDER BY rowid;
+
+INSERT OR IGNORE INTO sync_outbox (entidad, clave)
+SELECT 'sync_config', key FROM sync_config WHERE updated_at IS NOT NULL ORDER BY rowid;
+
+-- Cada cambio reencola la fila con un seq nuevo (DELETE + INSERT en lugar de
+-- INSERT OR REPLACE para no heredar la política ON CONFLICT de la sentencia externa).
+-- El push borra solo hasta el seq leído, así que un cambio concurrente sobrevive.
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_personas_insert
+AFTER INSERT ON personas
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'personas' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('personas', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_personas_update
+AFTER UPDATE ON personas
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'personas' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('personas', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_solicitudes_insert
+AFTER INSERT ON solicitudes
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'solicitudes' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('solicitudes', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_solicitudes_update
+AFTER UPDATE ON solicitudes
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'solicitudes' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('solicitudes', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_cuadrantes_insert
+AFTER INSERT ON cuadrantes
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'cuadrantes' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('cuadrantes', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_cuadrantes_update
+AFTER UPDATE ON cuadrantes
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'cuadrantes' AND clave = CAST(NEW.id AS TEXT);
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('cuadrantes', CAST(NEW.id AS TEXT));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_pdf_log_insert
+AFTER INSERT ON pdf_log
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'pdf_log' AND clave = NEW.pdf_id;
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('pdf_log', NEW.pdf_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_pdf_log_update
+AFTER UPDATE ON pdf_log
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'pdf_log' AND clave = NEW.pdf_id;
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('pdf_log', NEW.pdf_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_sync_config_insert
+AFTER INSERT ON sync_config
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'sync_config' AND clave = NEW.key;
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('sync_config', NEW.key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_outbox_sync_config_update
+AFTER UPDATE ON sync_config
+WHEN NEW.updated_at IS NOT NULL
+BEGIN
+    DELETE FROM sync_outbox WHERE entidad = 'sync_config' AND clave = NEW.key;
+    INSERT INTO sync_outbox (entidad, clave) VALUES ('sync_config', NEW.key);
+END;
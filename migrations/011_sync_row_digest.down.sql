@@ -0,0 +1 @@
+DROP TABLE IF EXISTS sync_row_digest;
@@ -0,0 +1,8 @@
+-- Huella del último contenido remoto aplicado por fila; el pull omite las filas
+-- cuya huella no ha cambiado desde el sync anterior.
+CREATE TABLE IF NOT EXISTS sync_row_digest (
+    entity TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (entity, uuid)
+) WITHOUT ROWID;
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+
+_FORMATO_CANONICO = "%Y-%m-%dT%H:%M:%S.%fZ"
+_TABLAS_UPDATED_AT = ("personas", "solicitudes", "cuadrantes", "pdf_log", "sync_config")
+
+
+def _es_canonico(texto: str) -> bool:
+    return len(texto) == 27 and texto[10] == "T" and texto[19] == "." and texto[26] == "Z"
+
+
+def _to_canonical(value: object) -> str | None:
+    raw = str(value or "").strip()
+    if not raw or _es_canonico(raw):
+        return None
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        moment = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    # Sin zona se interpreta como UTC, igual que en la sincronización.
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime(_FORMATO_CANONICO)
+
+
+def _tiene_columna(cursor: sqlite3.Cursor, tabla: str, columna: str) -> bool:
+    cursor.execute(f"PRAGMA table_info({tabla})")
+    return any(row["name"] == columna for row in cursor.fetchall())
+
+
+def _canonicalizar(cursor: sqlite3.Cursor, tabla: str, columna: str) -> None:
+    if not _tiene_columna(cursor, tabla, columna):
+        return
+    cursor.execute(f"SELECT rowid AS fila, {columna} AS valor FROM {tabla} WHERE {columna} IS NOT NULL")
+    updates: list[tuple[str, int]] = []
+    for row in cursor.fetchall():
+        canonico = _to_canonical(row["valor"])
+        if canonico is not None and canonico != row["valor"]:
+            updates.append((canonico, row["fila"]))
+    if updates:
+        cursor.executemany(f"UPDATE {tabla} SET {columna} = ? WHERE rowid = ?", updates)
+
+
+def run(connection: sqlite3.Connection) -> None:
+    cursor = connection.cursor()
+    # Reescribir el formato no es un cambio local: los triggers de sync_outbox encolarían
+    # cada fila tocada, así que al final se retiran solo las entradas que añade la migración.
+    cursor.execute("SELECT seq FROM sync_outbox ORDER BY seq DESC LIMIT 1")
+    ultimo = cursor.fetchone()
+    cursor.execute("SELECT entidad, clave FROM sync_outbox")
+    encoladas = {(row["entidad"], row["clave"]) for row in cursor.fetchall()}
+
+    for tabla in _TABLAS_UPDATED_AT:
+        _canonicalizar(cursor, tabla, "updated_at")
+    _canonicalizar(cursor, "sync_state", "last_sync_at")
+
+    cursor.execute(
+        "SELECT seq, entidad, clave FROM sync_outbox WHERE seq > ?",
+        (ultimo["seq"] if ultimo else 0,),
+    )
+    nuevas = [(row["seq"],) for row in cursor.fetchall() if (row["entidad"], row["clave"]) not in encoladas]
+    if nuevas:
+        cursor.executemany("DELETE FROM sync_outbox WHERE seq = ?", nuevas)
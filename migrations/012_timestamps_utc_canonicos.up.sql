@@ -0,0 +1,2 @@
+-- Canonicalización de updated_at y last_sync_at a UTC con ancho fijo
+-- (YYYY-MM-DDTHH:MM:SS.ffffffZ) ejecutada en hook Python.
@@ -0,0 +1,4 @@
+ALTER TABLE sync_state DROP COLUMN pull_checkpoint_at;
+ALTER TABLE sync_state DROP COLUMN pull_checkpoint_revision;
+ALTER TABLE sync_state DROP COLUMN pull_checkpoint_row;
+ALTER TABLE sync_state DROP COLUMN pull_checkpoint_worksheet;
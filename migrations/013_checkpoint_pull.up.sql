@@ -0,0 +1,7 @@
+-- Punto de reanudación del pull de solicitudes: hoja y última fila aplicada y
+-- confirmada, con la huella del contenido remoto hasta esa fila. Un pull
+-- interrumpido continúa desde aquí si la hoja no ha cambiado.
+ALTER TABLE sync_state ADD COLUMN pull_checkpoint_worksheet TEXT;
+ALTER TABLE sync_state ADD COLUMN pull_checkpoint_row INTEGER;
+ALTER TABLE sync_state ADD COLUMN pull_checkpoint_revision TEXT;
+ALTER TABLE sync_state ADD COLUMN pull_checkpoint_at TEXT;
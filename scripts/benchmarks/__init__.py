@@ -0,0 +1 @@
+"""Benchmarks reproducibles de rendimiento sobre la base SQLite local."""
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import time
+from datetime import datetime
+from typing import Callable
+
+from app.infrastructure.migrations import run_migrations
+from app.infrastructure.repos_sqlite import SolicitudRepositorySQLite
+
+_DIAS = tuple(f"2026-03-{dia:02d}" for dia in range(1, 29))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compara detectar_conflicto_pendiente en SQL (LIMIT 1) con la ruta anterior (filas a Python)"
+    )
+    parser.add_argument("--personas", type=int, default=20, help="Número de delegadas sintéticas")
+    parser.add_argument("--pendientes", type=int, default=12, help="Pendientes por delegada y día")
+    parser.add_argument("--consultas", type=int, default=5000, help="Validaciones preventivas simuladas")
+    parser.add_argument("--seed", type=int, default=7, help="Semilla del generador aleatorio")
+    return parser.parse_args()
+
+
+def crear_base_sintetica(personas: int, pendientes_por_dia: int, seed: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    run_migrations(connection)
+    rng = random.Random(seed)
+    connection.executemany(
+        "INSERT INTO personas (id, nombre, genero, horas_mes_min, horas_ano_min, is_active, deleted) "
+        "VALUES (?, ?, 'F', 600, 7200, 1, 0)",
+        [(persona_id, f"Delegada {persona_id:03d}") for persona_id in range(1, personas + 1)],
+    )
+    filas = []
+    for persona_id in range(1, personas + 1):
+        for fecha in _DIAS:
+            for _ in range(pendientes_por_dia):
+                desde, hasta = _tramo_aleatorio(rng)
+                filas.append((persona_id, fecha, fecha, desde, hasta, 1 if rng.random() < 0.05 else 0))
+    connection.executemany(
+        "INSERT INTO solicitudes (persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo, "
+        "horas_solicitadas_min, generated, deleted) VALUES (?, ?, ?, ?, ?, ?, 60, 0, 0)",
+        filas,
+    )
+    connection.commit()
+    connection.execute("ANALYZE")
+    return connection
+
+
+def _tramo_aleatorio(rng: random.Random) -> tuple[int, int]:
+    desde = rng.randrange(7 * 60, 20 * 60, 30)
+    return desde, desde + rng.choice((30, 60, 120))
+
+
+def _normalizar_fecha_legacy(fecha: str) -> str:
+    fecha_norm = str(fecha).strip()
+    for pattern in ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(fecha_norm, pattern).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return fecha_norm
+
+
+def _clasificar_legacy(desde: int | None, hasta: int | None, completo: bool, fila: sqlite3.Row) -> str | None:
+    if completo:
+        return "DUPLICADO" if fila["completo"] else "SOLAPE"
+    if fila["completo"]:
+        return "SOLAPE"
+    if desde == fila["desde_min"] and hasta == fila["hasta_min"]:
+        return "DUPLICADO"
+    if None in {desde, hasta, fila["desde_min"], fila["hasta_min"]}:
+        return None
+    return "SOLAPE" if desde < fila["hasta_min"] and hasta > fila["desde_min"] else None
+
+
+def detectar_legacy(
+    connection: sqlite3.Connection, persona_id: int, fecha: str, desde: int | None, hasta: int | None, completo: bool
+) -> tuple[str, int] | None:
+    """Ruta anterior: todas las pendientes del día a Python y clasificación fila a fila."""
+    filas = connection.execute(
+        """
+        SELECT s.id, s.persona_id, s.fecha_pedida, s.desde_min, s.hasta_min, s.completo, s.generated
+        FROM solicitudes s
+        WHERE s.persona_id = ? AND s.fecha_pedida = ? AND s.generated = 0 AND (s.deleted = 0 OR s.deleted IS NULL)
+        ORDER BY s.id DESC
+        """,
+        (persona_id, _normalizar_fecha_legacy(fecha)),
+    ).fetchall()
+    for fila in filas:
+        tipo = _clasificar_legacy(desde, hasta, completo, fila)
+        if tipo is not None:
+            return tipo, int(fila["id"])
+    return None
+
+
+def medir(operacion: Callable[[], object], repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        operacion()
+    return (time.perf_counter() - inicio) * 1_000_000 / repeticiones
+
+
+def main() -> int:
+    args = parse_args()
+    connection = crear_base_sintetica(args.personas, args.pendientes, args.seed)
+    repo = SolicitudRepositorySQLite(connection)
+    rng = random.Random(args.seed + 1)
+    consultas = []
+    for _ in range(args.consultas):
+        desde, hasta = _tramo_aleatorio(rng)
+        completo = rng.random() < 0.1
+        consultas.append(
+            (rng.randint(1, args.personas), rng.choice(_DIAS), None if completo else desde, None if completo else hasta, completo)
+        )
+
+    for consulta in consultas:
+        nuevo = repo.detectar_conflicto_pendiente(*consulta)
+        esperado = detectar_legacy(connection, *consulta)
+        obtenido = None if nuevo is None else (nuevo.tipo, nuevo.id_existente)
+        if obtenido != esperado:
+            raise SystemExit(f"Resultado distinto para {consulta}: sql={obtenido} legacy={esperado}")
+
+    iterador_legacy = iter(consultas * 2)
+    iterador_sql = iter(consultas * 2)
+    legacy_us = medir(lambda: detectar_legacy(connection, *next(iterador_legacy)), len(consultas))
+    sql_us = medir(lambda: repo.detectar_conflicto_pendiente(*next(iterador_sql)), len(consultas))
+    print(
+        f"Base sintética: {args.personas} delegadas x {len(_DIAS)} días x {args.pendientes} pendientes; "
+        f"{len(consultas)} consultas equivalentes"
+    )
+    print(f"ruta anterior (Python): {legacy_us:8.1f} µs/consulta")
+    print(f"SQL con LIMIT 1:        {sql_us:8.1f} µs/consulta")
+    connection.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import time
+from typing import Callable
+
+from app.infrastructure.migrations import run_migrations
+from app.infrastructure.repos_sqlite_builders import build_period_filters
+
+_LEGACY_WHERE_ANO = "strftime('%Y', fecha_pedida) = ?"
+_LEGACY_WHERE_MES = "strftime('%Y', fecha_pedida) = ? AND strftime('%m', fecha_pedida) = ?"
+
+_SQL_PERIODO = """
+    SELECT id, horas_solicitadas_min
+    FROM solicitudes
+    WHERE persona_id = ?
+      AND {where_period}
+      AND generated = 1
+      AND (deleted = 0 OR deleted IS NULL)
+    ORDER BY fecha_pedida DESC
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compara el plan y el tiempo de las consultas de periodo de solicitudes (strftime vs rango ISO)"
+    )
+    parser.add_argument("--personas", type=int, default=60, help="Número de delegadas sintéticas")
+    parser.add_argument("--solicitudes", type=int, default=1500, help="Solicitudes por delegada")
+    parser.add_argument("--repeticiones", type=int, default=200, help="Consultas por variante")
+    parser.add_argument("--seed", type=int, default=7, help="Semilla del generador aleatorio")
+    return parser.parse_args()
+
+
+def crear_base_sintetica(personas: int, solicitudes_por_persona: int, seed: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    run_migrations(connection)
+    rng = random.Random(seed)
+    connection.executemany(
+        "INSERT INTO personas (id, nombre, genero, horas_mes_min, horas_ano_min, is_active, deleted) "
+        "VALUES (?, ?, 'F', 600, 7200, 1, 0)",
+        [(persona_id, f"Delegada {persona_id:03d}") for persona_id in range(1, personas + 1)],
+    )
+    filas = []
+    for persona_id in range(1, personas + 1):
+        for _ in range(solicitudes_por_persona):
+            fecha = f"{rng.randint(2015, 2026):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            filas.append((persona_id, fecha, fecha, rng.choice((30, 60, 120, 480))))
+    connection.executemany(
+        "INSERT INTO solicitudes (persona_id, fecha_solicitud, fecha_pedida, completo, horas_solicitadas_min, generated, deleted) "
+        "VALUES (?, ?, ?, 0, ?, 1, 0)",
+        filas,
+    )
+    connection.commit()
+    connection.execute("ANALYZE")
+    return connection
+
+
+def plan_consulta(connection: sqlite3.Connection, sql: str, params: tuple[object, ...]) -> list[str]:
+    return [row["detail"] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def medir(operacion: Callable[[], object], repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        operacion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def _variantes(year: int, month: int) -> list[tuple[str, str, tuple[object, ...]]]:
+    where_ano, params_ano = build_period_filters(year)
+    where_mes, params_mes = build_period_filters(year, month)
+    return [
+        ("legacy strftime (año)", _LEGACY_WHERE_ANO, (f"{year:04d}",)),
+        ("rango ISO (año)", where_ano, params_ano),
+        ("legacy strftime (mes)", _LEGACY_WHERE_MES, (f"{year:04d}", f"{month:02d}")),
+        ("rango ISO (mes)", where_mes, params_mes),
+    ]
+
+
+def main() -> int:
+    args = parse_args()
+    connection = crear_base_sintetica(args.personas, args.solicitudes, args.seed)
+    persona_id = max(1, args.personas // 2)
+    print(f"Base sintética: {args.personas} delegadas x {args.solicitudes} solicitudes")
+    for nombre, where_period, period_params in _variantes(2024, 3):
+        sql = _SQL_PERIODO.format(where_period=where_period)
+        params = (persona_id, *period_params)
+        filas = len(connection.execute(sql, params).fetchall())
+        ms = medir(lambda sql=sql, params=params: connection.execute(sql, params).fetchall(), args.repeticiones)
+        print(f"\n== {nombre}: {filas} filas, {ms:.3f} ms/consulta")
+        for detalle in plan_consulta(connection, sql, params):
+            print(f"   EXPLAIN QUERY PLAN: {detalle}")
+    connection.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
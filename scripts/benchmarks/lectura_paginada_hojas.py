@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from itertools import islice
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from app.application.use_cases.sync_sheets.orquestacion_modelos import HEADER_CANONICO_SOLICITUDES
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import iter_rows_with_index, rows_with_index
+from app.infrastructure.sheets_client import SheetsClient
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compara el pico de memoria de leer una hoja entera con la lectura paginada (iter_values)"
+    )
+    parser.add_argument("--filas", type=int, default=100_000, help="Filas sintéticas de la hoja")
+    parser.add_argument("--pagina", type=int, default=5000, help="Filas por ventana de lectura")
+    parser.add_argument("--bloque", type=int, default=2000, help="Filas que procesa el pull de cada vez")
+    parser.add_argument("--cache-mb", type=int, default=8, help="Presupuesto de la caché de valores (MB)")
+    return parser.parse_args()
+
+
+class _SpreadsheetSintetico:
+    """Genera cada ventana al pedirla, como haría la API, sin tener la hoja entera en memoria."""
+
+    def __init__(self, filas: int) -> None:
+        self._filas = filas
+
+    def fila(self, numero: int) -> list[str]:
+        if numero == 1:
+            return list(HEADER_CANONICO_SOLICITUDES)
+        dia = numero % 28 + 1
+        return [
+            f"sol-{numero:07d}", f"del-{numero % 40:03d}", f"Delegada {numero % 40:03d}", f"2026-03-{dia:02d}",
+            "9", "0", "11", "0", "0", "120", "", "pendiente", "2026-03-01",
+            f"2026-03-{dia:02d}T10:00:00.000000Z", "pc-1", "0", "",
+        ]
+
+    def values_get(self, range_name: str) -> dict[str, Any]:
+        celdas = range_name.split("!", 1)[1]
+        inicio, fin = (int("".join(c for c in parte if c.isdigit())) for parte in celdas.split(":"))
+        return {"values": [self.fila(numero) for numero in range(inicio, min(fin, self._filas + 1) + 1)]}
+
+    def get_all_values(self) -> list[list[str]]:
+        return [self.fila(numero) for numero in range(1, self._filas + 2)]
+
+
+def _cliente(args: argparse.Namespace) -> SheetsClient:
+    client = SheetsClient(
+        read_quota_per_minute=1_000_000,
+        values_cache_max_bytes=args.cache_mb * 1024 * 1024,
+        read_page_rows=args.pagina,
+    )
+    spreadsheet = _SpreadsheetSintetico(args.filas)
+    client._spreadsheet = spreadsheet
+    client._worksheet_cache["solicitudes"] = SimpleNamespace(
+        title="solicitudes",
+        row_count=args.filas + 1,
+        col_count=len(HEADER_CANONICO_SOLICITUDES),
+        get_all_values=spreadsheet.get_all_values,
+    )
+    return client
+
+
+def lectura_completa(client: SheetsClient, bloque: int) -> int:
+    _, filas = rows_with_index(client.read_all_values("solicitudes"), worksheet_name="solicitudes")
+    return sum(len(filas[inicio : inicio + bloque]) for inicio in range(0, len(filas), bloque))
+
+
+def lectura_paginada(client: SheetsClient, bloque: int) -> int:
+    valores = client.iter_values("solicitudes")
+    filas = iter_rows_with_index(next(valores), valores)
+    total = 0
+    while lote := list(islice(filas, bloque)):
+        total += len(lote)
+    return total
+
+
+def medir(operacion: Callable[[], int]) -> tuple[int, float, float]:
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    total = operacion()
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, duracion * 1000, pico / (1024 * 1024)
+
+
+def main() -> int:
+    args = parse_args()
+    completa = medir(lambda: lectura_completa(_cliente(args), args.bloque))
+    paginada = medir(lambda: lectura_paginada(_cliente(args), args.bloque))
+    if completa[0] != paginada[0]:
+        raise SystemExit("La lectura paginada no devuelve las mismas filas")
+    print(f"Hoja sintética: {args.filas} filas, ventanas de {args.pagina}, caché {args.cache_mb} MB")
+    print(f"hoja entera (read_all_values):  {completa[1]:9.1f} ms  pico {completa[2]:8.1f} MB")
+    print(f"paginada (iter_values):         {paginada[1]:9.1f} ms  pico {paginada[2]:8.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets.normalizacion_columnar import (
+    columnas_desde_valores,
+    normalizar_columnas_solicitud,
+)
+from app.application.use_cases.sync_sheets.orquestacion_modelos import HEADER_CANONICO_SOLICITUDES
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rows_with_index
+
+_ALIASES = {
+    "uuid": ["id", "solicitud_uuid"],
+    "delegada_uuid": ["delegado_uuid", "persona_uuid"],
+    "delegada_nombre": ["Delegada", "delegado_nombre", "delegada", "delegado", "persona_nombre", "nombre"],
+    "fecha": ["fecha_pedida", "dia", "fecha solicitud"],
+    "completo": ["es_completo", "jornada_completa"],
+    "horas": ["minutos_total", "horas_solicitadas", "total_minutos"],
+    "notas": ["observaciones", "comentarios"],
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compara la normalización columnar de solicitudes remotas con la ruta anterior (dict por fila)"
+    )
+    parser.add_argument("--filas", type=int, default=50_000, help="Filas sintéticas de la hoja")
+    parser.add_argument("--delegadas", type=int, default=40, help="Delegadas distintas")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones por ruta (se toma la mejor)")
+    parser.add_argument("--seed", type=int, default=7, help="Semilla del generador aleatorio")
+    return parser.parse_args()
+
+
+def hoja_sintetica(filas: int, delegadas: int, seed: int) -> list[list[Any]]:
+    rng = random.Random(seed)
+    values: list[list[Any]] = [list(HEADER_CANONICO_SOLICITUDES)]
+    for numero in range(filas):
+        completo = rng.random() < 0.1
+        desde = rng.randrange(7 * 60, 18 * 60, 15)
+        hasta = desde + rng.choice((30, 60, 120))
+        dia = rng.randint(1, 28)
+        fecha = f"{dia:02d}/03/2026" if rng.random() < 0.3 else f"2026-03-{dia:02d}"
+        delegada = rng.randint(1, delegadas)
+        values.append(
+            [
+                f"sol-{numero:06d}",
+                f"del-{delegada:03d}",
+                f"Delegada {delegada:03d}",
+                fecha,
+                "" if completo else str(desde // 60),
+                "" if completo else str(desde % 60),
+                "" if completo else str(hasta // 60),
+                "" if completo else str(hasta % 60),
+                "1" if completo else "0",
+                str(hasta - desde),
+                "" if rng.random() < 0.8 else "nota",
+                rng.choice(("pendiente", "Aprobada", "")),
+                "2026-03-01",
+                f"2026-03-{dia:02d}T10:00:00Z",
+                "pc-1",
+                "0",
+                "",
+            ]
+        )
+    return values
+
+
+def ruta_por_fila(values: list[list[Any]]) -> list[tuple[Any, ...]]:
+    """Ruta anterior: un dict por fila y ``normalize_remote_solicitud_row`` fila a fila."""
+    _, filas = rows_with_index(values, worksheet_name="solicitudes", aliases=_ALIASES)
+    return [tuple(sync_sheets_core.normalize_remote_solicitud_row(fila, "solicitudes").values()) for _, fila in filas]
+
+
+def ruta_columnar(values: list[list[Any]]) -> list[tuple[Any, ...]]:
+    """Ruta del pull: alias resueltos una vez por hoja, una tupla por fila y normalización por columnas."""
+    numeros, columnas = columnas_desde_valores(values, _ALIASES)
+    return normalizar_columnas_solicitud(columnas, len(numeros), "solicitudes")
+
+
+def medir(operacion: Callable[[], object], repeticiones: int) -> float:
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        operacion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1000
+
+
+def main() -> int:
+    args = parse_args()
+    values = hoja_sintetica(args.filas, args.delegadas, args.seed)
+    esperado = ruta_por_fila(values)
+    if ruta_columnar(values) != esperado:
+        raise SystemExit("La normalización columnar no coincide con la ruta por fila")
+
+    por_fila_ms = medir(lambda: ruta_por_fila(values), args.repeticiones)
+    columnar_ms = medir(lambda: ruta_columnar(values), args.repeticiones)
+    print(f"Hoja sintética: {args.filas} filas, {args.delegadas} delegadas; resultados idénticos")
+    print(f"ruta anterior (dict por fila):        {por_fila_ms:9.1f} ms")
+    print(f"columnar desde valores (pull):        {columnar_ms:9.1f} ms  (x{por_fila_ms / columnar_ms:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
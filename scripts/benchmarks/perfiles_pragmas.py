@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from app.application.use_cases.sync_sheets import persistence_ops
+from app.infrastructure.configuracion_conexion_sqlite import PERFILES_PRAGMAS, cerrar_conexion
+from app.infrastructure.db import get_connection
+from app.infrastructure.migrations import run_migrations
+from app.infrastructure.repos_sqlite import RepositorioPersonasSQLite, SolicitudRepositorySQLite
+
+_PERFIL_BASE = "base"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Mide los perfiles de PRAGMAs SQLite con la carga real: apertura, histórico y pull de sync"
+    )
+    parser.add_argument("--personas", type=int, default=60, help="Número de delegadas sintéticas")
+    parser.add_argument("--solicitudes", type=int, default=1500, help="Solicitudes por delegada")
+    parser.add_argument("--pull", type=int, default=5000, help="Filas remotas aplicadas en el pull simulado")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Repeticiones por escenario (se informa la mediana)")
+    parser.add_argument("--seed", type=int, default=7, help="Semilla del generador aleatorio")
+    return parser.parse_args()
+
+
+def crear_base_fichero(path: Path, personas: int, solicitudes_por_persona: int, seed: int) -> None:
+    connection = get_connection(path)
+    try:
+        run_migrations(connection)
+        rng = random.Random(seed)
+        connection.executemany(
+            "INSERT INTO personas (id, uuid, nombre, genero, horas_mes_min, horas_ano_min, is_active, updated_at, deleted) "
+            "VALUES (?, ?, ?, 'F', 600, 7200, 1, '2025-01-01T00:00:00Z', 0)",
+            [(pid, str(uuid.UUID(int=pid)), f"Delegada {pid:03d}") for pid in range(1, personas + 1)],
+        )
+        filas = []
+        for persona_id in range(1, personas + 1):
+            for _ in range(solicitudes_por_persona):
+                fecha = f"{rng.randint(2015, 2026):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+                filas.append(
+                    (
+                        str(uuid.UUID(int=rng.getrandbits(128))),
+                        persona_id,
+                        fecha,
+                        fecha,
+                        rng.choice((30, 60, 120, 480)),
+                        1 if rng.random() < 0.9 else 0,
+                        "Nota de la solicitud " * 3,
+                    )
+                )
+        connection.executemany(
+            "INSERT INTO solicitudes (uuid, persona_id, fecha_solicitud, fecha_pedida, completo, horas_solicitadas_min, "
+            "generated, notas, updated_at, deleted) VALUES (?, ?, ?, ?, 0, ?, ?, ?, '2025-01-01T00:00:00Z', 0)",
+            filas,
+        )
+        connection.commit()
+        connection.execute("ANALYZE")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        connection.close()
+
+
+def _abrir(path: Path, perfil: str) -> sqlite3.Connection:
+    if perfil == _PERFIL_BASE:
+        # Configuración previa a los perfiles: solo foreign_keys, busy_timeout, WAL y synchronous.
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("PRAGMA busy_timeout=30000")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+    return get_connection(path, perfil=perfil)
+
+
+def _es_solo_lectura(perfil: str) -> bool:
+    configuracion = PERFILES_PRAGMAS.get(perfil)
+    return configuracion is not None and configuracion.query_only
+
+
+def escenario_apertura(path: Path, perfil: str) -> None:
+    connection = _abrir(path, perfil)
+    try:
+        if not _es_solo_lectura(perfil):
+            # En la app las migraciones las ejecuta el escritor, nunca un lector.
+            run_migrations(connection)
+        personas = RepositorioPersonasSQLite(connection)
+        solicitudes = SolicitudRepositorySQLite(connection)
+        personas.list_all()
+        list(solicitudes.list_consumo_mensual(2025))
+        list(solicitudes.list_pendientes_all())
+        list(solicitudes.list_historico_batch(limit=500))
+    finally:
+        cerrar_conexion(connection)
+
+
+def escenario_historico(path: Path, perfil: str) -> None:
+    connection = _abrir(path, perfil)
+    try:
+        repo = SolicitudRepositorySQLite(connection)
+        after: tuple[str, int] | None = None
+        while True:
+            pagina = list(repo.list_historico_batch(limit=500, after=after))
+            if not pagina:
+                break
+            ultima = pagina[-1]
+            after = (ultima.fecha_pedida, int(ultima.id or 0))
+    finally:
+        cerrar_conexion(connection)
+
+
+def escenario_pull(path: Path, perfil: str, filas_pull: int, seed: int) -> None:
+    """Réplica del patrón del pull: búsqueda por uuid y UPDATE/INSERT bajo SAVEPOINT por fila."""
+    connection = _abrir(path, perfil)
+    rng = random.Random(seed)
+    try:
+        uuids = [row[0] for row in connection.execute("SELECT uuid FROM solicitudes ORDER BY id LIMIT ?", (filas_pull // 2,))]
+        remotas = uuids + [str(uuid.uuid4()) for _ in range(filas_pull - len(uuids))]
+        persona_ids = [row[0] for row in connection.execute("SELECT id FROM personas ORDER BY id")]
+        connection.execute("BEGIN")
+        for indice, remote_uuid in enumerate(remotas):
+            connection.execute("SAVEPOINT pull_fila")
+            local = connection.execute("SELECT id FROM solicitudes WHERE uuid = ?", (remote_uuid,)).fetchone()
+            fecha = f"{rng.randint(2015, 2026):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            persona_id = persona_ids[indice % len(persona_ids)]
+            if local is None:
+                persistence_ops.execute_insert_solicitud(
+                    connection,
+                    (remote_uuid, persona_id, fecha, fecha, None, None, 1, 480, "", "remota", None, None, 1,
+                     "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z", "remoto", 0),
+                )
+            else:
+                persistence_ops.execute_update_solicitud(
+                    connection,
+                    (persona_id, fecha, None, None, 1, 480, "remota", None, "2026-01-01T00:00:00Z",
+                     "2026-01-01T00:00:00Z", "remoto", 0, local[0]),
+                )
+            connection.execute("RELEASE SAVEPOINT pull_fila")
+        connection.commit()
+    finally:
+        cerrar_conexion(connection)
+
+
+def medir_mediana(preparar: Callable[[], None], operacion: Callable[[], None], repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        preparar()
+        inicio = time.perf_counter()
+        operacion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main() -> int:
+    args = parse_args()
+    perfiles = [_PERFIL_BASE, *PERFILES_PRAGMAS]
+    with tempfile.TemporaryDirectory(prefix="bench_perfiles_") as tmp:
+        plantilla = Path(tmp) / "plantilla.db"
+        trabajo = Path(tmp) / "trabajo.db"
+        crear_base_fichero(plantilla, args.personas, args.solicitudes, args.seed)
+
+        def restaurar() -> None:
+            for sufijo in ("-wal", "-shm"):
+                Path(f"{trabajo}{sufijo}").unlink(missing_ok=True)
+            shutil.copyfile(plantilla, trabajo)
+
+        total = args.personas * args.solicitudes
+        print(f"Base sintética: {args.personas} delegadas, {total} solicitudes; pull de {args.pull} filas")
+        print(f"{'perfil':<12} {'apertura ms':>12} {'histórico ms':>13} {'pull ms':>10}")
+        for perfil in perfiles:
+            restaurar()
+            apertura = medir_mediana(lambda: None, functools.partial(escenario_apertura, trabajo, perfil), args.repeticiones)
+            historico = medir_mediana(lambda: None, functools.partial(escenario_historico, trabajo, perfil), args.repeticiones)
+            if _es_solo_lectura(perfil):
+                pull = "n/a"
+            else:
+                operacion_pull = functools.partial(escenario_pull, trabajo, perfil, args.pull, args.seed)
+                pull = f"{medir_mediana(restaurar, operacion_pull, args.repeticiones):.1f}"
+            print(f"{perfil:<12} {apertura:>12.1f} {historico:>13.1f} {pull:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
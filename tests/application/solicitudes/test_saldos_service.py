@@ -7,9 +7,10 @@ from app.application.use_cases.solicitudes.servicio_saldos import (
     acumular_consumo_anual_por_personas,
     calcular_totales_globales,
     construir_resumen_saldos,
+    indexar_consumo_por_persona,
     sumar_consumo_solicitudes,
 )
-from app.domain.models import Persona
+from app.domain.models import ConsumoMensual, Persona
 
 
 def _persona(persona_id: int, *, horas_mes_min: int, horas_ano_min: int) -> Persona:
@@ -97,3 +98,15 @@ def test_acumular_consumo_anual_por_personas_error_compatible_longitudes() -> No
     )
     assert bolsa == 1920
     assert consumo == 420
+
+
+def test_indexar_consumo_por_persona_agrega_anual_y_filtra_mes() -> None:
+    consumos = [
+        ConsumoMensual(persona_id=1, year=2025, month=1, minutos=60),
+        ConsumoMensual(persona_id=1, year=2025, month=2, minutos=90),
+        ConsumoMensual(persona_id=2, year=2025, month=2, minutos=30),
+    ]
+
+    assert indexar_consumo_por_persona(consumos) == {1: 150, 2: 30}
+    assert indexar_consumo_por_persona(consumos, month=2) == {1: 90, 2: 30}
+    assert indexar_consumo_por_persona(consumos, month=3) == {}
@@ -19,6 +19,9 @@ class _Repo:
     def update_pdf_info(self, solicitud_id: int, pdf_path: str, pdf_hash: str | None) -> None:
         self.updated.append((solicitud_id, pdf_path, pdf_hash))
 
+    def update_pdf_info_many(self, updates: list[tuple[int, str, str | None]]) -> None:
+        self.updated.extend(updates)
+
 
 class _Pdf:
     def __init__(self) -> None:
@@ -537,3 +537,38 @@ def test_pull_solicitudes_omite_si_delegada_no_resuelve_por_nombre(connection) -
     cursor = connection.cursor()
     cursor.execute("SELECT COUNT(*) AS total FROM solicitudes WHERE uuid = ?", ("sol-no-match",))
     assert cursor.fetchone()["total"] == 0
+
+
+def test_pull_precarga_hojas_pequenas_juntas_y_lee_solicitudes_aparte(connection, caplog) -> None:
+    spreadsheet = _FakeSpreadsheet(
+        {
+            "delegadas": _empty_sheet(["uuid", "updated_at"]),
+            "solicitudes": _empty_sheet(["uuid", "updated_at"]),
+            "Histórico": _empty_sheet(["uuid", "updated_at"]),
+            "cuadrantes": _empty_sheet(["uuid", "updated_at"]),
+            "pdf_log": _empty_sheet(["pdf_id", "updated_at"]),
+            "config": _empty_sheet(["key", "updated_at"]),
+        }
+    )
+    client = _FakeClient(spreadsheet)
+    service = SheetsSyncService(
+        connection=connection,
+        config_store=_FakeConfigStore(
+            SheetsConfig(
+                spreadsheet_id="sheet-id",
+                credentials_path="/tmp/fake_credentials.json",
+                device_id="device-local",
+            )
+        ),
+        client=client,
+        repository=_FakeRepository(),
+    )
+
+    with caplog.at_level("INFO"):
+        service.pull()
+
+    # delegadas, cuadrantes, pdf_log y config en un values_batch_get; cada hoja de solicitudes,
+    # que puede ser grande, se lee por separado en el hilo de lectura.
+    assert client.get_read_calls_count() == 3
+    assert "api_calls_evitadas=3" in caplog.text
+    assert "Pipeline pull: hojas=6" in caplog.text
@@ -59,3 +59,27 @@ def test_listar_historico_incluye_delegadas_inactivas(solicitud_use_cases, perso
 
     assert len(historico) == 2
     assert {sol.persona_id for sol in historico} == {int(activa.id or 0), int(inactiva.id or 0)}
+
+
+def test_iterar_historico_pagina_por_keyset_sin_perder_empates(solicitud_use_cases, persona_repo, connection) -> None:
+    persona = persona_repo.create(_persona("Keyset", activa=True))
+    persona_id = int(persona.id or 0)
+    fechas = ["2025-01-10", "2025-01-10", "2025-01-10", "2025-01-09", "2025-01-08"]
+    connection.executemany(
+        """
+        INSERT INTO solicitudes (
+            persona_id, fecha_solicitud, fecha_pedida, completo, horas_solicitadas_min, generated, deleted
+        ) VALUES (?, ?, ?, 1, 60, 1, 0)
+        """,
+        [(persona_id, fecha, fecha) for fecha in fechas],
+    )
+    connection.commit()
+
+    paginado = solicitud_use_cases.iterar_historico(batch_size=2)
+    primero = next(paginado)
+    resto = list(paginado)
+
+    ids = [primero.id, *(sol.id for sol in resto)]
+    assert len(ids) == len(set(ids)) == 5
+    assert [sol.fecha_pedida for sol in [primero, *resto]] == sorted(fechas, reverse=True)
+    assert [sol.id for sol in solicitud_use_cases.listar_historico()] == ids
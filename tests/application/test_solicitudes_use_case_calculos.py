@@ -125,7 +125,37 @@ def test_calcular_saldos_por_periodo_propaga_error_de_repo(connection, monkeypat
     def _falla_repo(*_args, **_kwargs):
         raise RuntimeError("fallo de consulta")
 
-    monkeypatch.setattr(solicitud_repo, "list_by_persona_and_period", _falla_repo)
+    monkeypatch.setattr(solicitud_repo, "list_consumo_mensual", _falla_repo)
 
     with pytest.raises(RuntimeError, match="fallo de consulta"):
         use_case.calcular_saldos_por_periodo(persona_id, PeriodoFiltro.mensual(2025, 1))
+
+
+def test_totales_y_resumen_usan_una_consulta_agregada_por_refresco(connection, monkeypatch: pytest.MonkeyPatch) -> None:
+    persona_repo = RepositorioPersonasSQLite(connection)
+    solicitud_repo = SolicitudRepositorySQLite(connection)
+    persona_id = _crear_persona(persona_repo, horas_mes=300, horas_ano=4000)
+    use_case = SolicitudUseCases(solicitud_repo, persona_repo, fs=SistemaArchivosLocal(), politica_modo_solo_lectura=crear_politica_modo_solo_lectura(crear_estado_modo_solo_lectura(lambda: False)))
+    creada, _ = use_case.agregar_solicitud(_dto_valido(persona_id))
+    solicitud_repo.mark_generated(int(creada.id or 0), True)
+
+    llamadas: list[int] = []
+    original = solicitud_repo.list_consumo_mensual
+
+    def _contar(year: int, persona_id: int | None = None):
+        llamadas.append(year)
+        return original(year, persona_id)
+
+    def _prohibido(*_args, **_kwargs):
+        raise AssertionError("N+1: no debe listarse por persona")
+
+    monkeypatch.setattr(solicitud_repo, "list_consumo_mensual", _contar)
+    monkeypatch.setattr(solicitud_repo, "list_by_persona_and_period", _prohibido)
+
+    totales = use_case.calcular_totales_globales(PeriodoFiltro.mensual(2025, 1))
+    resumen = use_case.calcular_resumen_saldos(persona_id, PeriodoFiltro.anual(2025))
+
+    assert llamadas == [2025, 2025]
+    assert totales.total_consumidas_min == 120
+    assert resumen.individual.consumidas_periodo_min == 120
+    assert resumen.global_anual.consumidas_anual_min == 120
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import threading
+import time
 
 import pytest
 
@@ -26,13 +28,13 @@ class _FakeSyncUseCase:
             raise value
         return value
 
-    def pull(self) -> SyncSummary:
+    def pull(self, cancellation_token: CancellationToken | None = None) -> SyncSummary:
         return self._next()
 
     def push(self) -> SyncSummary:
         return self._next()
 
-    def sync(self) -> SyncSummary:
+    def sync(self, cancellation_token: CancellationToken | None = None) -> SyncSummary:
         return self._next()
 
     def get_last_sync_at(self) -> str | None:
@@ -88,6 +90,99 @@ def test_cancellation_stops_execution() -> None:
         module.run(SyncOptions(cancellation_token=token))
 
 
+class _PullPorBloques(_FakeSyncUseCase):
+    """Pull que solo comprueba la cancelación entre bloques, como el servicio real."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+        self.bloques = 0
+        self.primer_bloque = threading.Event()
+        self.terminado = threading.Event()
+
+    def pull(self, cancellation_token: CancellationToken | None = None) -> SyncSummary:
+        try:
+            while True:
+                self.bloques += 1
+                self.primer_bloque.set()
+                time.sleep(0.01)
+                if cancellation_token is not None and cancellation_token.is_cancelled():
+                    raise SyncCancelledError("cancelado")
+        finally:
+            self.terminado.set()
+
+
+def test_timeout_para_el_pull_en_el_siguiente_bloque_antes_de_devolver_el_control() -> None:
+    use_case = _PullPorBloques()
+    module = GoogleSheetsSyncModule(use_case)
+    token = CancellationToken()
+
+    report = module.run(
+        SyncOptions(operation="pull", timeout_seconds=0.05, retry_policy=RetryPolicy(max_attempts=1), cancellation_token=token)
+    )
+
+    assert report.errors and "Timeout" in report.errors[0]
+    assert use_case.terminado.is_set()
+    # El timeout cancela solo el intento, no el token del usuario.
+    assert not token.is_cancelled()
+
+
+class _PullSinSolape(_PullPorBloques):
+    """El primer intento agota el timeout; el segundo termina. Registra intentos simultáneos."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.intentos = 0
+        self.activos = 0
+        self.max_activos = 0
+        self._lock = threading.Lock()
+
+    def pull(self, cancellation_token: CancellationToken | None = None) -> SyncSummary:
+        with self._lock:
+            self.intentos += 1
+            intento = self.intentos
+            self.activos += 1
+            self.max_activos = max(self.max_activos, self.activos)
+        try:
+            if intento == 1:
+                # Tarda en llegar al límite de bloque, más que el backoff del reintento.
+                while not (cancellation_token is not None and cancellation_token.is_cancelled()):
+                    time.sleep(0.01)
+                time.sleep(0.2)
+                raise SyncCancelledError("cancelado")
+            return SyncSummary(downloaded=1, uploaded=0, conflicts=0, omitted_duplicates=0)
+        finally:
+            with self._lock:
+                self.activos -= 1
+
+
+def test_reintento_tras_timeout_no_solapa_con_el_intento_anterior() -> None:
+    use_case = _PullSinSolape()
+    module = GoogleSheetsSyncModule(use_case, sleeper=lambda _seconds: None)
+
+    report = module.run(SyncOptions(operation="pull", timeout_seconds=0.05, retry_policy=RetryPolicy(max_attempts=2)))
+
+    assert report.errors == []
+    assert report.attempts == 2
+    assert use_case.max_activos == 1
+
+
+def test_cancelar_durante_el_pull_lo_para_en_el_siguiente_bloque() -> None:
+    use_case = _PullPorBloques()
+    module = GoogleSheetsSyncModule(use_case)
+    token = CancellationToken()
+
+    def _cancelar_al_empezar() -> None:
+        use_case.primer_bloque.wait(timeout=2)
+        token.cancel()
+
+    threading.Thread(target=_cancelar_al_empezar).start()
+
+    with pytest.raises(SyncCancelledError):
+        module.run(SyncOptions(operation="pull", timeout_seconds=5, cancellation_token=token))
+
+    assert use_case.terminado.is_set()
+
+
 def test_structured_file_logger_writes_jsonl(tmp_path: Path) -> None:
     log_path = tmp_path / "sync.jsonl"
     logger = StructuredFileLogger(log_path)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
-from app.application.use_cases.sync_sheets import SheetsSyncService
+from app.application.use_cases.sync_sheets import SheetsSyncService, cache_preflight_escritura
 from app.domain.models import SheetsConfig
 from app.domain.sheets_errors import SheetsPermissionError
 
@@ -82,3 +83,87 @@ def test_preflight_permissions_denied_blocks_push_without_writes(connection, mon
 
     assert summary.errors == 1
     assert client.append_rows_calls == 0
+
+
+class _FakeClientConPermiso(_FakeClientPermissionDenied):
+    def __init__(self) -> None:
+        super().__init__()
+        self.check_write_access_calls = 0
+        self.denegar = False
+
+    def check_write_access(self, worksheet_name: str | None = None) -> None:
+        self.check_write_access_calls += 1
+        if self.denegar:
+            raise SheetsPermissionError("403 Forbidden", worksheet=worksheet_name)
+
+    def get_service_account_email(self) -> str:
+        return "sync@proyecto.iam.gserviceaccount.com"
+
+
+def _build_service_con_permiso(connection, client: _FakeClientConPermiso, **kwargs) -> SheetsSyncService:
+    return SheetsSyncService(
+        connection=connection,
+        config_store=_FakeConfigStore(SheetsConfig("sheet-123", "/tmp/creds.json", "device-1")),
+        client=client,
+        repository=_FakeRepository(),
+        **kwargs,
+    )
+
+
+def test_preflight_correcto_se_reutiliza_durante_el_ttl_sin_salir_del_equipo(connection) -> None:
+    client = _FakeClientConPermiso()
+    spreadsheet = client.open_spreadsheet()
+
+    assert _build_service_con_permiso(connection, client).preflight_permisos_escritura(spreadsheet).ok
+    # Otra instancia del servicio (como hace el adaptador en cada sync) usa la entrada persistida.
+    assert _build_service_con_permiso(connection, client).preflight_permisos_escritura(spreadsheet).ok
+
+    assert client.check_write_access_calls == 1
+    clave, updated_at = connection.execute(
+        "SELECT key, updated_at FROM sync_config WHERE key LIKE 'preflight_escritura|%'"
+    ).fetchone()
+    assert clave == "preflight_escritura|sheet-123|sync@proyecto.iam.gserviceaccount.com|solicitudes"
+    assert updated_at is None
+    assert connection.execute("SELECT COUNT(*) FROM sync_outbox WHERE clave = ?", (clave,)).fetchone()[0] == 0
+
+    # Con TTL 0 la caché no se usa.
+    assert _build_service_con_permiso(connection, client, preflight_ttl_seconds=0).preflight_permisos_escritura(spreadsheet).ok
+    assert client.check_write_access_calls == 2
+
+
+def test_error_de_permisos_invalida_el_preflight_guardado(connection, monkeypatch) -> None:
+    monkeypatch.setenv("SYNC_STRICT_EXCEPTIONS", "false")
+    client = _FakeClientConPermiso()
+    service = _build_service_con_permiso(connection, client)
+    spreadsheet = client.open_spreadsheet()
+    assert service.preflight_permisos_escritura(spreadsheet).ok
+
+    def _push_denegado(_spreadsheet):
+        raise SheetsPermissionError("403 Forbidden", worksheet="solicitudes")
+
+    monkeypatch.setattr(service, "_push_with_spreadsheet", _push_denegado)
+    try:
+        service.push()
+        raise AssertionError("El push debía propagar el error de permisos")
+    except SheetsPermissionError:
+        pass
+
+    assert connection.execute("SELECT COUNT(*) FROM sync_config WHERE key LIKE 'preflight_escritura|%'").fetchone()[0] == 0
+    client.denegar = True
+    assert service.preflight_permisos_escritura(spreadsheet).ok is False
+    assert client.check_write_access_calls == 2
+
+
+def test_preflight_guardado_caduca_al_superar_el_ttl(connection) -> None:
+    clave = cache_preflight_escritura.clave_preflight("sheet-123", "cuenta", "solicitudes")
+    verificado = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+    cache_preflight_escritura.registrar_preflight(connection, clave, ahora=verificado)
+
+    def _vigente(segundos_despues: float) -> bool:
+        ahora = verificado + timedelta(seconds=segundos_despues)
+        return cache_preflight_escritura.preflight_vigente(connection, clave, 3600, ahora=ahora)
+
+    assert _vigente(3599)
+    assert not _vigente(3600)
+    # Un reloj que retrocede no alarga la vigencia.
+    assert not _vigente(-60)
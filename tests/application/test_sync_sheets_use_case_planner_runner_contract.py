@@ -18,6 +18,9 @@ class _Cursor:
     def fetchall(self) -> list[Any]:
         return self.rows
 
+    def fetchone(self) -> Any:
+        return None
+
 
 class _Connection:
     def __init__(self) -> None:
@@ -85,7 +88,7 @@ def test_process_pull_row_calls_planner_and_runner(monkeypatch) -> None:
 
 def test_pull_solicitudes_worksheet_uses_savepoint_runner(monkeypatch) -> None:
     service = _service()
-    monkeypatch.setattr(service, "_rows_with_index", lambda *args, **kwargs: ([], [(2, {"uuid": "u1"})]))
+    monkeypatch.setattr(service, "_iter_valores_con_indice", lambda *args, **kwargs: (["uuid"], [(2, ["u1"])]))
     monkeypatch.setattr(service, "_process_pull_solicitud_row", lambda *args, **kwargs: None)
 
     called = {"savepoint": ""}
@@ -104,7 +107,9 @@ def test_push_solicitudes_calls_builder_and_runner(monkeypatch) -> None:
     service = _service()
     worksheet = object()
     monkeypatch.setattr(service, "_get_worksheet", lambda *args, **kwargs: worksheet)
-    monkeypatch.setattr(service, "_rows_with_index", lambda *args, **kwargs: (uc.HEADER_CANONICO_SOLICITUDES, []))
+    # Hoja sin encabezado: se normaliza y se reescribe completa con el runner.
+    monkeypatch.setattr(service, "_rows_with_index", lambda *args, **kwargs: ([], []))
+    monkeypatch.setattr(service, "_normalize_solicitudes_header", lambda ws: None)
     monkeypatch.setattr(service, "_uuid_index", lambda rows: {})
     monkeypatch.setattr(service, "_store_conflict", lambda *args, **kwargs: None)
 
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator
+
+import pytest
+
+from app.application.use_cases.sync_sheets.canal_lectura_hojas import CanalLecturaHojas
+from app.core.errors import InfraError
+from app.domain.sheets_errors import SheetsRateLimitError
+from app.infrastructure.sheets_client import SheetsClient
+
+
+class _ClientePaginado:
+    def __init__(self, hojas: dict[str, list[list[str]]], fallos: set[str] | None = None) -> None:
+        self._hojas = hojas
+        self._fallos = fallos or set()
+        self.pedidas: list[str] = []
+        self.filas_leidas = 0
+        self.hoja_pedida = {nombre: threading.Event() for nombre in hojas}
+        self.rangos_precargados: list[str] = []
+
+    def batch_get_ranges(self, rangos: list[str]) -> dict[str, list[list[str]]]:
+        if self._fallos & set(rangos):
+            raise InfraError("Lectura simulada fallida")
+        self.rangos_precargados.extend(rangos)
+        return {rango: [] for rango in rangos}
+
+    def iter_values(self, nombre: str) -> Iterator[list[str]]:
+        self.pedidas.append(nombre)
+        self.hoja_pedida[nombre].set()
+        if nombre in self._fallos:
+            raise SheetsRateLimitError(f"Rate limit simulado en {nombre}")
+        for fila in self._hojas[nombre]:
+            self.filas_leidas += 1
+            yield fila
+
+
+def test_canal_lee_la_siguiente_hoja_mientras_se_aplica_la_actual() -> None:
+    client = _ClientePaginado({"a": [["uuid"], ["a-1"], ["a-2"]], "b": [["uuid"], ["b-1"]]})
+    canal = CanalLecturaHojas(client, ["a", "b"], precarga={"x": "'x'", "y": "'y'"}, filas_por_pagina=2)
+    canal.iniciar()
+
+    assert list(canal.filas("a")) == [["uuid"], ["a-1"], ["a-2"]]
+    # Mientras "a" se aplica, el hilo de lectura ya ha pedido "b".
+    assert client.hoja_pedida["b"].wait(timeout=2)
+    assert list(canal.filas("b")) == [["uuid"], ["b-1"]]
+    metricas = canal.cerrar()
+
+    assert client.rangos_precargados == ["'x'", "'y'"]
+    assert canal.hojas_precargadas == ["x", "y"]
+    assert (metricas.hojas, metricas.paginas) == (2, 3)
+    assert metricas.solapado_s >= 0.0
+
+
+def test_canal_descarta_hojas_no_pedidas_y_rechaza_las_no_previstas() -> None:
+    client = _ClientePaginado({"a": [["uuid"], ["a-1"]], "b": [["uuid"], ["b-1"]], "c": [["uuid"]]})
+    canal = CanalLecturaHojas(client, ["a", "b", "c"])
+    canal.iniciar()
+
+    filas_a = canal.filas("a")
+    assert next(filas_a) == ["uuid"]
+    assert canal.filas("otra") is None
+    assert list(canal.filas("c")) == [["uuid"]]
+    assert canal.filas("a") is None
+    canal.cerrar()
+
+
+def test_canal_entrega_el_error_de_lectura_y_deja_leer_directamente_despues() -> None:
+    client = _ClientePaginado({"a": [["uuid"]], "b": [["uuid"]], "c": [["uuid"]]}, fallos={"b"})
+    canal = CanalLecturaHojas(client, ["a", "b", "c"])
+    canal.iniciar()
+
+    assert list(canal.filas("a")) == [["uuid"]]
+    filas_b = canal.filas("b")
+    with pytest.raises(SheetsRateLimitError):
+        list(filas_b)
+    assert canal.filas("c") is None
+    canal.cerrar()
+    assert client.pedidas == ["a", "b"]
+
+
+class _ParadaAbrupta(BaseException):
+    """Termina el hilo de lectura sin pasar por el ``except Exception`` del productor."""
+
+
+class _ClienteQueMuere(_ClientePaginado):
+    def iter_values(self, nombre: str) -> Iterator[list[str]]:
+        if nombre == "b":
+            raise _ParadaAbrupta()
+        return super().iter_values(nombre)
+
+
+def test_canal_falla_en_vez_de_bloquearse_si_el_hilo_de_lectura_muere(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(threading, "excepthook", lambda _args: None)
+    client = _ClienteQueMuere({"a": [["uuid"]], "b": [["uuid"]]})
+    canal = CanalLecturaHojas(client, ["a", "b"])
+    canal.iniciar()
+
+    assert list(canal.filas("a")) == [["uuid"]]
+    filas_b = canal.filas("b")
+    with pytest.raises(RuntimeError, match="hilo de lectura"):
+        list(filas_b)
+    assert canal.filas("b") is None
+    canal.cerrar()
+
+
+def test_canal_no_lee_mas_alla_de_la_cola_acotada() -> None:
+    client = _ClientePaginado({"a": [[str(numero)] for numero in range(50)]})
+    canal = CanalLecturaHojas(client, ["a"], max_paginas=2, filas_por_pagina=1)
+    canal.iniciar()
+    time.sleep(0.2)
+
+    # Dos páginas en cola, una esperando sitio y la fila que se está leyendo.
+    assert client.filas_leidas <= 4
+    assert len(list(canal.filas("a"))) == 50
+    canal.cerrar()
+
+
+def test_canal_sin_precarga_valida_no_marca_hojas_precargadas() -> None:
+    client = _ClientePaginado({"a": [["uuid"]]}, fallos={"'x'"})
+    canal = CanalLecturaHojas(client, ["a"], precarga={"x": "'x'", "y": "'y'"})
+    canal.iniciar()
+
+    assert list(canal.filas("a")) == [["uuid"]]
+    canal.cerrar()
+    assert canal.hojas_precargadas == []
+
+
+class _SpreadsheetConcurrente:
+    """Hoja de cálculo falsa que sirve lecturas por ventanas y escrituras desde varios hilos."""
+
+    def __init__(self, hojas: dict[str, list[list[str]]]) -> None:
+        self._hojas = hojas
+        self.escrituras = 0
+
+    def worksheet(self, nombre: str) -> SimpleNamespace:
+        time.sleep(0.001)
+        return SimpleNamespace(title=nombre, row_count=len(self._hojas.get(nombre, [])), col_count=1)
+
+    def values_get(self, rango: str) -> dict[str, object]:
+        time.sleep(0.001)
+        hoja, celdas = rango.split("!", 1)
+        inicio, fin = (int("".join(c for c in parte if c.isdigit())) for parte in celdas.split(":"))
+        return {"values": self._hojas[hoja.strip("'")][inicio - 1 : fin]}
+
+    def values_batch_get(self, rangos: list[str]) -> dict[str, object]:
+        # Como la API real: cada valueRange lleva el rango resuelto, no el pedido.
+        resueltos = [(hoja, self._hojas[hoja]) for hoja in (rango.strip("'") for rango in rangos)]
+        return {"valueRanges": [{"range": f"{hoja}!A1:Z{len(filas)}", "values": filas} for hoja, filas in resueltos]}
+
+    def values_batch_update(self, _body: dict[str, object]) -> None:
+        time.sleep(0.001)
+        self.escrituras += 1
+
+
+def test_canal_y_consumidor_comparten_el_sheets_client_sin_perder_estado() -> None:
+    hojas = {nombre: [["uuid"], *([f"{nombre}-{fila}"] for fila in range(60))] for nombre in ("a", "b", "c")}
+    hojas.update({"p": [["clave"], ["x"]], "q": [["clave"], ["y"]]})
+    client = SheetsClient(read_page_rows=7, read_quota_per_minute=100_000, write_quota_per_minute=100_000, burst=100_000)
+    spreadsheet = _SpreadsheetConcurrente(hojas)
+    client._spreadsheet = spreadsheet
+    canal = CanalLecturaHojas(client, ["a", "b", "c"], precarga={"p": "'p'", "q": "'q'"}, filas_por_pagina=5)
+    canal.iniciar()
+
+    leidas: dict[str, list[list[str]]] = {}
+    for nombre in ("a", "b", "c"):
+        filas = canal.filas(nombre)
+        assert filas is not None
+        leidas[nombre] = []
+        for fila in filas:
+            leidas[nombre].append(fila)
+            # El consumidor sigue usando el cliente mientras el productor lee la página siguiente.
+            client.get_worksheet(f"otra-{len(leidas[nombre]) % 4}")
+            client.values_batch_update({"data": [{"range": "A1", "values": [fila]}]})
+    canal.cerrar()
+
+    assert leidas == {nombre: hojas[nombre] for nombre in ("a", "b", "c")}
+    assert canal.hojas_precargadas == ["p", "q"]
+    assert client.read_all_values("p") == hojas["p"]
+    escrituras = sum(len(filas) for filas in leidas.values())
+    assert client.get_write_calls_count() == spreadsheet.escrituras == escrituras
+    # Un values_batch_get y 3 hojas × 9 ventanas; cada worksheet se pide a la API una sola vez.
+    assert client.get_read_calls_count() == 1 + 3 * 9
+    assert client.get_sheets_api_calls_count() == client.get_read_calls_count() + escrituras + 3 + 4
+    assert set(client._worksheet_cache) == {"a", "b", "c", "otra-0", "otra-1", "otra-2", "otra-3"}
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from app.application.use_cases.sync_sheets import checkpoint_pull
+from app.application.use_cases.sync_sheets.checkpoint_pull import CheckpointPull, HuellaHoja
+
+
+def test_checkpoint_se_guarda_lee_y_borra_en_sync_state(connection: sqlite3.Connection) -> None:
+    assert checkpoint_pull.cargar_checkpoint(connection) is None
+
+    checkpoint_pull.guardar_checkpoint(connection, CheckpointPull("Histórico", 2001, "abc"))
+    assert checkpoint_pull.cargar_checkpoint(connection) == CheckpointPull("Histórico", 2001, "abc")
+    guardado_en = connection.execute("SELECT pull_checkpoint_at FROM sync_state WHERE id = 1").fetchone()[0]
+    assert guardado_en.endswith("Z")
+
+    checkpoint_pull.borrar_checkpoint(connection)
+    assert checkpoint_pull.cargar_checkpoint(connection) is None
+
+
+def test_checkpoint_sin_migrar_no_rompe_el_pull() -> None:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE sync_state (id INTEGER PRIMARY KEY, last_sync_at TEXT)")
+
+    checkpoint_pull.guardar_checkpoint(connection, CheckpointPull("solicitudes", 10, "abc"))
+
+    assert checkpoint_pull.cargar_checkpoint(connection) is None
+
+
+def test_huella_cambia_con_el_contenido_y_con_el_numero_de_fila() -> None:
+    def _huella(filas: list[tuple[int, list[str]]]) -> str:
+        huella = HuellaHoja(["uuid", "notas"])
+        for row_number, valores in filas:
+            huella.actualizar(row_number, valores)
+        return huella.hexdigest()
+
+    base = _huella([(2, ["a", "x"]), (3, ["b", ""])])
+    assert _huella([(2, ["a", "x"]), (3, ["b", ""])]) == base
+    assert _huella([(2, ["a", "y"]), (3, ["b", ""])]) != base
+    # Una fila vacía insertada desplaza las siguientes aunque su contenido no cambie.
+    assert _huella([(2, ["a", "x"]), (4, ["b", ""])]) != base
+
+
+def test_filas_por_bloque_pull_usa_argumento_entorno_o_valor_por_defecto(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(checkpoint_pull.ENV_FILAS_POR_BLOQUE_PULL, raising=False)
+    assert checkpoint_pull.filas_por_bloque_pull() == checkpoint_pull.FILAS_POR_BLOQUE_PULL
+
+    monkeypatch.setenv(checkpoint_pull.ENV_FILAS_POR_BLOQUE_PULL, "500")
+    assert checkpoint_pull.filas_por_bloque_pull() == 500
+    assert checkpoint_pull.filas_por_bloque_pull(50) == 50
+
+    monkeypatch.setenv(checkpoint_pull.ENV_FILAS_POR_BLOQUE_PULL, "cero")
+    assert checkpoint_pull.filas_por_bloque_pull() == checkpoint_pull.FILAS_POR_BLOQUE_PULL
+    with pytest.raises(ValueError):
+        checkpoint_pull.filas_por_bloque_pull(0)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets.normalizacion_columnar import (
+    CAMPOS_SOLICITUD_REMOTA,
+    IndiceColumnasHoja,
+    columnas_desde_valores,
+    normalizar_columnas_solicitud,
+    normalizar_filas_solicitud,
+)
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rows_with_index
+
+_FILAS: list[dict[str, Any]] = [
+    {
+        "uuid": "sol-1",
+        "delegada_uuid": "del-2",
+        "delegada_nombre": "Ana",
+        "fecha": "2024-05-09",
+        "desde": "09:15",
+        "hasta": "12:00",
+        "completo": "0",
+        "minutos_total": "165",
+        "estado": "APROBADA",
+        "created_at": "2024-05-01",
+        "updated_at": "2024-05-02",
+    },
+    {"uuid": None, "delegada_uuid": None, "delegada_nombre": None, "estado": None, "desde_h": None},
+    {"delegado_uuid": "legacy", "Delegada": "Bea", "fecha_pedida": "09/05/24", "desde_h": "8", "desde_m": "30"},
+    {"delegado": "Carla", "hora_desde": "7:05", "hora_hasta": "460", "horas": "1.5", "created_at": "10/05/2024"},
+    {"estado": " Pendiente ", "completo": 1, "minutos_total": 0, "horas": "90", "fecha": "no-es-fecha"},
+    {},
+]
+
+
+def test_normalizar_filas_solicitud_equivale_a_la_ruta_por_fila() -> None:
+    for worksheet_name in ("solicitudes", "Histórico"):
+        esperado = [sync_sheets_core.normalize_remote_solicitud_row(fila, worksheet_name) for fila in _FILAS]
+
+        obtenido = [dict(zip(CAMPOS_SOLICITUD_REMOTA, valores)) for valores in normalizar_filas_solicitud(_FILAS, worksheet_name)]
+
+        assert obtenido == esperado
+        assert [list(fila) for fila in obtenido] == [list(fila) for fila in esperado]
+
+
+def test_columnas_desde_valores_resuelve_alias_como_rows_with_index() -> None:
+    aliases = {"delegada_nombre": ["Delegada", "nombre"], "fecha": ["fecha_pedida"], "horas": ["minutos_total"]}
+    values = [
+        ["uuid", "Delegada", "nombre", "fecha_pedida", "minutos_total", "estado", ""],
+        ["sol-1", "", "Ana", "09/05/2024", "60", "", "ignorada"],
+        ["", "", "", "", ""],
+        ["sol-2", "Bea", "Otra", "2024-05-10"],
+    ]
+    _, filas = rows_with_index(values, worksheet_name="Historico", aliases=aliases)
+
+    numeros, columnas = columnas_desde_valores(values, aliases)
+
+    assert numeros == [row_number for row_number, _ in filas]
+    assert normalizar_columnas_solicitud(columnas, len(numeros), "Historico") == [
+        tuple(sync_sheets_core.normalize_remote_solicitud_row(fila, "Historico").values()) for _, fila in filas
+    ]
+
+
+def test_indice_columnas_hoja_reproduce_claves_y_valores_del_dict_por_fila() -> None:
+    # Las huellas de fila y de checkpoint guardadas se calcularon sobre el dict de cada fila.
+    aliases = {"delegada_nombre": ["Delegada", "nombre"], "fecha": ["fecha_pedida"]}
+    headers = ["uuid", "Delegada", "nombre", "fecha_pedida", "uuid", "", "notas"]
+    values = [headers, ["sol-1", " ", "Ana", "09/05/2024", "sol-1b", "x"], ["sol-2", "Bea", "Otra"]]
+    _, filas = rows_with_index(values, worksheet_name="solicitudes", aliases=aliases)
+
+    indice = IndiceColumnasHoja(headers, aliases)
+
+    for (row_number, fila), cruda in zip(filas, values[1:]):
+        assert [*indice.claves, "__row_number__"] == list(fila)
+        assert [*indice.valores(cruda), row_number] == list(fila.values())
+    assert indice.valor(indice.valores(values[1]), "fecha") == "09/05/2024"
+    assert indice.valor(indice.valores(values[1]), "estado") is None
@@ -192,3 +192,53 @@ def test_dedupe_local_ignora_registros_soft_deleted(connection) -> None:
     key = ("uuid:delegada-del", "2026-07-05", False, 60, 540, 600)
 
     assert persistence_ops.is_duplicate_local_solicitud(connection, key) is False
+
+
+def test_lote_escrituras_solicitudes_vuelca_con_executemany(connection) -> None:
+    persona_id = _insert_persona(connection, uuid="delegada-lote")
+    existente_id = _insert_solicitud(connection, uuid="sol-existente", persona_id=persona_id, fecha="2026-02-10")
+    lote = persistence_ops.LoteEscriturasSolicitudes()
+    lote.insertar(
+        (
+            "sol-nueva", persona_id, "2026-02-01", "2026-02-20", 480, 540, 0,
+            60, None, "nota", None, None, 1, "2026-02-01", "2026-02-02T00:00:00Z", "dev", 0,
+        )
+    )
+    lote.actualizar(
+        (persona_id, "2026-02-21", 600, 660, 0, 60, "remota", None, "2026-02-01", "2026-02-03T00:00:00Z", "dev", 0, existente_id)
+    )
+
+    assert connection.execute("SELECT COUNT(*) FROM solicitudes WHERE uuid = 'sol-nueva'").fetchone()[0] == 0
+    assert len(lote) == 2
+
+    lote.volcar(connection)
+
+    assert len(lote) == 0
+    assert connection.execute("SELECT fecha_pedida FROM solicitudes WHERE uuid = 'sol-nueva'").fetchone()[0] == "2026-02-20"
+    assert connection.execute("SELECT fecha_pedida FROM solicitudes WHERE id = ?", (existente_id,)).fetchone()[0] == "2026-02-21"
+
+
+def test_upsert_filas_remotas_pdf_log_solo_actualiza_si_el_remoto_es_mas_nuevo(connection) -> None:
+    viejo = "2026-01-01T00:00:00.000000Z"
+    nuevo = "2026-02-01T00:00:00.000000Z"
+    persistence_ops.upsert_filas_remotas(
+        connection,
+        "pdf_log",
+        [("pdf-1", "d", "r", "f", "h1", nuevo, "local"), ("pdf-2", "d", "r", "f", "h2", nuevo, "local"), ("pdf-3", "d", "r", "f", "h3", None, "local")],
+    )
+
+    insertadas, actualizadas = persistence_ops.upsert_filas_remotas(
+        connection,
+        "pdf_log",
+        [
+            ("pdf-1", "d", "r", "f", "h1-remoto", viejo, "remoto"),
+            ("pdf-2", "d", "r", "f", "h2-remoto", "2026-03-01T00:00:00.000000Z", "remoto"),
+            ("pdf-3", "d", "r", "f", "h3-remoto", viejo, "remoto"),
+            ("pdf-4", "d", "r", "f", "h4", "sin fecha", "remoto"),
+            ("pdf-2", "d", "r", "f", "h2-fecha-rota", "ayer", "remoto"),
+        ],
+    )
+
+    hashes = dict(connection.execute("SELECT pdf_id, hash FROM pdf_log").fetchall())
+    assert (insertadas, actualizadas) == (1, 2)
+    assert hashes == {"pdf-1": "h1", "pdf-2": "h2-remoto", "pdf-3": "h3-remoto", "pdf-4": "h4"}
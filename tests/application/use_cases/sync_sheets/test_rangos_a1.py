@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from app.application.use_cases.sync_sheets.rangos_a1 import RangoA1, fusionar_entradas, parsear_rango, trocear_por_bytes
+
+
+def test_parsear_rango_acepta_hoja_con_comillas_y_celda_unica() -> None:
+    assert parsear_rango("'O''Brien'!AA10:AB11") == RangoA1("O'Brien", 10, 27, 11, 28)
+    assert parsear_rango("'solicitudes'!B3") == RangoA1("solicitudes", 3, 2, 3, 2)
+    assert parsear_rango("A2:B2") is None
+
+
+def test_fusionar_entradas_disjuntas_ordena_y_une_filas_contiguas() -> None:
+    entradas = [
+        {"range": "'s'!A4:B4", "values": [["c", "4"]]},
+        {"range": "'s'!A2:B2", "values": [["a", "2"]]},
+        {"range": "'s'!C3", "values": [["x"]]},
+        {"range": "'s'!A3:B3", "values": [["b", "3"]]},
+        {"range": "'s'!A6:B6", "values": [["e", "6"]]},
+    ]
+
+    assert fusionar_entradas(entradas) == [
+        {"range": "'s'!A2:B4", "values": [["a", "2"], ["b", "3"], ["c", "4"]]},
+        {"range": "'s'!A6:B6", "values": [["e", "6"]]},
+        {"range": "'s'!C3", "values": [["x"]]},
+    ]
+
+
+def test_fusionar_entradas_solapadas_conserva_el_orden() -> None:
+    entradas = [
+        {"range": "'s'!A3:B3", "values": [["nuevo", "1"]]},
+        {"range": "'s'!A2:B2", "values": [["a", "2"]]},
+        {"range": "'s'!A3:B3", "values": [["final", "3"]]},
+    ]
+
+    assert fusionar_entradas(entradas) == [
+        {"range": "'s'!A3:B3", "values": [["nuevo", "1"]]},
+        {"range": "'s'!A2:B3", "values": [["a", "2"], ["final", "3"]]},
+    ]
+
+
+def test_trocear_por_bytes_parte_un_bloque_grande_por_filas() -> None:
+    entrada = {"range": "'s'!A2:A101", "values": [[f"valor-{fila:03d}"] for fila in range(100)]}
+
+    trozos = trocear_por_bytes([entrada], 400)
+
+    piezas = [pieza for trozo in trozos for pieza in trozo]
+    assert len(trozos) > 1
+    assert piezas[0]["range"].startswith("'s'!A2:A")
+    assert piezas[-1]["range"].endswith(":A101")
+    assert [valor for pieza in piezas for valor in pieza["values"]] == entrada["values"]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import threading
 from unittest.mock import Mock
 
 import pytest
 
+from app.application.use_cases.sync_sheets.rangos_a1 import bytes_entrada
 from app.application.use_cases.sync_sheets.servicio_escritura_lotes import ServicioEscrituraLotes
+from app.infrastructure.sheets_client import SheetsClient
 
 
 class _FakeWorksheet:
@@ -47,7 +50,7 @@ def test_flush_escribe_lotes_esperados() -> None:
             "valueInputOption": "USER_ENTERED",
             "data": [
                 {"range": "'solicitudes'!A2:B2", "values": [["uuid-1", "A"]]},
-                {"range": "A2:B2", "values": [["uuid-1", "B"]]},
+                {"range": "'solicitudes'!A2:B2", "values": [["uuid-1", "B"]]},
                 {"range": "'solicitudes'!B3", "values": [["ok"]]},
             ],
         }
@@ -108,3 +111,70 @@ def test_flush_redimensiona_hoja_si_el_append_supera_el_grid() -> None:
 
     worksheet.resize.assert_called_once_with(rows=5)
     assert worksheet.row_count == 5
+
+
+def test_flush_fusiona_backfills_contiguos_en_un_solo_rango() -> None:
+    servicio = ServicioEscrituraLotes()
+    cliente = _FakeCliente()
+    worksheet = _FakeWorksheet("solicitudes")
+    for fila in range(2, 3002):
+        servicio.encolar_backfill(worksheet, fila, 1, f"uuid-{fila}")
+
+    resultado = servicio.flush(
+        spreadsheet=_FakeSpreadsheet(),
+        worksheet=worksheet,
+        cliente=cliente,
+        lector_valores=cliente.read_all_values,
+    )
+
+    data = cliente.values_batch_update.call_args.args[0]["data"]
+    assert [entrada["range"] for entrada in data] == ["'solicitudes'!A2:A3001"]
+    assert data[0]["values"][0] == ["uuid-2"] and data[0]["values"][-1] == ["uuid-3001"]
+    assert (resultado.peticiones, resultado.rangos) == (1, 1)
+
+
+def test_flush_trocea_peticiones_grandes_y_las_envia_en_paralelo() -> None:
+    servicio = ServicioEscrituraLotes(max_bytes_por_peticion=2_000)
+    cliente = _FakeCliente()
+    hilos: list[str] = []
+    cliente.values_batch_update.side_effect = lambda _body: hilos.append(threading.current_thread().name)
+    worksheet = _FakeWorksheet("solicitudes")
+    cabeceras = ["uuid", "estado", "notas"]
+    for fila in range(2, 202, 2):
+        servicio.encolar_actualizacion(worksheet, fila, cabeceras, {"uuid": f"u-{fila}", "estado": "A", "notas": "x" * 20})
+
+    resultado = servicio.flush(
+        spreadsheet=_FakeSpreadsheet(),
+        worksheet=worksheet,
+        cliente=cliente,
+        lector_valores=cliente.read_all_values,
+    )
+
+    cuerpos = [llamada.args[0] for llamada in cliente.values_batch_update.call_args_list]
+    assert len(cuerpos) == resultado.peticiones > 1
+    assert sum(len(cuerpo["data"]) for cuerpo in cuerpos) == resultado.rangos == 100
+    assert all(sum(bytes_entrada(entrada) for entrada in cuerpo["data"]) <= 2_000 for cuerpo in cuerpos)
+    assert resultado.bytes_payload == sum(bytes_entrada(entrada) for cuerpo in cuerpos for entrada in cuerpo["data"])
+    assert threading.main_thread().name not in hilos
+
+
+def test_flush_en_paralelo_no_pierde_contadores_del_sheets_client() -> None:
+    cliente = SheetsClient(write_quota_per_minute=100_000, burst=100_000)
+    cliente._spreadsheet = _FakeSpreadsheet()
+    servicio = ServicioEscrituraLotes(max_bytes_por_peticion=500)
+    worksheet = _FakeWorksheet("solicitudes")
+    cabeceras = ["uuid", "estado", "notas"]
+    for fila in range(2, 802, 2):
+        servicio.encolar_actualizacion(worksheet, fila, cabeceras, {"uuid": f"u-{fila}", "estado": "A", "notas": "x" * 20})
+
+    resultado = servicio.flush(
+        spreadsheet=cliente._spreadsheet,
+        worksheet=worksheet,
+        cliente=cliente,
+        lector_valores=lambda _nombre: [cabeceras],
+    )
+
+    assert resultado.peticiones > servicio._max_peticiones_concurrentes
+    assert cliente._spreadsheet.values_batch_update.call_count == resultado.peticiones
+    assert cliente.get_write_calls_count() == resultado.peticiones
+    assert cliente.get_sheets_api_calls_count() == resultado.peticiones
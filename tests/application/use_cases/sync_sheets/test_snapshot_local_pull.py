@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from app.application.use_cases import sync_sheets_core
+from app.application.use_cases.sync_sheets import persistence_ops
+from app.application.use_cases.sync_sheets.snapshot_local_pull import SnapshotLocalPull
+
+
+def _insert_persona(connection, *, uuid: str | None, nombre: str) -> int:
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        INSERT INTO personas (uuid, nombre, genero, horas_mes_min, horas_ano_min, is_active, updated_at, source_device, deleted)
+        VALUES (?, ?, 'F', 600, 7200, 1, '2026-01-01T00:00:00+00:00', 'device-test', 0)
+        """,
+        (uuid, nombre),
+    )
+    return int(cursor.lastrowid)
+
+
+def _payload_insercion(uuid: str, persona_id: int, fecha: str, desde: int, hasta: int, deleted: int = 0) -> tuple:
+    return (
+        uuid, persona_id, fecha, fecha, desde, hasta, 0,
+        hasta - desde, None, "nota", None, None, 1, fecha, "2026-02-01T00:00:00Z", "dev", deleted,
+    )
+
+
+def _remota(delegada_uuid: str, fecha: str, desde_h: int, hasta_h: int) -> dict[str, object]:
+    return {
+        "delegada_uuid": delegada_uuid, "fecha": fecha, "completo": 0,
+        "desde_h": desde_h, "desde_m": 0, "hasta_h": hasta_h, "hasta_m": 0, "minutos_total": (hasta_h - desde_h) * 60,
+    }
+
+
+def test_snapshot_responde_igual_que_las_consultas_sql(connection) -> None:
+    persona_id = _insert_persona(connection, uuid="del-1", nombre="Ana  María")
+    _insert_persona(connection, uuid=None, nombre="Sin uuid")
+    persistence_ops.execute_insert_solicitud(connection, _payload_insercion("sol-1", persona_id, "2026-03-02", 540, 600))
+    persistence_ops.execute_insert_solicitud(connection, _payload_insercion("sol-borrada", persona_id, "2026-03-03", 540, 600, deleted=1))
+    snapshot = SnapshotLocalPull.cargar(connection)
+
+    for remota in (_remota("del-1", "2026-03-02", 9, 10), _remota("del-1", "2026-03-03", 9, 10), _remota("del-1", "2026-03-02", 9, 11)):
+        esperado = persistence_ops.find_solicitud_by_composite_key(connection, remota, persona_id)
+        obtenido = snapshot.solicitud_por_clave_compuesta(persistence_ops.solicitud_composite_key(remota, persona_id))
+        assert (obtenido or {}).get("uuid") == (esperado["uuid"] if esperado else None)
+        clave = sync_sheets_core.solicitud_dedupe_key_from_remote_row(remota)
+        assert snapshot.existe_duplicado(clave) == persistence_ops.is_duplicate_local_solicitud(connection, clave)
+        assert snapshot.existe_duplicado(clave, "sol-1") == persistence_ops.is_duplicate_local_solicitud(connection, clave, "sol-1")
+    assert snapshot.persona_id("del-1") == persona_id
+    assert snapshot.resolver_delegada_uuid("desconocido", "ana maría") == "del-1"
+    assert snapshot.resolver_delegada_uuid(None, "Sin uuid") is None
+
+
+def test_snapshot_refleja_las_escrituras_del_pull(connection) -> None:
+    persona_id = _insert_persona(connection, uuid="del-1", nombre="Ana")
+    persistence_ops.execute_insert_solicitud(connection, _payload_insercion("sol-1", persona_id, "2026-03-02", 540, 600))
+    snapshot = SnapshotLocalPull.cargar(connection)
+    existente = snapshot.solicitud_por_uuid("sol-1")
+    assert existente is not None
+
+    snapshot.registrar_insercion_solicitud(_payload_insercion("sol-2", persona_id, "2026-03-05", 600, 660))
+    snapshot.registrar_actualizacion_solicitud(
+        (persona_id, "2026-03-04", 540, 600, 0, 60, "nota", None, "2026-03-02", "2026-02-02T00:00:00Z", "dev", 0, existente["id"])
+    )
+
+    nueva = snapshot.solicitud_por_uuid("sol-2")
+    assert nueva is not None and nueva["id"] is None
+    assert snapshot.solicitud_por_clave_compuesta((persona_id, "2026-03-05", 0, 600, 660)) is nueva
+    assert snapshot.solicitud_por_clave_compuesta((persona_id, "2026-03-02", 0, 540, 600)) is None
+    assert snapshot.solicitud_por_clave_compuesta((persona_id, "2026-03-04", 0, 540, 600)) is existente
+    clave_movida = sync_sheets_core.solicitud_dedupe_key_from_remote_row(_remota("del-1", "2026-03-04", 9, 10))
+    assert snapshot.existe_duplicado(clave_movida) and not snapshot.existe_duplicado(clave_movida, "sol-1")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from app.application.use_cases.sync_sheets.snapshot_remoto_plan import construir_snapshot_remoto, huella_columnas
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rows_with_index
+
+
+def _snapshot(worksheet_name: str, values: list[list[str]]):
+    headers, rows = rows_with_index(values, worksheet_name=worksheet_name)
+    return construir_snapshot_remoto(worksheet_name, headers, rows)
+
+
+def test_construir_snapshot_remoto_sin_columnas_de_huella_no_es_verificable() -> None:
+    snapshot = _snapshot("solicitudes", [["fecha", "notas"], ["2026-01-01", ""]])
+
+    assert snapshot.fingerprint is None
+    assert snapshot.fingerprint_ranges == ()
+
+
+def test_huella_columnas_ignora_filas_vacias_finales_recortadas_por_la_api() -> None:
+    snapshot = _snapshot(
+        "hoja 'x'",
+        [["notas", "uuid", "updated_at"], ["a", "u-1", "2026-01-01"], ["b", "", ""]],
+    )
+
+    assert snapshot.fingerprint_ranges == ("'hoja ''x'''!B:B", "'hoja ''x'''!C:C")
+    assert huella_columnas([["uuid", "u-1"], ["updated_at", "2026-01-01"]]) == snapshot.fingerprint
+    assert huella_columnas([["uuid", "u-1"], ["updated_at", "2026-01-02"]]) != snapshot.fingerprint
+
+
+def test_huella_de_filas_planificadas_coincide_con_la_lectura_por_columnas() -> None:
+    # rows_with_index omite la fila en blanco; la lectura por columnas la devuelve vacía.
+    snapshot = _snapshot(
+        "solicitudes",
+        [["uuid", "notas", "updated_at"], ["u-1", "a", "2026-01-01"], ["", "", ""], ["u-2", "b", "2026-01-02"]],
+    )
+
+    assert snapshot.fingerprint == huella_columnas(
+        [["uuid", "u-1", "", "u-2"], ["updated_at", "2026-01-01", "", "2026-01-02"]]
+    )
+    assert snapshot.fingerprint != huella_columnas([["uuid", "u-1", "u-2"], ["updated_at", "2026-01-01", "2026-01-02"]])
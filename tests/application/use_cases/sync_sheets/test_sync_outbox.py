@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sqlite3
+from types import SimpleNamespace
+
+from app.application.use_cases.sync_sheets import SheetsSyncService, sync_outbox
+from app.application.use_cases.sync_sheets.ayudantes_push import push_config
+from app.domain.models import SheetsConfig
+
+
+class _StubService:
+    def __init__(self, connection) -> None:
+        self._connection = connection
+        self._enable_backfill = False
+        self.remote_rows: list[tuple[int, dict[str, object]]] = []
+        self.appended: list[dict[str, object]] = []
+
+    def _get_worksheet(self, spreadsheet, worksheet_name: str):
+        return SimpleNamespace(title=worksheet_name)
+
+    def _rows_with_index(self, _worksheet):
+        return ["key", "value", "updated_at", "source_device"], self.remote_rows
+
+    def _header_map(self, headers, _expected):
+        return headers
+
+    def _append_row(self, _worksheet, _header_map, payload):
+        self.appended.append(payload)
+
+    def _update_row(self, *_args):
+        raise AssertionError("sin backfill no debe actualizar filas")
+
+    def _flush_write_batches(self, _spreadsheet, _worksheet):
+        return None
+
+    def _device_id(self) -> str:
+        return "device-local"
+
+
+def _outbox(connection) -> list[tuple[str, str]]:
+    rows = connection.execute("SELECT entidad, clave FROM sync_outbox ORDER BY seq").fetchall()
+    return [(row["entidad"], row["clave"]) for row in rows]
+
+
+def _insert_config(connection, key: str, value: str, updated_at: str = "2026-01-01T10:00:00Z") -> None:
+    connection.execute(
+        """
+        INSERT INTO sync_config (key, value, updated_at, source_device) VALUES (?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+        """,
+        (key, value, updated_at, "device-local"),
+    )
+
+
+def test_triggers_encolan_altas_y_cambios_una_sola_vez(connection, persona_id) -> None:
+    _insert_config(connection, "k1", "v1")
+    _insert_config(connection, "k1", "v2")
+    connection.execute(
+        """
+        INSERT INTO pdf_log (pdf_id, delegada_uuid, rango_fechas, fecha_generacion, hash, updated_at, source_device)
+        VALUES ('pdf-1', 'd-1', '2026-01', '2026-01-01', 'h', '2026-01-01T10:00:00Z', 'dev')
+        """
+    )
+    connection.execute("UPDATE personas SET nombre = 'Otra' WHERE id = ?", (persona_id,))
+
+    entradas = _outbox(connection)
+
+    assert entradas.count(("sync_config", "k1")) == 1
+    assert ("pdf_log", "pdf-1") in entradas
+    assert entradas[-1] == ("personas", str(persona_id))
+
+
+def test_triggers_ignoran_filas_sin_updated_at(connection) -> None:
+    connection.execute("INSERT INTO sync_config (key, value, updated_at) VALUES ('solo_local', 'x', NULL)")
+
+    assert ("sync_config", "solo_local") not in _outbox(connection)
+
+
+def test_push_config_solo_lee_filas_encoladas_y_limpia_el_outbox(connection) -> None:
+    _insert_config(connection, "k1", "v1")
+    _insert_config(connection, "k2", "v2")
+    connection.execute("DELETE FROM sync_outbox WHERE entidad = 'sync_config' AND clave = 'k1'")
+    service = _StubService(connection)
+
+    uploaded = push_config(service, spreadsheet=object(), last_sync_at="2025-01-01T00:00:00Z")
+
+    assert uploaded == 1
+    assert [payload["key"] for payload in service.appended] == ["k2"]
+    assert _outbox(connection) == []
+
+
+def test_push_config_sin_last_sync_recorre_todo_y_limpia(connection) -> None:
+    _insert_config(connection, "k1", "v1")
+    connection.execute("DELETE FROM sync_outbox")
+    _insert_config(connection, "k2", "v2")
+    service = _StubService(connection)
+
+    uploaded = push_config(service, spreadsheet=object(), last_sync_at=None)
+
+    assert uploaded == 2
+    assert _outbox(connection) == []
+
+
+def test_cambio_durante_el_push_sobrevive_a_la_limpieza(connection) -> None:
+    _insert_config(connection, "k1", "v1")
+    lote = sync_outbox.abrir_lote(connection, "sync_config", last_sync_at="2025-01-01T00:00:00Z")
+    _insert_config(connection, "k1", "v2", updated_at="2026-01-02T10:00:00Z")
+
+    sync_outbox.confirmar_lote(connection, lote)
+
+    assert _outbox(connection) == [("sync_config", "k1")]
+
+
+def test_abrir_lote_sin_tabla_recorre_la_tabla_completa() -> None:
+    connection = sqlite3.connect(":memory:")
+
+    lote = sync_outbox.abrir_lote(connection, "solicitudes", last_sync_at="2025-01-01T00:00:00Z")
+
+    assert lote.filtra is False
+    assert sync_outbox.filtro_sql(lote, "id") == ("", ())
+    assert sync_outbox.hay_pendientes(connection) is None
+    sync_outbox.confirmar_lote(connection, lote)
+
+
+def test_preflight_consulta_el_outbox_para_detectar_cambios(connection) -> None:
+    connection.execute("UPDATE sync_state SET last_sync_at = '2026-01-01T00:00:00Z' WHERE id = 1")
+    connection.execute("DELETE FROM sync_outbox")
+    service = SheetsSyncService(
+        connection=connection,
+        config_store=SimpleNamespace(load=lambda: SheetsConfig("sheet", "/tmp/creds.json", "device")),
+        client=SimpleNamespace(),
+        repository=SimpleNamespace(),
+    )
+
+    assert service._hay_cambios_pendientes_para_push() is False
+
+    _insert_config(connection, "k1", "v1", updated_at="2025-12-01T00:00:00Z")
+
+    assert service._hay_cambios_pendientes_para_push() is True
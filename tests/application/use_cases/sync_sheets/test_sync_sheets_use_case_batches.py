@@ -103,7 +103,7 @@ def test_flush_write_batches_executes_small_batches_once(connection) -> None:
     )
 
 
-def test_push_solicitudes_with_no_rows_updates_header_only(connection) -> None:
+def test_push_solicitudes_with_no_rows_and_canonical_header_writes_nothing(connection) -> None:
     client = _FakeClient()
     spreadsheet = _FakeSpreadsheet()
     service = _build_service(connection, client=client)
@@ -111,7 +111,48 @@ def test_push_solicitudes_with_no_rows_updates_header_only(connection) -> None:
     uploaded, conflicts, duplicates = service._push_solicitudes(spreadsheet, last_sync_at=None)
 
     assert (uploaded, conflicts, duplicates) == (0, 0, 0)
-    client.worksheets["solicitudes"].update.assert_called_once_with("A1", [HEADER_CANONICO_SOLICITUDES])
+    client.worksheets["solicitudes"].update.assert_not_called()
+    client.values_batch_update.assert_not_called()
+
+
+def test_push_solicitudes_delta_only_writes_changed_and_new_rows(connection, persona_id) -> None:
+    client = _FakeClient()
+    spreadsheet = _FakeSpreadsheet()
+    service = _build_service(connection, client=client)
+    cursor = connection.cursor()
+    cursor.execute("UPDATE personas SET uuid = 'del-1', nombre = 'Ana' WHERE id = ?", (persona_id,))
+    for uuid_value, notas in (("sol-igual", "misma"), ("sol-cambiada", "nueva nota"), ("sol-nueva", "alta")):
+        cursor.execute(
+            """
+            INSERT INTO solicitudes (uuid, persona_id, fecha_solicitud, fecha_pedida, desde_min, hasta_min, completo,
+                                     horas_solicitadas_min, notas, created_at, updated_at, source_device, deleted, generated)
+            VALUES (?, ?, '2025-01-15', '2025-01-15', 540, 600, 0, 60, ?, '2025-01-15', '2025-01-20T00:00:00Z', 'device-x', 0, 1)
+            """,
+            (uuid_value, persona_id, notas),
+        )
+    connection.commit()
+
+    def _fila(uuid_value: str, notas: str) -> list[object]:
+        return [uuid_value, "del-1", "Ana", "2025-01-15", "9", "0", "10", "0", "0", "60", notas, "", "2025-01-15", "2025-01-20T00:00:00Z", "device-x", "0", ""]
+
+    remote_values = [
+        HEADER_CANONICO_SOLICITUDES,
+        _fila("sol-remota", "solo en Sheets"),
+        _fila("sol-igual", "misma"),
+        _fila("sol-cambiada", "nota vieja"),
+    ]
+    client.read_all_values.side_effect = lambda name: remote_values if name == "solicitudes" else []
+
+    uploaded, conflicts, duplicates = service._push_solicitudes(spreadsheet, last_sync_at=None)
+
+    assert (uploaded, conflicts, duplicates) == (3, 0, 1)
+    client.worksheets["solicitudes"].update.assert_not_called()
+    client.values_batch_update.assert_called_once()
+    data = client.values_batch_update.call_args.args[0]["data"]
+    # La fila 4 actualizada y la 5 añadida se fusionan en un único rango contiguo.
+    assert [entrada["range"] for entrada in data] == ["'solicitudes'!A4:Q5"]
+    assert data[0]["values"][0][10] == "nueva nota"
+    assert data[0]["values"][1][0] == "sol-nueva"
 
 
 def test_push_delegadas_single_batch_permission_error_propagates(connection, persona_id) -> None:
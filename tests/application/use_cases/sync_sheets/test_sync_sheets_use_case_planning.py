@@ -113,3 +113,50 @@ def test_insert_solicitud_from_remote_uses_conflict_resolution_service_mock(conn
     )
 
     assert (written, omitted_delegada, errors) == (False, 1, 1)
+
+
+class _FakeClientConHuella(_FakeClient):
+    def __init__(self) -> None:
+        super().__init__()
+        fila = dict.fromkeys(HEADER_CANONICO_SOLICITUDES, "")
+        fila.update(uuid="remota-1", fecha="2026-02-01", updated_at="2026-02-01T10:00:00Z")
+        self.solicitudes = [list(HEADER_CANONICO_SOLICITUDES), [fila[columna] for columna in HEADER_CANONICO_SOLICITUDES]]
+        self.batch_get_ranges = Mock(side_effect=self._batch_get_ranges)
+
+    def _read_all_values(self, worksheet_name: str) -> list[list[Any]]:
+        if worksheet_name == "solicitudes":
+            return [list(fila) for fila in self.solicitudes]
+        return super()._read_all_values(worksheet_name)
+
+    def _batch_get_ranges(self, ranges: list[str]) -> dict[str, list[list[str]]]:
+        indices = {"N": HEADER_CANONICO_SOLICITUDES.index("updated_at"), "A": 0}
+        return {rango: [[fila[indices[rango.rsplit(":", 1)[1]]]] for fila in self.solicitudes] for rango in ranges}
+
+
+def test_execute_sync_plan_reutiliza_snapshot_si_la_huella_no_cambia(connection) -> None:
+    client = _FakeClientConHuella()
+    service = _build_service(connection, client=client)
+    plan = service.simulate_sync_plan()
+    lecturas = client.read_all_values.call_count
+
+    service.execute_sync_plan(plan)
+
+    assert plan.remote_snapshot is not None
+    assert plan.remote_snapshot.fingerprint_ranges == ("'solicitudes'!A:A", "'solicitudes'!N:N")
+    client.batch_get_ranges.assert_called_once_with(["'solicitudes'!A:A", "'solicitudes'!N:N"])
+    assert client.read_all_values.call_count == lecturas
+    client.worksheets["solicitudes"].update.assert_called_once_with("A1", [list(row) for row in plan.values_matrix])
+
+
+def test_execute_sync_plan_recalcula_el_plan_si_la_hoja_cambio(connection) -> None:
+    client = _FakeClientConHuella()
+    service = _build_service(connection, client=client)
+    plan = service.simulate_sync_plan()
+    client.solicitudes[1][HEADER_CANONICO_SOLICITUDES.index("updated_at")] = "2026-02-02T08:00:00Z"
+    lecturas = client.read_all_values.call_count
+
+    service.execute_sync_plan(plan)
+
+    assert client.read_all_values.call_count > lecturas
+    escrito = client.worksheets["solicitudes"].update.call_args.args[1]
+    assert "2026-02-02T08:00:00Z" in escrito[1]
@@ -89,3 +89,20 @@ def test_cargar_demo_error_controlado_en_ruta_no_escribible(tmp_path: Path) -> N
 
     assert resultado.ok is False
     assert resultado.detalles is not None
+
+
+def test_cargador_demo_conserva_solicitudes_generadas_del_dataset(tmp_path: Path) -> None:
+    db_path = tmp_path / "demo.sqlite"
+    dataset = ProveedorDatasetDemo().cargar()
+    esperadas = sum(1 for solicitud in dataset["solicitudes"] if solicitud.get("generated", False))
+
+    assert CargadorDatosDemoSQLite(ProveedorDatasetDemo(), db_path).cargar("SEPARADO").ok is True
+
+    conn = get_connection(db_path)
+    try:
+        generadas = conn.execute("SELECT COUNT(*) FROM solicitudes WHERE generated = 1").fetchone()[0]
+        sin_uuid = conn.execute("SELECT COUNT(*) FROM solicitudes WHERE uuid IS NULL").fetchone()[0]
+    finally:
+        conn.close()
+    assert generadas == esperadas
+    assert sin_uuid == 0
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from app.configuracion.settings import STARTUP_TIMEOUT_MS_POR_DEFECTO, resolver_startup_timeout_ms
+from app.configuracion.settings import (
+    STARTUP_TIMEOUT_MS_POR_DEFECTO,
+    resolver_perfil_sqlite,
+    resolver_perfil_sqlite_lectura,
+    resolver_startup_timeout_ms,
+)
 
 
 def test_resolver_startup_timeout_ms_con_env_nuevo(monkeypatch) -> None:
@@ -12,3 +17,15 @@ def test_resolver_startup_timeout_ms_fallback_default(monkeypatch) -> None:
     monkeypatch.delenv("HORAS_SINDICALES_STARTUP_TIMEOUT_MS", raising=False)
     monkeypatch.setenv("HORAS_STARTUP_TIMEOUT_MS", "invalido")
     assert resolver_startup_timeout_ms() == STARTUP_TIMEOUT_MS_POR_DEFECTO
+
+
+def test_resolver_perfil_sqlite_valida_contra_perfiles_de_escritura(monkeypatch) -> None:
+    monkeypatch.setenv("HORAS_SINDICALES_SQLITE_PERFIL", "Bulk-Import")
+    assert resolver_perfil_sqlite() == "bulk-import"
+    monkeypatch.setenv("HORAS_SINDICALES_SQLITE_PERFIL", "read-only")
+    assert resolver_perfil_sqlite() == "interactive"
+
+
+def test_resolver_perfil_sqlite_lectura_por_defecto(monkeypatch) -> None:
+    monkeypatch.delenv("HORAS_SINDICALES_SQLITE_PERFIL_LECTURA", raising=False)
+    assert resolver_perfil_sqlite_lectura() == "read-only"
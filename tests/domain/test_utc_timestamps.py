@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.utc_timestamps import canonical_utc_or_raw, to_canonical_utc, utc_now_canonical
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-01-10T10:00:00Z", "2024-01-10T10:00:00.000000Z"),
+        ("2024-01-10T10:00:00.123456+00:00", "2024-01-10T10:00:00.123456Z"),
+        ("2024-01-10T12:00:00+02:00", "2024-01-10T10:00:00.000000Z"),
+        ("2024-01-10 10:00", "2024-01-10T10:00:00.000000Z"),
+        ("2024-01-10", "2024-01-10T00:00:00.000000Z"),
+        (datetime(2024, 1, 10, 10, 0, tzinfo=timezone(timedelta(hours=-1))), "2024-01-10T11:00:00.000000Z"),
+        ("2024-01-10T10:00:00.000001Z", "2024-01-10T10:00:00.000001Z"),
+        ("invalid", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_to_canonical_utc(value, expected) -> None:
+    assert to_canonical_utc(value) == expected
+
+
+def test_orden_de_cadenas_canonicas_es_cronologico() -> None:
+    # Con el formato anterior "…10:00:00Z" > "…10:00:00.5Z" aunque sea anterior.
+    anterior = to_canonical_utc("2024-01-10T10:00:00Z")
+    posterior = to_canonical_utc("2024-01-10T10:00:00.500000Z")
+    assert anterior < posterior
+    assert utc_now_canonical() > posterior
+
+
+def test_canonical_utc_or_raw_conserva_valores_no_reconocidos() -> None:
+    assert canonical_utc_or_raw("ayer") == "ayer"
+    assert canonical_utc_or_raw("2024-01-10T10:00:00Z") == "2024-01-10T10:00:00.000000Z"
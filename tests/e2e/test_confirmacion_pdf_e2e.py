@@ -40,6 +40,9 @@ class FakeSolicitudRepo:
     def update_pdf_info(self, solicitud_id: int, pdf_path: str, pdf_hash: str | None) -> None:
         self.updated.append((solicitud_id, pdf_path, pdf_hash))
 
+    def update_pdf_info_many(self, updates: list[tuple[int, str, str | None]]) -> None:
+        self.updated.extend(updates)
+
 
 def _persona() -> Persona:
     return Persona(
@@ -25,6 +25,7 @@ def make_service(e2e_connection: sqlite3.Connection):
         *,
         initial_values: dict[str, list[list[object]]] | None = None,
         rate_limit_failures: dict[str, int] | None = None,
+        pull_chunk_rows: int | None = None,
     ) -> tuple[SheetsSyncService, FakeSheetsGateway]:
         fake_gateway = FakeSheetsGateway(
             initial_values=initial_values,
@@ -42,6 +43,7 @@ def make_service(e2e_connection: sqlite3.Connection):
             config_store=config_store,
             client=fake_gateway,
             repository=FakeSheetsRepository(),
+            pull_chunk_rows=pull_chunk_rows,
         )
         return service, fake_gateway
 
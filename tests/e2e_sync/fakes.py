@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from app.application.sheets_service import SHEETS_SCHEMA
 from app.domain.models import SheetsConfig
@@ -78,6 +78,9 @@ class FakeSheetsGateway:
             raise SheetsRateLimitError(f"Rate limit simulado en {worksheet_name}")
         return self._values.get(worksheet_name, [[]])
 
+    def iter_values(self, worksheet_name: str) -> Iterator[list[Any]]:
+        yield from self.read_all_values(worksheet_name)
+
     def get_worksheet(self, name: str) -> FakeWorksheet:
         return self._worksheets[name]
 
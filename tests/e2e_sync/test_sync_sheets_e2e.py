@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import sqlite3
 
+import pytest
+
 from app.application.sheets_service import SHEETS_SCHEMA
+from app.application.sync import CancellationToken, SyncCancelledError
+from app.application.use_cases.sync_sheets import orquestador_pull
 
 
 BASE_TS = "2025-01-01T10:00:00+00:00"
@@ -207,3 +211,231 @@ def test_sync_no_corrompe_db_si_falla_parcialmente(make_service, e2e_connection:
     inserted = e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"]
     assert inserted == 0
     _assert_business_invariants(e2e_connection)
+
+
+def test_pull_resuelve_busquedas_con_snapshot_local_sin_select_por_fila(
+    make_service, e2e_connection: sqlite3.Connection
+) -> None:
+    filas = [
+        ["sol-%02d" % dia, "del-1", "Ana", "2025-02-%02d" % dia, 9, 0, 11, 0, 0, 120, "", "pendiente", BASE_TS, BASE_TS, "remote-device", 0, ""]
+        for dia in range(1, 29)
+    ]
+    repetida = list(filas[0])
+    mismo_contenido = list(filas[1])
+    mismo_contenido[0] = "sol-copia"
+    service, _ = make_service(
+        initial_values={
+            **_base_payload(),
+            "solicitudes": _worksheet_with_rows("solicitudes", [*filas, repetida, mismo_contenido]),
+        }
+    )
+    sentencias: list[str] = []
+    e2e_connection.set_trace_callback(sentencias.append)
+
+    summary = service.pull()
+
+    e2e_connection.set_trace_callback(None)
+    lecturas_solicitudes = [sql for sql in sentencias if sql.lstrip().upper().startswith("SELECT") and "FROM solicitudes" in sql]
+    assert len(lecturas_solicitudes) <= 2
+    assert summary.duplicates_skipped == 1
+    total = e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"]
+    assert total == 28
+    _assert_business_invariants(e2e_connection)
+
+
+def test_pull_omite_filas_sin_cambios_por_huella(
+    make_service, e2e_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    filas = [
+        ["sol-%02d" % dia, "del-1", "Ana", "2025-02-%02d" % dia, 9, 0, 11, 0, 0, 120, "", "pendiente", BASE_TS, BASE_TS, "remote-device", 0, ""]
+        for dia in range(1, 11)
+    ]
+    valores_solicitudes = _worksheet_with_rows("solicitudes", filas)
+    service, _ = make_service(initial_values={**_base_payload(), "solicitudes": valores_solicitudes})
+    service.pull()
+    huellas = e2e_connection.execute("SELECT COUNT(*) AS total FROM sync_row_digest WHERE entity = 'solicitudes'").fetchone()["total"]
+    assert huellas == 10
+
+    valores_solicitudes[3][10] = "Nota remota"
+    valores_solicitudes[3][13] = NEWER_TS
+    normalizadas: list[str] = []
+    normalizar = orquestador_pull.normalizar_columnas_solicitud
+
+    def _normalizar_contando(columnas, total, worksheet_name):
+        normalizadas.extend(str(uuid) for uuid in columnas["uuid"])
+        return normalizar(columnas, total, worksheet_name)
+
+    monkeypatch.setattr(orquestador_pull, "normalizar_columnas_solicitud", _normalizar_contando)
+
+    service.pull()
+
+    assert normalizadas == ["sol-03"]
+    notas = e2e_connection.execute("SELECT notas FROM solicitudes WHERE uuid = 'sol-03'").fetchone()["notas"]
+    assert notas == "Nota remota"
+    _assert_business_invariants(e2e_connection)
+
+
+def test_pull_lee_por_paginas_y_aplica_por_bloques(
+    make_service, e2e_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    filas: list[list[object]] = [
+        ["sol-%02d" % dia, "del-1", "Ana", "2025-02-%02d" % dia, 9, 0, 11, 0, 0, 120, "", "pendiente", BASE_TS, BASE_TS, "remote-device", 0, ""]
+        for dia in range(1, 8)
+    ]
+    filas.insert(3, [""] * len(SHEETS_SCHEMA["solicitudes"]))
+    service, _ = make_service(
+        initial_values={**_base_payload(), "solicitudes": _worksheet_with_rows("solicitudes", filas)},
+        pull_chunk_rows=3,
+    )
+    bloques: list[list[str]] = []
+    normalizar = orquestador_pull.normalizar_columnas_solicitud
+
+    def _normalizar_contando(columnas, total, worksheet_name):
+        bloques.append([str(uuid) for uuid in columnas["uuid"]])
+        return normalizar(columnas, total, worksheet_name)
+
+    monkeypatch.setattr(orquestador_pull, "normalizar_columnas_solicitud", _normalizar_contando)
+
+    service.pull()
+
+    assert bloques == [["sol-01", "sol-02", "sol-03"], ["sol-04", "sol-05", "sol-06"], ["sol-07"]]
+    total = e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"]
+    assert total == 7
+    # Cabecera + 7 filas + 1 vacía: el siguiente append va a la fila 10.
+    assert service._servicio_escritura_lotes.siguiente_fila_append["solicitudes"] == 10
+    _assert_business_invariants(e2e_connection)
+
+
+def _filas_solicitudes(total: int) -> list[list[object]]:
+    return [
+        ["sol-%02d" % dia, "del-1", "Ana", "2025-02-%02d" % dia, 9, 0, 11, 0, 0, 120, "", "pendiente", BASE_TS, BASE_TS, "remote-device", 0, ""]
+        for dia in range(1, total + 1)
+    ]
+
+
+def _interrumpir_en_bloque(monkeypatch: pytest.MonkeyPatch, numero: int, bloques: list[list[str]]) -> None:
+    normalizar = orquestador_pull.normalizar_columnas_solicitud
+    cortes = [numero]
+
+    def _normalizar_contando(columnas, total, worksheet_name):
+        bloques.append([str(uuid) for uuid in columnas["uuid"]])
+        if cortes and len(bloques) == cortes[0]:
+            cortes.clear()
+            raise ConnectionError("Conexión cortada a mitad del pull")
+        return normalizar(columnas, total, worksheet_name)
+
+    monkeypatch.setattr(orquestador_pull, "normalizar_columnas_solicitud", _normalizar_contando)
+
+
+def _checkpoint(connection: sqlite3.Connection) -> tuple[object, object]:
+    row = connection.execute("SELECT pull_checkpoint_worksheet, pull_checkpoint_row FROM sync_state WHERE id = 1").fetchone()
+    return row["pull_checkpoint_worksheet"], row["pull_checkpoint_row"]
+
+
+def test_pull_interrumpido_se_reanuda_desde_el_checkpoint(
+    make_service, e2e_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = {**_base_payload(), "solicitudes": _worksheet_with_rows("solicitudes", _filas_solicitudes(7))}
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    bloques: list[list[str]] = []
+    _interrumpir_en_bloque(monkeypatch, 2, bloques)
+
+    with pytest.raises(ConnectionError):
+        service.pull()
+
+    # El primer bloque quedó confirmado junto con su checkpoint (filas 2 a 4 de la hoja).
+    assert e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"] == 3
+    assert _checkpoint(e2e_connection) == ("solicitudes", 4)
+
+    bloques.clear()
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    service.pull()
+
+    assert bloques == [["sol-04", "sol-05", "sol-06"], ["sol-07"]]
+    assert e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"] == 7
+    assert _checkpoint(e2e_connection) == (None, None)
+    _assert_business_invariants(e2e_connection)
+
+
+def test_pull_descarta_el_checkpoint_si_la_hoja_cambio(
+    make_service, e2e_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    filas = _filas_solicitudes(7)
+    payload = {**_base_payload(), "solicitudes": _worksheet_with_rows("solicitudes", filas)}
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    bloques: list[list[str]] = []
+    _interrumpir_en_bloque(monkeypatch, 2, bloques)
+    with pytest.raises(ConnectionError):
+        service.pull()
+
+    # Alguien edita una fila ya aplicada antes de reanudar: la huella del checkpoint no coincide.
+    filas[1][10] = "Nota remota"
+    filas[1][13] = NEWER_TS
+    bloques.clear()
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    service.pull()
+
+    assert bloques[0] == ["sol-02"]
+    notas = e2e_connection.execute("SELECT notas FROM solicitudes WHERE uuid = 'sol-02'").fetchone()["notas"]
+    assert notas == "Nota remota"
+    assert e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"] == 7
+    assert _checkpoint(e2e_connection) == (None, None)
+
+
+def test_pull_config_aplica_en_lote_y_solo_reaplica_lo_que_cambia(
+    make_service, e2e_connection: sqlite3.Connection
+) -> None:
+    config = _worksheet_with_rows(
+        "config",
+        [["pdf_text", "Texto remoto", NEWER_TS, "remote-device"], ["tema", "oscuro", NEWER_TS, "remote-device"]],
+    )
+    service, _ = make_service(initial_values={**_base_payload(), "config": config})
+
+    service.pull()
+
+    intro = e2e_connection.execute("SELECT pdf_intro_text FROM grupo_config WHERE id = 1").fetchone()[0]
+    assert intro == "Texto remoto"
+    assert e2e_connection.execute("SELECT COUNT(*) FROM sync_config WHERE key IN ('pdf_text', 'tema')").fetchone()[0] == 2
+
+    # Sin cambios remotos el upsert no toca la fila y el efecto no se vuelve a aplicar.
+    e2e_connection.execute("UPDATE grupo_config SET pdf_intro_text = 'Texto local' WHERE id = 1")
+    e2e_connection.commit()
+    service, _ = make_service(initial_values={**_base_payload(), "config": config})
+    service.pull()
+
+    intro = e2e_connection.execute("SELECT pdf_intro_text FROM grupo_config WHERE id = 1").fetchone()[0]
+    assert intro == "Texto local"
+
+
+def test_pull_cancelado_para_tras_el_bloque_confirmado_y_se_reanuda(
+    make_service, e2e_connection: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = {**_base_payload(), "solicitudes": _worksheet_with_rows("solicitudes", _filas_solicitudes(7))}
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    token = CancellationToken()
+    bloques: list[list[str]] = []
+    normalizar = orquestador_pull.normalizar_columnas_solicitud
+
+    def _normalizar_y_cancelar(columnas, total, worksheet_name):
+        bloques.append([str(uuid) for uuid in columnas["uuid"]])
+        # El usuario cancela mientras se aplica el primer bloque: ese bloque aún se confirma.
+        token.cancel()
+        return normalizar(columnas, total, worksheet_name)
+
+    monkeypatch.setattr(orquestador_pull, "normalizar_columnas_solicitud", _normalizar_y_cancelar)
+
+    with pytest.raises(SyncCancelledError):
+        service.pull(token)
+
+    assert bloques == [["sol-01", "sol-02", "sol-03"]]
+    assert e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"] == 3
+    assert _checkpoint(e2e_connection) == ("solicitudes", 4)
+
+    bloques.clear()
+    service, _ = make_service(initial_values=payload, pull_chunk_rows=3)
+    service.pull(CancellationToken())
+
+    assert bloques == [["sol-04", "sol-05", "sol-06"], ["sol-07"]]
+    assert e2e_connection.execute("SELECT COUNT(*) AS total FROM solicitudes").fetchone()["total"] == 7
+    assert _checkpoint(e2e_connection) == (None, None)
+    _assert_business_invariants(e2e_connection)
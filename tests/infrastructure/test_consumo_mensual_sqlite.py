@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+
+from app.domain.models import Solicitud
+from app.infrastructure.consumo_mensual_sqlite import reconstruir_consumo_mensual, verificar_consumo_mensual
+
+
+def _consumo(connection: sqlite3.Connection) -> dict[tuple[int, int, int], tuple[int, int]]:
+    return {
+        (row["persona_id"], row["year"], row["month"]): (row["minutos"], row["pendientes_min"])
+        for row in connection.execute("SELECT * FROM consumo_mensual").fetchall()
+    }
+
+
+def _solicitud(persona_id: int, fecha: str, minutos: int) -> Solicitud:
+    return Solicitud(
+        id=None,
+        persona_id=persona_id,
+        fecha_solicitud=fecha,
+        fecha_pedida=fecha,
+        desde_min=None,
+        hasta_min=None,
+        completo=True,
+        horas_solicitadas_min=minutos,
+        observaciones=None,
+        notas=None,
+    )
+
+
+def test_triggers_mantienen_consumo_en_alta_confirmacion_y_borrado(connection, solicitud_repo, persona_id) -> None:
+    primera = solicitud_repo.create(_solicitud(persona_id, "2025-03-10", 60))
+    segunda = solicitud_repo.create(_solicitud(persona_id, "2025-03-11", 30))
+    assert _consumo(connection) == {(persona_id, 2025, 3): (0, 90)}
+
+    solicitud_repo.mark_generated(int(primera.id or 0))
+    assert _consumo(connection) == {(persona_id, 2025, 3): (60, 30)}
+
+    solicitud_repo.delete(int(segunda.id or 0))
+    assert _consumo(connection) == {(persona_id, 2025, 3): (60, 0)}
+
+    connection.execute("UPDATE solicitudes SET fecha_pedida = '2025-04-01', horas_solicitadas_min = 45 WHERE id = ?", (primera.id,))
+    assert _consumo(connection) == {(persona_id, 2025, 4): (45, 0)}
+
+    connection.execute("DELETE FROM solicitudes WHERE id = ?", (primera.id,))
+    assert _consumo(connection) == {}
+    assert verificar_consumo_mensual(connection) == []
+
+
+def test_saldos_se_leen_de_la_tabla_resumen(solicitud_repo, persona_id) -> None:
+    creada = solicitud_repo.create(_solicitud(persona_id, "2025-05-02", 120))
+    solicitud_repo.create(_solicitud(persona_id, "2025-05-03", 15))
+    solicitud_repo.mark_generated(int(creada.id or 0))
+
+    consumos = list(solicitud_repo.list_consumo_mensual(2025, persona_id))
+
+    assert [(c.month, c.minutos, c.pendientes_min) for c in consumos] == [(5, 120, 15)]
+    assert list(solicitud_repo.list_consumo_mensual(2024, persona_id)) == []
+
+
+def test_verificar_detecta_desajuste_y_reconstruir_lo_corrige(connection, solicitud_repo, persona_id) -> None:
+    creada = solicitud_repo.create(_solicitud(persona_id, "2025-06-01", 60))
+    solicitud_repo.mark_generated(int(creada.id or 0))
+    connection.execute("UPDATE consumo_mensual SET minutos = 999")
+    connection.execute(
+        "INSERT INTO consumo_mensual (persona_id, year, month, minutos, pendientes_min) VALUES (?, 2020, 1, 5, 0)",
+        (persona_id,),
+    )
+    connection.commit()
+
+    diferencias = verificar_consumo_mensual(connection)
+    assert [(d.year, d.month, d.esperado, d.almacenado) for d in diferencias] == [
+        (2020, 1, (0, 0), (5, 0)),
+        (2025, 6, (60, 0), (999, 0)),
+    ]
+
+    assert reconstruir_consumo_mensual(connection) == 1
+    assert verificar_consumo_mensual(connection) == []
+    assert _consumo(connection) == {(persona_id, 2025, 6): (60, 0)}
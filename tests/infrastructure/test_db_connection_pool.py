@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from functools import partial
+
+import pytest
+
+from app.domain.models import Persona
+from app.infrastructure.db import SingleConnectionProvider, SQLiteConnectionPool, get_connection
+from app.infrastructure.migrations import run_migrations
+from app.infrastructure.repos_sqlite import RepositorioPersonasSQLite
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(partial(get_connection, tmp_path / "pool.db"), busy_timeout_ms=200)
+    with pool.writer() as connection:
+        run_migrations(connection)
+    yield pool
+    pool.close()
+
+
+def _en_hilo(funcion):
+    resultado: dict[str, object] = {}
+
+    def _run() -> None:
+        try:
+            resultado["valor"] = funcion()
+        except Exception as exc:  # pragma: no cover - se relanza abajo
+            resultado["error"] = exc
+
+    hilo = threading.Thread(target=_run)
+    hilo.start()
+    hilo.join(timeout=5)
+    if "error" in resultado:
+        raise resultado["error"]  # type: ignore[misc]
+    return resultado.get("valor")
+
+
+def _persona(nombre: str) -> Persona:
+    return Persona(
+        id=None,
+        nombre=nombre,
+        genero="F",
+        horas_mes_min=600,
+        horas_ano_min=7200,
+        is_active=True,
+        cuad_lun_man_min=0,
+        cuad_lun_tar_min=0,
+        cuad_mar_man_min=0,
+        cuad_mar_tar_min=0,
+        cuad_mie_man_min=0,
+        cuad_mie_tar_min=0,
+        cuad_jue_man_min=0,
+        cuad_jue_tar_min=0,
+        cuad_vie_man_min=0,
+        cuad_vie_tar_min=0,
+        cuad_sab_man_min=0,
+        cuad_sab_tar_min=0,
+        cuad_dom_man_min=0,
+        cuad_dom_tar_min=0,
+    )
+
+
+def test_pool_entrega_una_conexion_lectora_por_hilo(pool) -> None:
+    principal = pool.connection()
+    otra = _en_hilo(pool.connection)
+
+    assert pool.connection() is principal
+    assert otra is not principal
+    with pool.writer() as escritor:
+        assert escritor is not principal
+        assert pool.connection() is escritor
+
+
+def test_lectura_concurrente_no_espera_a_una_transaccion_abierta(pool) -> None:
+    repo = RepositorioPersonasSQLite(pool)
+    repo.create(_persona("Antes"))
+
+    with pool.writer() as escritor:
+        escritor.execute("BEGIN IMMEDIATE")
+        escritor.execute("UPDATE personas SET nombre = 'Durante' WHERE nombre = 'Antes'")
+
+        nombres = _en_hilo(lambda: [persona.nombre for persona in repo.list_all()])
+        propios = [persona.nombre for persona in repo.list_all()]
+        escritor.rollback()
+
+    assert nombres == ["Antes"]
+    assert propios == ["Durante"]
+
+
+def test_escrituras_de_otro_hilo_esperan_al_escritor_y_fallan_como_locked(pool) -> None:
+    repo = RepositorioPersonasSQLite(pool)
+
+    with pool.writer():
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            _en_hilo(lambda: repo.create(_persona("Bloqueada")))
+
+    creada = _en_hilo(lambda: repo.create(_persona("Libre")))
+    assert repo.get_by_id(creada.id) is not None
+
+
+def test_pool_cierra_lectores_de_hilos_terminados(pool) -> None:
+    _en_hilo(pool.connection)
+    _en_hilo(pool.connection)
+
+    pool.connection()
+
+    assert pool.reader_count() == 1
+
+
+def test_single_connection_provider_comparte_la_conexion(connection) -> None:
+    provider = SingleConnectionProvider(connection)
+
+    with provider.writer() as escritor:
+        assert escritor is connection
+    assert provider.connection() is connection
+
+
+def test_lectores_usan_el_perfil_de_solo_lectura(tmp_path) -> None:
+    path = tmp_path / "perfiles.db"
+    pool = SQLiteConnectionPool(
+        partial(get_connection, path),
+        reader_factory=partial(get_connection, path, perfil="read-only"),
+        busy_timeout_ms=200,
+    )
+    try:
+        with pool.writer() as escritor:
+            run_migrations(escritor)
+            assert int(escritor.execute("PRAGMA query_only").fetchone()[0]) == 0
+        lector = _en_hilo(pool.connection)
+        assert int(lector.execute("PRAGMA query_only").fetchone()[0]) == 1
+    finally:
+        pool.close()
@@ -201,3 +201,22 @@ def test_excluir_solicitud_id_omite_el_registro_actual(solicitud_repo, persona_i
     )
 
     assert conflicto is None
+
+
+def test_completo_contra_completo_es_duplicado_y_gana_la_pendiente_mas_reciente(solicitud_repo, persona_id: int) -> None:
+    _crear_solicitud(solicitud_repo, persona_id=persona_id, fecha="2026-07-21", desde_min=9 * 60, hasta_min=10 * 60, completo=False)
+    reciente = _crear_solicitud(solicitud_repo, persona_id=persona_id, fecha="2026-07-21", desde_min=None, hasta_min=None, completo=True)
+
+    conflicto = solicitud_repo.detectar_conflicto_pendiente(persona_id, "2026-07-21", None, None, True)
+
+    assert conflicto is not None
+    assert (conflicto.tipo, conflicto.id_existente, conflicto.completo) == ("DUPLICADO", reciente.id, True)
+
+
+def test_tramo_sin_limites_solo_conflicta_si_es_identico(solicitud_repo, persona_id: int) -> None:
+    existente = _crear_solicitud(solicitud_repo, persona_id=persona_id, fecha="2026-07-22", desde_min=None, hasta_min=None, completo=False)
+
+    assert solicitud_repo.detectar_conflicto_pendiente(persona_id, "2026-07-22", 9 * 60, 10 * 60, False) is None
+    conflicto = solicitud_repo.detectar_conflicto_pendiente(persona_id, "2026/07/22", None, None, False)
+    assert conflicto is not None
+    assert (conflicto.tipo, conflicto.id_existente) == ("DUPLICADO", existente.id)
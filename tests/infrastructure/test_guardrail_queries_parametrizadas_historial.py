@@ -1,10 +1,12 @@
 from pathlib import Path
 
 
-def test_list_historico_batch_usa_parametros_en_limit_offset() -> None:
+def test_list_historico_batch_usa_parametros_keyset_sin_offset() -> None:
     contenido = Path("app/infrastructure/repos_sqlite.py").read_text(encoding="utf-8")
     bloque_inicio = contenido.index("def list_historico_batch")
-    bloque = contenido[bloque_inicio: bloque_inicio + 900]
+    bloque = contenido[bloque_inicio: contenido.index("def list_pendientes_by_persona")]
 
-    assert "LIMIT ? OFFSET ?" in bloque
-    assert "(limit, offset)" in bloque
+    assert "LIMIT ?" in bloque
+    assert "(fecha_pedida, id) < (?, ?)" in bloque
+    assert "OFFSET" not in bloque
+    assert "(after[0], after[1], limit)" in bloque
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from app.infrastructure.repos_sqlite import SolicitudRepositorySQLite
+
+
+def _plan(connection: sqlite3.Connection, sql: str, params: tuple[object, ...] = ()) -> str:
+    filas = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " | ".join(row["detail"] for row in filas)
+
+
+def _capturar_selects(connection: sqlite3.Connection, operacion) -> list[str]:
+    sentencias: list[str] = []
+    connection.set_trace_callback(sentencias.append)
+    try:
+        operacion()
+    finally:
+        connection.set_trace_callback(None)
+    return [sql for sql in sentencias if sql.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.parametrize(
+    ("nombre", "operacion", "indice"),
+    [
+        ("por_persona", lambda repo: repo.list_pendientes_by_persona(1), "idx_sol_pendientes_persona_fecha"),
+        ("todas", lambda repo: repo.list_pendientes_all(), "idx_sol_pendientes_fecha"),
+        (
+            "conflicto",
+            lambda repo: repo.detectar_conflicto_pendiente(1, "2025-01-10", 540, 600, False, excluir_solicitud_id=7),
+            "idx_sol_pendientes_persona_fecha",
+        ),
+    ],
+)
+def test_consultas_de_pendientes_usan_indices_parciales(connection, nombre, operacion, indice) -> None:
+    repo = SolicitudRepositorySQLite(connection)
+
+    selects = _capturar_selects(connection, lambda: operacion(repo))
+
+    assert selects, nombre
+    plan = _plan(connection, selects[0])
+    assert indice in plan, plan
+
+
+@pytest.mark.parametrize("tabla", ["personas", "solicitudes", "pdf_log"])
+def test_deteccion_de_cambios_por_updated_at_usa_indice_cubriente(connection, tabla: str) -> None:
+    plan = _plan(connection, f"SELECT 1 FROM {tabla} WHERE updated_at > ? LIMIT 1", ("2025-01-01T00:00:00Z",))
+
+    assert f"USING COVERING INDEX idx_{tabla}_updated_at" in plan
+
+
+def test_migracion_deja_estadisticas_del_planificador(connection) -> None:
+    tablas = {row["name"] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    assert "sqlite_stat1" in tablas
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import sqlite3
+
+from app.infrastructure.migrations import MigrationRunner
+from app.infrastructure.repos_sqlite import SolicitudRepositorySQLite
+
+
+def _insertar(connection: sqlite3.Connection, solicitud_id: int, fecha_pedida: str) -> None:
+    connection.execute(
+        """
+        INSERT INTO solicitudes (
+            id, persona_id, fecha_solicitud, fecha_pedida, completo, horas_solicitadas_min, generated, deleted
+        ) VALUES (?, 1, '2025-01-01', ?, 1, 60, 1, 0)
+        """,
+        (solicitud_id, fecha_pedida),
+    )
+
+
+def test_migracion_canonicaliza_fecha_pedida_legacy(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        "INSERT INTO personas (id, nombre, genero, horas_mes_min, horas_ano_min, is_active, deleted) "
+        "VALUES (1, 'Ana', 'F', 600, 7200, 1, 0)"
+    )
+    for solicitud_id, fecha in (
+        (1, "2025-03-04"),
+        (2, "05/03/2025"),
+        (3, "2025/03/06"),
+        (4, "07-03-2025"),
+        (5, "2025-03-08T09:30:00Z"),
+        (6, "sin fecha"),
+    ):
+        _insertar(connection, solicitud_id, fecha)
+    connection.execute("DELETE FROM schema_migrations WHERE version = 6")
+    connection.commit()
+
+    MigrationRunner(connection).apply_all()
+
+    fechas = dict(connection.execute("SELECT id, fecha_pedida FROM solicitudes ORDER BY id").fetchall())
+    assert fechas == {
+        1: "2025-03-04",
+        2: "2025-03-05",
+        3: "2025-03-06",
+        4: "2025-03-07",
+        5: "2025-03-08",
+        6: "sin fecha",
+    }
+    repo = SolicitudRepositorySQLite(connection)
+    assert len(list(repo.list_by_persona_and_period(1, 2025, 3))) == 5
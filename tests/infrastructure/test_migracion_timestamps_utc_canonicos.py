@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sqlite3
+
+from app.infrastructure.migrations import MigrationRunner
+
+
+def test_migracion_canonicaliza_updated_at_y_last_sync_at(connection: sqlite3.Connection) -> None:
+    connection.executemany(
+        "INSERT INTO personas (id, nombre, genero, horas_mes_min, horas_ano_min, is_active, deleted, updated_at) "
+        "VALUES (?, ?, 'F', 600, 7200, 1, 0, ?)",
+        [
+            (1, "Ana", "2025-03-04T10:00:00Z"),
+            (2, "Bea", "2025-03-04T12:30:00.250000+02:00"),
+            (3, "Carla", "2025-03-04T10:00:00.000001Z"),
+            (4, "Dora", "sin fecha"),
+        ],
+    )
+    connection.execute(
+        "INSERT INTO sync_config (key, value, updated_at) VALUES ('delegado_default', 'x', '2025-03-04 09:00:00')"
+    )
+    connection.execute("UPDATE sync_state SET last_sync_at = '2025-03-04T10:00:00+00:00' WHERE id = 1")
+    connection.execute("DELETE FROM sync_outbox WHERE entidad = 'personas' AND clave IN ('2', '3', '4')")
+    connection.execute("DELETE FROM schema_migrations WHERE version = 12")
+    connection.commit()
+
+    MigrationRunner(connection).apply_all()
+
+    assert dict(connection.execute("SELECT id, updated_at FROM personas ORDER BY id").fetchall()) == {
+        1: "2025-03-04T10:00:00.000000Z",
+        2: "2025-03-04T10:30:00.250000Z",
+        3: "2025-03-04T10:00:00.000001Z",
+        4: "sin fecha",
+    }
+    assert connection.execute("SELECT updated_at FROM sync_config").fetchone()[0] == "2025-03-04T09:00:00.000000Z"
+    assert connection.execute("SELECT last_sync_at FROM sync_state").fetchone()[0] == "2025-03-04T10:00:00.000000Z"
+    # Reescribir el formato no encola cambios nuevos; lo ya pendiente se conserva.
+    pendientes = {
+        tuple(row) for row in connection.execute("SELECT entidad, clave FROM sync_outbox WHERE entidad = 'personas'")
+    }
+    assert pendientes == {("personas", "1")}
@@ -80,10 +80,26 @@ def test_builders_solicitud_insert_y_periodo() -> None:
 
     where_year, values_year = build_period_filters(2025)
     where_month, values_month = build_period_filters(2025, 3)
-    assert where_year == "strftime('%Y', fecha_pedida) = ?"
-    assert values_year == ("2025",)
-    assert "strftime('%m', fecha_pedida) = ?" in where_month
-    assert values_month == ("2025", "03")
+    where_december, values_december = build_period_filters(2025, 12)
+    assert where_year == "fecha_pedida >= ? AND fecha_pedida < ?"
+    assert values_year == ("2025-01-01", "2026-01-01")
+    assert where_month == where_year
+    assert values_month == ("2025-03-01", "2025-04-01")
+    assert values_december == ("2025-12-01", "2026-01-01")
+    assert "strftime" not in where_december
+
+
+def test_periodo_por_rango_usa_indice_persona_fecha(connection: sqlite3.Connection) -> None:
+    where_period, period_params = build_period_filters(2025, 3)
+
+    plan = connection.execute(
+        f"EXPLAIN QUERY PLAN SELECT id FROM solicitudes WHERE persona_id = ? AND {where_period}",
+        (1, *period_params),
+    ).fetchall()
+
+    detalle = " ".join(row["detail"] for row in plan)
+    assert "idx_sol_persona_fecha_pedida" in detalle
+    assert "fecha_pedida>? AND fecha_pedida<?" in detalle
 
 
 def test_builders_delete_many_sql_no_duplica_ids() -> None:
@@ -119,3 +135,22 @@ def test_delete_by_ids_realiza_soft_delete_solo_en_ids_indicados(connection: sql
         ).fetchall()
     }
     assert estados == {101: 1, 102: 0, 103: 1}
+
+
+def test_list_historico_batch_keyset_usa_indice_parcial(connection: sqlite3.Connection) -> None:
+    plan = connection.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT id FROM solicitudes
+        WHERE generated = 1
+          AND (deleted = 0 OR deleted IS NULL)
+          AND (fecha_pedida, id) < (?, ?)
+        ORDER BY fecha_pedida DESC, id DESC
+        LIMIT ?
+        """,
+        ("2025-01-01", 10, 500),
+    ).fetchall()
+
+    detalle = " ".join(row["detail"] for row in plan)
+    assert "idx_sol_historico_keyset" in detalle
+    assert "TEMP B-TREE" not in detalle
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.infrastructure.sheets_client import SheetsClient
+from app.infrastructure.sheets_values_cache import WorksheetValuesCache, estimate_values_bytes
+
+
+class _SpreadsheetPaginado:
+    """Simula ``values_get``: devuelve la ventana pedida sin las filas vacías finales."""
+
+    def __init__(self, values: list[list[str]]) -> None:
+        self._values = values
+        self.rangos: list[str] = []
+
+    def values_get(self, range_name: str) -> dict[str, object]:
+        self.rangos.append(range_name)
+        celdas = range_name.split("!", 1)[1]
+        inicio, fin = (int("".join(c for c in parte if c.isdigit())) for parte in celdas.split(":"))
+        ventana = self._values[inicio - 1 : fin]
+        while ventana and not any(ventana[-1]):
+            ventana.pop()
+        return {"range": range_name, "values": ventana} if ventana else {"range": range_name}
+
+
+def _cliente(values: list[list[str]], *, page_rows: int, row_count: int, **kwargs) -> tuple[SheetsClient, _SpreadsheetPaginado]:
+    client = SheetsClient(read_page_rows=page_rows, read_quota_per_minute=6000, **kwargs)
+    spreadsheet = _SpreadsheetPaginado(values)
+    client._spreadsheet = spreadsheet
+    client._worksheet_cache["solicitudes"] = SimpleNamespace(title="solicitudes", row_count=row_count, col_count=3)
+    return client, spreadsheet
+
+
+def test_iter_values_recorre_ventanas_y_conserva_numeros_de_fila() -> None:
+    values = [["uuid", "estado", "notas"], ["u-1", "ok", ""], [], [], ["u-2", "ok", "x"], ["u-3", "", ""]]
+    client, spreadsheet = _cliente(values, page_rows=3, row_count=1000)
+
+    leidas = list(client.iter_values("solicitudes"))
+
+    assert leidas == values
+    # La ventana vacía termina la lectura aunque la rejilla tenga 1000 filas.
+    assert spreadsheet.rangos == ["'solicitudes'!A1:C3", "'solicitudes'!A4:C6", "'solicitudes'!A7:C9"]
+    assert client.get_read_calls_count() == 3
+
+
+def test_iter_values_sigue_leyendo_si_row_count_esta_desfasado() -> None:
+    values = [["uuid"], ["u-1"], ["u-2"], ["u-3"]]
+    client, spreadsheet = _cliente(values, page_rows=2, row_count=2)
+
+    assert list(client.iter_values("solicitudes")) == values
+    assert len(spreadsheet.rangos) == 3
+
+
+def test_iter_values_cachea_la_hoja_solo_si_cabe_en_el_presupuesto() -> None:
+    values = [["uuid", "estado", "notas"], ["u-1", "ok", "n"], ["u-2", "ok", "n"]]
+    client, spreadsheet = _cliente(values, page_rows=2, row_count=3)
+    list(client.iter_values("solicitudes"))
+
+    assert client.read_all_values("solicitudes") == values
+    assert list(client.iter_values("solicitudes")) == values
+    assert len(spreadsheet.rangos) == 2
+
+    pequeno, spreadsheet = _cliente(values, page_rows=2, row_count=3, values_cache_max_bytes=100)
+    list(pequeno.iter_values("solicitudes"))
+    list(pequeno.iter_values("solicitudes"))
+
+    assert "solicitudes" not in pequeno._worksheet_values_cache
+    assert len(spreadsheet.rangos) == 4
+
+
+def test_worksheet_values_cache_expulsa_la_hoja_menos_usada() -> None:
+    hoja = [["uuid", "updated_at"], ["u-1", "2025-01-01T10:00:00.000000Z"]]
+    tamano = estimate_values_bytes(hoja)
+    cache = WorksheetValuesCache(max_bytes=tamano * 2)
+    cache.put("a", hoja)
+    cache.put("b", hoja)
+    assert cache.get("a") is hoja
+
+    cache.put("c", hoja)
+
+    assert [nombre for nombre, _ in cache.items()] == ["a", "c"]
+    assert cache.bytes_used == tamano * 2
+    assert cache.put("grande", hoja * 3) is False
+    assert "grande" not in cache
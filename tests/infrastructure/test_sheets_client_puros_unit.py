@@ -4,6 +4,7 @@ import pytest
 
 from app.infrastructure.sheets_client_puros import (
     normalize_batch_get_result,
+    pad_rows,
     worksheet_from_operation_name,
     worksheet_name_from_range,
     write_backoff_seconds,
@@ -29,6 +30,15 @@ def test_normalize_batch_get_result_desde_dict_y_lista() -> None:
     assert from_list == {"A": [["1"]], "B": [], "C": [["3"]]}
 
 
+def test_pad_rows_rellena_celdas_vacias_finales_como_get_all_values() -> None:
+    assert pad_rows([["uuid", "nombre", "notas"], ["u1", "Ana"], []]) == [
+        ["uuid", "nombre", "notas"],
+        ["u1", "Ana", ""],
+        ["", "", ""],
+    ]
+    assert pad_rows([]) == []
+
+
 def test_normalize_batch_get_result_filtra_entradas_invalidas() -> None:
     result = normalize_batch_get_result(
         ["A"],
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 
 import gspread
@@ -7,6 +8,7 @@ import pytest
 
 from app.domain.sheets_errors import SheetsPermissionError, SheetsRateLimitError
 from app.infrastructure.sheets_client import SheetsClient
+from app.infrastructure.sheets_rate_limiter import TokenBucket
 
 
 class _Resp429:
@@ -75,3 +77,41 @@ def test_with_rate_limit_retry_error_permisos_mapea_y_registra(monkeypatch: pyte
     assert capturado["spreadsheet_id"] == "spreadsheet-x"
     assert capturado["worksheet_name"] == "Resumen"
     assert capturado["operation"] == "worksheet.get_all_values(Resumen)"
+
+
+def test_with_write_retry_espera_en_el_bucket_antes_de_superar_la_cuota(monkeypatch: pytest.MonkeyPatch) -> None:
+    cliente = SheetsClient()
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", lambda segundos: sleeps.append(segundos))
+    cliente._write_bucket = TokenBucket(62, burst=2, clock=lambda: 0.0)
+
+    for _ in range(3):
+        cliente._with_write_retry("escritura", lambda: None)
+
+    assert sleeps == [pytest.approx(1.0)]
+    assert cliente.get_throttled_calls_count() == 1
+    assert cliente.get_throttle_wait_seconds() == pytest.approx(1.0)
+    assert cliente.get_sheets_api_calls_count() == 3
+
+
+def test_contadores_de_throttle_no_pierden_llamadas_entre_hilos(monkeypatch: pytest.MonkeyPatch) -> None:
+    cliente = SheetsClient()
+    monkeypatch.setattr("time.sleep", lambda _segundos: None)
+    cliente._write_bucket = TokenBucket(61, burst=1, clock=lambda: 0.0)
+    llamadas_por_hilo = 200
+
+    def _escribir() -> None:
+        for _ in range(llamadas_por_hilo):
+            cliente._with_write_retry("escritura", lambda: None)
+
+    hilos = [threading.Thread(target=_escribir) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    total = 4 * llamadas_por_hilo
+    assert cliente.get_sheets_api_calls_count() == total
+    # Con el reloj parado solo la primera ficha es gratis; cada espera se acumula una sola vez.
+    assert cliente.get_throttled_calls_count() == total - 1
+    assert cliente.get_throttle_wait_seconds() == pytest.approx(sum(range(1, total)))
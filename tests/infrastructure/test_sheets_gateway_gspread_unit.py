@@ -14,12 +14,10 @@ class _Config:
 
 
 class _WorksheetFake:
-    def __init__(self, values: list[list[str]], records: list[dict[str, str]] | None = None) -> None:
+    def __init__(self, values: list[list[str]]) -> None:
         self._values = values
-        self._records = records or []
         self.updated: list[tuple[str, list[list[str]]]] = []
         self.updated_cell: tuple[int, int, str] | None = None
-        self.appended: list[list[str]] = []
 
     def get_all_values(self):
         return self._values
@@ -27,19 +25,12 @@ class _WorksheetFake:
     def row_values(self, _):
         return self._values[0] if self._values else []
 
-    def get_all_records(self):
-        return self._records
-
     def update(self, ref: str, payload: list[list[str]]):
         self.updated.append((ref, payload))
 
     def update_cell(self, row: int, col: int, value: str):
         self.updated_cell = (row, col, value)
 
-    def append_row(self, row: list[str], value_input_option: str):
-        assert value_input_option == "USER_ENTERED"
-        self.appended.append(row)
-
 
 class _SpreadsheetFake:
     def __init__(self, worksheet: _WorksheetFake) -> None:
@@ -54,10 +45,25 @@ class _SpreadsheetFake:
 class _ClientFake:
     def __init__(self, spreadsheet) -> None:
         self._spreadsheet = spreadsheet
+        self.opened = 0
+        self.read_calls = 0
+        self.batch_bodies: list[dict] = []
+        self.appended: list[tuple[str, list[list[str]]]] = []
 
     def open_spreadsheet(self, *_args):
+        self.opened += 1
         return self._spreadsheet
 
+    def read_all_values(self, _name: str):
+        self.read_calls += 1
+        return self._spreadsheet.worksheet(_name).get_all_values()
+
+    def values_batch_update(self, body: dict) -> None:
+        self.batch_bodies.append(body)
+
+    def append_rows(self, worksheet_name: str, rows: list[list[str]]) -> None:
+        self.appended.append((worksheet_name, rows))
+
 
 class _RepoFake:
     def ensure_schema(self, *_args):
@@ -74,12 +80,59 @@ def test_read_rows_filtra_vacias(tmp_path) -> None:
 
 
 def test_upsert_actualiza_por_uuid(tmp_path) -> None:
-    ws = _WorksheetFake([["uuid", "nombre"]], records=[{"uuid": "u1", "nombre": "Viejo"}])
-    gateway = SheetsGatewayGspread(_ClientFake(_SpreadsheetFake(ws)), _RepoFake())
+    ws = _WorksheetFake([["uuid", "nombre"], ["u1", "Viejo"]])
+    client = _ClientFake(_SpreadsheetFake(ws))
+    gateway = SheetsGatewayGspread(client, _RepoFake())
 
     gateway.upsert_persona(_Config(str(tmp_path / "creds.json"), "sheet"), {"uuid": "u1", "nombre": "Nuevo"})
 
-    assert ws.updated == [("A2", [["u1", "Nuevo"]])]
+    assert client.batch_bodies == [
+        {"valueInputOption": "USER_ENTERED", "data": [{"range": "'delegadas'!A2", "values": [["u1", "Nuevo"]]}]}
+    ]
+    assert client.appended == []
+
+
+def test_upsert_many_abre_y_lee_una_vez_y_agrupa_escrituras(tmp_path) -> None:
+    ws = _WorksheetFake([["uuid", "nombre", "notas"], ["u1", "Ana", "n1"], ["", "", ""], ["u2", "Bea", "n2"]])
+    client = _ClientFake(_SpreadsheetFake(ws))
+    gateway = SheetsGatewayGspread(client, _RepoFake())
+
+    gateway.upsert_many(
+        _Config(str(tmp_path / "creds.json"), "sheet"),
+        "solicitudes",
+        [
+            {"uuid": "u2", "nombre": "Bea 2"},
+            {"uuid": "u3", "nombre": "Cris", "notas": "n3"},
+            {"uuid": "u1", "nombre": "Ana 2"},
+            {"uuid": "u3", "notas": "n3b"},
+        ],
+    )
+
+    assert client.opened == 1
+    assert client.read_calls == 1
+    assert client.batch_bodies == [
+        {
+            "valueInputOption": "USER_ENTERED",
+            "data": [
+                {"range": "'solicitudes'!A2", "values": [["u1", "Ana 2", "n1"]]},
+                {"range": "'solicitudes'!A4", "values": [["u2", "Bea 2", "n2"]]},
+            ],
+        }
+    ]
+    assert client.appended == [("solicitudes", [["u3", "Cris", "n3b"]])]
+
+
+def test_upsert_many_en_hoja_vacia_escribe_cabecera_y_anade_filas(tmp_path) -> None:
+    ws = _WorksheetFake([])
+    client = _ClientFake(_SpreadsheetFake(ws))
+    gateway = SheetsGatewayGspread(client, _RepoFake())
+
+    gateway.upsert_many(_Config(str(tmp_path / "creds.json"), "sheet"), "delegadas", [{"uuid": "u1", "nombre": "Ana"}])
+
+    assert client.batch_bodies == [
+        {"valueInputOption": "USER_ENTERED", "data": [{"range": "'delegadas'!A1", "values": [["uuid", "nombre"]]}]}
+    ]
+    assert client.appended == [("delegadas", [["u1", "Ana"]])]
 
 
 def test_backfill_uuid_agrega_columna_si_no_existe(tmp_path) -> None:
@@ -14,6 +14,7 @@ from app.infrastructure.sheets_gateway_puros import (
     normalize_payload,
     normalize_rows,
     parse_a1_range,
+    plan_upserts,
 )
 
 
@@ -143,3 +144,12 @@ def test_map_gateway_error(exc: Exception, expected_message: str) -> None:
     mapped = map_gateway_error(exc)
     assert isinstance(mapped, RuntimeError)
     assert str(mapped) == expected_message
+
+
+def test_plan_upserts_usa_la_primera_fila_de_un_uuid_repetido_y_anade_filas_sin_uuid() -> None:
+    values = [["uuid", "nombre"], ["u1", "Ana"], ["u1", "Copia"]]
+
+    updates, appends = plan_upserts(["uuid", "nombre"], values, [{"uuid": "u1", "nombre": "Nueva"}, {"nombre": "Sin uuid"}, {"nombre": "Otra"}])
+
+    assert updates == {2: ["u1", "Nueva"]}
+    assert appends == [["", "Sin uuid"], ["", "Otra"]]
@@ -7,6 +7,8 @@ from types import SimpleNamespace
 import gspread
 import pytest
 
+from app.application.use_cases.sync_sheets.snapshot_remoto_plan import construir_snapshot_remoto, snapshot_vigente
+from app.application.use_cases.sync_sheets.sync_sheets_helpers import rows_with_index
 from app.bootstrap.logging import OPERATIONAL_ERROR_LOG_NAME, configure_logging
 from app.domain.sheets_errors import SheetsPermissionError, SheetsRateLimitError
 from app.infrastructure.sheets_client import SheetsClient
@@ -73,20 +75,69 @@ def test_open_spreadsheet_exceeds_retry_limit(monkeypatch) -> None:
 def test_batch_get_ranges_normalizes_value_ranges() -> None:
     client = SheetsClient()
     normalized = client._normalize_batch_get_result(
-        ["A!A1:B2", "B!A1:A2"],
+        ["'A'", "B!A:A"],
         {
             "valueRanges": [
-                {"range": "A!A1:B2", "values": [["1", "2"], ["3", "4"]]},
-                {"range": "B!A1:A2", "values": [["x"], ["y"]]},
+                {"range": "A!A1:Z1000", "values": [["1", "2"], ["3", "4"]]},
+                {"range": "B!A1:A1000", "values": [["x"], ["y"]]},
             ]
         },
     )
     assert normalized == {
-        "A!A1:B2": [["1", "2"], ["3", "4"]],
-        "B!A1:A2": [["x"], ["y"]],
+        "'A'": [["1", "2"], ["3", "4"]],
+        "B!A:A": [["x"], ["y"]],
     }
 
 
+def test_batch_get_ranges_solo_cachea_rangos_de_hoja_completa() -> None:
+    client = SheetsClient()
+    client._spreadsheet = SimpleNamespace(
+        values_batch_get=lambda ranges: {
+            "valueRanges": [
+                {"range": "solicitudes!A1:Z1000", "values": [["uuid", "updated_at"], ["u-1"]]},
+                {"range": "solicitudes!A1:A1000", "values": [["uuid"], ["u-1"]]},
+                {"range": "pdf_log!A1:A1000", "values": [["pdf_id"]]},
+            ]
+        }
+    )
+
+    client.batch_get_ranges(["'solicitudes'", "'solicitudes'!A:A", "'pdf_log'!A:A"])
+
+    assert dict(client._worksheet_values_cache.items()) == {"solicitudes": [["uuid", "updated_at"], ["u-1", ""]]}
+    assert client.read_all_values("solicitudes") == [["uuid", "updated_at"], ["u-1", ""]]
+
+
+def test_batch_get_ranges_no_cachea_rangos_sin_respuesta() -> None:
+    client = SheetsClient()
+    client._spreadsheet = SimpleNamespace(
+        values_batch_get=lambda ranges: {
+            "valueRanges": [{"range": "delegadas!A1:Z1000", "values": [["uuid"], ["d-1"]]}, {"range": "config!A1:Z1000"}]
+        }
+    )
+
+    leidos = client.batch_get_ranges(["'delegadas'", "'config'", "'pdf_log'"])
+
+    assert leidos == {"'delegadas'": [["uuid"], ["d-1"]], "'config'": [], "'pdf_log'": []}
+    assert dict(client._worksheet_values_cache.items()) == {"delegadas": [["uuid"], ["d-1"]], "config": []}
+
+
+def test_snapshot_vigente_compara_la_huella_con_rangos_resueltos_por_la_api() -> None:
+    values = [["uuid", "notas", "updated_at"], ["u-1", "a", "2026-01-01"]]
+    headers, rows = rows_with_index(values, worksheet_name="solicitudes")
+    snapshot = construir_snapshot_remoto("solicitudes", headers, rows)
+    client = SheetsClient()
+    client._spreadsheet = SimpleNamespace(
+        values_batch_get=lambda ranges: {
+            "valueRanges": [
+                {"range": "solicitudes!A1:A1000", "values": [["uuid"], ["u-1"]]},
+                {"range": "solicitudes!C1:C1000", "values": [["updated_at"], ["2026-01-01"]]},
+            ]
+        }
+    )
+
+    assert snapshot_vigente(client, snapshot) is True
+
+
 def test_with_rate_limit_retry_does_not_retry_attribute_error() -> None:
     client = SheetsClient()
     calls = {"count": 0}
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.sheets_rate_limiter import TokenBucket
+
+
+class _Reloj:
+    def __init__(self) -> None:
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+    def dormir(self, segundos: float) -> None:
+        self.ahora += segundos
+
+
+def test_token_bucket_deja_pasar_la_rafaga_y_despues_espera() -> None:
+    reloj = _Reloj()
+    bucket = TokenBucket(70, burst=10, clock=reloj, sleep=reloj.dormir)
+
+    esperas = [bucket.acquire() for _ in range(12)]
+
+    assert esperas[:10] == [0.0] * 10
+    assert esperas[10] == pytest.approx(1.0)
+    assert esperas[11] == pytest.approx(1.0)
+    assert reloj.ahora == pytest.approx(2.0)
+
+
+def test_token_bucket_no_supera_la_cuota_en_ningun_minuto() -> None:
+    reloj = _Reloj()
+    bucket = TokenBucket(60, burst=10, clock=reloj, sleep=reloj.dormir)
+    instantes: list[float] = []
+
+    for _ in range(200):
+        bucket.acquire()
+        instantes.append(reloj.ahora)
+
+    for inicio in instantes:
+        assert sum(1 for instante in instantes if inicio <= instante < inicio + 60) <= 60
+
+
+def test_token_bucket_repone_fichas_con_el_tiempo() -> None:
+    reloj = _Reloj()
+    bucket = TokenBucket(70, burst=10, clock=reloj, sleep=reloj.dormir)
+    for _ in range(10):
+        bucket.acquire()
+
+    reloj.ahora += 5.0
+
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    assert bucket.acquire() > 0
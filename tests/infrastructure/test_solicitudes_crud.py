@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import sqlite3
+
+import pytest
+
 from app.domain.models import Persona, Solicitud
 
 def test_crud_insert_update_delete_solicitud(
@@ -115,3 +119,42 @@ def test_find_duplicate_filtra_por_persona_id(solicitud_repo, persona_repo) -> N
     assert duplicate_b is not None
     assert duplicate_a.id == creada_a.id
     assert duplicate_a.persona_id != duplicate_b.persona_id
+
+
+def _solicitud(persona_id: int, fecha: str) -> Solicitud:
+    return Solicitud(
+        id=None,
+        persona_id=persona_id,
+        fecha_solicitud=fecha,
+        fecha_pedida=fecha,
+        desde_min=540,
+        hasta_min=600,
+        completo=False,
+        horas_solicitadas_min=60,
+        observaciones=None,
+    )
+
+
+def test_operaciones_en_lote_crean_confirman_y_registran_pdf(solicitud_repo, persona_id) -> None:
+    creadas = solicitud_repo.create_many(
+        [_solicitud(persona_id, "2026-03-02"), _solicitud(persona_id, "2026-03-03"), _solicitud(persona_id, "2026-03-04")]
+    )
+    ids = [creada.id for creada in creadas]
+    assert None not in ids and len(set(ids)) == 3
+    assert [solicitud_repo.get_by_id(i).fecha_pedida for i in ids] == ["2026-03-02", "2026-03-03", "2026-03-04"]
+
+    solicitud_repo.mark_generated_many(ids[:1])
+    solicitud_repo.update_pdf_info_many([(ids[1], "/tmp/lote.pdf", "hash-lote")])
+
+    primera, segunda, tercera = (solicitud_repo.get_by_id(i) for i in ids)
+    assert primera.generated is True and primera.pdf_path is None
+    assert (segunda.generated, segunda.pdf_path, segunda.pdf_hash) == (True, "/tmp/lote.pdf", "hash-lote")
+    assert tercera.generated is False
+    assert solicitud_repo.create_many([]) == []
+
+
+def test_create_many_es_atomico(solicitud_repo, persona_id) -> None:
+    with pytest.raises(sqlite3.IntegrityError):
+        solicitud_repo.create_many([_solicitud(persona_id, "2026-03-05"), _solicitud(-1, "2026-03-06")])
+
+    assert list(solicitud_repo.list_by_persona(persona_id)) == []
@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import sqlite3
 
-from app.infrastructure.configuracion_conexion_sqlite import configurar_conexion
+import pytest
+
+from app.infrastructure.configuracion_conexion_sqlite import (
+    PERFIL_IMPORTACION_MASIVA,
+    PERFIL_INTERACTIVO,
+    PERFIL_SOLO_LECTURA,
+    PERFILES_PRAGMAS,
+    cerrar_conexion,
+    configurar_conexion,
+    resolver_perfil_pragmas,
+)
 
 
 def test_configurar_conexion_habilita_foreign_keys() -> None:
@@ -25,3 +35,35 @@ def test_configurar_conexion_configura_busy_timeout() -> None:
         assert int(row[0]) > 0
     finally:
         connection.close()
+
+
+def test_perfil_solo_lectura_aplica_pragmas_y_bloquea_escrituras(tmp_path) -> None:
+    connection = sqlite3.connect(tmp_path / "perfil.db")
+    try:
+        configurar_conexion(connection, perfil=PERFIL_SOLO_LECTURA)
+        perfil = PERFILES_PRAGMAS[PERFIL_SOLO_LECTURA]
+        assert int(connection.execute("PRAGMA cache_size").fetchone()[0]) == -perfil.cache_size_kib
+        assert int(connection.execute("PRAGMA temp_store").fetchone()[0]) == 2
+        assert int(connection.execute("PRAGMA query_only").fetchone()[0]) == 1
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            connection.execute("CREATE TABLE t (x INTEGER)")
+    finally:
+        cerrar_conexion(connection)
+
+
+def test_perfil_desconocido_usa_interactive() -> None:
+    assert resolver_perfil_pragmas("turbo") is PERFILES_PRAGMAS[PERFIL_INTERACTIVO]
+    assert resolver_perfil_pragmas(" BULK-IMPORT ") is PERFILES_PRAGMAS[PERFIL_IMPORTACION_MASIVA]
+
+
+def test_cerrar_conexion_ejecuta_optimize_y_cierra() -> None:
+    connection = sqlite3.connect(":memory:")
+    sentencias: list[str] = []
+    connection.set_trace_callback(sentencias.append)
+    configurar_conexion(connection, perfil=PERFIL_SOLO_LECTURA)
+
+    cerrar_conexion(connection)
+
+    assert "PRAGMA optimize" in sentencias
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
@@ -31,3 +31,34 @@ def test_repos_sqlite_persisten_datos_en_memoria(persona_repo, solicitud_repo, p
 
     solicitudes_mes = list(solicitud_repo.list_by_persona_and_period(persona_id, 2025, 1))
     assert len(solicitudes_mes) == 1
+
+
+def test_list_consumo_mensual_agrupa_confirmadas_por_persona_y_mes(connection, solicitud_repo) -> None:
+    connection.executemany(
+        "INSERT INTO personas (id, nombre, genero, horas_mes_min, horas_ano_min, is_active, deleted) VALUES (?, ?, 'F', 600, 7200, 1, 0)",
+        [(1, "Ana"), (2, "Berta")],
+    )
+    connection.executemany(
+        """
+        INSERT INTO solicitudes (
+            persona_id, fecha_solicitud, fecha_pedida, completo, horas_solicitadas_min, generated, deleted
+        ) VALUES (?, ?, ?, 0, ?, ?, ?)
+        """,
+        [
+            (1, "2025-01-02", "2025-01-02", 60, 1, 0),
+            (1, "2025-01-20", "2025-01-20", 30, 1, 0),
+            (1, "2025-02-03", "2025-02-03", 120, 1, 0),
+            (1, "2025-02-04", "2025-02-04", 999, 0, 0),
+            (1, "2025-02-05", "2025-02-05", 999, 1, 1),
+            (1, "2024-12-31", "2024-12-31", 999, 1, 0),
+            (2, "2025-02-10", "2025-02-10", 45, 1, 0),
+        ],
+    )
+    connection.commit()
+
+    consumos = {(c.persona_id, c.month): c.minutos for c in solicitud_repo.list_consumo_mensual(2025)}
+    solo_ana = list(solicitud_repo.list_consumo_mensual(2025, 1))
+
+    assert consumos == {(1, 1): 90, (1, 2): 120, (2, 2): 45}
+    assert {c.persona_id for c in solo_ana} == {1}
+    assert all(c.year == 2025 for c in solo_ana)